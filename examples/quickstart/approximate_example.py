@@ -0,0 +1,24 @@
+from throttled import ApproximateRateLimiter, RateLimiterRegistry, per_min, store
+
+
+def main() -> None:
+    limiter = RateLimiterRegistry.get("fixed_window")(
+        per_min(100_000), store.RedisStore(server="redis://127.0.0.1:6379/0")
+    )
+    # Lease 1,000 tokens from Redis at once and serve requests locally,
+    # the next lease is fetched in the background.
+    rate_limiter = ApproximateRateLimiter(limiter, lease_size=1_000, max_overshoot=100)
+
+    # Only the first request goes to Redis.
+    results = [rate_limiter.limit("/tenant/1") for _ in range(400)]
+
+    # >> [False]
+    print(list({result.limited for result in results}))
+    # Tokens leased by this process are already consumed from Redis.
+    # >> 99000
+    print(rate_limiter.peek("/tenant/1").remaining)
+    rate_limiter.close()
+
+
+if __name__ == "__main__":
+    main()
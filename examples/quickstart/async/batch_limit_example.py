@@ -0,0 +1,24 @@
+import asyncio
+
+from throttled.asyncio import RateLimiterType, Throttled, store
+
+
+async def main() -> None:
+    throttle = Throttled(
+        using=RateLimiterType.GCRA.value,
+        quota="1/s burst 2",
+        # The whole batch is sent to Redis in a single pipeline.
+        # MemoryStore is also supported, the batch is applied under one lock.
+        store=store.RedisStore(server="redis://127.0.0.1:6379/0"),
+    )
+
+    # Deduct requests for multiple keys in a single round trip.
+    results = await throttle.limit_many([("/ping", 1), ("/pong", 1), ("/ping", 2)])
+
+    # Results are returned in the same order as the given items.
+    # >> [False, False, True]
+    print([result.limited for result in results])
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
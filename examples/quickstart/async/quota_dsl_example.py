@@ -8,6 +8,7 @@ throttle = Throttled(
     # quota="100/s burst 200",
     # quota="100 per second",
     # quota="100 per second burst 200",
+    # quota="10/s, 500/m, 10000/d",
 )
 
 
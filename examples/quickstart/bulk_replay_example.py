@@ -0,0 +1,28 @@
+import numpy as np
+from throttled import per_sec
+from throttled.contrib.bulk import BulkEvaluator
+
+
+def main() -> None:
+    # An access log of 1M requests over an hour from 100 keys, e.g. loaded
+    # from Parquet, with keys mapped to integer ids.
+    rng = np.random.default_rng(2025)
+    timestamps = np.sort(rng.uniform(0, 3600, 1_000_000))
+    key_ids = rng.integers(0, 100, 1_000_000)
+
+    evaluator = BulkEvaluator(per_sec(1, burst=5), using="gcra")
+    # Long logs can be replayed in chunks, the state of keys is kept.
+    limited = np.concatenate(
+        [
+            evaluator.evaluate(timestamps[chunk], key_ids[chunk]).limited
+            for chunk in np.array_split(np.arange(timestamps.size), 4)
+        ]
+    )
+
+    # Share of requests that would have been limited.
+    # >> 0.64
+    print(round(limited.mean(), 2))
+
+
+if __name__ == "__main__":
+    main()
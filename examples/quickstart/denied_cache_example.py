@@ -0,0 +1,21 @@
+from throttled import DeniedCache, RateLimiterType, Throttled, per_min, store
+
+
+def main() -> None:
+    throttle = Throttled(
+        using=RateLimiterType.GCRA.value,
+        quota=per_min(1),
+        store=store.RedisStore(server="redis://127.0.0.1:6379/0"),
+        # Remember up to 10,000 denied keys locally until their retry_after.
+        denied_cache=DeniedCache(max_size=10_000),
+    )
+
+    # Only the first two requests go to Redis, the rest are denied locally.
+    results = [throttle.limit("/ping") for _ in range(100)]
+
+    # >> [False, True]
+    print(sorted({result.limited for result in results}))
+
+
+if __name__ == "__main__":
+    main()
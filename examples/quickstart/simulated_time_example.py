@@ -0,0 +1,29 @@
+import time
+
+from throttled import ManualClock, RateLimiterType, Throttled, per_min, store
+
+
+def main() -> None:
+    clock = ManualClock()
+    throttle = Throttled(
+        using=RateLimiterType.GCRA.value,
+        quota=per_min(60),
+        # Keys expire and quotas are counted on the clock of the store.
+        store=store.MemoryStore(options={"CLOCK": clock}),
+    )
+
+    # Simulate an hour of traffic at twice the quota.
+    started_at = time.monotonic()
+    allowed = 0
+    for _ in range(7200):
+        allowed += not throttle.limit("/ping").limited
+        clock.advance(0.5)
+
+    # It allows 60 requests a minute, plus the burst of the first minute, and takes
+    # a fraction of a second.
+    # >> 3659 True
+    print(allowed, time.monotonic() - started_at < 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+import asyncio
+from datetime import timedelta
+
+import pytest
+from throttled.asyncio import (
+    ApproximateRateLimiter,
+    BaseRateLimiter,
+    BaseStore,
+    RateLimiterRegistry,
+    RateLimitResult,
+    constants,
+    per_duration,
+    per_min,
+)
+
+from ...rate_limiter import parametrizes
+
+
+def _create_rate_limiter(
+    store: BaseStore,
+    using: str = constants.RateLimiterType.TOKEN_BUCKET.value,
+    limit: int = 100,
+) -> BaseRateLimiter:
+    return RateLimiterRegistry.get(using)(per_min(limit), store)
+
+
+@pytest.mark.asyncio
+class TestApproximateRateLimiter:
+    async def test_limit(self, store: BaseStore):
+        limiter: BaseRateLimiter = _create_rate_limiter(store)
+        rate_limiter = ApproximateRateLimiter(limiter, lease_size=10)
+
+        result: RateLimitResult = await rate_limiter.limit("key")
+        assert result.limited is False
+        assert result.state.remaining == 99
+        # The whole lease is consumed from the wrapped limiter at once.
+        assert (await rate_limiter.peek("key")).remaining == 90
+
+        # Requests are served from the lease, until half of it is consumed.
+        for remaining in range(98, 94, -1):
+            assert (await rate_limiter.limit("key")).state.remaining == remaining
+        assert (await rate_limiter.peek("key")).remaining == 90
+
+        # Then the next lease is fetched in a background task.
+        await rate_limiter.limit("key")
+        await rate_limiter.flush()
+        assert (await rate_limiter.peek("key")).remaining == 80
+        assert (await rate_limiter.limit("key")).state.remaining == 93
+        await rate_limiter.close()
+
+    async def test_limit__sub_second_period(self, store: BaseStore):
+        quota = per_duration(timedelta(milliseconds=100), limit=5)
+        limiter: BaseRateLimiter = RateLimiterRegistry.get(
+            constants.RateLimiterType.TOKEN_BUCKET.value
+        )(quota, store)
+        rate_limiter = ApproximateRateLimiter(limiter, lease_size=2)
+
+        # Leases of sub-second quotas are kept for a second at least.
+        assert (await rate_limiter.limit("key")).limited is False
+        lease_key: str = rate_limiter._prepare_lease_key(limiter._prepare_key("key"))
+        assert await rate_limiter._local_store.ttl(lease_key) == 1
+        await rate_limiter.close()
+
+    @pytest.mark.parametrize("using", parametrizes.CONSUMING_LIMITER_TYPES)
+    async def test_limit__exhausted(self, store: BaseStore, using: str):
+        limiter: BaseRateLimiter = _create_rate_limiter(store, using, limit=10)
+        rate_limiters: list[ApproximateRateLimiter] = [
+            ApproximateRateLimiter(limiter, lease_size=4, max_overshoot=1)
+            for _ in range(2)
+        ]
+
+        async def _call(rate_limiter: ApproximateRateLimiter) -> int:
+            return sum(
+                [not (await rate_limiter.limit("key")).limited for _ in range(10)]
+            )
+
+        # Leases never grant more than the quota, plus the allowed overshoot.
+        allowed: list[int] = await asyncio.gather(*map(_call, rate_limiters))
+        for rate_limiter in rate_limiters:
+            await rate_limiter.flush()
+        assert 10 <= sum(allowed) <= 10 + 2
+        assert (await rate_limiters[0].limit("key")).limited is True
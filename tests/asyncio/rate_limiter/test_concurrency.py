@@ -0,0 +1,106 @@
+import asyncio
+from collections.abc import Callable
+from datetime import timedelta
+
+import pytest
+from throttled.asyncio import (
+    BaseRateLimiter,
+    BaseStore,
+    Quota,
+    RateLimiterRegistry,
+    RateLimiterType,
+    RateLimitResult,
+    RateLimitState,
+    per_duration,
+    per_min,
+)
+
+from ...rate_limiter import parametrizes
+from ...rate_limiter.test_concurrency import assert_rate_limit_result
+
+
+@pytest.fixture
+def rate_limiter_constructor(
+    store: BaseStore,
+) -> Callable[[Quota], BaseRateLimiter]:
+    def _create_rate_limiter(quota: Quota) -> BaseRateLimiter:
+        return RateLimiterRegistry.get(RateLimiterType.CONCURRENCY.value)(quota, store)
+
+    return _create_rate_limiter
+
+
+@pytest.mark.asyncio
+class TestConcurrencyRateLimiter:
+    async def test_limit(
+        self, rate_limiter_constructor: Callable[[Quota], BaseRateLimiter]
+    ):
+        quota: Quota = per_min(5)
+        rate_limiter: BaseRateLimiter = rate_limiter_constructor(quota)
+        for case in parametrizes.CONCURRENCY_LIMIT_CASES:
+            result: RateLimitResult = await rate_limiter.limit("key", cost=case["cost"])
+            assert_rate_limit_result(case, quota, result)
+
+    async def test_release(
+        self, rate_limiter_constructor: Callable[[Quota], BaseRateLimiter]
+    ):
+        rate_limiter: BaseRateLimiter = rate_limiter_constructor(per_min(3))
+        result: RateLimitResult = await rate_limiter.limit("key", cost=2)
+        assert result.lease is not None
+        assert (await rate_limiter.limit("key", cost=2)).limited is True
+
+        assert await rate_limiter.release("key", result.lease) is True
+        assert await rate_limiter.release("key", result.lease) is False
+        assert (await rate_limiter.peek("key")).remaining == 3
+        assert (await rate_limiter.limit("key", cost=3)).limited is False
+
+    async def test_release__expired(
+        self, rate_limiter_constructor: Callable[[Quota], BaseRateLimiter]
+    ):
+        rate_limiter: BaseRateLimiter = rate_limiter_constructor(
+            per_duration(timedelta(milliseconds=200), 1)
+        )
+        result: RateLimitResult = await rate_limiter.limit("key")
+        assert result.lease is not None
+        assert (await rate_limiter.limit("key")).limited is True
+
+        await asyncio.sleep(0.21)
+        assert (await rate_limiter.limit("key")).limited is False
+        assert await rate_limiter.release("key", result.lease) is False
+
+    async def test_limit__concurrent(
+        self, rate_limiter_constructor: Callable[[Quota], BaseRateLimiter]
+    ):
+        rate_limiter: BaseRateLimiter = rate_limiter_constructor(per_min(3))
+        in_flight: list[int] = [0, 0]
+
+        async def _task() -> None:
+            for __ in range(20):
+                result: RateLimitResult = await rate_limiter.limit("key")
+                if result.lease is None:
+                    await asyncio.sleep(0)
+                    continue
+                in_flight[0] += 1
+                in_flight[1] = max(in_flight)
+                await asyncio.sleep(0.001)
+                in_flight[0] -= 1
+                await rate_limiter.release("key", result.lease)
+
+        await asyncio.gather(*[_task() for __ in range(8)])
+
+        assert 0 < in_flight[1] <= 3
+        assert (await rate_limiter.peek("key")).remaining == 3
+
+    async def test_peek(
+        self, rate_limiter_constructor: Callable[[Quota], BaseRateLimiter]
+    ):
+        key: str = "key"
+        rate_limiter: BaseRateLimiter = rate_limiter_constructor(per_min(2))
+        assert await rate_limiter.peek(key) == RateLimitState(
+            limit=2, remaining=2, reset_after=0
+        )
+
+        await rate_limiter.limit(key)
+        await rate_limiter.limit(key)
+        state: RateLimitState = await rate_limiter.peek(key)
+        assert state.remaining == 0
+        assert state.retry_after == pytest.approx(60, abs=0.1)
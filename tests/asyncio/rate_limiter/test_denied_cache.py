@@ -0,0 +1,96 @@
+import pytest
+from throttled.asyncio import (
+    BaseRateLimiter,
+    BaseStore,
+    DeniedCache,
+    ManualClock,
+    MemoryStore,
+    RateLimiterRegistry,
+    RateLimitResult,
+    Throttled,
+    constants,
+    exceptions,
+    per_min,
+)
+
+
+def _create_rate_limiter(
+    store: BaseStore, using: str, denied_cache: DeniedCache
+) -> BaseRateLimiter:
+    return RateLimiterRegistry.get(using)(per_min(1), store, denied_cache=denied_cache)
+
+
+@pytest.mark.asyncio
+class TestDeniedCache:
+    @pytest.mark.parametrize(
+        "using",
+        [
+            constants.RateLimiterType.GCRA.value,
+            constants.RateLimiterType.FIXED_WINDOW.value,
+            constants.RateLimiterType.SLIDING_WINDOW_LOG.value,
+        ],
+    )
+    async def test_limit(
+        self, monkeypatch: pytest.MonkeyPatch, store: BaseStore, using: str
+    ):
+        cache = DeniedCache()
+        limiter: BaseRateLimiter = _create_rate_limiter(store, using, cache)
+        calls: list[int] = []
+        limit = limiter._limit
+
+        async def _limit(key: str, cost: int) -> RateLimitResult:
+            calls.append(cost)
+            return await limit(key, cost)
+
+        monkeypatch.setattr(limiter, "_limit", _limit)
+
+        assert (await limiter.limit("key")).limited is False
+        denied: RateLimitResult = await limiter.limit("key")
+        assert denied.limited is True
+
+        # Requests of the same or a higher cost are answered locally.
+        for cost in [1, 2]:
+            result: RateLimitResult = await limiter.limit("key", cost)
+            assert result.limited is True
+            assert result.state.retry_after <= denied.state.retry_after
+        assert calls == [1, 1]
+
+    async def test_limit__inexact_retry_after(self, store: BaseStore):
+        cache = DeniedCache()
+        limiter: BaseRateLimiter = _create_rate_limiter(
+            store, constants.RateLimiterType.TOKEN_BUCKET.value, cache
+        )
+        await limiter.limit("key")
+        assert (await limiter.limit("key")).limited is True
+        assert len(cache) == 0
+
+    async def test_throttled(self, store: BaseStore):
+        cache = DeniedCache()
+        throttle = Throttled(
+            using=constants.RateLimiterType.GCRA.value,
+            quota=per_min(1),
+            store=store,
+            denied_cache=cache,
+        )
+        assert (await throttle.limit("key")).limited is False
+        assert (await throttle.limit("key")).limited is True
+        assert len(cache) == 1
+
+    async def test_throttled__clock(self):
+        clock: ManualClock = ManualClock()
+        cache = DeniedCache()
+        throttle = Throttled(
+            using=constants.RateLimiterType.GCRA.value,
+            quota=per_min(1),
+            store=MemoryStore(options={"CLOCK": clock}),
+            denied_cache=cache,
+        )
+        # Deadlines are counted on the clock of the store by default.
+        assert cache.clock is clock
+        assert (await throttle.limit("key")).limited is False
+        assert (await throttle.limit("key")).limited is True
+        clock.advance(60)
+        assert (await throttle.limit("key")).limited is False
+
+        with pytest.raises(exceptions.SetUpError, match="clock of the store"):
+            Throttled(quota=per_min(1), store=MemoryStore(), denied_cache=cache)
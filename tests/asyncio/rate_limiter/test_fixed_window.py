@@ -40,13 +40,15 @@ class TestFixedWindowRateLimiter:
         key: str = "key"
         rate_limiter: BaseRateLimiter = rate_limiter_constructor(quota)
 
-        store_key: str = f"throttled:v1:fixed_window:key:period:{now_sec() // period}"
+        store_key: str = "throttled:v1:fixed_window:key"
         assert await rate_limiter._store.exists(store_key) is False
 
         for case in parametrizes.FIXED_WINDOW_LIMIT_CASES:
             result: RateLimitResult = await rate_limiter.limit(key, cost=case["cost"])
             assert_rate_limit_result(case["limited"], case["remaining"], quota, result)
-            assert await rate_limiter._store.get(store_key) == case["count"]
+            counter = await rate_limiter._store.hgetall(store_key)
+            assert int(counter["window"]) == now_sec() // period
+            assert int(counter["count"]) == case["count"]
 
     @pytest.mark.parametrize(
         "quota", [per_min(1), per_min(10), per_min(100), per_min(1_000)]
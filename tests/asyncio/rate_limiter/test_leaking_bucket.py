@@ -1,5 +1,6 @@
 import asyncio
 from collections.abc import Callable
+from datetime import timedelta
 
 import pytest
 from throttled.asyncio import (
@@ -10,6 +11,7 @@ from throttled.asyncio import (
     RateLimitResult,
     RateLimitState,
     constants,
+    per_duration,
     per_min,
     types,
     utils,
@@ -45,6 +47,16 @@ class TestLeakingBucketRateLimiter:
             result: RateLimitResult = await rate_limiter.limit("key", cost=case["cost"])
             assert_rate_limit_result(case, quota, result)
 
+    async def test_limit__ttl(
+        self,
+        store: BaseStore,
+        rate_limiter_constructor: Callable[[Quota], BaseRateLimiter],
+    ):
+        rate_limiter: BaseRateLimiter = rate_limiter_constructor(per_min(60, burst=10))
+        await rate_limiter.limit("key")
+        # The bucket of a new key expires once it has leaked twice over.
+        assert 0 < await store.ttl("throttled:v1:leaking_bucket:key") <= 20
+
     @parametrizes.LIMIT_C_QUOTA
     @parametrizes.LIMIT_C_REQUESTS_NUM
     async def test_limit__concurrent(
@@ -82,10 +94,26 @@ class TestLeakingBucketRateLimiter:
 
         await rate_limiter.limit(key, cost=5)
         state = await rate_limiter.peek(key)
-        assert state == RateLimitState(limit=10, remaining=5, reset_after=5)
+        assert (state.limit, state.remaining) == (10, 5)
+        assert state.reset_after == pytest.approx(5, abs=0.1)
 
         await asyncio.sleep(1)
         state = await rate_limiter.peek(key)
         assert state.limit == 10
         assert 6 - state.remaining <= 1
         assert 4 - state.reset_after <= 4
+
+    async def test_limit__sub_second_period(
+        self, rate_limiter_constructor: Callable[[Quota], BaseRateLimiter]
+    ):
+        # One request leaks every 20ms, rather than 5 requests every 100ms.
+        quota: Quota = per_duration(timedelta(milliseconds=100), limit=5)
+        rate_limiter: BaseRateLimiter = rate_limiter_constructor(quota)
+        assert (await rate_limiter.limit("key", cost=5)).limited is False
+
+        result: RateLimitResult = await rate_limiter.limit("key", cost=2)
+        assert result.limited is True
+        assert 0 < result.state.retry_after <= 0.04
+
+        await asyncio.sleep(result.state.retry_after + 0.005)
+        assert (await rate_limiter.limit("key", cost=2)).limited is False
@@ -2,12 +2,17 @@ import pytest
 from throttled.asyncio import (
     BaseRateLimiter,
     BaseStore,
+    Lease,
+    MemoryStore,
     RateLimiterRegistry,
+    RateLimitResult,
     constants,
     exceptions,
+    per_min,
     per_sec,
 )
 
+from ...rate_limiter import parametrizes
 from ..store.unavailable import OperationUnavailableStore, UnavailableStore
 
 
@@ -39,3 +44,111 @@ class TestRateLimiter:
         rate_limiter = _build_rate_limiter(limiter_type)
         with pytest.raises(exceptions.StoreUnavailableError):
             await rate_limiter.peek("key")
+
+    @classmethod
+    @pytest.mark.parametrize("limiter_type", constants.RateLimiterType.choice())
+    async def test_limit_many__store_unavailable(cls, limiter_type: str) -> None:
+        rate_limiter = _build_rate_limiter(limiter_type)
+        with pytest.raises(exceptions.StoreUnavailableError):
+            await rate_limiter.limit_many([("key", 1)])
+
+    @classmethod
+    @pytest.mark.parametrize("limiter_type", constants.RateLimiterType.choice())
+    async def test_limit_many(cls, store: BaseStore, limiter_type: str) -> None:
+        limiter_cls = RateLimiterRegistry.get(limiter_type)
+        rate_limiter: BaseRateLimiter = limiter_cls(per_min(3), store)
+
+        items: list[tuple[str, int]] = [
+            ("a", 1),
+            ("b", 2),
+            ("a", 1),
+            ("a", 2),
+            ("b", 2),
+        ]
+        results: list[RateLimitResult] = await rate_limiter.limit_many(items)
+        assert [result.limited for result in results] == [
+            False,
+            False,
+            False,
+            True,
+            True,
+        ]
+        assert [result.state.limit for result in results] == [3] * len(items)
+        assert [result.state.remaining for result in results[:3]] == [2, 1, 1]
+
+        # Batch requests share state with single requests.
+        await rate_limiter.limit_many([("c", 3)])
+        assert (await rate_limiter.limit("c")).limited is True
+
+    @classmethod
+    @pytest.mark.parametrize("limiter_type", constants.RateLimiterType.choice())
+    async def test_limit_many__empty(cls, store: BaseStore, limiter_type: str) -> None:
+        limiter_cls = RateLimiterRegistry.get(limiter_type)
+        assert await limiter_cls(per_min(3), store).limit_many([]) == []
+
+    @classmethod
+    @pytest.mark.parametrize("limiter_type", parametrizes.CONSUMING_LIMITER_TYPES)
+    async def test_limit_all(cls, store: BaseStore, limiter_type: str) -> None:
+        limiter_cls = RateLimiterRegistry.get(limiter_type)
+        rate_limiter: BaseRateLimiter = limiter_cls(per_min(3), store)
+
+        results: list[RateLimitResult] = await rate_limiter.limit_all(
+            [
+                ("user", 1),
+                ("tenant", 3),
+            ]
+        )
+        assert [result.limited for result in results] == [False, False]
+        assert [result.state.remaining for result in results] == [2, 0]
+
+        # The tenant bucket denies the request, the user bucket is left untouched.
+        results = await rate_limiter.limit_all([("user", 1), ("tenant", 1)])
+        assert [result.limited for result in results] == [True, True]
+        assert [result.state.remaining for result in results] == [2, 0]
+        assert results[1].state.retry_after > 0
+        assert (await rate_limiter.peek("user")).remaining == results[0].state.remaining
+
+        assert await rate_limiter.limit_all([]) == []
+
+    @classmethod
+    @pytest.mark.parametrize("limiter_type", parametrizes.CONSUMING_LIMITER_TYPES)
+    async def test_limit_all__duplicate_keys(
+        cls, store: BaseStore, limiter_type: str
+    ) -> None:
+        limiter_cls = RateLimiterRegistry.get(limiter_type)
+        with pytest.raises(exceptions.DataError, match="keys must be unique"):
+            await limiter_cls(per_min(3), store).limit_all([("key", 1), ("key", 1)])
+
+    @classmethod
+    @pytest.mark.parametrize("limiter_type", constants.RateLimiterType.choice())
+    async def test_limit_all__not_supported(
+        cls, store: BaseStore, limiter_type: str
+    ) -> None:
+        limiter_cls = RateLimiterRegistry.get(limiter_type)
+        rate_limiter: BaseRateLimiter = limiter_cls(per_min(3), store)
+        rate_limiter._atomic_actions.pop(constants.ATOMIC_ACTION_TYPE_LIMIT_ALL, None)
+        with pytest.raises(exceptions.SetUpError, match="does not support limit_all"):
+            await rate_limiter.limit_all([("key", 1)])
+
+    @classmethod
+    @pytest.mark.parametrize("limiter_type", parametrizes.CONSUMING_LIMITER_TYPES)
+    async def test_release__not_supported(
+        cls, store: BaseStore, limiter_type: str
+    ) -> None:
+        rate_limiter: BaseRateLimiter = RateLimiterRegistry.get(limiter_type)(
+            per_min(3), store
+        )
+        with pytest.raises(exceptions.SetUpError, match="does not support release"):
+            await rate_limiter.release("key", Lease(id=1, cost=1))
+
+    @classmethod
+    @pytest.mark.parametrize("limiter_type", constants.RateLimiterType.choice())
+    async def test_prepare_key__hash_tag(cls, limiter_type: str) -> None:
+        store = MemoryStore(options={"KEY_LAYOUT": constants.KeyLayout.HASH_TAG.value})
+        rate_limiter: BaseRateLimiter = _build_rate_limiter(limiter_type, store)
+        prefix: str = f"throttled:v1:{limiter_type}:"
+        assert rate_limiter._prepare_key("user") == prefix + "{user}"
+        assert rate_limiter._prepare_key("{tenant}:user") == prefix + "{tenant}:user"
+
+        assert (await rate_limiter.limit("user")).limited is False
+        assert (await rate_limiter.peek("user")).remaining == 0
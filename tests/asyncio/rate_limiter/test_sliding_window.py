@@ -43,15 +43,15 @@ class TestSlidingWindowRateLimiter:
         quota: Quota = Quota(Rate(period=timedelta(minutes=1), limit=limit))
 
         rate_limiter: BaseRateLimiter = rate_limiter_constructor(quota)
-        store_key: str = (
-            f"throttled:v1:sliding_window:key:period:{utils.now_sec() // period}"
-        )
+        store_key: str = "throttled:v1:sliding_window:key"
         assert await rate_limiter._store.exists(store_key) is False
 
         for case in parametrizes.SLIDING_WINDOW_LIMIT_CASES:
             result: RateLimitResult = await rate_limiter.limit("key", cost=case["cost"])
             assert_rate_limit_result(case["limited"], case["remaining"], quota, result)
-            assert await rate_limiter._store.get(store_key) == case["count"]
+            counter = await rate_limiter._store.hgetall(store_key)
+            assert int(counter["window"]) == utils.now_sec() // period
+            assert int(counter["current"]) == case["count"]
             if "ttl" in case:
                 assert await rate_limiter._store.ttl(store_key) == case["ttl"]
 
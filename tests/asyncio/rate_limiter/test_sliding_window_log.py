@@ -0,0 +1,132 @@
+import asyncio
+from collections.abc import Callable
+from datetime import timedelta
+
+import pytest
+from throttled.asyncio import (
+    BaseRateLimiter,
+    BaseStore,
+    MemoryStore,
+    Quota,
+    RateLimiterRegistry,
+    RateLimiterType,
+    RateLimitResult,
+    RateLimitState,
+    per_duration,
+    per_min,
+    types,
+    utils,
+)
+
+from ...rate_limiter import parametrizes
+from ...rate_limiter.test_sliding_window_log import assert_rate_limit_result
+
+
+@pytest.fixture
+def rate_limiter_constructor(
+    store: BaseStore,
+) -> Callable[[Quota], BaseRateLimiter]:
+    def _create_rate_limiter(quota: Quota) -> BaseRateLimiter:
+        return RateLimiterRegistry.get(RateLimiterType.SLIDING_WINDOW_LOG.value)(
+            quota, store
+        )
+
+    return _create_rate_limiter
+
+
+@pytest.mark.asyncio
+class TestSlidingWindowLogRateLimiter:
+    async def test_limit(
+        self, rate_limiter_constructor: Callable[[Quota], BaseRateLimiter]
+    ):
+        quota: Quota = per_min(5)
+        rate_limiter: BaseRateLimiter = rate_limiter_constructor(quota)
+        for case in parametrizes.SLIDING_WINDOW_LOG_LIMIT_CASES:
+            result: RateLimitResult = await rate_limiter.limit("key", cost=case["cost"])
+            assert_rate_limit_result(case, quota, result)
+
+    async def test_limit__retry_after(
+        self, rate_limiter_constructor: Callable[[Quota], BaseRateLimiter]
+    ):
+        rate_limiter: BaseRateLimiter = rate_limiter_constructor(
+            per_duration(timedelta(seconds=1), 3)
+        )
+        await rate_limiter.limit("key")
+        await asyncio.sleep(0.3)
+        await rate_limiter.limit("key", cost=2)
+
+        result: RateLimitResult = await rate_limiter.limit("key")
+        assert result.limited is True
+        assert result.state.retry_after == pytest.approx(0.7, abs=0.05)
+
+        await asyncio.sleep(result.state.retry_after + 0.01)
+        assert (await rate_limiter.limit("key")).limited is False
+        assert (await rate_limiter.limit("key")).limited is True
+
+    async def test_limit__sub_second_period(
+        self, rate_limiter_constructor: Callable[[Quota], BaseRateLimiter]
+    ):
+        rate_limiter: BaseRateLimiter = rate_limiter_constructor(
+            per_duration(timedelta(milliseconds=200), 2)
+        )
+        assert [(await rate_limiter.limit("key")).limited for __ in range(3)] == [
+            False,
+            False,
+            True,
+        ]
+
+        await asyncio.sleep(0.21)
+        assert (await rate_limiter.limit("key")).limited is False
+
+    async def test_limit__memory_bounded(self):
+        store: MemoryStore = MemoryStore()
+        rate_limiter: BaseRateLimiter = RateLimiterRegistry.get(
+            RateLimiterType.SLIDING_WINDOW_LOG.value
+        )(per_min(3), store)
+        for __ in range(10):
+            await rate_limiter.limit("key")
+
+        log = store._backend.get_log("throttled:v1:sliding_window_log:key")
+        assert log is not None and len(log) == 3 and log.maxlen == 3
+
+    @parametrizes.LIMIT_C_QUOTA
+    @parametrizes.LIMIT_C_REQUESTS_NUM
+    async def test_limit__concurrent(
+        self,
+        benchmark: utils.Benchmark,
+        rate_limiter_constructor: Callable[[Quota], BaseRateLimiter],
+        quota: Quota,
+        requests_num: int,
+    ):
+        def _callback(elapsed: types.TimeLikeValueT, *args, **kwargs):
+            accessed_num: int = requests_num - sum(results)
+            limit: int = min(requests_num, quota.get_limit())
+            # Logged requests only leave the window once a period has elapsed.
+            windows: int = 1 + int(elapsed // quota.get_period_sec())
+            assert limit <= accessed_num <= limit * windows
+
+        async def _task():
+            result = await rate_limiter.limit("key")
+            return result.limited
+
+        with utils.Timer(callback=_callback):
+            rate_limiter: BaseRateLimiter = rate_limiter_constructor(quota)
+            results: list[bool] = await benchmark.async_concurrent(
+                task=_task, batch=requests_num
+            )
+
+    async def test_peek(
+        self, rate_limiter_constructor: Callable[[Quota], BaseRateLimiter]
+    ):
+        key: str = "key"
+        rate_limiter: BaseRateLimiter = rate_limiter_constructor(per_min(2))
+        assert await rate_limiter.peek(key) == RateLimitState(
+            limit=2, remaining=2, reset_after=0
+        )
+
+        await rate_limiter.limit(key)
+        await rate_limiter.limit(key)
+        state: RateLimitState = await rate_limiter.peek(key)
+        assert state.remaining == 0
+        assert state.reset_after == pytest.approx(60, abs=0.1)
+        assert state.retry_after == pytest.approx(60, abs=0.1)
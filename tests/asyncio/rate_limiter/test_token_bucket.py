@@ -1,5 +1,6 @@
 import asyncio
 from collections.abc import Callable
+from datetime import timedelta
 
 import pytest
 from throttled.asyncio import (
@@ -10,6 +11,7 @@ from throttled.asyncio import (
     RateLimitResult,
     RateLimitState,
     constants,
+    per_duration,
     per_min,
     types,
     utils,
@@ -83,8 +85,25 @@ class TestTokenBucketRateLimiter:
 
         await rate_limiter.limit(key, cost=5)
         state = await rate_limiter.peek(key)
-        assert state == RateLimitState(limit=10, remaining=5, reset_after=5)
+        assert (state.limit, state.remaining) == (10, 5)
+        assert state.reset_after == pytest.approx(5, abs=0.1)
 
         await asyncio.sleep(1)
         state = await rate_limiter.peek(key)
-        assert state == RateLimitState(limit=10, remaining=6, reset_after=4)
+        assert (state.limit, state.remaining) == (10, 6)
+        assert state.reset_after == pytest.approx(4, abs=0.2)
+
+    async def test_limit__sub_second_period(
+        self, rate_limiter_constructor: Callable[[Quota], BaseRateLimiter]
+    ):
+        # One token is refilled every 20ms, rather than 5 tokens every 100ms.
+        quota: Quota = per_duration(timedelta(milliseconds=100), limit=5)
+        rate_limiter: BaseRateLimiter = rate_limiter_constructor(quota)
+        assert (await rate_limiter.limit("key", cost=5)).limited is False
+
+        result: RateLimitResult = await rate_limiter.limit("key", cost=2)
+        assert result.limited is True
+        assert 0 < result.state.retry_after <= 0.04
+
+        await asyncio.sleep(result.state.retry_after + 0.005)
+        assert (await rate_limiter.limit("key", cost=2)).limited is False
@@ -1,5 +1,15 @@
+import asyncio
+
 import pytest
-from throttled.asyncio import MemoryStore, constants
+from throttled.asyncio import (
+    ManualClock,
+    MemoryStore,
+    Throttled,
+    constants,
+    exceptions,
+)
+
+from ...rate_limiter import parametrizes
 
 
 @pytest.fixture
@@ -24,3 +34,133 @@ class TestMemoryStore:
                 assert await store.ttl(key) == constants.STORE_TTL_STATE_NOT_EXIST
 
             assert await store.exists(key) is exists
+
+    @pytest.mark.parametrize(
+        "options",
+        [
+            {"SHARDS": 0},
+            {"SHARDS": "4"},
+            {"MAX_SIZE": 2, "SHARDS": 4},
+        ],
+    )
+    async def test_constructor__invalid_shards(self, options: dict[str, object]):
+        with pytest.raises(
+            exceptions.SetUpError, match="SHARDS must be a positive integer"
+        ):
+            MemoryStore(options=options)
+
+    async def test_set__overflow__shards(self):
+        timeout: int = 10
+        store: MemoryStore = MemoryStore(options={"MAX_SIZE": 64, "SHARDS": 4})
+        assert [segment.max_size for segment in store._backend.segments] == [16] * 4
+
+        keys: list[str] = [str(idx) for idx in range(256)]
+        for key in keys:
+            await store.set(key, 1, timeout)
+
+        # Capacity is enforced per shard, and the most recent key always survives.
+        for segment in store._backend.segments:
+            assert len(segment.get_client()) <= segment.max_size
+        assert await store.get(keys[-1]) == 1
+
+        # The lock of the first segment is still reachable, with a warning.
+        with pytest.warns(DeprecationWarning, match="get_lock"):
+            assert store._backend.lock is store._backend.locks[0]
+
+    @pytest.mark.parametrize("using", parametrizes.CONSUMING_LIMITER_TYPES)
+    async def test_limit__shards__concurrent(self, using: str):
+        store: MemoryStore = MemoryStore(options={"SHARDS": 8})
+        throttle: Throttled = Throttled(using=using, quota="100/h", store=store)
+        keys: list[str] = [f"key-{idx}" for idx in range(8)]
+
+        async def _call() -> None:
+            for _ in range(50):
+                await throttle.limit_all([(key, 1) for key in keys])
+
+        await asyncio.gather(*[_call() for _ in range(4)])
+
+        # Multi-key operations across shards neither deadlock nor lose updates.
+        states = [await throttle.peek(key) for key in keys]
+        assert [state.remaining for state in states] == [0] * len(keys)
+
+    @pytest.mark.parametrize(
+        ("options", "match"),
+        [
+            ({"SWEEP_INTERVAL": -1}, "SWEEP_INTERVAL must be a non-negative number"),
+            ({"SWEEP_BATCH_SIZE": 0}, "SWEEP_BATCH_SIZE must be a positive integer"),
+        ],
+    )
+    async def test_constructor__invalid_sweep(
+        self, options: dict[str, object], match: str
+    ):
+        with pytest.raises(exceptions.SetUpError, match=match):
+            MemoryStore(options=options)
+
+    async def test_clock(self):
+        clock: ManualClock = ManualClock()
+        store: MemoryStore = MemoryStore(options={"CLOCK": clock})
+        await store.set("key", 1, 10)
+        clock.advance(9.5)
+        assert await store.ttl("key") == 1
+        assert await store.get("key") == 1
+
+        clock.advance(0.5)
+        assert await store.get("key") is None
+        assert await store.ttl("key") == constants.STORE_TTL_STATE_NOT_EXIST
+
+    async def test_sweep(self):
+        clock: ManualClock = ManualClock()
+        store: MemoryStore = MemoryStore(
+            options={"SHARDS": 2, "SWEEP_BATCH_SIZE": 2, "CLOCK": clock}
+        )
+        for idx in range(5):
+            await store.set(f"expired-{idx}", idx, 1)
+            await store.set(f"alive-{idx}", idx, 10)
+
+        assert await store._backend.sweep() == 0
+        # Keys are indexed by the second they expire in, wait for it to pass.
+        clock.advance(2.1)
+
+        # Expired keys are removed without being touched, in multiple batches.
+        assert await store._backend.sweep() == 5
+        clients = [segment.get_client() for segment in store._backend.segments]
+        assert sorted(key for client in clients for key in client) == sorted(
+            f"alive-{idx}" for idx in range(5)
+        )
+
+    async def test_constructor__invalid_eviction_policy(self):
+        with pytest.raises(
+            exceptions.SetUpError, match="EVICTION_POLICY must be one of"
+        ):
+            MemoryStore(options={"EVICTION_POLICY": "fifo"})
+
+    @pytest.mark.parametrize("policy", constants.MemoryEvictionPolicy.choice())
+    async def test_set__overflow__eviction_policy(self, policy: str):
+        store: MemoryStore = MemoryStore(
+            options={"MAX_SIZE": 100, "SHARDS": 2, "EVICTION_POLICY": policy}
+        )
+        for idx in range(1000):
+            await store.set(str(idx), idx, idx % 10 + 1)
+            await store.get(str(idx // 2))
+
+        for segment in store._backend.segments:
+            assert len(segment.get_client()) <= segment.max_size
+            # Evicted keys are dropped from the expiration index.
+            indexed: int = sum(len(keys) for keys in segment._expire_slots.values())
+            assert indexed == len(segment.get_client())
+        assert await store.get("999") == 999
+
+    async def test_sweeper(self):
+        clock: ManualClock = ManualClock()
+        store: MemoryStore = MemoryStore(options={"SWEEP_INTERVAL": 0.1, "CLOCK": clock})
+        # The sweeper task is started on the first locked access.
+        assert store._backend._sweeper is None
+        await store.set("key", 1, 1)
+        assert store._backend._sweeper is not None
+
+        clock.advance(2.1)
+        await asyncio.sleep(0.3)
+        assert "key" not in store._backend.get_client()
+
+        store._backend.stop_sweeper()
+        assert store._backend._sweeper is None
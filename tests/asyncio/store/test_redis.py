@@ -0,0 +1,440 @@
+import asyncio
+import time
+from collections.abc import AsyncGenerator, Callable, Coroutine
+from typing import TYPE_CHECKING, Any, cast
+
+import pytest
+import pytest_asyncio
+from fakeredis import FakeServer
+from fakeredis.aioredis import FakeConnection, FakeRedis
+from redis.asyncio import BlockingConnectionPool, Redis
+from redis.exceptions import ResponseError
+from throttled.asyncio import (
+    RateLimiterRegistry,
+    RateLimiterType,
+    RateLimitResult,
+    RedisStore,
+    exceptions,
+    per_min,
+)
+from throttled.asyncio.store.redis import ClientTracker
+from throttled.constants import RedisScriptMode
+from throttled.store import ClientCacheStats, PoolStats, ScriptRegistry
+
+if TYPE_CHECKING:
+    from throttled.asyncio.store.redis import AutoPipeline
+    from throttled.store.redis_pool import AsyncPoolStatsMixin
+
+
+def _create_store(**options: Any) -> RedisStore:
+    return RedisStore(
+        options={
+            "REDIS_CLIENT_CLASS": "fakeredis.aioredis.FakeRedis",
+            "CONNECTION_POOL_KWARGS": {"connection_class": FakeConnection},
+            **options,
+        }
+    )
+
+
+@pytest_asyncio.fixture
+async def store() -> AsyncGenerator[RedisStore, Any]:
+    store: RedisStore = _create_store(AUTO_PIPELINE=True)
+    yield store
+    await store._backend.get_client().flushall()
+
+
+def _count_batches(monkeypatch: pytest.MonkeyPatch, store: RedisStore) -> list[int]:
+    auto_pipeline: AutoPipeline | None = store._backend.get_auto_pipeline()
+    assert auto_pipeline is not None
+
+    batches: list[int] = []
+    execute = auto_pipeline._execute
+
+    async def _execute(batch: list[Any]) -> None:
+        batches.append(len(batch))
+        await execute(batch)
+
+    monkeypatch.setattr(auto_pipeline, "_execute", _execute)
+    return batches
+
+
+def _use_replica(monkeypatch: pytest.MonkeyPatch, store: RedisStore) -> FakeRedis:
+    # A Redis server of its own, which never receives the writes of limit().
+    replica = FakeRedis(server=FakeServer())
+    monkeypatch.setattr(
+        store._backend._connection_factory, "connect_replica", lambda url: replica
+    )
+    return replica
+
+
+async def _emulate_tracking(monkeypatch: pytest.MonkeyPatch, store: RedisStore) -> None:
+    """Emulate CLIENT TRACKING, which fakeredis lacks, and wait for the tracker.
+
+    Invalidations are published by hand.
+    """
+    monkeypatch.setattr(ClientTracker, "_get_tracking_args", lambda *_: ["PING"])
+    deadline: float = time.monotonic() + 5
+    while not store.client_cache_stats().enabled:
+        assert time.monotonic() < deadline
+        await asyncio.sleep(0.01)
+
+
+def _emulate_functions(monkeypatch: pytest.MonkeyPatch, client: Any) -> list[str]:
+    """Emulate FUNCTION LOAD / FCALL with EVAL, which fakeredis lacks."""
+    calls: list[str] = []
+    libraries: list[str] = []
+
+    async def _function_load(code: str, replace: bool = False) -> str:
+        libraries.append(code.split("\n", 1)[1])
+        return code.split("name=", 1)[1].split("\n", 1)[0]
+
+    def _fcall(command: str) -> Callable[..., Coroutine[Any, Any, Any]]:
+        async def _call(function: str, numkeys: int, *keys_and_args: Any) -> Any:
+            calls.append(command)
+            # Run the library in a script, with the function to call as the
+            # first argument.
+            script: str = "\n".join(
+                [
+                    "local functions = {}",
+                    "local function register_function(f)",
+                    "    functions[f.function_name] = f.callback",
+                    "end",
+                    libraries[-1].replace(
+                        "redis.register_function", "register_function"
+                    ),
+                    "local name = table.remove(ARGV, 1)",
+                    "return functions[name](KEYS, ARGV)",
+                ]
+            )
+            keys, args = keys_and_args[:numkeys], keys_and_args[numkeys:]
+            return await client.eval(script, numkeys, *keys, function, *args)
+
+        return _call
+
+    monkeypatch.setattr(client, "function_load", _function_load)
+    monkeypatch.setattr(client, "fcall", _fcall("fcall"))
+    monkeypatch.setattr(client, "fcall_ro", _fcall("fcall_ro"))
+    return calls
+
+
+@pytest.mark.asyncio
+class TestRedisStore:
+    async def test_preload_scripts(self):
+        store: RedisStore = _create_store()
+        client = cast("Redis", store._backend.get_client())
+        await client.script_flush()
+
+        shas: list[str] = await store.preload_scripts()
+        assert shas == list(ScriptRegistry.get_scripts())
+        assert all(await client.script_exists(*shas))
+
+    async def test_execute_script__function(self, monkeypatch: pytest.MonkeyPatch):
+        store: RedisStore = _create_store(SCRIPT_MODE=RedisScriptMode.FUNCTION.value)
+        calls: list[str] = _emulate_functions(monkeypatch, store._backend.get_client())
+
+        for using in RateLimiterType.choice():
+            limiter = RateLimiterRegistry.get(using)(per_min(1), store)
+            assert (await limiter.limit(using)).limited is False
+            assert (await limiter.limit(using)).limited is True
+            assert (await limiter.peek(using)).remaining == 0
+
+        # GCRA, sliding window log and concurrency peek by read-only functions.
+        assert calls.count("fcall_ro") == 3
+        assert calls.count("fcall") == 2 * len(RateLimiterType.choice())
+
+    async def test_execute_script__function_missing(
+        self, monkeypatch: pytest.MonkeyPatch
+    ):
+        store: RedisStore = _create_store(SCRIPT_MODE=RedisScriptMode.FUNCTION.value)
+        client = store._backend.get_client()
+        _emulate_functions(monkeypatch, client)
+        limiter = RateLimiterRegistry.get(RateLimiterType.GCRA.value)(per_min(1), store)
+        assert (await limiter.limit("missing")).limited is False
+
+        async def _fcall(*args: Any) -> Any:
+            raise ResponseError("ERR Function not found")
+
+        monkeypatch.setattr(client, "fcall", _fcall)
+        loads: list[bool] = []
+        load_functions = store._backend.load_functions
+
+        async def _load_functions() -> bool:
+            loads.append(await load_functions())
+            return loads[-1]
+
+        monkeypatch.setattr(store._backend, "load_functions", _load_functions)
+
+        # The library is loaded again, and the call falls back to EVALSHA.
+        assert (await limiter.limit("missing")).limited is True
+        assert loads == [True]
+
+    async def test_execute_script__function_unsupported(self):
+        # fakeredis does not support FUNCTION, scripts fall back to EVALSHA.
+        store: RedisStore = _create_store(SCRIPT_MODE=RedisScriptMode.FUNCTION.value)
+        limiter = RateLimiterRegistry.get(RateLimiterType.GCRA.value)(per_min(1), store)
+        assert (await limiter.limit("unsupported")).limited is False
+        assert (await limiter.limit("unsupported")).limited is True
+        assert store._backend.uses_functions() is False
+
+    async def test_script_mode__invalid(self):
+        with pytest.raises(
+            exceptions.SetUpError, match="SCRIPT_MODE must be one of eval, function"
+        ):
+            _create_store(SCRIPT_MODE="fcall")
+
+    async def test_execute_script__reload(self, monkeypatch: pytest.MonkeyPatch):
+        store: RedisStore = _create_store()
+        limiter = RateLimiterRegistry.get(RateLimiterType.GCRA.value)(per_min(1), store)
+        client = cast("Redis", store._backend.get_client())
+        await client.flushall()
+        await client.script_flush()
+
+        loads: list[list[str]] = []
+        load_scripts = store._backend.load_scripts
+
+        async def _load_scripts() -> list[str]:
+            loads.append(await load_scripts())
+            return loads[-1]
+
+        monkeypatch.setattr(store._backend, "load_scripts", _load_scripts)
+
+        # A missing script reloads all scripts at once.
+        assert (await limiter.limit("key")).limited is False
+        assert (await limiter.peek("key")).remaining == 0
+        assert len(loads) == 1
+        assert all(await client.script_exists(*loads[0]))
+
+        # Once a connection has reconnected, e.g. after a failover, all scripts
+        # are loaded again before the next call instead of on a miss.
+        await client.script_flush()
+        reconnected: int = store.pool_stats().reconnected
+        pool = cast("AsyncPoolStatsMixin", client.connection_pool)
+        connection = await pool.acquire()
+        await connection.disconnect()
+        await connection.connect()
+        await pool.release(connection)
+        assert store.pool_stats().reconnected == reconnected + 1
+
+        await store._backend.ensure_scripts()
+        await store._backend.ensure_scripts()
+        assert len(loads) == 2
+        assert all(await client.script_exists(*loads[1]))
+
+    @pytest.mark.parametrize("using", RateLimiterType.choice())
+    async def test_read_from_replicas(self, monkeypatch: pytest.MonkeyPatch, using: str):
+        store: RedisStore = _create_store(READ_FROM_REPLICAS=True)
+        _use_replica(monkeypatch, store)
+        limiter = RateLimiterRegistry.get(using)(per_min(1), store)
+
+        assert (await limiter.limit(f"replica-{using}")).limited is False
+        # Peeks are served by the replica, which has not seen the write yet.
+        assert (await limiter.peek(f"replica-{using}")).remaining == 1
+
+    async def test_read_from_replicas__max_lag(self, monkeypatch: pytest.MonkeyPatch):
+        store: RedisStore = _create_store(READ_FROM_REPLICAS=True, REPLICA_MAX_LAG=1)
+        _use_replica(monkeypatch, store)
+        info: dict[str, Any] = {
+            "role": "master",
+            "master_repl_offset": 200,
+            "slave0": {"state": "online", "offset": 100},
+        }
+
+        async def _info(section: str, **kwargs: Any) -> dict[str, Any]:
+            return info
+
+        # The lag is checked on the primary.
+        monkeypatch.setattr(store._backend.get_client(), "info", _info)
+        await store.set("lag", 1, 60)
+
+        # Reads go to the primary while replicas lag behind.
+        assert await store.get("lag") == 1
+
+        # The lag is checked again after replica_check_interval, the replica has
+        # caught up with the primary as of the previous check.
+        info.update(master_repl_offset=300, slave0={"state": "online", "offset": 200})
+        store._backend._replica_checked_at -= store._backend.replica_check_interval
+        assert await store.get("lag") is None
+
+    async def test_prewarm(self):
+        store: RedisStore = _create_store(MAX_CONNECTIONS=4, POOL_PREWARM=2)
+        assert await store.prewarm() == 2
+        # Connections beyond MAX_CONNECTIONS are not opened.
+        assert await store.prewarm(10) == 4
+
+        stats: PoolStats = store.pool_stats()
+        assert (stats.created, stats.in_use, stats.idle) == (4, 0, 4)
+        assert stats.max_connections == 4
+        assert stats.acquired == 6
+
+    async def test_pool_stats(self):
+        store: RedisStore = _create_store()
+        await asyncio.gather(*[store.get("pool-stats") for __ in range(3)])
+
+        stats: PoolStats = store.pool_stats()
+        # Connections are reused once released.
+        assert 1 <= stats.created == stats.idle <= 3
+        assert (stats.in_use, stats.acquired) == (0, 3)
+        assert stats.max_connections is None
+        assert stats.wait_time > 0
+
+    async def test_pool_timeout(self):
+        store: RedisStore = _create_store(MAX_CONNECTIONS=1, POOL_TIMEOUT=1)
+        pool: Any = store._backend.get_client().connection_pool
+        assert isinstance(pool, BlockingConnectionPool)
+
+        # Calls wait for a free connection rather than failing.
+        await asyncio.gather(*[store.get("pool-timeout") for __ in range(3)])
+        assert store.pool_stats().created == 1
+
+    async def test_execute_scripts__reload(self, monkeypatch: pytest.MonkeyPatch):
+        store: RedisStore = _create_store()
+        limiter = RateLimiterRegistry.get(RateLimiterType.GCRA.value)(per_min(1), store)
+        client = cast("Redis", store._backend.get_client())
+        await client.flushall()
+        await client.script_flush()
+
+        loads: list[list[str]] = []
+        load_scripts = store._backend.load_scripts
+
+        async def _load_scripts() -> list[str]:
+            loads.append(await load_scripts())
+            return loads[-1]
+
+        monkeypatch.setattr(store._backend, "load_scripts", _load_scripts)
+
+        # Missed calls are retried in order after one reload.
+        results: list[RateLimitResult] = await limiter.limit_many(
+            [("batch-a", 1), ("batch-b", 1), ("batch-a", 1)]
+        )
+        assert [result.limited for result in results] == [False, False, True]
+        assert len(loads) == 1
+
+    async def test_auto_pipeline__disabled(self):
+        assert _create_store()._backend.get_auto_pipeline() is None
+
+    @pytest.mark.parametrize("window", [-1, "0"])
+    async def test_auto_pipeline__invalid_window(self, window: Any):
+        with pytest.raises(
+            exceptions.SetUpError,
+            match="AUTO_PIPELINE_WINDOW must be a non-negative number",
+        ):
+            _create_store(AUTO_PIPELINE=True, AUTO_PIPELINE_WINDOW=window)
+
+    @pytest.mark.parametrize("using", RateLimiterType.choice())
+    async def test_auto_pipeline(
+        self, monkeypatch: pytest.MonkeyPatch, store: RedisStore, using: str
+    ):
+        batches: list[int] = _count_batches(monkeypatch, store)
+        limiter = RateLimiterRegistry.get(using)(per_min(5), store)
+
+        results: list[RateLimitResult] = await asyncio.gather(
+            *[limiter.limit("key") for __ in range(10)]
+        )
+        assert sum(result.limited for result in results) == 5
+        assert batches == [10]
+
+    async def test_auto_pipeline__window(self, monkeypatch: pytest.MonkeyPatch):
+        store: RedisStore = _create_store(AUTO_PIPELINE=True, AUTO_PIPELINE_WINDOW=0.05)
+        batches: list[int] = _count_batches(monkeypatch, store)
+        limiter = RateLimiterRegistry.get(RateLimiterType.GCRA.value)(per_min(5), store)
+
+        async def _limit(delay: float) -> RateLimitResult:
+            await asyncio.sleep(delay)
+            return await limiter.limit("key")
+
+        # Calls in different loop iterations are batched within the window.
+        await asyncio.gather(*[_limit(delay * 0.01) for delay in range(3)])
+        assert batches == [3]
+
+    async def test_auto_pipeline__max_size(self, monkeypatch: pytest.MonkeyPatch):
+        store: RedisStore = _create_store(AUTO_PIPELINE=True, AUTO_PIPELINE_MAX_SIZE=4)
+        batches: list[int] = _count_batches(monkeypatch, store)
+        limiter = RateLimiterRegistry.get(RateLimiterType.GCRA.value)(per_min(5), store)
+
+        await asyncio.gather(*[limiter.limit("key") for __ in range(10)])
+        assert batches == [4, 4, 2]
+
+    async def test_auto_pipeline__error(self, store: RedisStore):
+        client = store._backend.get_client()
+        ok_script = client.register_script("return tonumber(ARGV[1])")
+        error_script = client.register_script("return redis.error_reply('oops')")
+
+        auto_pipeline: AutoPipeline | None = store._backend.get_auto_pipeline()
+        assert auto_pipeline is not None
+        results: list[Any] = list(
+            await asyncio.gather(
+                auto_pipeline.execute(ok_script, [], [1]),
+                auto_pipeline.execute(error_script, [], []),
+                auto_pipeline.execute(ok_script, [], [2]),
+                return_exceptions=True,
+            )
+        )
+
+        # An error is only raised to the caller of the failing script.
+        assert results[0] == 1
+        assert results[2] == 2
+        assert isinstance(results[1], ResponseError)
+
+
+@pytest.mark.asyncio
+class TestRedisStoreClientCache:
+    @pytest.mark.parametrize(
+        "using",
+        [
+            RateLimiterType.FIXED_WINDOW.value,
+            RateLimiterType.SLIDING_WINDOW.value,
+            RateLimiterType.TOKEN_BUCKET.value,
+            RateLimiterType.LEAKING_BUCKET.value,
+        ],
+    )
+    async def test_client_cache(self, monkeypatch: pytest.MonkeyPatch, using: str):
+        store: RedisStore = _create_store(CLIENT_CACHE=True)
+        await _emulate_tracking(monkeypatch, store)
+        # The fake server is shared with other tests that use the same keys.
+        await cast("Redis", store._backend.get_client()).flushall()
+        limiter = RateLimiterRegistry.get(using)(per_min(5), store)
+
+        await limiter.limit(f"cache-{using}")
+        # Peeks are answered locally until the key changes.
+        assert (await limiter.peek(f"cache-{using}")).remaining == 4
+        assert (await limiter.peek(f"cache-{using}")).remaining == 4
+        stats: ClientCacheStats = store.client_cache_stats()
+        assert (stats.hits, stats.misses, stats.size) == (1, 1, 1)
+
+        # Writes of the same process are visible right away.
+        await limiter.limit(f"cache-{using}")
+        assert (await limiter.peek(f"cache-{using}")).remaining == 3
+        assert store.client_cache_stats().misses == 2
+
+    async def test_client_cache__invalidate(self, monkeypatch: pytest.MonkeyPatch):
+        store: RedisStore = _create_store(CLIENT_CACHE=True)
+        await _emulate_tracking(monkeypatch, store)
+        await store.set("throttled:invalidate", 1, 60)
+        assert await store.get("throttled:invalidate") == 1
+
+        # Another process changes the key, Redis reports it as invalidated.
+        client = cast("Redis", store._backend.get_client())
+        await client.set("throttled:invalidate", 2)
+        assert await store.get("throttled:invalidate") == 1
+        await client.publish(ClientTracker.CHANNEL, "throttled:invalidate")
+
+        deadline: float = time.monotonic() + 5
+        while await store.get("throttled:invalidate") != 2:
+            assert time.monotonic() < deadline
+            await asyncio.sleep(0.01)
+
+    async def test_client_cache__unsupported(self):
+        # fakeredis does not support CLIENT TRACKING, reads are not cached.
+        store: RedisStore = _create_store(CLIENT_CACHE=True)
+        await store.set("throttled:unsupported", 1, 60)
+        tracker: ClientTracker | None = store._backend._client_tracker
+        assert tracker is not None
+
+        deadline: float = time.monotonic() + 5
+        while tracker.supported:
+            assert await store.get("throttled:unsupported") == 1
+            assert time.monotonic() < deadline
+            await asyncio.sleep(0.01)
+        assert await store.get("throttled:unsupported") == 1
+        assert store.client_cache_stats().hits == 0
+        assert store.pool_stats().in_use == 0
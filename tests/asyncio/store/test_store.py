@@ -156,6 +156,19 @@ _REDIS_STORE_PARSE_COMMON_OPTIONS: dict[str, Any] = {
     "REUSE_CONNECTION": False,
     "REDIS_CLIENT_CLASS": "redis.asyncio.Redis",
     "PARSER_CLASS": "redis.asyncio.connection.DefaultParser",
+    "AUTO_PIPELINE": False,
+    "AUTO_PIPELINE_WINDOW": 0,
+    "AUTO_PIPELINE_MAX_SIZE": 1024,
+    "SCRIPT_MODE": "eval",
+    "READ_FROM_REPLICAS": False,
+    "REPLICA_MAX_LAG": None,
+    "MAX_CONNECTIONS": None,
+    "POOL_TIMEOUT": None,
+    "POOL_PREWARM": 0,
+    "HEALTH_CHECK_INTERVAL": None,
+    "CLIENT_CACHE": False,
+    "CLIENT_CACHE_MAX_SIZE": 10000,
+    "CLIENT_CACHE_PREFIXES": ["throttled:"],
 }
 
 _REDIS_STORE_PARSE_SENTINEL_OPTIONS: dict[str, Any] = {
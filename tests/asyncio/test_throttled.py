@@ -1,11 +1,14 @@
+import asyncio
 from collections.abc import Awaitable, Callable, Coroutine
 from functools import partial
 from typing import Any, cast
 
 import pytest
 from throttled.asyncio import (
+    ManualClock,
     RateLimiterType,
     Throttled,
+    constants,
     exceptions,
     per_sec,
     rate_limiter,
@@ -14,7 +17,11 @@ from throttled.asyncio import (
     utils,
 )
 from throttled.asyncio.hooks import Hook
-from throttled.rate_limiter import RateLimitResult
+from throttled.rate_limiter import RateLimitResult, RateLimitState
+
+from ..rate_limiter import parametrizes
+
+EXPECTED_MULTI_RULES_LIMIT = 2
 
 
 @pytest.fixture
@@ -70,6 +77,42 @@ class TestThrottled:
         async with utils.Timer(callback=partial(_callback, 0, 0.1)):
             assert (await throttle.limit("key", timeout=0.5)).limited
 
+    @classmethod
+    @pytest.mark.parametrize("using", parametrizes.CONSUMING_LIMITER_TYPES)
+    async def test_limit__manual_clock(cls, using: str) -> None:
+        clock: ManualClock = ManualClock()
+        mem_store: store.MemoryStore = store.MemoryStore(options={"CLOCK": clock})
+        throttle: Throttled = Throttled(
+            key="key", using=using, quota=rate_limiter.per_min(60), store=mem_store
+        )
+
+        # Simulate an hour of traffic, at twice the quota, in no time.
+        allowed: int = 0
+        for _ in range(7200):
+            allowed += not (await throttle.limit()).limited
+            clock.advance(0.5)
+        # Bucket algorithms let the burst of 60 through first.
+        assert 3600 <= allowed <= 3660
+
+    @classmethod
+    async def test_limit__manual_clock_timeout(cls) -> None:
+        clock: ManualClock = ManualClock()
+        mem_store: store.MemoryStore = store.MemoryStore(options={"CLOCK": clock})
+        throttle: Throttled = Throttled(
+            key="key", timeout=60, quota=rate_limiter.per_min(60), store=mem_store
+        )
+
+        def _callback(
+            elapsed: types.TimeLikeValueT, *args: object, **kwargs: object
+        ) -> None:
+            assert elapsed < 1
+
+        # Blocking waits sleep on the clock of the store.
+        async with utils.Timer(callback=_callback):
+            for _ in range(120):
+                assert not (await throttle.limit()).limited
+        assert 59 <= clock.monotonic() <= 61
+
     @classmethod
     async def test_enter(cls) -> None:
         construct_kwargs: dict[str, Any] = {
@@ -88,12 +131,56 @@ class TestThrottled:
         assert raised_result is not None
         assert raised_result.limited
         assert raised_result.state.remaining == 0
-        assert raised_result.state.reset_after == 1
-        assert raised_result.state.retry_after == 1
+        assert raised_result.state.reset_after == pytest.approx(1, abs=0.1)
+        assert raised_result.state.retry_after == pytest.approx(1, abs=0.1)
 
         async with Throttled(**construct_kwargs, timeout=1) as rate_limit_result:
             assert not rate_limit_result.limited
 
+    @classmethod
+    async def test_limit_many(cls) -> None:
+        throttle: Throttled = Throttled(
+            key="default", quota=per_sec(1), store=store.MemoryStore()
+        )
+        results: list[RateLimitResult] = await throttle.limit_many(
+            [
+                ("a", 1),
+                ("b", 1),
+                ("a", 1),
+                (None, 1),
+            ]
+        )
+        assert [result.limited for result in results] == [False, False, True, False]
+        # Keys fall back to the instance key.
+        assert (await throttle.limit()).limited
+
+    @classmethod
+    async def test_limit_many__raise(cls) -> None:
+        throttle: Throttled = Throttled(quota=per_sec(1))
+        with pytest.raises(exceptions.DataError, match="Invalid cost"):
+            await throttle.limit_many([("a", -1)])
+
+        with pytest.raises(exceptions.DataError, match="Invalid key"):
+            await throttle.limit_many([(None, 1)])
+
+    @classmethod
+    async def test_limit_all(cls) -> None:
+        throttle: Throttled = Throttled(
+            key="tenant", quota="1/m burst 2", store=store.MemoryStore()
+        )
+        results: list[RateLimitResult] = await throttle.limit_all(
+            [
+                ("user", 1),
+                (None, 2),
+            ]
+        )
+        assert [result.limited for result in results] == [False, False]
+
+        # The tenant quota is exhausted, so the user quota is not consumed.
+        results = await throttle.limit_all([("user", 1), (None, 1)])
+        assert [result.limited for result in results] == [True, True]
+        assert not (await throttle.limit("user")).limited
+
     @classmethod
     async def test_constructor__string_quota(cls) -> None:
         throttle: Throttled = Throttled(
@@ -104,14 +191,129 @@ class TestThrottled:
         assert not (await throttle.limit()).limited
 
     @classmethod
-    async def test_constructor__reject_multi_rules_string(cls) -> None:
-        with pytest.raises(exceptions.DataError, match="multiple quota rules"):
+    @pytest.mark.parametrize("using", parametrizes.CONSUMING_LIMITER_TYPES)
+    async def test_limit__multi_rules(cls, using: str) -> None:
+        # Fixed windows of both rules end together, 18.75 seconds before the hour.
+        clock: ManualClock = ManualClock(start=7200 - 18.75)
+        throttle: Throttled = Throttled(
+            key="quota-multi",
+            using=using,
+            quota="3/m; 2/h",
+            store=store.MemoryStore(options={"CLOCK": clock}),
+        )
+        for _ in range(2):
+            assert not (await throttle.limit()).limited
+
+        # The hourly rule is the most restrictive one and denies the request.
+        result: RateLimitResult = await throttle.limit()
+        assert result.limited
+        assert result.state.limit == EXPECTED_MULTI_RULES_LIMIT
+        assert result.state.retry_after > 0
+
+        state: RateLimitState = await throttle.peek("quota-multi")
+        assert state.limit == EXPECTED_MULTI_RULES_LIMIT
+        assert state.remaining == 0
+
+    @classmethod
+    @pytest.mark.parametrize("using", parametrizes.CONSUMING_LIMITER_TYPES)
+    async def test_limit__multi_rules_hash_tag(cls, using: str) -> None:
+        mem_store: store.MemoryStore = store.MemoryStore(
+            options={"KEY_LAYOUT": constants.KeyLayout.HASH_TAG.value}
+        )
+        throttle: Throttled = Throttled(
+            key="quota-multi", using=using, quota="3/m; 2/h", store=mem_store
+        )
+        assert not (await throttle.limit()).limited
+
+        # The keys of all quota rules share the hash tag of the subject, so they
+        # are stored in the same Redis Cluster slot.
+        keys: list[str] = [
+            f"throttled:v1:{using}:{{quota-multi}}:{rule}"
+            for rule in ["3/60s", "2/3600s"]
+        ]
+        assert all([await mem_store.exists(key) for key in keys])
+        assert {utils.get_hash_tag(key) for key in keys} == {"quota-multi"}
+
+    @classmethod
+    async def test_constructor__multi_rules_raise(cls) -> None:
+        with pytest.raises(exceptions.DataError, match="duplicate quota rules"):
             Throttled(
-                key="quota-multi",
-                quota="1/s; 10/m",
-                store=store.MemoryStore(),
+                key="quota-multi", quota="1/s; 60/m; 1/s", store=store.MemoryStore()
             )
 
+        throttle: Throttled = Throttled(
+            key="quota-multi", quota="1/s burst 2; 10/m", store=store.MemoryStore()
+        )
+        with pytest.raises(exceptions.DataError, match="multiple quota rules"):
+            await throttle.limit_many([("user", 1)])
+        with pytest.raises(exceptions.DataError, match="multiple quota rules"):
+            await throttle.limit_all([("user", 1)])
+        with pytest.raises(exceptions.DataError, match="concurrency is not supported"):
+            Throttled(using=RateLimiterType.CONCURRENCY.value, quota="1/s; 10/m")
+
+    @classmethod
+    async def test_enter__concurrency(cls) -> None:
+        throttle: Throttled = Throttled(
+            key="key",
+            using=RateLimiterType.CONCURRENCY.value,
+            quota=rate_limiter.per_min(1),
+            store=store.MemoryStore(),
+        )
+        async with throttle as rate_limit_result:
+            assert rate_limit_result.lease is not None
+            with pytest.raises(exceptions.LimitedError):
+                async with throttle:
+                    pass
+
+        with pytest.raises(ValueError, match="boom"):
+            async with throttle:
+                raise ValueError("boom")
+        assert (await throttle.peek("key")).remaining == 1
+
+    @classmethod
+    async def test_demo__concurrency(cls) -> None:
+        throttle: Throttled = Throttled(
+            key="/api/product",
+            using=RateLimiterType.CONCURRENCY.value,
+            quota=rate_limiter.per_min(1),
+            store=store.MemoryStore(),
+        )
+
+        @throttle
+        async def demo(left: int, right: int) -> int:
+            assert (await throttle.peek("/api/product")).remaining == 0
+            return left + right
+
+        assert await demo(1, 2) == EXPECTED_RESULT
+        assert await demo(1, 2) == EXPECTED_RESULT
+        assert (await throttle.peek("/api/product")).remaining == 1
+
+    @classmethod
+    async def test_limit__concurrency_timeout(cls) -> None:
+        throttle: Throttled = Throttled(
+            key="key",
+            timeout=1,
+            using=RateLimiterType.CONCURRENCY.value,
+            quota=rate_limiter.per_min(1),
+            store=store.MemoryStore(),
+        )
+        result: RateLimitResult = await throttle.limit()
+
+        async def _release() -> None:
+            await asyncio.sleep(0.3)
+            await throttle.release(result)
+
+        def _callback(elapsed: float, *args: object, **kwargs: object) -> None:
+            assert elapsed < 1
+
+        # Waiting requests poll for released slots instead of the lease expiration.
+        task: asyncio.Task[None] = asyncio.create_task(_release())
+        async with utils.Timer(callback=_callback):
+            assert not (await throttle.limit()).limited
+        await task
+
+        assert not await throttle.release(result)
+
     @classmethod
     async def test_hook__execution_order(cls) -> None:
         """Throttled should execute hooks in correct middleware order.
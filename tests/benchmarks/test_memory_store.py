@@ -0,0 +1,73 @@
+import itertools
+import random
+from collections.abc import Callable, Iterator
+
+import pytest
+from throttled import MemoryStore, RateLimiterType, Throttled, per_sec
+from throttled.constants import MemoryEvictionPolicy
+from throttled.types import RateLimiterTypeT
+from throttled.utils import Benchmark
+
+BATCH: int = 200_000
+
+# Number of keys that fit in the store in eviction benchmarks.
+CAPACITY: int = 2_000
+
+
+def call_api__new_key(throttle: Throttled, counter: Iterator[int]) -> bool:
+    result = throttle.limit(f"/ping/{next(counter)}", cost=1)
+    return result.limited
+
+
+def access(store: MemoryStore, keys: Iterator[str]) -> bool:
+    key: str = next(keys)
+    if store.get(key) is None:
+        store.set(key, 1, 60)
+        return False
+    return True
+
+
+def zipf_keys(total: int, seed: int = 1) -> list[str]:
+    """Keys drawn from 50 * CAPACITY keys with a Zipfian (s=1) distribution."""
+    rnd: random.Random = random.Random(seed)
+    population: range = range(50 * CAPACITY)
+    weights: list[float] = [1 / (rank + 1) for rank in population]
+    return [f"hot-{idx}" for idx in rnd.choices(population, weights, k=total)]
+
+
+def scan_keys(total: int, seed: int = 1) -> list[str]:
+    """Zipfian keys mixed half-and-half with one-off keys, e.g. a scan over IPs."""
+    rnd: random.Random = random.Random(seed + 1)
+    counter: Iterator[int] = itertools.count()
+    return [
+        key if rnd.random() < 0.5 else f"scan-{next(counter)}"
+        for key in zipf_keys(total, seed)
+    ]
+
+
+WORKLOADS: dict[str, Callable[[int], list[str]]] = {
+    "zipf": zipf_keys,
+    "scan": scan_keys,
+}
+
+
+@pytest.mark.skip(reason="skip benchmarks")
+class TestBenchmarkMemoryStore:
+    @classmethod
+    @pytest.mark.parametrize("using", RateLimiterType.choice())
+    def test_limit__memory_per_key(cls, benchmark: Benchmark, using: RateLimiterTypeT):
+        store = MemoryStore(options={"MAX_SIZE": BATCH})
+        throttle = Throttled(using=using, quota=per_sec(1_000), store=store)
+        benchmark.memory(
+            call_api__new_key, BATCH, throttle=throttle, counter=itertools.count()
+        )
+
+    @classmethod
+    @pytest.mark.parametrize("workload", WORKLOADS.keys())
+    @pytest.mark.parametrize("policy", MemoryEvictionPolicy.choice())
+    def test_access__eviction_policy(
+        cls, benchmark: Benchmark, policy: str, workload: str
+    ):
+        keys: list[str] = WORKLOADS[workload](BATCH)
+        store = MemoryStore(options={"MAX_SIZE": CAPACITY, "EVICTION_POLICY": policy})
+        benchmark.hit_rate(access, len(keys), store=store, keys=iter(keys))
@@ -1,3 +1,4 @@
+import random
 import threading
 from collections.abc import Generator
 from typing import Any, cast
@@ -45,6 +46,11 @@ def call_api(throttle: Throttled) -> bool:
     return result.limited
 
 
+def call_api__multi_keys(throttle: Throttled) -> bool:
+    result = throttle.limit(f"/ping/{random.randrange(1024)}", cost=1)
+    return result.limited
+
+
 @pytest.fixture(params=StoreType.choice())
 def store(request) -> Generator[BaseStore, Any, None]:
     def _create_store(store_type: str) -> BaseStore:
@@ -124,3 +130,33 @@ class TestBenchmarkThrottled:
     ):
         throttle = Throttled(using=using, quota=quota, store=store)
         benchmark.concurrent(call_api, batch=100_000, workers=WORKERS, throttle=throttle)
+
+    @classmethod
+    @pytest.mark.parametrize("using", RateLimiterType.choice())
+    @pytest.mark.parametrize("shards", [1, 16])
+    def test_limit__memory_shards__concurrent(
+        cls, benchmark: Benchmark, using: RateLimiterTypeT, shards: int
+    ):
+        store = MemoryStore(options={"MAX_SIZE": 2048, "SHARDS": shards})
+        throttle = Throttled(using=using, quota=per_sec(1_000), store=store)
+        benchmark.concurrent(
+            call_api__multi_keys, batch=100_000, workers=WORKERS, throttle=throttle
+        )
+
+    @classmethod
+    @pytest.mark.parametrize(
+        "using",
+        [RateLimiterType.SLIDING_WINDOW.value, RateLimiterType.SLIDING_WINDOW_LOG.value],
+    )
+    @pytest.mark.parametrize("quota", [per_sec(10), per_sec(1_000), per_sec(100_000)])
+    def test_limit__sliding_window_log__serial(
+        cls,
+        benchmark: Benchmark,
+        store: BaseStore,
+        using: RateLimiterTypeT,
+        quota: Quota,
+    ):
+        # The log keeps up to limit entries per key, compare it with the weighted
+        # counters of the sliding window as the limit grows.
+        throttle = Throttled(using=using, quota=quota, store=store)
+        benchmark.serial(call_api, batch=100_000, throttle=throttle)
@@ -0,0 +1 @@
+"""Bulk evaluator tests."""
@@ -0,0 +1,107 @@
+from datetime import timedelta
+from typing import Any
+
+import numpy as np
+import pytest
+from throttled import (
+    ManualClock,
+    MemoryStore,
+    Quota,
+    RateLimiterRegistry,
+    per_duration,
+    per_min,
+    per_sec,
+)
+from throttled.constants import RateLimiterType
+from throttled.contrib.bulk import BulkEvaluator, BulkResult
+from throttled.exceptions import DataError, SetUpError
+
+BULK_LIMITER_TYPES: list[str] = [
+    RateLimiterType.GCRA.value,
+    RateLimiterType.TOKEN_BUCKET.value,
+]
+
+# Emission intervals that are not binary fractions round at each step, the
+# results must still be the same as the ones of the rate limiters.
+BULK_QUOTAS: list[Quota] = [
+    per_sec(1, burst=1),
+    per_sec(4, burst=8),
+    per_sec(5),
+    per_min(7, burst=3),
+    per_duration(timedelta(seconds=8), 2),
+]
+
+
+class TestBulkEvaluator:
+    @pytest.mark.parametrize("using", BULK_LIMITER_TYPES)
+    @pytest.mark.parametrize("quota", BULK_QUOTAS)
+    def test_evaluate(self, using: str, quota: Quota):
+        rng: np.random.Generator = np.random.default_rng(2025)
+        size: int = 6_000
+        # Epoch timestamps in milliseconds, as in an access log.
+        timestamps = np.sort(1_700_000_000 + np.round(rng.uniform(0, 60, size), 3))
+        # Most keys are evaluated in vectorized rounds, the busy ones one by one.
+        key_ids = np.where(
+            rng.random(size) < 0.5, rng.integers(0, 4, size), rng.integers(4, 200, size)
+        )
+        costs = rng.integers(0, 4, size)
+
+        # The state of keys is kept across chunks.
+        evaluator: BulkEvaluator = BulkEvaluator(quota, using)
+        results: list[BulkResult] = [
+            evaluator.evaluate(timestamps[chunk], key_ids[chunk], costs[chunk])
+            for chunk in (slice(0, size // 2), slice(size // 2, size))
+        ]
+        limited = np.concatenate([result.limited for result in results])
+        remaining = np.concatenate([result.remaining for result in results])
+        reset_after = np.concatenate([result.reset_after for result in results])
+        retry_after = np.concatenate([result.retry_after for result in results])
+        assert 0 < limited.sum() < size
+
+        clock: ManualClock = ManualClock(start=timestamps[0])
+        rate_limiter = RateLimiterRegistry.get(using)(
+            quota, MemoryStore(options={"CLOCK": clock})
+        )
+        for index in range(size):
+            clock.advance(timestamps[index] - clock.time())
+            result = rate_limiter.limit(str(key_ids[index]), int(costs[index]))
+            assert (
+                limited[index],
+                remaining[index],
+                reset_after[index],
+                retry_after[index],
+            ) == (
+                result.limited,
+                result.state.remaining,
+                result.state.reset_after,
+                result.state.retry_after,
+            ), f"request {index}"
+
+    def test_evaluate__unsorted(self):
+        evaluator: BulkEvaluator = BulkEvaluator(per_sec(1))
+        result: BulkResult = evaluator.evaluate([2.5, 1, 1.5, 1], [0, 1, 0, 0])
+        assert result.limited.tolist() == [False, False, True, False]
+        assert result.remaining.tolist() == [0, 0, 0, 0]
+        assert result.reset_after.tolist() == [1, 1, 0.5, 1]
+        assert result.retry_after.tolist() == [0, 0, 0.5, 0]
+
+        evaluator.reset()
+        assert evaluator.evaluate([2.5], [0]).retry_after.tolist() == [0]
+
+    @pytest.mark.parametrize(
+        ("arrays", "match"),
+        [
+            (([1, 2], [0]), "must be 1-D arrays of the same length"),
+            (([[1]], [[0]]), "must be 1-D arrays of the same length"),
+            (([np.nan], [0]), "Invalid timestamps"),
+            (([1], [-1]), "Invalid key_ids"),
+            (([1], [0], [-1]), "Invalid costs"),
+        ],
+    )
+    def test_evaluate__invalid(self, arrays: tuple[list[Any], ...], match: str):
+        with pytest.raises(DataError, match=match):
+            BulkEvaluator(per_sec(1)).evaluate(*arrays)
+
+    def test_constructor__not_supported(self):
+        with pytest.raises(SetUpError, match="not supported by BulkEvaluator"):
+            BulkEvaluator(per_sec(1), RateLimiterType.FIXED_WINDOW.value)
@@ -2,6 +2,7 @@ from typing import Any
 
 import pytest
 from throttled import per_min
+from throttled.constants import RateLimiterType
 
 LIMIT_C_QUOTA = pytest.mark.parametrize(
     "quota",
@@ -10,6 +11,14 @@ LIMIT_C_QUOTA = pytest.mark.parametrize(
 
 LIMIT_C_REQUESTS_NUM = pytest.mark.parametrize("requests_num", [10, 100, 1_000, 10_000])
 
+# Algorithms whose requests consume quota, the concurrency algorithm holds
+# slots until they are released instead.
+CONSUMING_LIMITER_TYPES: list[str] = [
+    limiter_type
+    for limiter_type in RateLimiterType.choice()
+    if limiter_type != RateLimiterType.CONCURRENCY.value
+]
+
 
 FIXED_WINDOW_LIMIT_CASES: list[dict[str, Any]] = [
     {"cost": 0, "limited": False, "remaining": 5, "count": 0},
@@ -42,9 +51,27 @@ LEAKING_BUCKET_LIMIT_CASES: list[dict[str, Any]] = [
 TOKEN_BUCKET_LIMIT_CASES: list[dict[str, Any]] = LEAKING_BUCKET_LIMIT_CASES
 
 SLIDING_WINDOW_LIMIT_CASES: list[dict[str, Any]] = [
-    {"cost": 0, "limited": False, "remaining": 5, "count": 0, "ttl": 3 * 60},
+    {"cost": 0, "limited": False, "remaining": 5, "count": 0, "ttl": 2 * 60},
     {"cost": 1, "limited": False, "remaining": 4, "count": 1},
     {"cost": 4, "limited": False, "remaining": 0, "count": 5},
     {"cost": 4, "limited": True, "remaining": 0, "count": 5},
     {"cost": 0, "limited": False, "remaining": 0, "count": 5},
 ]
+
+SLIDING_WINDOW_LOG_LIMIT_CASES: list[dict[str, Any]] = [
+    {"cost": 0, "limited": False, "remaining": 5, "reset_after": 0},
+    {"cost": 1, "limited": False, "remaining": 4, "reset_after": 60},
+    {"cost": 4, "limited": False, "remaining": 0, "reset_after": 60},
+    {"cost": 4, "limited": True, "remaining": 0, "reset_after": 60, "retry_after": 60},
+    {"cost": 6, "limited": True, "remaining": 0, "reset_after": 60, "retry_after": 60},
+    {"cost": 0, "limited": False, "remaining": 0, "reset_after": 60},
+]
+
+CONCURRENCY_LIMIT_CASES: list[dict[str, Any]] = [
+    {"cost": 0, "limited": False, "remaining": 5, "reset_after": 0, "leased": False},
+    {"cost": 1, "limited": False, "remaining": 4, "reset_after": 60, "leased": True},
+    {"cost": 4, "limited": False, "remaining": 0, "reset_after": 60, "leased": True},
+    {"cost": 1, "limited": True, "remaining": 0, "reset_after": 60, "leased": False},
+    {"cost": 6, "limited": True, "remaining": 0, "reset_after": 60, "leased": False},
+    {"cost": 0, "limited": False, "remaining": 0, "reset_after": 60, "leased": False},
+]
@@ -0,0 +1,141 @@
+import threading
+from datetime import timedelta
+
+import pytest
+from throttled import (
+    ApproximateRateLimiter,
+    BaseRateLimiter,
+    BaseStore,
+    MemoryStore,
+    RateLimiterRegistry,
+    RateLimitResult,
+    per_duration,
+    per_min,
+)
+from throttled.constants import RateLimiterType
+from throttled.exceptions import SetUpError
+
+from . import parametrizes
+
+
+def _create_rate_limiter(
+    store: BaseStore, using: str = RateLimiterType.TOKEN_BUCKET.value, limit: int = 100
+) -> BaseRateLimiter:
+    return RateLimiterRegistry.get(using)(per_min(limit), store)
+
+
+class TestApproximateRateLimiter:
+    @pytest.mark.parametrize(
+        ("lease_size", "max_overshoot", "match"),
+        [
+            (0, 0, "lease_size must be a positive integer"),
+            (1, -1, "max_overshoot must be"),
+        ],
+    )
+    def test_constructor__invalid_options(
+        self, store: BaseStore, lease_size: int, max_overshoot: int, match: str
+    ):
+        with pytest.raises(SetUpError, match=match):
+            ApproximateRateLimiter(
+                _create_rate_limiter(store),
+                lease_size=lease_size,
+                max_overshoot=max_overshoot,
+            )
+
+    def test_constructor__concurrency(self, store: BaseStore):
+        limiter: BaseRateLimiter = _create_rate_limiter(
+            store, RateLimiterType.CONCURRENCY.value
+        )
+        with pytest.raises(SetUpError, match="not supported by ApproximateRateLimiter"):
+            ApproximateRateLimiter(limiter, lease_size=4)
+
+    def test_limit(self, store: BaseStore):
+        limiter: BaseRateLimiter = _create_rate_limiter(store)
+        rate_limiter = ApproximateRateLimiter(limiter, lease_size=10)
+
+        result: RateLimitResult = rate_limiter.limit("key")
+        assert result.limited is False
+        assert result.state.remaining == 99
+        # The whole lease is consumed from the wrapped limiter at once.
+        assert rate_limiter.peek("key").remaining == 90
+
+        # Requests are served from the lease, until half of it is consumed.
+        for remaining in range(98, 94, -1):
+            assert rate_limiter.limit("key").state.remaining == remaining
+        assert rate_limiter.peek("key").remaining == 90
+
+        # Then the next lease is fetched in the background.
+        rate_limiter.limit("key")
+        rate_limiter.flush()
+        assert rate_limiter.peek("key").remaining == 80
+        assert rate_limiter.limit("key").state.remaining == 93
+        rate_limiter.close()
+
+    def test_limit__sub_second_period(self, store: BaseStore):
+        quota = per_duration(timedelta(milliseconds=100), limit=5)
+        limiter: BaseRateLimiter = RateLimiterRegistry.get(
+            RateLimiterType.TOKEN_BUCKET.value
+        )(quota, store)
+        rate_limiter = ApproximateRateLimiter(limiter, lease_size=2)
+
+        # Leases of sub-second quotas are kept for a second at least.
+        assert rate_limiter.limit("key").limited is False
+        lease_key: str = rate_limiter._prepare_lease_key(limiter._prepare_key("key"))
+        assert rate_limiter._local_store.ttl(lease_key) == 1
+        rate_limiter.close()
+
+    @pytest.mark.parametrize("using", parametrizes.CONSUMING_LIMITER_TYPES)
+    def test_limit__exhausted(self, store: BaseStore, using: str):
+        limiter: BaseRateLimiter = _create_rate_limiter(store, using, limit=10)
+        rate_limiters: list[ApproximateRateLimiter] = [
+            ApproximateRateLimiter(limiter, lease_size=4) for _ in range(2)
+        ]
+
+        # Leases never grant more than the quota, across limiters.
+        allowed: int = 0
+        for _ in range(10):
+            for rate_limiter in rate_limiters:
+                allowed += not rate_limiter.limit("key").limited
+                rate_limiter.flush()
+        assert allowed == 10
+        assert rate_limiters[0].limit("key").limited is True
+
+    def test_limit__overshoot(self, store: BaseStore, monkeypatch: pytest.MonkeyPatch):
+        limiter: BaseRateLimiter = _create_rate_limiter(store, limit=10)
+        rate_limiter = ApproximateRateLimiter(limiter, lease_size=4, max_overshoot=2)
+        # Keep the refill in flight forever.
+        monkeypatch.setattr(
+            rate_limiter, "_schedule_refill", rate_limiter._refilling.add
+        )
+        for _ in range(4):
+            assert rate_limiter.limit("key").limited is False
+
+        # The lease may be overshot by up to 2 while the refill is in flight.
+        assert rate_limiter.limit("key", cost=2).limited is False
+        assert rate_limiter.peek("key").remaining == 6
+
+        # Beyond that, a new lease is taken along with the overshoot.
+        assert rate_limiter.limit("key").state.remaining == 3
+        assert rate_limiter.peek("key").remaining == 0
+
+    def test_limit__concurrent(self, store: BaseStore):
+        limiter: BaseRateLimiter = _create_rate_limiter(store, limit=1000)
+        rate_limiter = ApproximateRateLimiter(
+            limiter, lease_size=50, local_store=MemoryStore()
+        )
+
+        def _call() -> None:
+            for _ in range(300):
+                rate_limiter.limit("key")
+
+        threads: list[threading.Thread] = [
+            threading.Thread(target=_call) for _ in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        rate_limiter.close()
+
+        assert rate_limiter.limit("key").limited is True
+        assert rate_limiter.peek("key").remaining == 0
@@ -56,3 +56,10 @@ class TestQuota:
         assert quota.burst == 150
         assert quota.get_limit() == 120
         assert quota.get_period_sec() == 120
+
+    def test_per_duration__sub_second(self):
+        quota: Quota = rate_limiter.per_duration(timedelta(milliseconds=100), limit=5)
+        assert quota.get_period_sec() == 0
+        assert quota.period_sec_f == pytest.approx(0.1)
+        assert quota.fill_rate == pytest.approx(50)
+        assert quota.emission_interval == pytest.approx(0.02)
@@ -0,0 +1,131 @@
+import threading
+import time
+from collections.abc import Callable
+from datetime import timedelta
+from typing import Any
+
+import pytest
+from throttled import (
+    BaseRateLimiter,
+    BaseStore,
+    Quota,
+    RateLimiterRegistry,
+    RateLimitResult,
+    RateLimitState,
+    per_duration,
+    per_min,
+)
+from throttled.constants import RateLimiterType
+
+from . import parametrizes
+
+
+@pytest.fixture
+def rate_limiter_constructor(
+    store: BaseStore,
+) -> Callable[[Quota], BaseRateLimiter]:
+    def _create_rate_limiter(quota: Quota) -> BaseRateLimiter:
+        return RateLimiterRegistry.get(RateLimiterType.CONCURRENCY.value)(quota, store)
+
+    return _create_rate_limiter
+
+
+def assert_rate_limit_result(
+    case: dict[str, Any], quota: Quota, result: RateLimitResult
+):
+    assert result.limited == case["limited"]
+    assert result.state.limit == quota.get_limit()
+    assert result.state.remaining == case["remaining"]
+    assert result.state.reset_after == pytest.approx(case["reset_after"], abs=0.1)
+    assert (result.lease is not None) == case["leased"]
+    if result.limited:
+        assert result.state.retry_after == pytest.approx(case["reset_after"], abs=0.1)
+    if result.lease is not None:
+        assert result.lease.cost == case["cost"]
+
+
+class TestConcurrencyRateLimiter:
+    def test_limit(self, rate_limiter_constructor: Callable[[Quota], BaseRateLimiter]):
+        quota: Quota = per_min(5)
+        rate_limiter: BaseRateLimiter = rate_limiter_constructor(quota)
+        for case in parametrizes.CONCURRENCY_LIMIT_CASES:
+            result: RateLimitResult = rate_limiter.limit("key", cost=case["cost"])
+            assert_rate_limit_result(case, quota, result)
+
+    def test_release(self, rate_limiter_constructor: Callable[[Quota], BaseRateLimiter]):
+        rate_limiter: BaseRateLimiter = rate_limiter_constructor(per_min(3))
+        result: RateLimitResult = rate_limiter.limit("key", cost=2)
+        assert result.lease is not None
+        assert rate_limiter.limit("key", cost=2).limited is True
+
+        # Releasing gives the slots back, a lease can only be released once.
+        assert rate_limiter.release("key", result.lease) is True
+        assert rate_limiter.release("key", result.lease) is False
+        assert rate_limiter.peek("key").remaining == 3
+        assert rate_limiter.limit("key", cost=3).limited is False
+
+    def test_release__expired(
+        self, rate_limiter_constructor: Callable[[Quota], BaseRateLimiter]
+    ):
+        rate_limiter: BaseRateLimiter = rate_limiter_constructor(
+            per_duration(timedelta(milliseconds=200), 1)
+        )
+        result: RateLimitResult = rate_limiter.limit("key")
+        assert result.lease is not None
+        limited_result: RateLimitResult = rate_limiter.limit("key")
+        assert limited_result.limited is True
+        assert limited_result.state.retry_after == pytest.approx(0.2, abs=0.05)
+
+        # Leases that are never released are reclaimed once they expire.
+        time.sleep(0.21)
+        assert rate_limiter.limit("key").limited is False
+        assert rate_limiter.release("key", result.lease) is False
+
+    def test_limit__concurrent(
+        self, rate_limiter_constructor: Callable[[Quota], BaseRateLimiter]
+    ):
+        rate_limiter: BaseRateLimiter = rate_limiter_constructor(per_min(3))
+        lock: threading.Lock = threading.Lock()
+        in_flight: list[int] = [0, 0]
+
+        def _task() -> None:
+            for __ in range(20):
+                result: RateLimitResult = rate_limiter.limit("key")
+                if result.lease is None:
+                    continue
+                with lock:
+                    in_flight[0] += 1
+                    in_flight[1] = max(in_flight)
+                time.sleep(0.001)
+                with lock:
+                    in_flight[0] -= 1
+                rate_limiter.release("key", result.lease)
+
+        threads: list[threading.Thread] = [
+            threading.Thread(target=_task) for __ in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        # No more than the limit of holders are in flight at any time.
+        assert 0 < in_flight[1] <= 3
+        assert rate_limiter.peek("key").remaining == 3
+
+    def test_peek(self, rate_limiter_constructor: Callable[[Quota], BaseRateLimiter]):
+        key: str = "key"
+        rate_limiter: BaseRateLimiter = rate_limiter_constructor(per_min(2))
+        assert rate_limiter.peek(key) == RateLimitState(
+            limit=2, remaining=2, reset_after=0
+        )
+
+        rate_limiter.limit(key)
+        state: RateLimitState = rate_limiter.peek(key)
+        assert state.remaining == 1 and state.retry_after == 0
+        assert state.reset_after == pytest.approx(60, abs=0.1)
+
+        rate_limiter.limit(key)
+        state = rate_limiter.peek(key)
+        assert state.remaining == 0
+        assert state.retry_after == pytest.approx(60, abs=0.1)
@@ -0,0 +1,204 @@
+import time
+
+import pytest
+from throttled import (
+    BaseRateLimiter,
+    BaseStore,
+    DeniedCache,
+    ManualClock,
+    MemoryStore,
+    RateLimiterRegistry,
+    RateLimitResult,
+    Throttled,
+    per_min,
+    per_sec,
+)
+from throttled.constants import RateLimiterType
+from throttled.exceptions import SetUpError
+
+
+def _create_rate_limiter(
+    store: BaseStore, using: str, denied_cache: DeniedCache, limit: int = 1
+) -> BaseRateLimiter:
+    return RateLimiterRegistry.get(using)(
+        per_min(limit), store, denied_cache=denied_cache
+    )
+
+
+def _count_calls(monkeypatch: pytest.MonkeyPatch, limiter: BaseRateLimiter) -> list[int]:
+    calls: list[int] = []
+    limit = limiter._limit
+
+    def _limit(key: str, cost: int) -> RateLimitResult:
+        calls.append(cost)
+        return limit(key, cost)
+
+    monkeypatch.setattr(limiter, "_limit", _limit)
+    return calls
+
+
+class TestDeniedCache:
+    def test_constructor__invalid_max_size(self):
+        with pytest.raises(SetUpError, match="max_size must be a positive integer"):
+            DeniedCache(max_size=0)
+
+    def test_get(self):
+        cache = DeniedCache()
+        assert cache.get("key", 1) is None
+
+        now: float = time.time()
+        cache.set("key", 2, RateLimitResult(True, (1, 0, 10, 5)), now, 5)
+        # A lower cost may still be allowed.
+        assert cache.get("key", 1) is None
+
+        result: RateLimitResult | None = cache.get("key", 3)
+        assert result is not None
+        assert result.limited is True
+        assert result.state.limit == 1
+        assert result.state.remaining == 0
+        assert 0 < 5 - result.state.retry_after < 0.1
+        assert 0 < 10 - result.state.reset_after < 0.1
+
+    def test_get__expired(self):
+        cache = DeniedCache()
+        cache.set("key", 1, RateLimitResult(True, (1, 0, 1, 1)), time.time() - 2, 1)
+        assert cache.get("key", 1) is None
+        assert len(cache) == 0
+
+    def test_set__max_size(self):
+        cache = DeniedCache(max_size=2)
+        for key in ["a", "b", "a", "c"]:
+            cache.set(key, 1, RateLimitResult(True, (1, 0, 60, 60)), time.time(), 60)
+
+        assert len(cache) == 2
+        assert cache.get("b", 1) is None
+        assert cache.get("a", 1) is not None
+        assert cache.get("c", 1) is not None
+
+        cache.clear()
+        assert len(cache) == 0
+
+    @pytest.mark.parametrize(
+        "using",
+        [
+            RateLimiterType.GCRA.value,
+            RateLimiterType.FIXED_WINDOW.value,
+            RateLimiterType.SLIDING_WINDOW_LOG.value,
+        ],
+    )
+    def test_limit(self, monkeypatch: pytest.MonkeyPatch, store: BaseStore, using: str):
+        cache = DeniedCache()
+        limiter: BaseRateLimiter = _create_rate_limiter(store, using, cache)
+        calls: list[int] = _count_calls(monkeypatch, limiter)
+
+        assert limiter.limit("key").limited is False
+        denied: RateLimitResult = limiter.limit("key")
+        assert denied.limited is True
+        assert len(cache) == 1
+
+        # Requests of the same or a higher cost are answered locally.
+        for cost in [1, 2]:
+            result: RateLimitResult = limiter.limit("key", cost)
+            assert result.limited is True
+            assert result.state.limit == denied.state.limit
+            assert result.state.retry_after <= denied.state.retry_after
+        assert calls == [1, 1]
+
+        # Other keys, and costs that may still be allowed, reach the store.
+        assert limiter.limit("other").limited is False
+        limiter.limit("key", 0)
+        assert calls == [1, 1, 1, 0]
+
+        # peek always reaches the store.
+        assert limiter.peek("key").remaining == 0
+
+    @pytest.mark.parametrize(
+        "using",
+        [
+            RateLimiterType.TOKEN_BUCKET.value,
+            RateLimiterType.LEAKING_BUCKET.value,
+            RateLimiterType.SLIDING_WINDOW.value,
+        ],
+    )
+    def test_limit__inexact_retry_after(self, store: BaseStore, using: str):
+        # retry_after is rounded up by these algorithms, denials are not cached.
+        cache = DeniedCache()
+        limiter: BaseRateLimiter = _create_rate_limiter(store, using, cache)
+        limiter.limit("key")
+        assert limiter.limit("key").limited is True
+        assert len(cache) == 0
+
+    def test_limit__expired(self, store: BaseStore):
+        cache = DeniedCache()
+        limiter: BaseRateLimiter = RateLimiterRegistry.get(RateLimiterType.GCRA.value)(
+            per_sec(10), store, denied_cache=cache
+        )
+        result: RateLimitResult = limiter.limit("key", 10)
+        while not result.limited:
+            result = limiter.limit("key", 10)
+        assert len(cache) == 1
+
+        time.sleep(result.state.retry_after + 0.01)
+        assert limiter.limit("key", 10).limited is False
+
+    def test_limit__clock(self):
+        clock: ManualClock = ManualClock()
+        cache = DeniedCache(clock=clock)
+        limiter: BaseRateLimiter = _create_rate_limiter(
+            MemoryStore(options={"CLOCK": clock}), RateLimiterType.GCRA.value, cache
+        )
+        limiter.limit("key")
+        assert limiter.limit("key").limited is True
+        assert len(cache) == 1
+
+        # Deadlines are counted on the clock of the cache.
+        clock.advance(30)
+        cached: RateLimitResult | None = cache.get("key", 1)
+        assert cached is not None
+        assert cached.state.retry_after == 30
+        clock.advance(30)
+        assert limiter.limit("key").limited is False
+
+    def test_throttled(self, store: BaseStore):
+        cache = DeniedCache()
+        throttle = Throttled(
+            using=RateLimiterType.GCRA.value,
+            quota=per_min(1),
+            store=store,
+            denied_cache=cache,
+        )
+        assert throttle.limit("key").limited is False
+        assert throttle.limit("key").limited is True
+        assert len(cache) == 1
+
+    def test_throttled__clock(self):
+        clock: ManualClock = ManualClock()
+        cache = DeniedCache()
+        throttle = Throttled(
+            using=RateLimiterType.GCRA.value,
+            quota=per_min(1),
+            store=MemoryStore(options={"CLOCK": clock}),
+            denied_cache=cache,
+        )
+        # Deadlines are counted on the clock of the store by default.
+        assert cache.clock is clock
+        assert throttle.limit("key").limited is False
+        assert throttle.limit("key").limited is True
+        clock.advance(30)
+        cached: RateLimitResult | None = cache.get("key", 1)
+        assert cached is not None
+        assert cached.state.retry_after == 30
+        clock.advance(30)
+        assert throttle.limit("key").limited is False
+
+        # Stores on system clocks can share a cache.
+        shared = DeniedCache()
+        for store in [MemoryStore(), MemoryStore()]:
+            Throttled(quota=per_min(1), store=store, denied_cache=shared)
+
+        with pytest.raises(SetUpError, match="clock of the store"):
+            Throttled(quota=per_min(1), store=MemoryStore(), denied_cache=cache)
+        with pytest.raises(SetUpError, match="clock of the store"):
+            _create_rate_limiter(
+                MemoryStore(), RateLimiterType.GCRA.value, DeniedCache(clock=clock)
+            )
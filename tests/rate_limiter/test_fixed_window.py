@@ -1,3 +1,4 @@
+import time
 from collections.abc import Callable
 from datetime import timedelta
 
@@ -10,7 +11,9 @@ from throttled import (
     RateLimiterRegistry,
     RateLimitResult,
     RateLimitState,
+    RedisStore,
     per_min,
+    utils,
 )
 from throttled.constants import RateLimiterType
 from throttled.utils import Benchmark, now_sec
@@ -36,7 +39,7 @@ def assert_rate_limit_result(
     assert result.state.remaining == remaining
 
     period: int = quota.get_period_sec()
-    assert result.state.reset_after == period - (now_sec() % period)
+    assert abs(result.state.reset_after - (period - time.time() % period)) <= 1
     if result.limited:
         assert result.state.retry_after == result.state.reset_after
 
@@ -50,14 +53,33 @@ class TestFixedWindowRateLimiter:
         assert quota.get_period_sec() == period
 
         rate_limiter: BaseRateLimiter = rate_limiter_constructor(quota)
-        store_key: str = f"throttled:v1:fixed_window:key:period:{now_sec() // period}"
+        store_key: str = "throttled:v1:fixed_window:key"
         assert rate_limiter._store.exists(store_key) is False
 
         # fixture does not support pytest.mark.parametrize scope.
         for case in parametrizes.FIXED_WINDOW_LIMIT_CASES:
             result: RateLimitResult = rate_limiter.limit("key", cost=case["cost"])
             assert_rate_limit_result(case["limited"], case["remaining"], quota, result)
-            assert rate_limiter._store.get(store_key) == case["count"]
+            counter = rate_limiter._store.hgetall(store_key)
+            assert int(counter["window"]) == now_sec() // period
+            assert int(counter["count"]) == case["count"]
+
+    def test_limit__server_time(
+        self, monkeypatch: pytest.MonkeyPatch, redis_store: RedisStore
+    ):
+        # Clients with skewed clocks count in the window of the Redis server, and
+        # reset_after is computed by the server.
+        rate_limiter: BaseRateLimiter = RateLimiterRegistry.get(
+            RateLimiterType.FIXED_WINDOW.value
+        )(per_min(5), redis_store)
+        for skew in [-3600, 0, 3600]:
+            monkeypatch.setattr(utils, "now_sec_f", lambda skew=skew: time.time() + skew)
+            result: RateLimitResult = rate_limiter.limit("key")
+            assert abs(result.state.reset_after - (60 - time.time() % 60)) <= 1
+
+        counter = redis_store.hgetall("throttled:v1:fixed_window:key")
+        assert int(counter["window"]) == now_sec() // 60
+        assert int(counter["count"]) == 3
 
     @parametrizes.LIMIT_C_QUOTA
     @parametrizes.LIMIT_C_REQUESTS_NUM
@@ -1,5 +1,6 @@
 import time
 from collections.abc import Callable
+from datetime import timedelta
 from typing import Any
 
 import pytest
@@ -10,6 +11,7 @@ from throttled import (
     RateLimiterRegistry,
     RateLimitResult,
     RateLimitState,
+    per_duration,
     per_min,
 )
 from throttled.constants import RateLimiterType
@@ -37,8 +39,11 @@ def assert_rate_limit_result(
     assert result.limited == case["limited"]
     assert result.state.limit == quota.burst
     assert result.state.remaining == case["remaining"]
-    assert result.state.reset_after == quota.burst - case["remaining"]
-    assert result.state.retry_after == case.get("retry_after", 0)
+    # The bucket leaks continuously, so the times are a bit shorter.
+    assert result.state.reset_after == pytest.approx(
+        quota.burst - case["remaining"], abs=0.1
+    )
+    assert result.state.retry_after == pytest.approx(case.get("retry_after", 0), abs=0.1)
 
 
 class TestLeakingBucketRateLimiter:
@@ -52,6 +57,16 @@ class TestLeakingBucketRateLimiter:
             result: RateLimitResult = rate_limiter.limit("key", cost=case["cost"])
             assert_rate_limit_result(case, quota, result)
 
+    def test_limit__ttl(
+        self,
+        store: BaseStore,
+        rate_limiter_constructor: Callable[[Quota], BaseRateLimiter],
+    ):
+        rate_limiter: BaseRateLimiter = rate_limiter_constructor(per_min(60, burst=10))
+        rate_limiter.limit("key")
+        # The bucket of a new key expires once it has leaked twice over.
+        assert 0 < store.ttl("throttled:v1:leaking_bucket:key") <= 20
+
     @parametrizes.LIMIT_C_QUOTA
     @parametrizes.LIMIT_C_REQUESTS_NUM
     def test_limit__concurrent(
@@ -83,10 +98,28 @@ class TestLeakingBucketRateLimiter:
 
         rate_limiter.limit(key, cost=5)
         state = rate_limiter.peek(key)
-        assert state == RateLimitState(limit=10, remaining=5, reset_after=5)
+        assert (state.limit, state.remaining) == (10, 5)
+        assert state.reset_after == pytest.approx(5, abs=0.1)
 
         time.sleep(1)
         state = rate_limiter.peek(key)
         assert state.limit == 10
         assert 6 - state.remaining <= 1
         assert 4 - state.reset_after <= 4
+
+    def test_limit__sub_second_period(
+        self, rate_limiter_constructor: Callable[[Quota], BaseRateLimiter]
+    ):
+        # One request leaks every 20ms, rather than 5 requests every 100ms.
+        quota: Quota = per_duration(timedelta(milliseconds=100), limit=5)
+        rate_limiter: BaseRateLimiter = rate_limiter_constructor(quota)
+        assert rate_limiter.limit("key", cost=5).limited is False
+
+        result: RateLimitResult = rate_limiter.limit("key", cost=2)
+        assert result.limited is True
+        assert 0 < result.state.retry_after <= 0.04
+        assert result.state.reset_after <= 0.1
+
+        time.sleep(result.state.retry_after + 0.005)
+        assert rate_limiter.limit("key", cost=2).limited is False
+        assert rate_limiter.peek("key").reset_after <= 0.1
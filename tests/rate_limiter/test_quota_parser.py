@@ -41,6 +41,26 @@ class TestQuotaParser:
         assert len(parsed) == 1
         assert_quota(parsed[0], limit=limit, period_sec=period_sec, burst=burst)
 
+    @classmethod
+    @pytest.mark.parametrize(
+        ("expression", "limit", "period_sec_f", "burst"),
+        [
+            ("5 per 100ms", 5, 0.1, 5),
+            ("5/100ms", 5, 0.1, 5),
+            ("5 / 100 ms burst 8", 5, 0.1, 8),
+            ("1 per millisecond", 1, 0.001, 1),
+            ("10/2m", 10, 120, 10),
+            ("10 per 2 hours", 10, 7200, 10),
+        ],
+    )
+    def test_parse__period_count(
+        cls, expression: str, limit: int, period_sec_f: float, burst: int
+    ) -> None:
+        parsed: Quota = parse(expression)[0]
+        assert parsed.get_limit() == limit
+        assert parsed.period_sec_f == pytest.approx(period_sec_f)
+        assert parsed.burst == burst
+
     @classmethod
     def test_parse__multi_rules(cls) -> None:
         parsed = parse("1/s burst 3 | 60/minute")
@@ -57,6 +77,7 @@ class TestQuotaParser:
             ("burst=1", "expected '<n>/<unit>' or '<n> per <unit>'"),
             ("1/s burst 1 burst 2", "expected '<n>/<unit>' or '<n> per <unit>'"),
             ("0/s", "limit must be greater than 0"),
+            ("1/0s", "period must be greater than 0"),
             ("10/month", "unsupported unit"),
             ("not-a-rule", "expected '<n>/<unit>' or '<n> per <unit>'"),
         ],
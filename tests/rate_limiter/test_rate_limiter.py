@@ -1,13 +1,23 @@
+from datetime import timedelta
+
 import pytest
 from throttled import (
     BaseRateLimiter,
+    BaseStore,
+    Lease,
+    MemoryStore,
+    Quota,
     RateLimiterRegistry,
+    RateLimitResult,
     constants,
     exceptions,
+    per_duration,
+    per_min,
     per_sec,
 )
 
 from ..store.unavailable import OperationUnavailableStore, UnavailableStore
+from . import parametrizes
 
 
 def _build_rate_limiter(limiter_type: str) -> BaseRateLimiter:
@@ -36,3 +46,145 @@ class TestRateLimiter:
         rate_limiter = _build_rate_limiter(limiter_type)
         with pytest.raises(exceptions.StoreUnavailableError):
             rate_limiter.peek("key")
+
+    @classmethod
+    @pytest.mark.parametrize("limiter_type", constants.RateLimiterType.choice())
+    def test_limit_many__store_unavailable(cls, limiter_type: str) -> None:
+        rate_limiter = _build_rate_limiter(limiter_type)
+        with pytest.raises(exceptions.StoreUnavailableError):
+            rate_limiter.limit_many([("key", 1)])
+
+    @classmethod
+    @pytest.mark.parametrize("limiter_type", constants.RateLimiterType.choice())
+    def test_limit_many(cls, store: BaseStore, limiter_type: str) -> None:
+        limiter_cls = RateLimiterRegistry.get(limiter_type)
+        rate_limiter: BaseRateLimiter = limiter_cls(per_min(3), store)
+
+        items: list[tuple[str, int]] = [
+            ("a", 1),
+            ("b", 2),
+            ("a", 1),
+            ("a", 2),
+            ("b", 2),
+        ]
+        results: list[RateLimitResult] = rate_limiter.limit_many(items)
+        assert [result.limited for result in results] == [
+            False,
+            False,
+            False,
+            True,
+            True,
+        ]
+        assert [result.state.limit for result in results] == [3] * len(items)
+        assert [result.state.remaining for result in results[:3]] == [2, 1, 1]
+
+        # Batch requests share state with single requests.
+        rate_limiter.limit_many([("c", 3)])
+        assert rate_limiter.limit("c").limited is True
+
+    @classmethod
+    @pytest.mark.parametrize("limiter_type", constants.RateLimiterType.choice())
+    def test_limit_many__empty(cls, store: BaseStore, limiter_type: str) -> None:
+        limiter_cls = RateLimiterRegistry.get(limiter_type)
+        assert limiter_cls(per_min(3), store).limit_many([]) == []
+
+    @classmethod
+    @pytest.mark.parametrize("limiter_type", parametrizes.CONSUMING_LIMITER_TYPES)
+    def test_limit_all(cls, store: BaseStore, limiter_type: str) -> None:
+        limiter_cls = RateLimiterRegistry.get(limiter_type)
+        rate_limiter: BaseRateLimiter = limiter_cls(per_min(3), store)
+
+        results: list[RateLimitResult] = rate_limiter.limit_all(
+            [
+                ("user", 1),
+                ("tenant", 3),
+            ]
+        )
+        assert [result.limited for result in results] == [False, False]
+        assert [result.state.remaining for result in results] == [2, 0]
+
+        # The tenant bucket denies the request, the user bucket is left untouched.
+        results = rate_limiter.limit_all([("user", 1), ("tenant", 1)])
+        assert [result.limited for result in results] == [True, True]
+        assert [result.state.remaining for result in results] == [2, 0]
+        assert results[1].state.retry_after > 0
+        assert rate_limiter.peek("user").remaining == results[0].state.remaining
+
+        assert rate_limiter.limit_all([]) == []
+
+    @classmethod
+    @pytest.mark.parametrize("limiter_type", parametrizes.CONSUMING_LIMITER_TYPES)
+    def test_limit_all__duplicate_keys(cls, store: BaseStore, limiter_type: str) -> None:
+        limiter_cls = RateLimiterRegistry.get(limiter_type)
+        with pytest.raises(exceptions.DataError, match="keys must be unique"):
+            limiter_cls(per_min(3), store).limit_all([("key", 1), ("key", 1)])
+
+    @classmethod
+    @pytest.mark.parametrize("limiter_type", constants.RateLimiterType.choice())
+    def test_limit_all__not_supported(cls, store: BaseStore, limiter_type: str) -> None:
+        limiter_cls = RateLimiterRegistry.get(limiter_type)
+        rate_limiter: BaseRateLimiter = limiter_cls(per_min(3), store)
+        rate_limiter._atomic_actions.pop(constants.ATOMIC_ACTION_TYPE_LIMIT_ALL, None)
+        with pytest.raises(exceptions.SetUpError, match="does not support limit_all"):
+            rate_limiter.limit_all([("key", 1)])
+
+    @classmethod
+    @pytest.mark.parametrize("limiter_type", parametrizes.CONSUMING_LIMITER_TYPES)
+    def test_release__not_supported(cls, store: BaseStore, limiter_type: str) -> None:
+        rate_limiter: BaseRateLimiter = RateLimiterRegistry.get(limiter_type)(
+            per_min(3), store
+        )
+        with pytest.raises(exceptions.SetUpError, match="does not support release"):
+            rate_limiter.release("key", Lease(id=1, cost=1))
+
+    @classmethod
+    @pytest.mark.parametrize("limiter_type", constants.RateLimiterType.choice())
+    def test_prepare_key__hash_tag(cls, limiter_type: str) -> None:
+        store = MemoryStore(options={"KEY_LAYOUT": constants.KeyLayout.HASH_TAG.value})
+        rate_limiter: BaseRateLimiter = RateLimiterRegistry.get(limiter_type)(
+            per_min(1), store
+        )
+        prefix: str = f"throttled:v1:{limiter_type}:"
+        assert rate_limiter._prepare_key("user") == prefix + "{user}"
+        # Keys with a hash tag of their own are left as is.
+        assert rate_limiter._prepare_key("{tenant}:user") == prefix + "{tenant}:user"
+
+        assert rate_limiter.limit("user").limited is False
+        assert rate_limiter.limit("user").limited is True
+        assert rate_limiter.peek("user").remaining == 0
+
+    @classmethod
+    def test_prepare_key__plain(cls, store: BaseStore) -> None:
+        limiter_cls = RateLimiterRegistry.get(constants.RateLimiterType.GCRA.value)
+        rate_limiter: BaseRateLimiter = limiter_cls(per_min(1), store)
+        assert rate_limiter._prepare_key("user") == "throttled:v1:gcra:user"
+
+    @classmethod
+    @pytest.mark.parametrize("limiter_type", constants.RateLimiterType.choice())
+    def test_init__sub_second_period(cls, store: BaseStore, limiter_type: str) -> None:
+        quota: Quota = per_duration(timedelta(milliseconds=100), 5)
+        limiter_cls = RateLimiterRegistry.get(limiter_type)
+        if limiter_type in {
+            constants.RateLimiterType.TOKEN_BUCKET.value,
+            constants.RateLimiterType.LEAKING_BUCKET.value,
+            constants.RateLimiterType.GCRA.value,
+            constants.RateLimiterType.SLIDING_WINDOW_LOG.value,
+            constants.RateLimiterType.CONCURRENCY.value,
+        }:
+            assert limiter_cls(quota, store).limit("key", 5).limited is False
+            return
+
+        with pytest.raises(exceptions.SetUpError, match="period under one second"):
+            limiter_cls(quota, store)
+
+        # Window-based algorithms would truncate the period to whole seconds.
+        quota = per_duration(timedelta(milliseconds=1500), 3)
+        with pytest.raises(exceptions.SetUpError, match="fraction of seconds"):
+            limiter_cls(quota, store)
+
+    @classmethod
+    def test_key_layout__invalid(cls) -> None:
+        with pytest.raises(
+            exceptions.SetUpError, match="KEY_LAYOUT must be one of plain, hash_tag"
+        ):
+            MemoryStore(options={"KEY_LAYOUT": "tag"})
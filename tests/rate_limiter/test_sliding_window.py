@@ -1,4 +1,5 @@
 import math
+import time
 from collections.abc import Callable
 from datetime import timedelta
 
@@ -11,7 +12,9 @@ from throttled import (
     RateLimiterRegistry,
     RateLimitResult,
     RateLimitState,
+    RedisStore,
     per_min,
+    utils,
 )
 from throttled.constants import RateLimiterType
 from throttled.types import TimeLikeValueT
@@ -50,16 +53,33 @@ class TestSlidingWindowRateLimiter:
         assert quota.get_period_sec() == period
 
         rate_limiter: BaseRateLimiter = rate_limiter_constructor(quota)
-        store_key: str = f"throttled:v1:sliding_window:key:period:{now_sec() // period}"
+        store_key: str = "throttled:v1:sliding_window:key"
         assert rate_limiter._store.exists(store_key) is False
 
         for case in parametrizes.SLIDING_WINDOW_LIMIT_CASES:
             result: RateLimitResult = rate_limiter.limit("key", cost=case["cost"])
             assert_rate_limit_result(case["limited"], case["remaining"], quota, result)
-            assert rate_limiter._store.get(store_key) == case["count"]
+            counter = rate_limiter._store.hgetall(store_key)
+            assert int(counter["window"]) == now_sec() // period
+            assert int(counter["current"]) == case["count"]
             if "ttl" in case:
                 assert rate_limiter._store.ttl(store_key) == case["ttl"]
 
+    def test_limit__server_time(
+        self, monkeypatch: pytest.MonkeyPatch, redis_store: RedisStore
+    ):
+        # Clients with skewed clocks count in the window of the Redis server.
+        rate_limiter: BaseRateLimiter = RateLimiterRegistry.get(
+            RateLimiterType.SLIDING_WINDOW.value
+        )(per_min(5), redis_store)
+        for skew in [-3600, 0, 3600]:
+            monkeypatch.setattr(utils, "now_sec_f", lambda skew=skew: time.time() + skew)
+            rate_limiter.limit("key")
+
+        counter = redis_store.hgetall("throttled:v1:sliding_window:key")
+        assert int(counter["window"]) == now_sec() // 60
+        assert int(counter["current"]) == 3
+
     @parametrizes.LIMIT_C_QUOTA
     @parametrizes.LIMIT_C_REQUESTS_NUM
     def test_limit__concurrent(
@@ -0,0 +1,145 @@
+import time
+from collections.abc import Callable
+from datetime import timedelta
+from typing import Any
+
+import pytest
+from throttled import (
+    BaseRateLimiter,
+    BaseStore,
+    MemoryStore,
+    Quota,
+    RateLimiterRegistry,
+    RateLimitResult,
+    RateLimitState,
+    per_duration,
+    per_min,
+)
+from throttled.constants import RateLimiterType
+from throttled.types import TimeLikeValueT
+from throttled.utils import Benchmark, Timer
+
+from . import parametrizes
+
+
+@pytest.fixture
+def rate_limiter_constructor(
+    store: BaseStore,
+) -> Callable[[Quota], BaseRateLimiter]:
+    def _create_rate_limiter(quota: Quota) -> BaseRateLimiter:
+        return RateLimiterRegistry.get(RateLimiterType.SLIDING_WINDOW_LOG.value)(
+            quota, store
+        )
+
+    return _create_rate_limiter
+
+
+def assert_rate_limit_result(
+    case: dict[str, Any], quota: Quota, result: RateLimitResult
+):
+    assert result.limited == case["limited"]
+    assert result.state.limit == quota.get_limit()
+    assert result.state.remaining == case["remaining"]
+    assert result.state.reset_after == pytest.approx(case["reset_after"], abs=0.1)
+    assert result.state.retry_after == pytest.approx(case.get("retry_after", 0), abs=0.1)
+
+
+class TestSlidingWindowLogRateLimiter:
+    def test_limit(self, rate_limiter_constructor: Callable[[Quota], BaseRateLimiter]):
+        quota: Quota = per_min(5)
+        rate_limiter: BaseRateLimiter = rate_limiter_constructor(quota)
+        for case in parametrizes.SLIDING_WINDOW_LOG_LIMIT_CASES:
+            result: RateLimitResult = rate_limiter.limit("key", cost=case["cost"])
+            assert_rate_limit_result(case, quota, result)
+
+    def test_limit__retry_after(
+        self, rate_limiter_constructor: Callable[[Quota], BaseRateLimiter]
+    ):
+        rate_limiter: BaseRateLimiter = rate_limiter_constructor(
+            per_duration(timedelta(seconds=1), 3)
+        )
+        rate_limiter.limit("key")
+        time.sleep(0.3)
+        rate_limiter.limit("key", cost=2)
+
+        # A request is allowed as soon as enough logged requests leave the window.
+        result: RateLimitResult = rate_limiter.limit("key")
+        assert result.limited is True
+        assert result.state.retry_after == pytest.approx(0.7, abs=0.05)
+        assert rate_limiter.limit("key", cost=2).state.retry_after == pytest.approx(
+            1, abs=0.05
+        )
+
+        time.sleep(result.state.retry_after + 0.01)
+        assert rate_limiter.limit("key").limited is False
+        assert rate_limiter.limit("key").limited is True
+
+    def test_limit__sub_second_period(
+        self, rate_limiter_constructor: Callable[[Quota], BaseRateLimiter]
+    ):
+        rate_limiter: BaseRateLimiter = rate_limiter_constructor(
+            per_duration(timedelta(milliseconds=200), 2)
+        )
+        assert [rate_limiter.limit("key").limited for __ in range(3)] == [
+            False,
+            False,
+            True,
+        ]
+
+        time.sleep(0.21)
+        result: RateLimitResult = rate_limiter.limit("key")
+        assert result.limited is False
+        assert result.state.reset_after == pytest.approx(0.2)
+
+    def test_limit__memory_bounded(self):
+        store: MemoryStore = MemoryStore()
+        rate_limiter: BaseRateLimiter = RateLimiterRegistry.get(
+            RateLimiterType.SLIDING_WINDOW_LOG.value
+        )(per_min(3), store)
+        for __ in range(10):
+            rate_limiter.limit("key")
+
+        # Only allowed requests are logged.
+        log = store._backend.get_log("throttled:v1:sliding_window_log:key")
+        assert log is not None and len(log) == 3 and log.maxlen == 3
+
+    @parametrizes.LIMIT_C_QUOTA
+    @parametrizes.LIMIT_C_REQUESTS_NUM
+    def test_limit__concurrent(
+        self,
+        benchmark: Benchmark,
+        rate_limiter_constructor: Callable[[Quota], BaseRateLimiter],
+        quota: Quota,
+        requests_num: int,
+    ):
+        def _callback(elapsed: TimeLikeValueT, *args, **kwargs):
+            accessed_num: int = requests_num - sum(results)
+            limit: int = min(requests_num, quota.get_limit())
+            # Logged requests only leave the window once a period has elapsed.
+            windows: int = 1 + int(elapsed // quota.get_period_sec())
+            assert limit <= accessed_num <= limit * windows
+
+        with Timer(callback=_callback):
+            rate_limiter: BaseRateLimiter = rate_limiter_constructor(quota)
+            results: list[bool] = benchmark.concurrent(
+                task=lambda: rate_limiter.limit("key").limited, batch=requests_num
+            )
+
+    def test_peek(self, rate_limiter_constructor: Callable[[Quota], BaseRateLimiter]):
+        key: str = "key"
+        rate_limiter: BaseRateLimiter = rate_limiter_constructor(per_min(2))
+        assert rate_limiter.peek(key) == RateLimitState(
+            limit=2, remaining=2, reset_after=0
+        )
+
+        rate_limiter.limit(key)
+        state: RateLimitState = rate_limiter.peek(key)
+        assert state.remaining == 1 and state.retry_after == 0
+        assert state.reset_after == pytest.approx(60, abs=0.1)
+
+        time.sleep(0.2)
+        rate_limiter.limit(key)
+        state = rate_limiter.peek(key)
+        assert state.remaining == 0
+        assert state.reset_after == pytest.approx(60, abs=0.1)
+        assert state.retry_after == pytest.approx(59.8, abs=0.1)
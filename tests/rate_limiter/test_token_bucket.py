@@ -1,5 +1,6 @@
 import time
 from collections.abc import Callable
+from datetime import timedelta
 from typing import Any
 
 import pytest
@@ -10,6 +11,7 @@ from throttled import (
     RateLimiterRegistry,
     RateLimitResult,
     RateLimitState,
+    per_duration,
     per_min,
 )
 from throttled.constants import RateLimiterType
@@ -35,8 +37,11 @@ def assert_rate_limit_result(
     assert result.limited == case["limited"]
     assert result.state.limit == quota.burst
     assert result.state.remaining == case["remaining"]
-    assert result.state.reset_after == quota.burst - case["remaining"]
-    assert result.state.retry_after == case.get("retry_after", 0)
+    # Tokens are refilled continuously, so the times are a bit shorter.
+    assert result.state.reset_after == pytest.approx(
+        quota.burst - case["remaining"], abs=0.1
+    )
+    assert result.state.retry_after == pytest.approx(case.get("retry_after", 0), abs=0.1)
 
 
 class TestTokenBucketRateLimiter:
@@ -82,11 +87,27 @@ class TestTokenBucketRateLimiter:
 
         rate_limiter.limit(key, cost=5)
         state = rate_limiter.peek(key)
-        assert state == RateLimitState(limit=10, remaining=5, reset_after=5)
+        assert (state.limit, state.remaining) == (10, 5)
+        assert state.reset_after == pytest.approx(5, abs=0.1)
 
         time.sleep(1)
         state = rate_limiter.peek(key)
-        assert state in [
-            RateLimitState(limit=10, remaining=6, reset_after=4),
-            RateLimitState(limit=10, remaining=7, reset_after=3),
-        ]
+        assert (state.limit, state.remaining) == (10, 6)
+        assert state.reset_after == pytest.approx(4, abs=0.2)
+
+    def test_limit__sub_second_period(
+        self, rate_limiter_constructor: Callable[[Quota], BaseRateLimiter]
+    ):
+        # One token is refilled every 20ms, rather than 5 tokens every 100ms.
+        quota: Quota = per_duration(timedelta(milliseconds=100), limit=5)
+        rate_limiter: BaseRateLimiter = rate_limiter_constructor(quota)
+        assert rate_limiter.limit("key", cost=5).limited is False
+
+        result: RateLimitResult = rate_limiter.limit("key", cost=2)
+        assert result.limited is True
+        assert 0 < result.state.retry_after <= 0.04
+        assert result.state.reset_after <= 0.1
+
+        time.sleep(result.state.retry_after + 0.005)
+        assert rate_limiter.limit("key", cost=2).limited is False
+        assert rate_limiter.peek("key").reset_after <= 0.1
@@ -0,0 +1,111 @@
+import pytest
+from throttled.exceptions import SetUpError
+from throttled.store import ClientCache, ClientCacheStats
+from throttled.store.client_cache import BaseClientTracker
+
+
+def _create_cache(**kwargs) -> ClientCache:
+    cache = ClientCache(**kwargs)
+    cache.enable()
+    return cache
+
+
+class TestClientCache:
+    def test_constructor__invalid_max_size(self):
+        with pytest.raises(SetUpError, match="max_size must be a positive integer"):
+            ClientCache(max_size=0)
+
+    def test_get(self):
+        cache: ClientCache = _create_cache()
+        assert cache.get("get", "throttled:key") == (False, None)
+
+        cache.set(cache.begin("throttled:key"), "get", "throttled:key", None)
+        assert cache.get("get", "throttled:key") == (True, None)
+        # Values are cached per read command.
+        assert cache.get("hgetall", "throttled:key") == (False, None)
+
+        stats: ClientCacheStats = cache.get_stats()
+        assert (stats.hits, stats.misses, stats.size) == (1, 2, 1)
+
+    def test_is_cachable(self):
+        assert _create_cache().is_cachable("throttled:key") is True
+        assert _create_cache().is_cachable("other:key") is False
+        assert _create_cache(prefixes=[""]).is_cachable("other:key") is True
+
+    def test_set__invalidated(self):
+        cache: ClientCache = _create_cache()
+        token: object | None = cache.begin("throttled:key")
+
+        # The key changes while it is read, the value read may be stale.
+        cache.invalidate(["throttled:key"])
+        cache.set(token, "get", "throttled:key", 1)
+        assert cache.get("get", "throttled:key") == (False, None)
+
+    def test_set__max_size(self):
+        cache: ClientCache = _create_cache(max_size=2)
+        for key in ["a", "b", "a", "c"]:
+            cache.set(cache.begin(key), "get", key, key)
+
+        assert len(cache) == 2
+        assert cache.get("get", "b") == (False, None)
+        assert cache.get("get", "a") == (True, "a")
+        assert cache.get("get", "c") == (True, "c")
+
+    def test_invalidate__all(self):
+        cache: ClientCache = _create_cache()
+        for key in ["a", "b"]:
+            cache.set(cache.begin(key), "get", key, key)
+
+        cache.invalidate(None)
+        assert len(cache) == 0
+
+    def test_disable(self):
+        cache: ClientCache = _create_cache()
+        cache.set(cache.begin("a"), "get", "a", 1)
+
+        cache.disable()
+        assert len(cache) == 0
+        assert cache.begin("a") is None
+        assert cache.get_stats().enabled is False
+
+
+class TestBaseClientTracker:
+    @pytest.mark.parametrize(
+        ("message", "expected"),
+        [
+            ([b"message", b"__redis__:invalidate", [b"a"]], ["b"]),
+            (["message", "__redis__:invalidate", ["a", "b"]], []),
+            ([b"message", b"__redis__:invalidate", None], []),
+            ([b"message", b"__redis__:invalidate", b"a"], ["b"]),
+            ([b"subscribe", b"__redis__:invalidate", 1], ["a", "b"]),
+            (None, ["a", "b"]),
+        ],
+        ids=["keys", "decoded", "all", "published", "subscribe", "none"],
+    )
+    def test_on_message(self, message: object, expected: list[str]):
+        cache: ClientCache = _create_cache(prefixes=[""])
+        for key in ["a", "b"]:
+            cache.set(cache.begin(key), "get", key, key)
+
+        BaseClientTracker(cache)._on_message(message)
+        assert [key for key in ["a", "b"] if cache.get("get", key)[0]] == expected
+
+    @pytest.mark.parametrize(
+        ("prefixes", "expected"),
+        [
+            (["throttled:"], ["PREFIX", "throttled:"]),
+            (["a:", "b:"], ["PREFIX", "a:", "PREFIX", "b:"]),
+            (["a:", ""], []),
+        ],
+    )
+    def test_get_tracking_args(self, prefixes: list[str], expected: list[str]):
+        tracker = BaseClientTracker(ClientCache(prefixes=prefixes))
+        assert tracker._get_tracking_args(7) == [
+            "CLIENT",
+            "TRACKING",
+            "ON",
+            "REDIRECT",
+            7,
+            "BCAST",
+            *expected,
+        ]
@@ -1,6 +1,23 @@
+import threading
+import time
+from collections import deque
+
 import pytest
-from throttled import MemoryStore
-from throttled.constants import STORE_TTL_STATE_NOT_EXIST
+from throttled import (
+    ManualClock,
+    MemoryStore,
+    RateLimiterRegistry,
+    Throttled,
+    per_sec,
+)
+from throttled.constants import (
+    STORE_TTL_STATE_NOT_EXIST,
+    MemoryEvictionPolicy,
+    RateLimiterType,
+)
+from throttled.exceptions import DataError, SetUpError
+
+from ..rate_limiter import parametrizes
 
 
 @pytest.fixture
@@ -24,3 +41,241 @@ class TestMemoryStore:
                 assert store.ttl(key) == STORE_TTL_STATE_NOT_EXIST
 
             assert store.exists(key) is exists
+
+    @pytest.mark.parametrize(
+        "options",
+        [
+            {"SHARDS": 0},
+            {"SHARDS": "4"},
+            {"MAX_SIZE": 2, "SHARDS": 4},
+        ],
+    )
+    def test_constructor__invalid_shards(self, options: dict[str, object]):
+        with pytest.raises(SetUpError, match="SHARDS must be a positive integer"):
+            MemoryStore(options=options)
+
+    def test_set__overflow__shards(self):
+        timeout: int = 10
+        store: MemoryStore = MemoryStore(options={"MAX_SIZE": 64, "SHARDS": 4})
+        assert [segment.max_size for segment in store._backend.segments] == [16] * 4
+
+        keys: list[str] = [str(idx) for idx in range(256)]
+        for key in keys:
+            store.set(key, 1, timeout)
+
+        # Capacity is enforced per shard, and the most recent key always survives.
+        for segment in store._backend.segments:
+            assert len(segment.get_client()) <= segment.max_size
+        assert sum(store.exists(key) for key in keys) <= store._backend.max_size
+        assert store.get(keys[-1]) == 1
+
+        # The lock of the first segment is still reachable, with a warning.
+        with pytest.warns(DeprecationWarning, match="get_lock"):
+            assert store._backend.lock is store._backend.locks[0]
+
+    @pytest.mark.parametrize("using", parametrizes.CONSUMING_LIMITER_TYPES)
+    def test_limit__shards__concurrent(self, using: str):
+        store: MemoryStore = MemoryStore(options={"SHARDS": 8})
+        throttle: Throttled = Throttled(using=using, quota="100/h", store=store)
+        keys: list[str] = [f"key-{idx}" for idx in range(8)]
+
+        def _call() -> None:
+            for _ in range(50):
+                throttle.limit_all([(key, 1) for key in keys])
+
+        threads: list[threading.Thread] = [
+            threading.Thread(target=_call) for _ in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        # Multi-key operations across shards neither deadlock nor lose updates.
+        assert [throttle.peek(key).remaining for key in keys] == [0] * len(keys)
+
+    @pytest.mark.parametrize(
+        ("options", "match"),
+        [
+            ({"SWEEP_INTERVAL": -1}, "SWEEP_INTERVAL must be a non-negative number"),
+            ({"SWEEP_INTERVAL": "1"}, "SWEEP_INTERVAL must be a non-negative number"),
+            ({"SWEEP_BATCH_SIZE": 0}, "SWEEP_BATCH_SIZE must be a positive integer"),
+        ],
+    )
+    def test_constructor__invalid_sweep(self, options: dict[str, object], match: str):
+        with pytest.raises(SetUpError, match=match):
+            MemoryStore(options=options)
+
+    def test_constructor__invalid_clock(self):
+        with pytest.raises(SetUpError, match="CLOCK must be an instance of Clock"):
+            MemoryStore(options={"CLOCK": time.monotonic})
+
+    def test_clock(self):
+        clock: ManualClock = ManualClock()
+        store: MemoryStore = MemoryStore(options={"CLOCK": clock})
+        store.set("key", 1, 10)
+        clock.advance(9.5)
+        assert store.ttl("key") == 1
+        assert store.get("key") == 1
+
+        clock.advance(0.5)
+        assert store.get("key") is None
+        assert store.ttl("key") == STORE_TTL_STATE_NOT_EXIST
+
+    def test_sweep(self):
+        clock: ManualClock = ManualClock()
+        store: MemoryStore = MemoryStore(
+            options={"SHARDS": 2, "SWEEP_BATCH_SIZE": 2, "CLOCK": clock}
+        )
+        for idx in range(5):
+            store.set(f"expired-{idx}", idx, 1)
+            store.set(f"alive-{idx}", idx, 10)
+        store.hset("extended", "tokens", 1)
+        store.expire("extended", 1)
+        store.expire("extended", 10)
+
+        assert store._backend.sweep() == 0
+        # Keys are indexed by the second they expire in, wait for it to pass.
+        clock.advance(2.1)
+
+        # Expired keys are removed without being touched, in multiple batches.
+        assert store._backend.sweep() == 5
+        clients = [segment.get_client() for segment in store._backend.segments]
+        assert sorted(key for client in clients for key in client) == sorted(
+            ["extended"] + [f"alive-{idx}" for idx in range(5)]
+        )
+        assert store.hgetall("extended") == {"tokens": 1}
+
+    def test_constructor__invalid_eviction_policy(self):
+        with pytest.raises(SetUpError, match="EVICTION_POLICY must be one of"):
+            MemoryStore(options={"EVICTION_POLICY": "fifo"})
+
+    @pytest.mark.parametrize("policy", MemoryEvictionPolicy.choice())
+    def test_set__overflow__eviction_policy(self, policy: str):
+        store: MemoryStore = MemoryStore(
+            options={"MAX_SIZE": 100, "SHARDS": 2, "EVICTION_POLICY": policy}
+        )
+        for idx in range(1000):
+            store.set(str(idx), idx, idx % 10 + 1)
+            store.get(str(idx // 2))
+
+        for segment in store._backend.segments:
+            assert len(segment.get_client()) <= segment.max_size
+            # Evicted keys are dropped from the expiration index.
+            indexed: int = sum(len(keys) for keys in segment._expire_slots.values())
+            assert indexed == len(segment.get_client())
+        assert store.get("999") == 999
+
+    def test_set__overflow__ttl_first(self):
+        store: MemoryStore = MemoryStore(
+            options={"MAX_SIZE": 3, "EVICTION_POLICY": "ttl_first"}
+        )
+        store.hset("no-ttl", "tokens", 1)
+        store.set("short", 1, 10)
+        store.set("long", 1, 100)
+        # The key that expires soonest is evicted, even if it was used recently.
+        store.get("short")
+        store.set("middle", 1, 50)
+        assert sorted(store._backend.get_client()) == ["long", "middle", "no-ttl"]
+
+        # An extended key is evicted by its new expiration time.
+        store.expire("middle", 200)
+        store.set("new", 1, 150)
+        assert sorted(store._backend.get_client()) == ["middle", "new", "no-ttl"]
+
+    def test_set__overflow__w_tinylfu(self):
+        store: MemoryStore = MemoryStore(
+            options={"MAX_SIZE": 100, "EVICTION_POLICY": "w_tinylfu"}
+        )
+        hot_keys: list[str] = [f"hot-{idx}" for idx in range(50)]
+        for key in hot_keys:
+            store.set(key, 1, 60)
+        # Move the last hot key out of the window before it gets hit.
+        store.set("warm", 1, 60)
+        for _ in range(3):
+            for key in hot_keys:
+                store.get(key)
+
+        # A scan over one-off keys does not flush out the hot keys.
+        for idx in range(1000):
+            store.set(f"scan-{idx}", 1, 60)
+        assert all(store.exists(key) for key in hot_keys)
+        assert len(store._backend.get_client()) == 100
+
+        lru_store: MemoryStore = MemoryStore(options={"MAX_SIZE": 100})
+        for key in hot_keys:
+            lru_store.set(key, 1, 60)
+        for idx in range(1000):
+            lru_store.set(f"scan-{idx}", 1, 60)
+        assert not any(lru_store.exists(key) for key in hot_keys)
+
+    def test_set__expire_index(self, store: MemoryStore):
+        backend = store._backend
+        limiter = RateLimiterRegistry.get(RateLimiterType.GCRA.value)(
+            per_sec(1000), store
+        )
+        for idx in range(1000):
+            store.set("number", idx, 10)
+            backend.set_log("log", deque([float(idx)]), 10)
+            backend.set_leases("leases", {str(idx): float(idx)}, 10)
+            limiter.limit("key")
+
+        # Keys keep their expiration time when overwritten, so they are only
+        # indexed again if they expire earlier.
+        segment = backend.segments[0]
+        assert sum(len(keys) for keys in segment._expire_slots.values()) <= 8
+        assert store.get("number") == 999
+        assert backend.get_log("log") == deque([999.0])
+
+        # Deleted keys are dropped from the index without sweeping.
+        for key in list(backend.get_client()):
+            store._backend.delete(key)
+        assert segment._expire_slots == {}
+
+    def test_get_log(self, store: MemoryStore):
+        backend = store._backend
+        assert backend.get_log("log") is None
+
+        backend.set_log("log", deque([1.0, 2.0], maxlen=2), 10)
+        assert backend.get_log("log") == deque([1.0, 2.0])
+        assert 0 < store.ttl("log") <= 10
+
+        store.set("number", 1, 10)
+        store.hset("dict", "k", 1)
+        for key in ["number", "dict"]:
+            with pytest.raises(DataError, match="does not support get_log"):
+                backend.get_log(key)
+        for method in [backend.get, lambda key: backend.incrby(key, 1)]:
+            with pytest.raises(DataError, match="log value does not support"):
+                method("log")
+
+    def test_get_leases(self, store: MemoryStore):
+        backend = store._backend
+        assert backend.get_leases("leases") is None
+
+        backend.set_leases("leases", {"1:1": 1.0}, 10)
+        assert backend.get_leases("leases") == {"1:1": 1.0}
+        assert 0 < store.ttl("leases") <= 10
+
+        store.set("number", 1, 10)
+        backend.set_log("log", deque([1.0]), 10)
+        for key in ["number", "log"]:
+            with pytest.raises(DataError, match="does not support get_leases"):
+                backend.get_leases(key)
+        for method in [backend.get, lambda key: backend.incrby(key, 1)]:
+            with pytest.raises(DataError, match="lease value does not support"):
+                method("leases")
+
+    def test_sweeper(self):
+        clock: ManualClock = ManualClock()
+        store: MemoryStore = MemoryStore(options={"SWEEP_INTERVAL": 0.1, "CLOCK": clock})
+        with pytest.raises(SetUpError, match="SWEEP_INTERVAL must be set"):
+            MemoryStore()._backend.start_sweeper()
+
+        store.set("key", 1, 1)
+        clock.advance(2.1)
+        time.sleep(0.3)
+        assert "key" not in store._backend.get_client()
+
+        store._backend.stop_sweeper()
+        assert store._backend._sweeper is None
@@ -0,0 +1,543 @@
+import time
+from collections.abc import Callable, Generator
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, cast
+
+import pytest
+from fakeredis import FakeConnection, FakeRedis, FakeServer
+from redis import BlockingConnectionPool, Redis
+from redis.exceptions import ConnectionError as RedisConnectionError
+from redis.exceptions import ResponseError
+from throttled import (
+    RateLimiterRegistry,
+    RateLimiterType,
+    RateLimitResult,
+    RedisStore,
+    per_min,
+)
+from throttled.constants import RedisScriptMode
+from throttled.exceptions import SetUpError, StoreUnavailableError
+from throttled.store import ClientCacheStats, PoolStats, ScriptRegistry
+from throttled.store.redis import BaseRedisAtomicAction, ClientTracker
+
+if TYPE_CHECKING:
+    from throttled.store.redis import AutoPipeline
+    from throttled.store.redis_pool import SyncPoolStatsMixin
+
+
+def _create_store(**options: Any) -> RedisStore:
+    return RedisStore(
+        options={
+            "REDIS_CLIENT_CLASS": "fakeredis.FakeRedis",
+            "CONNECTION_POOL_KWARGS": {"connection_class": FakeConnection},
+            **options,
+        }
+    )
+
+
+@pytest.fixture
+def store() -> Generator[RedisStore, Any, None]:
+    store: RedisStore = _create_store(
+        AUTO_PIPELINE=True, AUTO_PIPELINE_WINDOW=1, AUTO_PIPELINE_MAX_SIZE=5
+    )
+    yield store
+    store._backend.get_client().flushall()
+
+
+def _get_auto_pipeline(store: RedisStore) -> "AutoPipeline":
+    auto_pipeline: AutoPipeline | None = store._backend.get_auto_pipeline()
+    assert auto_pipeline is not None
+    return auto_pipeline
+
+
+def _count_batches(monkeypatch: pytest.MonkeyPatch, store: RedisStore) -> list[int]:
+    auto_pipeline: AutoPipeline = _get_auto_pipeline(store)
+    batches: list[int] = []
+    execute = auto_pipeline._execute
+
+    def _execute(batch: list[Any]) -> None:
+        batches.append(len(batch))
+        execute(batch)
+
+    monkeypatch.setattr(auto_pipeline, "_execute", _execute)
+    return batches
+
+
+def _emulate_tracking(monkeypatch: pytest.MonkeyPatch, store: RedisStore) -> None:
+    """Emulate CLIENT TRACKING, which fakeredis lacks, and wait for the tracker.
+
+    Invalidations are published by hand.
+    """
+    monkeypatch.setattr(ClientTracker, "_get_tracking_args", lambda *_: ["PING"])
+    deadline: float = time.monotonic() + 5
+    while not store.client_cache_stats().enabled:
+        assert time.monotonic() < deadline
+        time.sleep(0.01)
+
+
+def _emulate_functions(monkeypatch: pytest.MonkeyPatch, client: Any) -> list[str]:
+    """Emulate FUNCTION LOAD / FCALL with EVAL, which fakeredis lacks."""
+    calls: list[str] = []
+    libraries: list[str] = []
+
+    def _function_load(code: str, replace: bool = False) -> str:
+        libraries.append(code.split("\n", 1)[1])
+        return code.split("name=", 1)[1].split("\n", 1)[0]
+
+    def _fcall(command: str) -> Callable[..., Any]:
+        def _call(function: str, numkeys: int, *keys_and_args: Any) -> Any:
+            calls.append(command)
+            # Run the library in a script, with the function to call as the
+            # first argument.
+            script: str = "\n".join(
+                [
+                    "local functions = {}",
+                    "local function register_function(f)",
+                    "    functions[f.function_name] = f.callback",
+                    "end",
+                    libraries[-1].replace(
+                        "redis.register_function", "register_function"
+                    ),
+                    "local name = table.remove(ARGV, 1)",
+                    "return functions[name](KEYS, ARGV)",
+                ]
+            )
+            keys, args = keys_and_args[:numkeys], keys_and_args[numkeys:]
+            return client.eval(script, numkeys, *keys, function, *args)
+
+        return _call
+
+    monkeypatch.setattr(client, "function_load", _function_load)
+    monkeypatch.setattr(client, "fcall", _fcall("fcall"))
+    monkeypatch.setattr(client, "fcall_ro", _fcall("fcall_ro"))
+    return calls
+
+
+def _use_replica(monkeypatch: pytest.MonkeyPatch, store: RedisStore) -> FakeRedis:
+    # A Redis server of its own, which never receives the writes of limit().
+    replica = FakeRedis(server=FakeServer())
+    monkeypatch.setattr(
+        store._backend._connection_factory, "connect_replica", lambda url: replica
+    )
+    return replica
+
+
+def _run_in_threads(tasks: list[Callable[[], Any]]) -> list[Any]:
+    with ThreadPoolExecutor(max_workers=len(tasks)) as executor:
+        futures = [executor.submit(task) for task in tasks]
+    return [future.exception() or future.result() for future in futures]
+
+
+class TestRedisStore:
+    def test_preload_scripts(self):
+        store: RedisStore = _create_store()
+        client = cast("Redis", store._backend.get_client())
+        client.script_flush()
+
+        shas: list[str] = store.preload_scripts()
+        assert shas == list(ScriptRegistry.get_scripts())
+        assert all(cast("list[bool]", client.script_exists(*shas)))
+
+        # The scripts of all rate limiters are registered.
+        for using in RateLimiterType.choice():
+            limiter = RateLimiterRegistry.get(using)(per_min(1), store)
+            for action in limiter._atomic_actions.values():
+                assert isinstance(action, BaseRedisAtomicAction)
+                assert action._script.sha in shas
+
+    def test_execute_script__function(self, monkeypatch: pytest.MonkeyPatch):
+        store: RedisStore = _create_store(SCRIPT_MODE=RedisScriptMode.FUNCTION.value)
+        calls: list[str] = _emulate_functions(monkeypatch, store._backend.get_client())
+
+        for using in RateLimiterType.choice():
+            limiter = RateLimiterRegistry.get(using)(per_min(1), store)
+            assert limiter.limit(using).limited is False
+            assert limiter.limit(using).limited is True
+            assert limiter.peek(using).remaining == 0
+
+        # GCRA, sliding window log and concurrency peek by read-only functions.
+        assert calls.count("fcall_ro") == 3
+        assert calls.count("fcall") == 2 * len(RateLimiterType.choice())
+
+    def test_execute_script__function_missing(self, monkeypatch: pytest.MonkeyPatch):
+        store: RedisStore = _create_store(SCRIPT_MODE=RedisScriptMode.FUNCTION.value)
+        client = store._backend.get_client()
+        _emulate_functions(monkeypatch, client)
+        limiter = RateLimiterRegistry.get(RateLimiterType.GCRA.value)(per_min(1), store)
+        assert limiter.limit("missing").limited is False
+
+        def _fcall(*args: Any) -> Any:
+            raise ResponseError("ERR Function not found")
+
+        monkeypatch.setattr(client, "fcall", _fcall)
+        loads: list[bool] = []
+        load_functions = store._backend.load_functions
+        monkeypatch.setattr(
+            store._backend, "load_functions", lambda: loads.append(load_functions())
+        )
+
+        # The library is loaded again, and the call falls back to EVALSHA.
+        assert limiter.limit("missing").limited is True
+        assert loads == [True]
+
+    def test_execute_script__function_unsupported(self):
+        # fakeredis does not support FUNCTION, scripts fall back to EVALSHA.
+        store: RedisStore = _create_store(SCRIPT_MODE=RedisScriptMode.FUNCTION.value)
+        limiter = RateLimiterRegistry.get(RateLimiterType.GCRA.value)(per_min(1), store)
+        assert limiter.limit("unsupported").limited is False
+        assert limiter.limit("unsupported").limited is True
+        assert store._backend.uses_functions() is False
+
+    def test_script_mode__invalid(self):
+        with pytest.raises(
+            SetUpError, match="SCRIPT_MODE must be one of eval, function"
+        ):
+            _create_store(SCRIPT_MODE="fcall")
+
+    def test_execute_script__reload(self, monkeypatch: pytest.MonkeyPatch):
+        store: RedisStore = _create_store()
+        limiter = RateLimiterRegistry.get(RateLimiterType.GCRA.value)(per_min(1), store)
+        client = cast("Redis", store._backend.get_client())
+        client.flushall()
+        client.script_flush()
+
+        loads: list[list[str]] = []
+        load_scripts = store._backend.load_scripts
+
+        def _load_scripts() -> list[str]:
+            loads.append(load_scripts())
+            return loads[-1]
+
+        monkeypatch.setattr(store._backend, "load_scripts", _load_scripts)
+
+        # A missing script reloads all scripts at once.
+        assert limiter.limit("key").limited is False
+        assert limiter.peek("key").remaining == 0
+        assert len(loads) == 1
+        assert all(cast("list[bool]", client.script_exists(*loads[0])))
+
+        # Once a connection has reconnected, e.g. after a failover, all scripts
+        # are loaded again before the next call instead of on a miss.
+        client.script_flush()
+        reconnected: int = store.pool_stats().reconnected
+        pool = cast("SyncPoolStatsMixin", client.connection_pool)
+        connection = pool.acquire()
+        connection.disconnect()
+        connection.connect()
+        pool.release(connection)
+        assert store.pool_stats().reconnected == reconnected + 1
+
+        store._backend.ensure_scripts()
+        store._backend.ensure_scripts()
+        assert len(loads) == 2
+        assert all(cast("list[bool]", client.script_exists(*loads[1])))
+
+    @pytest.mark.parametrize("using", RateLimiterType.choice())
+    def test_read_from_replicas(self, monkeypatch: pytest.MonkeyPatch, using: str):
+        store: RedisStore = _create_store(READ_FROM_REPLICAS=True)
+        _use_replica(monkeypatch, store)
+        limiter = RateLimiterRegistry.get(using)(per_min(1), store)
+
+        assert limiter.limit(f"replica-{using}").limited is False
+        # Peeks are served by the replica, which has not seen the write yet.
+        assert limiter.peek(f"replica-{using}").remaining == 1
+
+    def test_read_from_replicas__max_lag(self, monkeypatch: pytest.MonkeyPatch):
+        store: RedisStore = _create_store(READ_FROM_REPLICAS=True, REPLICA_MAX_LAG=1)
+        _use_replica(monkeypatch, store)
+        info: dict[str, Any] = {
+            "role": "master",
+            "master_repl_offset": 200,
+            "slave0": {"state": "online", "offset": 100},
+        }
+        # The lag is checked on the primary.
+        monkeypatch.setattr(
+            store._backend.get_client(), "info", lambda section, **kwargs: info
+        )
+        store.set("lag", 1, 60)
+
+        # Reads go to the primary while replicas lag behind.
+        assert store.get("lag") == 1
+
+        # The lag is checked again after replica_check_interval, the replica has
+        # caught up with the primary as of the previous check.
+        info.update(master_repl_offset=300, slave0={"state": "online", "offset": 200})
+        assert store.get("lag") == 1
+        store._backend._replica_checked_at -= store._backend.replica_check_interval
+        assert store.get("lag") is None
+
+        info["slave0"] = {"state": "wait_bgsave", "offset": 300}
+        store._backend._replica_checked_at -= store._backend.replica_check_interval
+        assert store.get("lag") == 1
+
+    def test_get_replication_lag(self):
+        backend = _create_store(READ_FROM_REPLICAS=True, REPLICA_MAX_LAG=5)._backend
+        assert backend._get_replication_lag({"role": "master"}, 0) == float("inf")
+
+        def _info(primary: int, *replicas: int) -> dict[str, Any]:
+            info: dict[str, Any] = {"role": "master", "master_repl_offset": primary}
+            for index, offset in enumerate(replicas):
+                info[f"slave{index}"] = {"state": "online", "offset": offset}
+            return info
+
+        assert backend._get_replication_lag(_info(100, 100), 1) == 0
+        assert backend._get_replication_lag(_info(200, 200), 2) == 0
+        # The lag is the time since the primary was at the offset of the replica,
+        # the largest one of all replicas.
+        assert backend._get_replication_lag(_info(300, 300, 100), 4) == 3
+        assert backend._get_replication_lag(_info(300, 200, 250), 5) == 3
+        # Checks older than REPLICA_MAX_LAG are forgotten.
+        assert backend._get_replication_lag(_info(300, 200), 8) == float("inf")
+
+        # Redis Cluster replies with the info of each node.
+        backend = _create_store(READ_FROM_REPLICAS=True, REPLICA_MAX_LAG=5)._backend
+        cluster: dict[str, dict[str, Any]] = {
+            "127.0.0.1:7000": _info(100, 100),
+            "127.0.0.1:7001": {"role": "slave"},
+            "127.0.0.1:7002": _info(200, 200),
+        }
+        assert backend._get_replication_lag(cluster, 1) == 0
+        cluster["127.0.0.1:7000"] = _info(300, 100)
+        cluster["127.0.0.1:7002"] = _info(200, 200)
+        assert backend._get_replication_lag(cluster, 2) == 1
+
+    @pytest.mark.parametrize("max_lag", [-1, "1"])
+    def test_read_from_replicas__invalid_max_lag(self, max_lag: Any):
+        with pytest.raises(
+            SetUpError, match="REPLICA_MAX_LAG must be a non-negative number or None"
+        ):
+            _create_store(READ_FROM_REPLICAS=True, REPLICA_MAX_LAG=max_lag)
+
+    def test_prewarm(self):
+        store: RedisStore = _create_store(
+            REUSE_CONNECTION=False, MAX_CONNECTIONS=4, POOL_PREWARM=2
+        )
+        assert store.prewarm() == 2
+        # Connections beyond MAX_CONNECTIONS are not opened.
+        assert store.prewarm(10) == 4
+
+        stats: PoolStats = store.pool_stats()
+        assert (stats.created, stats.in_use, stats.idle) == (4, 0, 4)
+        assert stats.max_connections == 4
+        assert stats.acquired == 6
+
+    def test_pool_stats(self):
+        store: RedisStore = _create_store(REUSE_CONNECTION=False)
+        limiter = RateLimiterRegistry.get(RateLimiterType.GCRA.value)(per_min(1), store)
+        limiter.limit("pool-stats")
+        limiter.peek("pool-stats")
+
+        stats: PoolStats = store.pool_stats()
+        assert (stats.created, stats.in_use, stats.idle) == (1, 0, 1)
+        assert stats.max_connections is None
+        assert stats.acquired >= 2
+        assert stats.wait_time > 0
+
+    def test_pool_timeout(self):
+        store: RedisStore = _create_store(
+            REUSE_CONNECTION=False, MAX_CONNECTIONS=1, POOL_TIMEOUT=0.01
+        )
+        pool: Any = store._backend.get_client().connection_pool
+        assert isinstance(pool, BlockingConnectionPool)
+
+        connection: Any = cast("SyncPoolStatsMixin", pool).acquire()
+        # The pool waits for POOL_TIMEOUT for a free connection.
+        with pytest.raises(StoreUnavailableError) as exc_info:
+            store.get("pool-timeout")
+        assert isinstance(exc_info.value.__cause__, RedisConnectionError)
+        pool.release(connection)
+        assert store.get("pool-timeout") is None
+
+    @pytest.mark.parametrize(
+        ("options", "match"),
+        [
+            ({"MAX_CONNECTIONS": 0}, "MAX_CONNECTIONS must be a positive integer"),
+            ({"POOL_TIMEOUT": -1}, "POOL_TIMEOUT must be a non-negative number"),
+            (
+                {"HEALTH_CHECK_INTERVAL": "1"},
+                "HEALTH_CHECK_INTERVAL must be a non-negative number",
+            ),
+            ({"POOL_PREWARM": -1}, "POOL_PREWARM must be a non-negative integer"),
+            (
+                {"POOL_TIMEOUT": 1, "SENTINELS": [("localhost", 26379)]},
+                "POOL_TIMEOUT requires a standalone Redis server",
+            ),
+        ],
+    )
+    def test_pool_options__invalid(self, options: dict[str, Any], match: str):
+        with pytest.raises(SetUpError, match=match):
+            _create_store(**options)
+
+    def test_execute_scripts__reload(self, monkeypatch: pytest.MonkeyPatch):
+        store: RedisStore = _create_store()
+        limiter = RateLimiterRegistry.get(RateLimiterType.GCRA.value)(per_min(1), store)
+        client = cast("Redis", store._backend.get_client())
+        client.flushall()
+        client.script_flush()
+
+        loads: list[list[str]] = []
+        load_scripts = store._backend.load_scripts
+        monkeypatch.setattr(
+            store._backend, "load_scripts", lambda: loads.append(load_scripts())
+        )
+
+        # Missed calls are retried in order after one reload.
+        results: list[RateLimitResult] = limiter.limit_many(
+            [("batch-a", 1), ("batch-b", 1), ("batch-a", 1)]
+        )
+        assert [result.limited for result in results] == [False, False, True]
+        assert len(loads) == 1
+
+    def test_auto_pipeline__disabled(self):
+        assert _create_store()._backend.get_auto_pipeline() is None
+
+    @pytest.mark.parametrize(
+        ("options", "match"),
+        [
+            (
+                {"AUTO_PIPELINE_WINDOW": -1},
+                "AUTO_PIPELINE_WINDOW must be a non-negative number",
+            ),
+            (
+                {"AUTO_PIPELINE_WINDOW": "0"},
+                "AUTO_PIPELINE_WINDOW must be a non-negative number",
+            ),
+            (
+                {"AUTO_PIPELINE_MAX_SIZE": 0},
+                "AUTO_PIPELINE_MAX_SIZE must be a positive integer",
+            ),
+            (
+                {"AUTO_PIPELINE_MAX_SIZE": 1.5},
+                "AUTO_PIPELINE_MAX_SIZE must be a positive integer",
+            ),
+        ],
+    )
+    def test_auto_pipeline__invalid_options(self, options: dict[str, Any], match: str):
+        with pytest.raises(SetUpError, match=match):
+            _create_store(AUTO_PIPELINE=True, **options)
+
+    @pytest.mark.parametrize("using", RateLimiterType.choice())
+    def test_auto_pipeline(
+        self, monkeypatch: pytest.MonkeyPatch, store: RedisStore, using: str
+    ):
+        batches: list[int] = _count_batches(monkeypatch, store)
+        limiter = RateLimiterRegistry.get(using)(per_min(5), store)
+
+        results: list[RateLimitResult] = _run_in_threads(
+            [lambda: limiter.limit("key") for __ in range(10)]
+        )
+        assert sum(result.limited for result in results) == 5
+        # Full batches are flushed without waiting for the window.
+        assert batches == [5, 5]
+
+    def test_auto_pipeline__window(self, monkeypatch: pytest.MonkeyPatch):
+        store: RedisStore = _create_store(AUTO_PIPELINE=True, AUTO_PIPELINE_WINDOW=0.2)
+        batches: list[int] = _count_batches(monkeypatch, store)
+        limiter = RateLimiterRegistry.get(RateLimiterType.GCRA.value)(per_min(5), store)
+
+        # Calls from other threads are batched within the window.
+        _run_in_threads([lambda: limiter.limit("key") for __ in range(3)])
+        assert batches == [3]
+
+    def test_auto_pipeline__error(self, store: RedisStore):
+        client = store._backend.get_client()
+        ok_script = client.register_script("return tonumber(ARGV[1])")
+        error_script = client.register_script("return redis.error_reply('oops')")
+
+        auto_pipeline: AutoPipeline = _get_auto_pipeline(store)
+        results: list[Any] = _run_in_threads(
+            [
+                lambda: auto_pipeline.execute(ok_script, [], [1]),
+                lambda: auto_pipeline.execute(error_script, [], []),
+                lambda: auto_pipeline.execute(ok_script, [], [2]),
+            ]
+        )
+
+        # An error is only raised to the caller of the failing script.
+        assert results[0] == 1
+        assert results[2] == 2
+        assert isinstance(results[1], ResponseError)
+
+
+class TestRedisStoreClientCache:
+    @pytest.mark.parametrize(
+        "using",
+        [
+            RateLimiterType.FIXED_WINDOW.value,
+            RateLimiterType.SLIDING_WINDOW.value,
+            RateLimiterType.TOKEN_BUCKET.value,
+            RateLimiterType.LEAKING_BUCKET.value,
+        ],
+    )
+    def test_client_cache(self, monkeypatch: pytest.MonkeyPatch, using: str):
+        store: RedisStore = _create_store(REUSE_CONNECTION=False, CLIENT_CACHE=True)
+        _emulate_tracking(monkeypatch, store)
+        # The fake server is shared with other tests that use the same keys.
+        cast("Redis", store._backend.get_client()).flushall()
+        limiter = RateLimiterRegistry.get(using)(per_min(5), store)
+
+        limiter.limit(f"cache-{using}")
+        # Peeks are answered locally until the key changes.
+        assert limiter.peek(f"cache-{using}").remaining == 4
+        assert limiter.peek(f"cache-{using}").remaining == 4
+        stats: ClientCacheStats = store.client_cache_stats()
+        assert (stats.hits, stats.misses, stats.size) == (1, 1, 1)
+
+        # Writes of the same process are visible right away.
+        limiter.limit(f"cache-{using}")
+        assert limiter.peek(f"cache-{using}").remaining == 3
+        assert store.client_cache_stats().misses == 2
+
+    def test_client_cache__invalidate(self, monkeypatch: pytest.MonkeyPatch):
+        store: RedisStore = _create_store(REUSE_CONNECTION=False, CLIENT_CACHE=True)
+        _emulate_tracking(monkeypatch, store)
+        store.set("throttled:invalidate", 1, 60)
+        assert store.get("throttled:invalidate") == 1
+
+        # Another process changes the key, Redis reports it as invalidated.
+        client = cast("Redis", store._backend.get_client())
+        client.set("throttled:invalidate", 2)
+        assert store.get("throttled:invalidate") == 1
+        client.publish(ClientTracker.CHANNEL, "throttled:invalidate")
+
+        deadline: float = time.monotonic() + 5
+        while store.get("throttled:invalidate") != 2:
+            assert time.monotonic() < deadline
+            time.sleep(0.01)
+
+    def test_client_cache__unsupported(self):
+        # fakeredis does not support CLIENT TRACKING, reads are not cached.
+        store: RedisStore = _create_store(REUSE_CONNECTION=False, CLIENT_CACHE=True)
+        store.set("throttled:unsupported", 1, 60)
+        tracker: ClientTracker | None = store._backend._client_tracker
+        assert tracker is not None
+
+        deadline: float = time.monotonic() + 5
+        while tracker.supported:
+            assert store.get("throttled:unsupported") == 1
+            assert time.monotonic() < deadline
+            time.sleep(0.01)
+        assert store.get("throttled:unsupported") == 1
+        assert store.client_cache_stats().hits == 0
+        assert store.pool_stats().in_use == 0
+
+    @pytest.mark.parametrize(
+        ("options", "match"),
+        [
+            (
+                {"CLIENT_CACHE_MAX_SIZE": 0},
+                "CLIENT_CACHE_MAX_SIZE must be a positive integer",
+            ),
+            (
+                {"READ_FROM_REPLICAS": True},
+                "CLIENT_CACHE is not available on Redis Cluster or with",
+            ),
+        ],
+    )
+    def test_client_cache__invalid_options(self, options: dict[str, Any], match: str):
+        with pytest.raises(SetUpError, match=match):
+            _create_store(CLIENT_CACHE=True, **options)
+
+    def test_client_cache__disabled(self):
+        with pytest.raises(SetUpError, match="CLIENT_CACHE is not enabled"):
+            _create_store().client_cache_stats()
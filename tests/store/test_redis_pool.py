@@ -1,7 +1,14 @@
 from typing import Any
 
 import pytest
-from throttled.store import BaseConnectionFactory, get_connection_factory
+from redis.sentinel import SentinelConnectionPool
+from throttled.exceptions import SetUpError
+from throttled.store import (
+    BaseConnectionFactory,
+    ConnectionFactory,
+    SentinelConnectionFactory,
+    get_connection_factory,
+)
 
 
 class TestRedisPool:
@@ -50,3 +57,15 @@ class TestRedisPool:
     ):
         with pytest.raises(exc, match=match):
             get_connection_factory(path, options)
+
+    def test_connect_replica(self):
+        factory = SentinelConnectionFactory({"SENTINELS": [("localhost", 26379)]})
+        replica = factory.connect_replica("redis://mymaster/0")
+        primary = factory.connect("redis://mymaster/0")
+        for client, is_master in ((replica, False), (primary, True)):
+            assert isinstance(client.connection_pool, SentinelConnectionPool)
+            assert client.connection_pool.is_master is is_master
+
+    def test_connect_replica__standalone(self):
+        with pytest.raises(SetUpError, match="requires Redis Sentinel or Cluster"):
+            ConnectionFactory({}).connect_replica()
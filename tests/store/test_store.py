@@ -131,14 +131,31 @@ class TestStore:
         assert isinstance(exc_info.value.__cause__, OpError)
 
 
+_REDIS_STORE_PARSE_COMMON_OPTIONS: dict[str, Any] = {
+    "AUTO_PIPELINE": False,
+    "AUTO_PIPELINE_WINDOW": 0,
+    "AUTO_PIPELINE_MAX_SIZE": 1024,
+    "SCRIPT_MODE": "eval",
+    "READ_FROM_REPLICAS": False,
+    "REPLICA_MAX_LAG": None,
+    "MAX_CONNECTIONS": None,
+    "POOL_TIMEOUT": None,
+    "POOL_PREWARM": 0,
+    "HEALTH_CHECK_INTERVAL": None,
+    "CLIENT_CACHE": False,
+    "CLIENT_CACHE_MAX_SIZE": 10000,
+    "CLIENT_CACHE_PREFIXES": ["throttled:"],
+}
+
 _REDIS_STORE_PARSE_EXPECTED_RESULTS: dict[str, dict[str, Any]] = {
     "standalone": {
         "server": "redis://localhost:6379/0",
-        "options": {},
+        "options": _REDIS_STORE_PARSE_COMMON_OPTIONS,
     },
     "sentinel": {
         "server": "redis://mymaster/0",
         "options": {
+            **_REDIS_STORE_PARSE_COMMON_OPTIONS,
             "SENTINELS": [("h1", 26379), ("h2", 26379)],
             "SENTINEL_KWARGS": {},
             "CONNECTION_FACTORY_CLASS": "throttled.store.SentinelConnectionFactory",
@@ -147,6 +164,7 @@ _REDIS_STORE_PARSE_EXPECTED_RESULTS: dict[str, dict[str, Any]] = {
     "sentinel_with_auth": {
         "server": "redis://mymaster/0",
         "options": {
+            **_REDIS_STORE_PARSE_COMMON_OPTIONS,
             "SENTINELS": [("localhost", 26379)],
             "USERNAME": "user",
             "PASSWORD": "pass",
@@ -157,6 +175,7 @@ _REDIS_STORE_PARSE_EXPECTED_RESULTS: dict[str, dict[str, Any]] = {
     "cluster": {
         "server": "redis+cluster://c1:7000,c2:7000,c3:7000",
         "options": {
+            **_REDIS_STORE_PARSE_COMMON_OPTIONS,
             "CLUSTER_NODES": [("c1", 7000), ("c2", 7000), ("c3", 7000)],
             "CONNECTION_FACTORY_CLASS": "throttled.store.ClusterConnectionFactory",
         },
@@ -164,6 +183,7 @@ _REDIS_STORE_PARSE_EXPECTED_RESULTS: dict[str, dict[str, Any]] = {
     "cluster_with_auth": {
         "server": "redis+cluster://user:pass@c1:7000",
         "options": {
+            **_REDIS_STORE_PARSE_COMMON_OPTIONS,
             "CLUSTER_NODES": [("c1", 7000)],
             "USERNAME": "user",
             "PASSWORD": "pass",
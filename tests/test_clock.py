@@ -0,0 +1,52 @@
+import asyncio
+import time
+
+import pytest
+from throttled import ManualClock, SimulatedClock, SystemClock
+from throttled.exceptions import DataError, SetUpError
+
+
+class TestClock:
+    def test_system_clock(self):
+        clock: SystemClock = SystemClock()
+        assert abs(clock.time() - time.time()) < 1
+        assert abs(clock.monotonic() - time.monotonic()) < 1
+
+    def test_manual_clock(self):
+        clock: ManualClock = ManualClock(start=100)
+        assert clock.time() == clock.monotonic() == 100
+
+        clock.advance(1.5)
+        assert clock.time() == clock.monotonic() == 101.5
+
+        # Sleeping advances the clock instead of blocking.
+        started_at: float = time.monotonic()
+        clock.sleep(3600)
+        asyncio.run(clock.async_sleep(3600))
+        assert time.monotonic() - started_at < 1
+        assert clock.time() == 7301.5
+
+        with pytest.raises(DataError, match="Invalid seconds"):
+            clock.advance(-1)
+
+    def test_simulated_clock(self):
+        clock: SimulatedClock = SimulatedClock(speed=1000, start=100)
+        assert clock.time() >= 100
+
+        started_at: float = time.monotonic()
+        clock.sleep(100)
+        asyncio.run(clock.async_sleep(100))
+        assert time.monotonic() - started_at < 1
+        assert clock.monotonic() >= 300
+
+        now: float = clock.time()
+        clock.advance(3600)
+        assert clock.time() >= now + 3600
+
+        with pytest.raises(DataError, match="Invalid seconds"):
+            clock.advance(-1)
+
+    @pytest.mark.parametrize("speed", [0, -1, "1"])
+    def test_simulated_clock__invalid_speed(self, speed: float):
+        with pytest.raises(SetUpError, match="speed must be a positive number"):
+            SimulatedClock(speed=speed)
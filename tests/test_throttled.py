@@ -1,14 +1,25 @@
+import threading
 from collections.abc import Callable
 from functools import partial
 from typing import Any, cast
 
 import pytest
-from throttled import RateLimiterType, Throttled, per_sec, rate_limiter, store
+from throttled import (
+    ManualClock,
+    RateLimiterType,
+    Throttled,
+    per_sec,
+    rate_limiter,
+    store,
+)
+from throttled.constants import KeyLayout
 from throttled.exceptions import BaseThrottledError, DataError, LimitedError
 from throttled.hooks import Hook
-from throttled.rate_limiter import RateLimitResult
+from throttled.rate_limiter import RateLimitResult, RateLimitState
 from throttled.types import TimeLikeValueT
-from throttled.utils import Timer
+from throttled.utils import Timer, get_hash_tag
+
+from .rate_limiter import parametrizes
 
 # Test constants
 EXPECTED_SUM = 3  # 1 + 2
@@ -18,6 +29,7 @@ EXPECTED_HOOK_CALL_COUNT = 2
 EXPECTED_REMAINING = 0
 EXPECTED_RESET_AFTER = 1
 EXPECTED_RETRY_AFTER = 1
+EXPECTED_MULTI_RULES_LIMIT = 2
 
 
 @pytest.fixture
@@ -116,6 +128,40 @@ class TestThrottled:
         with Timer(callback=partial(_callback, 0, 0.1)):
             assert throttle.limit("key", timeout=0.5).limited
 
+    @classmethod
+    @pytest.mark.parametrize("using", parametrizes.CONSUMING_LIMITER_TYPES)
+    def test_limit__manual_clock(cls, using: str) -> None:
+        clock: ManualClock = ManualClock()
+        mem_store: store.MemoryStore = store.MemoryStore(options={"CLOCK": clock})
+        throttle: Throttled = Throttled(
+            key="key", using=using, quota=rate_limiter.per_min(60), store=mem_store
+        )
+
+        # Simulate an hour of traffic, at twice the quota, in no time.
+        allowed: int = 0
+        for _ in range(7200):
+            allowed += not throttle.limit().limited
+            clock.advance(0.5)
+        # Bucket algorithms let the burst of 60 through first.
+        assert 3600 <= allowed <= 3660
+
+    @classmethod
+    def test_limit__manual_clock_timeout(cls) -> None:
+        clock: ManualClock = ManualClock()
+        mem_store: store.MemoryStore = store.MemoryStore(options={"CLOCK": clock})
+        throttle: Throttled = Throttled(
+            key="key", timeout=60, quota=rate_limiter.per_min(60), store=mem_store
+        )
+
+        def _callback(elapsed: TimeLikeValueT, *args: object, **kwargs: object) -> None:
+            assert elapsed < 1
+
+        # Blocking waits sleep on the clock of the store.
+        with Timer(callback=_callback):
+            for _ in range(120):
+                assert not throttle.limit().limited
+        assert 59 <= clock.monotonic() <= 61
+
     @classmethod
     def test_enter(cls) -> None:
         mem_store: store.MemoryStore = store.MemoryStore()
@@ -134,12 +180,55 @@ class TestThrottled:
         assert raised_result is not None
         assert raised_result.limited
         assert raised_result.state.remaining == EXPECTED_REMAINING
-        assert raised_result.state.reset_after == EXPECTED_RESET_AFTER
-        assert raised_result.state.retry_after == EXPECTED_RETRY_AFTER
+        assert raised_result.state.reset_after == pytest.approx(
+            EXPECTED_RESET_AFTER, abs=0.1
+        )
+        assert raised_result.state.retry_after == pytest.approx(
+            EXPECTED_RETRY_AFTER, abs=0.1
+        )
 
         with Throttled(**construct_kwargs, timeout=1) as rate_limit_result:
             assert not rate_limit_result.limited
 
+    @classmethod
+    def test_limit_many(cls) -> None:
+        throttle: Throttled = Throttled(
+            key="default", quota=per_sec(1), store=store.MemoryStore()
+        )
+        results: list[RateLimitResult] = throttle.limit_many(
+            [
+                ("a", 1),
+                ("b", 1),
+                ("a", 1),
+                (None, 1),
+            ]
+        )
+        assert [result.limited for result in results] == [False, False, True, False]
+        # Keys fall back to the instance key.
+        assert throttle.limit().limited
+
+    @classmethod
+    def test_limit_many__raise(cls) -> None:
+        throttle: Throttled = Throttled(quota=per_sec(1))
+        with pytest.raises(DataError, match="Invalid cost"):
+            throttle.limit_many([("a", -1)])
+
+        with pytest.raises(DataError, match="Invalid key"):
+            throttle.limit_many([(None, 1)])
+
+    @classmethod
+    def test_limit_all(cls) -> None:
+        throttle: Throttled = Throttled(
+            key="tenant", quota="1/m burst 2", store=store.MemoryStore()
+        )
+        results: list[RateLimitResult] = throttle.limit_all([("user", 1), (None, 2)])
+        assert [result.limited for result in results] == [False, False]
+
+        # The tenant quota is exhausted, so the user quota is not consumed.
+        results = throttle.limit_all([("user", 1), (None, 1)])
+        assert [result.limited for result in results] == [True, True]
+        assert not throttle.limit("user").limited
+
     @classmethod
     def test_constructor__string_quota_keep_backward_compatible(cls) -> None:
         mem_store: store.MemoryStore = store.MemoryStore()
@@ -161,14 +250,128 @@ class TestThrottled:
         assert not throttle_with_quota.limit().limited
 
     @classmethod
-    def test_constructor__reject_multi_rules_string(cls) -> None:
-        with pytest.raises(DataError, match="multiple quota rules"):
+    @pytest.mark.parametrize("using", parametrizes.CONSUMING_LIMITER_TYPES)
+    def test_limit__multi_rules(cls, using: str) -> None:
+        # Fixed windows of both rules end together, 18.75 seconds before the hour.
+        clock: ManualClock = ManualClock(start=7200 - 18.75)
+        throttle: Throttled = Throttled(
+            key="quota-multi",
+            using=using,
+            quota="3/m; 2/h",
+            store=store.MemoryStore(options={"CLOCK": clock}),
+        )
+        for _ in range(2):
+            assert not (throttle.limit()).limited
+
+        # The hourly rule is the most restrictive one and denies the request.
+        result: RateLimitResult = throttle.limit()
+        assert result.limited
+        assert result.state.limit == EXPECTED_MULTI_RULES_LIMIT
+        assert result.state.retry_after > 0
+
+        state: RateLimitState = throttle.peek("quota-multi")
+        assert state.limit == EXPECTED_MULTI_RULES_LIMIT
+        assert state.remaining == 0
+
+    @classmethod
+    @pytest.mark.parametrize("using", parametrizes.CONSUMING_LIMITER_TYPES)
+    def test_limit__multi_rules_hash_tag(cls, using: str) -> None:
+        mem_store: store.MemoryStore = store.MemoryStore(
+            options={"KEY_LAYOUT": KeyLayout.HASH_TAG.value}
+        )
+        throttle: Throttled = Throttled(
+            key="quota-multi", using=using, quota="3/m; 2/h", store=mem_store
+        )
+        assert not throttle.limit().limited
+
+        # The keys of all quota rules share the hash tag of the subject, so they
+        # are stored in the same Redis Cluster slot.
+        keys: list[str] = [
+            f"throttled:v1:{using}:{{quota-multi}}:{rule}"
+            for rule in ["3/60s", "2/3600s"]
+        ]
+        assert all(mem_store.exists(key) for key in keys)
+        assert {get_hash_tag(key) for key in keys} == {"quota-multi"}
+
+    @classmethod
+    def test_constructor__multi_rules_raise(cls) -> None:
+        with pytest.raises(DataError, match="duplicate quota rules"):
             Throttled(
-                key="quota-multi",
-                quota="1/s burst 2; 10/m",
-                store=store.MemoryStore(),
+                key="quota-multi", quota="1/s; 60/m; 1/s", store=store.MemoryStore()
             )
 
+        throttle: Throttled = Throttled(
+            key="quota-multi", quota="1/s burst 2; 10/m", store=store.MemoryStore()
+        )
+        with pytest.raises(DataError, match="multiple quota rules"):
+            throttle.limit_many([("user", 1)])
+        with pytest.raises(DataError, match="multiple quota rules"):
+            throttle.limit_all([("user", 1)])
+        with pytest.raises(DataError, match="concurrency is not supported"):
+            Throttled(using=RateLimiterType.CONCURRENCY.value, quota="1/s; 10/m")
+
+    @classmethod
+    def test_enter__concurrency(cls) -> None:
+        throttle: Throttled = Throttled(
+            key="key",
+            using=RateLimiterType.CONCURRENCY.value,
+            quota=rate_limiter.per_min(1),
+            store=store.MemoryStore(),
+        )
+        with throttle as rate_limit_result:
+            assert rate_limit_result.lease is not None
+            # The slot is held until the block exits.
+            with pytest.raises(LimitedError), throttle:
+                pass
+
+        # The slot is released on exit, even if the block raises.
+        with pytest.raises(ValueError, match="boom"), throttle:
+            raise ValueError("boom")
+        assert throttle.peek("key").remaining == 1
+
+    @classmethod
+    def test_demo__concurrency(cls) -> None:
+        throttle: Throttled = Throttled(
+            key="/api/product",
+            using=RateLimiterType.CONCURRENCY.value,
+            quota=rate_limiter.per_min(1),
+            store=store.MemoryStore(),
+        )
+
+        @throttle
+        def demo(left: int, right: int) -> int:
+            assert throttle.peek("/api/product").remaining == 0
+            return left + right
+
+        assert demo(1, 2) == EXPECTED_SUM
+        assert demo(1, 2) == EXPECTED_SUM
+        assert throttle.peek("/api/product").remaining == 1
+
+    @classmethod
+    def test_limit__concurrency_timeout(cls) -> None:
+        throttle: Throttled = Throttled(
+            key="key",
+            timeout=1,
+            using=RateLimiterType.CONCURRENCY.value,
+            quota=rate_limiter.per_min(1),
+            store=store.MemoryStore(),
+        )
+        result: RateLimitResult = throttle.limit()
+        assert throttle.limit(timeout=-1).state.retry_after == pytest.approx(60, abs=1)
+
+        def _callback(elapsed: float, *args: object, **kwargs: object) -> None:
+            assert elapsed < 1
+
+        # Waiting requests poll for released slots instead of the lease expiration.
+        timer: threading.Timer = threading.Timer(0.3, throttle.release, [result])
+        timer.start()
+        with Timer(callback=_callback):
+            assert not throttle.limit().limited
+        timer.join()
+
+        assert not throttle.release(result)
+        assert not throttle.release(throttle.limit(timeout=-1))
+
     @classmethod
     def test_hook__execution_order(cls) -> None:
         """Throttled should execute hooks in correct middleware order.
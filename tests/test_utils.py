@@ -2,7 +2,7 @@ from typing import Any
 
 import pytest
 from throttled.types import KeyT
-from throttled.utils import format_key, to_bool
+from throttled.utils import format_key, get_hash_tag, to_bool
 
 
 class TestUtils:
@@ -41,3 +41,18 @@ class TestUtils:
     )
     def test_format_key(self, key: bytes | str, expect: KeyT):
         assert format_key(key) == expect
+
+    @pytest.mark.parametrize(
+        ["key", "expect"],
+        [
+            ("user", None),
+            ("{user}", "user"),
+            ("{tenant}:user", "tenant"),
+            ("prefix:{user}:{tenant}", "user"),
+            ("{}user", None),
+            ("{user", None),
+            ("}{user}", "user"),
+        ],
+    )
+    def test_get_hash_tag(self, key: str, expect: str | None):
+        assert get_hash_tag(key) == expect
@@ -1,10 +1,14 @@
 """High-performance Python rate limiting library."""
 
 from . import asyncio, constants, exceptions, rate_limiter, types, utils
+from .clock import Clock, ManualClock, SimulatedClock, SystemClock
 from .constants import RateLimiterType
 from .hooks import Hook, HookContext
 from .rate_limiter import (
+    ApproximateRateLimiter,
     BaseRateLimiter,
+    DeniedCache,
+    Lease,
     Quota,
     Rate,
     RateLimiterMeta,
@@ -54,9 +58,12 @@ __all__ = [
     "Quota",
     "RateLimitState",
     "RateLimitResult",
+    "Lease",
     "RateLimiterRegistry",
     "RateLimiterMeta",
     "BaseRateLimiter",
+    "ApproximateRateLimiter",
+    "DeniedCache",
     # store
     "BaseStoreBackend",
     "BaseAtomicAction",
@@ -72,4 +79,9 @@ __all__ = [
     "HookContext",
     # constants
     "RateLimiterType",
+    # clock
+    "Clock",
+    "SystemClock",
+    "ManualClock",
+    "SimulatedClock",
 ]
@@ -1,6 +1,17 @@
+from collections.abc import Sequence
+from contextvars import ContextVar
+
 from .. import constants, exceptions, rate_limiter, types, utils
+from ..clock import Clock
 from ..rate_limiter.quota_parser import parse as parse_quota
 
+# The ``(throttle, key, lease)`` held by context managers in the current thread or
+# task, innermost last, so a throttle shared by concurrent callers releases the
+# lease of its own caller on exit.
+_held_leases: ContextVar[
+    tuple[tuple["ThrottledLogic", types.KeyT, rate_limiter.Lease], ...]
+] = ContextVar("throttled_held_leases", default=())
+
 
 class ThrottledLogic:
     """Pure throttler logic shared by sync and async implementations."""
@@ -17,6 +28,11 @@ class ThrottledLogic:
 
     key: str | None
     timeout: float
+    _quotas: list[rate_limiter.Quota]
+    # Whether allowed requests hold slots until they are released.
+    _leased: bool
+    # The clock of the store, which blocking waits sleep on.
+    _clock: Clock
 
     @classmethod
     def _validate_cost(cls, cost: int) -> None:
@@ -53,20 +69,90 @@ class ThrottledLogic:
         )
 
     @classmethod
-    def _parse_quota(cls, quota: rate_limiter.Quota | str | None) -> rate_limiter.Quota:
+    def _parse_quotas(
+        cls, quota: rate_limiter.Quota | str | None
+    ) -> list[rate_limiter.Quota]:
         if quota is None:
-            return rate_limiter.per_min(60)
+            return [rate_limiter.per_min(60)]
 
         if isinstance(quota, rate_limiter.Quota):
-            return quota
+            return [quota]
+
+        quotas: list[rate_limiter.Quota] = parse_quota(quota)
+        rule_ids: set[str] = {cls._get_rule_key("", rule) for rule in quotas}
+        if len(rule_ids) != len(quotas):
+            raise exceptions.DataError(
+                f"Invalid quota: '{quota}', duplicate quota rules are not allowed."
+            )
+        return quotas
+
+    @classmethod
+    def _is_leased(
+        cls,
+        limiter_cls: type[rate_limiter.BaseRateLimiterMixin],
+        quotas: Sequence[rate_limiter.Quota],
+    ) -> bool:
+        """Return whether allowed requests of ``limiter_cls`` hold slots.
 
-        parsed_quotas = parse_quota(quota)
-        if len(parsed_quotas) > 1:
+        :raise: DataError if slots are held with multiple quota rules.
+        """
+        leased: bool = (
+            constants.ATOMIC_ACTION_TYPE_RELEASE
+            in limiter_cls._supported_atomic_action_types()
+        )
+        if leased and len(quotas) > 1:
             raise exceptions.DataError(
-                "Invalid quota: multiple quota rules are not supported in "
-                "Throttled(quota=...) yet."
+                f"Invalid quota: {limiter_cls.Meta.type} is not supported with "
+                f"multiple quota rules."
             )
-        return parsed_quotas[0]
+        return leased
+
+    @classmethod
+    def _get_rule_key(
+        cls, key: types.KeyT, quota: rate_limiter.Quota, hash_tag: bool = False
+    ) -> types.KeyT:
+        """Return the key of ``quota`` when multiple quota rules are configured.
+
+        :param hash_tag: Whether to wrap ``key`` in a hash tag, so that the keys of
+            all quota rules of a subject are stored in the same Redis Cluster slot.
+        """
+        if hash_tag and utils.get_hash_tag(key) is None:
+            key = f"{{{key}}}"
+        period: types.StoreValueT = utils.format_value(quota.period_sec_f)
+        return f"{key}:{quota.get_limit()}/{period}s"
+
+    @classmethod
+    def _select_result(
+        cls, results: Sequence[rate_limiter.RateLimitResult]
+    ) -> rate_limiter.RateLimitResult:
+        """Select the most restrictive result of multiple quota rules.
+
+        A limited result with the longest ``retry_after`` wins, otherwise the
+        result with the fewest ``remaining`` requests. Ties, e.g. fixed windows
+        that end together, go to the result with the fewest ``remaining``.
+        """
+        limited_results: list[rate_limiter.RateLimitResult] = [
+            result for result in results if result.limited
+        ]
+        if limited_results:
+            return max(
+                limited_results,
+                key=lambda result: (result.state.retry_after, -result.state.remaining),
+            )
+        return min(
+            results,
+            key=lambda result: (result.state.remaining, -result.state.reset_after),
+        )
+
+    @classmethod
+    def _select_state(
+        cls, states: Sequence[rate_limiter.RateLimitState]
+    ) -> rate_limiter.RateLimitState:
+        """Select the most restrictive state of multiple quota rules."""
+        return min(
+            states,
+            key=lambda state: (state.remaining, -state.retry_after, -state.reset_after),
+        )
 
     def _get_key(self, key: types.KeyT | None = None) -> types.KeyT:
         # Use the provided key if available.
@@ -78,6 +164,41 @@ class ThrottledLogic:
 
         raise exceptions.DataError(f"Invalid key: {key}, must be a non-empty key.")
 
+    def _get_items(
+        self, items: Sequence[tuple[types.KeyT | None, int]]
+    ) -> list[tuple[types.KeyT, int]]:
+        """Validate and resolve ``(key, cost)`` pairs of a batch request."""
+        resolved_items: list[tuple[types.KeyT, int]] = []
+        for key, cost in items:
+            self._validate_cost(cost)
+            resolved_items.append((self._get_key(key), cost))
+        return resolved_items
+
+    def _validate_single_rule(self, api: str) -> None:
+        if len(self._quotas) > 1:
+            raise exceptions.DataError(
+                f"Invalid quota: {api} is not supported with multiple quota rules."
+            )
+
+    def _hold_lease(self, result: rate_limiter.RateLimitResult) -> None:
+        """Hold the lease of an allowed request until the context manager exits."""
+        if result.lease is not None:
+            _held_leases.set(
+                (*_held_leases.get(), (self, self._get_key(), result.lease))
+            )
+
+    def _unhold_lease(self) -> tuple[types.KeyT, rate_limiter.Lease] | None:
+        """Return the innermost lease held by this throttle in the current context."""
+        held: tuple[tuple[ThrottledLogic, types.KeyT, rate_limiter.Lease], ...] = (
+            _held_leases.get()
+        )
+        for index in range(len(held) - 1, -1, -1):
+            throttle, key, lease = held[index]
+            if throttle is self:
+                _held_leases.set(held[:index] + held[index + 1 :])
+                return key, lease
+        return None
+
     def _get_timeout(self, timeout: float | None = None) -> float:
         if timeout is not None:
             self._validate_timeout(timeout)
@@ -92,13 +213,22 @@ class ThrottledLogic:
         # WAIT_MIN_INTERVAL: Minimum wait interval to prevent busy-waiting.
         return max(min(retry_after, self._WAIT_INTERVAL), self._WAIT_MIN_INTERVAL)
 
-    @classmethod
+    def _get_retry_after(
+        self, result: rate_limiter.RateLimitResult, timeout: float
+    ) -> float:
+        """Return how long to wait before retrying a limited request."""
+        if self._leased:
+            # Slots are usually released long before their leases expire,
+            # so poll for them instead of waiting for retry_after.
+            return min(result.state.retry_after, self._WAIT_MIN_INTERVAL, timeout)
+        return result.state.retry_after
+
     def _is_exit_waiting(
-        cls, start_time: float, retry_after: float, timeout: float
+        self, start_time: float, retry_after: float, timeout: float
     ) -> bool:
         # Calculate the elapsed time since the start time.
         # Due to additional context switching overhead in multithread contexts,
         # we don't directly use sleep_time to calculate elapsed time.
         # Instead, we re-fetch the current time and subtract it from the start time.
-        elapsed: float = utils.now_mono_f() - start_time
+        elapsed: float = self._clock.monotonic() - start_time
         return elapsed >= retry_after or elapsed >= timeout
@@ -1,11 +1,15 @@
 """Asyncio support for throttled."""
 
 from .. import constants, exceptions, rate_limiter, types, utils
+from ..clock import Clock, ManualClock, SimulatedClock, SystemClock
 from ..constants import RateLimiterType
 from ..hooks import HookContext
 from .hooks import Hook
 from .rate_limiter import (
+    ApproximateRateLimiter,
     BaseRateLimiter,
+    DeniedCache,
+    Lease,
     Quota,
     Rate,
     RateLimiterMeta,
@@ -53,9 +57,12 @@ __all__ = [
     "Quota",
     "RateLimitState",
     "RateLimitResult",
+    "Lease",
     "RateLimiterRegistry",
     "RateLimiterMeta",
     "BaseRateLimiter",
+    "ApproximateRateLimiter",
+    "DeniedCache",
     # store
     "BaseStoreBackend",
     "BaseAtomicAction",
@@ -71,4 +78,9 @@ __all__ = [
     "HookContext",
     # constants
     "RateLimiterType",
+    # clock
+    "Clock",
+    "SystemClock",
+    "ManualClock",
+    "SimulatedClock",
 ]
@@ -1,6 +1,8 @@
 """Async rate limiter exports."""
 
 from ...rate_limiter import (
+    DeniedCache,
+    Lease,
     Quota,
     Rate,
     RateLimitResult,
@@ -12,13 +14,16 @@ from ...rate_limiter import (
     per_sec,
     per_week,
 )
+from .approximate import ApproximateRateLimiter
 from .base import BaseRateLimiter, RateLimiterMeta, RateLimiterRegistry
 
 # Trigger to register Async RateLimiter
+from .concurrency import ConcurrencyRateLimiter
 from .fixed_window import FixedWindowRateLimiter
 from .gcra import GCRARateLimiter
 from .leaking_bucket import LeakingBucketRateLimiter
 from .sliding_window import SlidingWindowRateLimiter
+from .sliding_window_log import SlidingWindowLogRateLimiter
 from .token_bucket import TokenBucketRateLimiter
 
 __all__ = [
@@ -32,12 +37,17 @@ __all__ = [
     "Quota",
     "RateLimitState",
     "RateLimitResult",
+    "Lease",
     "RateLimiterRegistry",
     "RateLimiterMeta",
     "BaseRateLimiter",
     "FixedWindowRateLimiter",
     "LeakingBucketRateLimiter",
     "SlidingWindowRateLimiter",
+    "SlidingWindowLogRateLimiter",
     "TokenBucketRateLimiter",
     "GCRARateLimiter",
+    "ConcurrencyRateLimiter",
+    "ApproximateRateLimiter",
+    "DeniedCache",
 ]
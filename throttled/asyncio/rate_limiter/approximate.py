@@ -0,0 +1,138 @@
+import asyncio
+from typing import TYPE_CHECKING
+
+from ...rate_limiter import Quota, RateLimitResult, RateLimitState
+from ...rate_limiter.approximate import ApproximateRateLimiterMixin
+from ..store import MemoryStore
+from .base import BaseRateLimiter
+
+if TYPE_CHECKING:
+    from ... import types
+
+
+class ApproximateRateLimiter(ApproximateRateLimiterMixin):
+    """Serve rate limit checks from quota leased in bulk from another limiter.
+
+    Async version of :class:`throttled.rate_limiter.ApproximateRateLimiter`,
+    the next lease is fetched in a background task.
+    """
+
+    def __init__(
+        self,
+        limiter: BaseRateLimiter,
+        lease_size: int,
+        max_overshoot: int = 0,
+        local_store: MemoryStore | None = None,
+    ) -> None:
+        """Initializes the approximate rate limiter.
+
+        :param limiter: The limiter to lease quota from, usually on a RedisStore.
+        :param lease_size: The number of tokens leased from ``limiter`` at once.
+        :param max_overshoot: The maximum cost a key may be served beyond its
+            lease while a refill is in flight, default: 0.
+        :param local_store: The store to keep leases in, by default a new
+            :class:`MemoryStore` is created with the clock of ``limiter``.
+        """
+        self._validate_options(lease_size, max_overshoot)
+        self._validate_limiter(limiter)
+        self.quota: Quota = limiter.quota
+        self.lease_size: int = lease_size
+        self.max_overshoot: int = max_overshoot
+
+        self._limiter: BaseRateLimiter = limiter
+        self._local_store: MemoryStore = local_store or MemoryStore(
+            options={"CLOCK": limiter._clock}
+        )
+        self._lock: asyncio.Lock = asyncio.Lock()
+        self._refilling: set[str] = set()
+        # Keep references to the background tasks until they are done.
+        self._tasks: set[asyncio.Task[None]] = set()
+
+    async def limit(self, key: str, cost: int = 1) -> RateLimitResult:
+        """Apply rate limiting logic to a given key with a specified cost.
+
+        The request is served from the local lease if possible, otherwise a new
+        lease is consumed from the wrapped limiter.
+
+        :param key: The unique identifier for the rate limit subject.
+        :param cost: The cost of the current request.
+        :return: The result of the rate limiting check.
+        """
+        lease_key: str = self._prepare_lease_key(self._limiter._prepare_key(key))
+        async with self._lock:
+            lease: types.StoreDictValueT = await self._local_store.hgetall(lease_key)
+            result: RateLimitResult | None = self._consume_lease(
+                lease, cost, key in self._refilling
+            )
+            if result is not None:
+                await self._local_store.hset(lease_key, mapping=lease)
+                if self._should_refill(int(lease["tokens"])):
+                    self._schedule_refill(key)
+                return result
+
+        return await self._lease(key, cost)
+
+    async def peek(self, key: str) -> RateLimitState:
+        """Retrieve the state of the wrapped limiter for the given key.
+
+        Tokens leased by any process are reported as consumed.
+        """
+        return await self._limiter.peek(key)
+
+    async def flush(self) -> None:
+        """Wait for the leases being refilled in the background."""
+        while self._tasks:
+            await asyncio.gather(*self._tasks)
+
+    async def close(self) -> None:
+        """Wait for the background refills."""
+        await self.flush()
+
+    def _schedule_refill(self, key: str) -> None:
+        if key not in self._refilling:
+            self._refilling.add(key)
+            task: asyncio.Task[None] = asyncio.create_task(self._refill(key))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _refill(self, key: str) -> None:
+        try:
+            await self._lease(key, 0)
+        finally:
+            self._refilling.discard(key)
+
+    async def _consume_remote(self, key: str, cost: int) -> RateLimitResult:
+        # All-or-nothing, so that a denied lease never consumes quota.
+        return (await self._limiter.limit_all([(key, cost)]))[0]
+
+    async def _lease(self, key: str, cost: int) -> RateLimitResult:
+        """Lease tokens from the wrapped limiter, then consume ``cost`` from them.
+
+        The debt of the key is settled along with the lease.
+        """
+        lease_key: str = self._prepare_lease_key(self._limiter._prepare_key(key))
+        async with self._lock:
+            lease: types.StoreDictValueT = await self._local_store.hgetall(lease_key)
+            debt: int = int(lease.get("debt", 0))
+            if debt:
+                await self._local_store.hset(lease_key, "debt", 0)
+
+        size: int = max(self.lease_size, cost)
+        result: RateLimitResult = await self._consume_remote(key, size + debt)
+        if result.limited:
+            size = self._get_lease_size(cost, debt, result.state)
+            if size:
+                result = await self._consume_remote(key, size + debt)
+        if result.limited:
+            return result
+
+        async with self._lock:
+            lease = await self._local_store.hgetall(lease_key)
+            lease["tokens"] = int(lease.get("tokens", 0)) + size - cost
+            lease["limit"] = result.state.limit
+            lease["remaining"] = result.state.remaining
+            lease["reset_after"] = result.state.reset_after
+            await self._local_store.hset(lease_key, mapping=lease)
+            # Unused tokens are dropped once the quota period has passed.
+            await self._local_store.expire(lease_key, self._get_lease_timeout())
+        return self._to_leased_result(lease, result.state)
@@ -2,7 +2,7 @@ import abc
 from abc import ABC
 from typing import TYPE_CHECKING
 
-from ... import rate_limiter
+from ... import constants, exceptions, rate_limiter
 from ...rate_limiter.base import BaseRateLimiterRegistry
 
 if TYPE_CHECKING:
@@ -10,6 +10,7 @@ if TYPE_CHECKING:
     from typing import ClassVar
 
     from ... import types
+    from ...rate_limiter import DeniedCache
     from ..store import BaseAtomicAction, BaseStore
 
 
@@ -52,9 +53,16 @@ class BaseRateLimiter(
         quota: rate_limiter.Quota,
         store: "BaseStore",
         additional_atomic_actions: "Sequence[type[BaseAtomicAction]] | None" = None,
+        denied_cache: "DeniedCache | None" = None,
     ) -> None:
+        self._validate_quota(quota)
         self.quota: rate_limiter.Quota = quota
         self._store = store
+        self._hash_tag_keys = store.key_layout == constants.KeyLayout.HASH_TAG.value
+        self._clock = store.clock
+        self._denied_cache = denied_cache
+        if denied_cache is not None:
+            denied_cache.bind_clock(store.clock)
         self._atomic_actions = {}
         self._register_atomic_actions(additional_atomic_actions or ())
 
@@ -84,8 +92,124 @@ class BaseRateLimiter(
     async def _peek(self, key: str) -> rate_limiter.RateLimitState:
         raise NotImplementedError
 
+    async def _do_limit_many(
+        self, items: "Sequence[tuple[rate_limiter.BaseRateLimiterMixin, str, int]]"
+    ) -> list[rate_limiter.RateLimitResult]:
+        calls: list[tuple[list[types.KeyT], list[types.StoreValueT]]] = [
+            limiter._prepare_limit(key, cost) for limiter, key, cost in items
+        ]
+        rets: Sequence[tuple[int | float, ...]] = await self._atomic_actions[
+            constants.ATOMIC_ACTION_TYPE_LIMIT
+        ].do_many(calls)
+        return [
+            limiter._to_limit_result(args, ret)
+            for (limiter, _key, _cost), (_keys, args), ret in zip(
+                items, calls, rets, strict=True
+            )
+        ]
+
+    async def _do_limit_all(
+        self, items: "Sequence[tuple[rate_limiter.BaseRateLimiterMixin, str, int]]"
+    ) -> list[rate_limiter.RateLimitResult]:
+        if not items:
+            return []
+
+        action: BaseAtomicAction | None = self._atomic_actions.get(
+            constants.ATOMIC_ACTION_TYPE_LIMIT_ALL
+        )
+        if action is None:
+            raise exceptions.SetUpError(
+                f"RateLimiter({self.Meta.type}) does not support limit_all."
+            )
+
+        keys, args, items_args = self._prepare_limit_all(items)
+        return self._to_limit_all_results(items, items_args, await action.do(keys, args))
+
+    async def _limit_many(
+        self, items: "Sequence[tuple[str, int]]"
+    ) -> list[rate_limiter.RateLimitResult]:
+        return await self._do_limit_many([(self, key, cost) for key, cost in items])
+
+    async def _limit_all(
+        self, items: "Sequence[tuple[str, int]]"
+    ) -> list[rate_limiter.RateLimitResult]:
+        return await self._do_limit_all([(self, key, cost) for key, cost in items])
+
+    async def _release(
+        self,
+        key: str,  # noqa: ARG002
+        lease: rate_limiter.Lease,  # noqa: ARG002
+    ) -> bool:
+        raise exceptions.SetUpError(
+            f"RateLimiter({self.Meta.type}) does not support release."
+        )
+
     async def limit(self, key: str, cost: int = 1) -> rate_limiter.RateLimitResult:
-        return await self._limit(key, cost)
+        if self._denied_cache is None:
+            return await self._limit(key, cost)
+
+        result: rate_limiter.RateLimitResult | None = self._denied_cache.get(key, cost)
+        if result is not None:
+            return result
+
+        started_at: float = self._denied_cache.clock.time()
+        result = await self._limit(key, cost)
+        self._cache_denied(key, cost, result, started_at)
+        return result
+
+    async def limit_many(
+        self, items: "Sequence[tuple[str, int]]"
+    ) -> list[rate_limiter.RateLimitResult]:
+        """Apply rate limiting logic to many keys in a single store round trip.
+
+        :param items: A sequence of ``(key, cost)`` pairs.
+        :return: A list of :class:`RateLimitResult`, in the same order as ``items``.
+        """
+        return await self._limit_many(items)
+
+    async def limit_all(
+        self, items: "Sequence[tuple[str, int]]"
+    ) -> list[rate_limiter.RateLimitResult]:
+        """Apply rate limiting logic to many keys as a single all-or-nothing request.
+
+        The cost of each item is consumed only if every key allows the request.
+
+        :param items: A sequence of ``(key, cost)`` pairs with unique keys.
+        :return: A list of :class:`RateLimitResult`, in the same order as ``items``.
+        :raise: DataError if ``items`` contains duplicate keys.
+        :raise: SetUpError if the algorithm does not support all-or-nothing limiting.
+        """
+        return await self._limit_all(items)
+
+    async def limit_rules(
+        self, rules: "Sequence[tuple[BaseRateLimiter, str]]", cost: int = 1
+    ) -> list[rate_limiter.RateLimitResult]:
+        """Apply the rules of a multi-rule quota to a request in a single round trip.
+
+        The rules are applied all-or-nothing if the algorithm supports
+        :meth:`limit_all`, otherwise they are applied independently in one pipeline.
+
+        :param rules: A sequence of ``(limiter, key)`` pairs with unique keys.
+        :param cost: The cost of the current request.
+        :return: A list of :class:`RateLimitResult`, in the same order as ``rules``.
+        """
+        items: list[tuple[rate_limiter.BaseRateLimiterMixin, str, int]] = [
+            (limiter, key, cost) for limiter, key in rules
+        ]
+        if constants.ATOMIC_ACTION_TYPE_LIMIT_ALL in self._atomic_actions:
+            return await self._do_limit_all(items)
+        return await self._do_limit_many(items)
 
     async def peek(self, key: str) -> rate_limiter.RateLimitState:
         return await self._peek(key)
+
+    async def release(self, key: str, lease: rate_limiter.Lease) -> bool:
+        """Give back the slots held by ``lease`` before it expires.
+
+        :param key: The unique identifier for the rate limit subject.
+        :param lease: The :attr:`RateLimitResult.lease` of an allowed request.
+        :return: True if the slots were released, False if the lease had already
+                 expired or been released.
+        :raise: SetUpError if the algorithm does not hold slots until released.
+        """
+        return await self._release(key, lease)
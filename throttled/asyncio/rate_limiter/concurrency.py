@@ -0,0 +1,133 @@
+from collections.abc import Sequence
+from typing import TYPE_CHECKING, Any, cast
+
+from ... import constants, types
+from ...rate_limiter.concurrency import (
+    ConcurrencyRateLimiterCoreMixin,
+    MemoryLimitActionLogic,
+    MemoryPeekActionLogic,
+    MemoryReleaseActionLogic,
+    RedisLimitAtomicActionSpec,
+    RedisPeekAtomicActionSpec,
+    RedisReleaseAtomicActionSpec,
+)
+from .. import store
+from . import BaseRateLimiter, Lease, RateLimitResult, RateLimitState
+
+if TYPE_CHECKING:
+    from redis.commands.core import AsyncScript
+
+
+class RedisLimitAtomicAction(RedisLimitAtomicActionSpec, store.BaseRedisAtomicAction):
+    """Redis-based AtomicAction for Async ConcurrencyRateLimiter's limit."""
+
+    def __init__(self, backend: store.RedisStoreBackend) -> None:
+        super().__init__(backend)
+        self._script: AsyncScript = self._register_script(self.SCRIPTS)
+
+    async def do(
+        self,
+        keys: Sequence[types.KeyT],
+        args: Sequence[types.StoreValueT] | None,
+    ) -> tuple[int, int, float, float]:
+        return self._parse_result(await self._execute_script(self._script, keys, args))
+
+    async def do_many(
+        self, calls: Sequence[types.AtomicActionCallT]
+    ) -> list[tuple[int, int, float, float]]:
+        results: list[Any] = await self._execute_script_many(self._script, calls)
+        return [self._parse_result(result) for result in results]
+
+
+class RedisReleaseAtomicAction(
+    RedisReleaseAtomicActionSpec, store.BaseRedisAtomicAction
+):
+    """Redis-based AtomicAction for Async ConcurrencyRateLimiter's release."""
+
+    def __init__(self, backend: store.RedisStoreBackend) -> None:
+        super().__init__(backend)
+        self._script: AsyncScript = self._register_script(self.SCRIPTS)
+
+    async def do(
+        self,
+        keys: Sequence[types.KeyT],
+        args: Sequence[types.StoreValueT] | None,
+    ) -> tuple[int]:
+        return self._parse_result(await self._execute_script(self._script, keys, args))
+
+
+class RedisPeekAtomicAction(RedisPeekAtomicActionSpec, store.BaseRedisAtomicAction):
+    """Redis-based AtomicAction for Async ConcurrencyRateLimiter's peek."""
+
+    def __init__(self, backend: store.RedisStoreBackend) -> None:
+        super().__init__(backend)
+        self._script: AsyncScript = self._register_script(self.SCRIPTS)
+
+    async def do(
+        self,
+        keys: Sequence[types.KeyT],
+        args: Sequence[types.StoreValueT] | None,
+    ) -> tuple[int, int, float, float]:
+        return self._parse_result(await self._execute_script(self._script, keys, args))
+
+
+class MemoryLimitAtomicAction(MemoryLimitActionLogic, store.BaseMemoryAtomicAction):
+    """Memory-based AtomicAction for Async ConcurrencyRateLimiter's limit."""
+
+    TYPE: types.AtomicActionTypeT = constants.ATOMIC_ACTION_TYPE_LIMIT
+
+
+class MemoryReleaseAtomicAction(MemoryReleaseActionLogic, store.BaseMemoryAtomicAction):
+    """Memory-based AtomicAction for Async ConcurrencyRateLimiter's release."""
+
+    TYPE: types.AtomicActionTypeT = constants.ATOMIC_ACTION_TYPE_RELEASE
+
+
+class MemoryPeekAtomicAction(MemoryPeekActionLogic, store.BaseMemoryAtomicAction):
+    """Memory-based AtomicAction for Async ConcurrencyRateLimiter's peek."""
+
+    TYPE: types.AtomicActionTypeT = constants.ATOMIC_ACTION_TYPE_PEEK
+
+
+class ConcurrencyRateLimiter(ConcurrencyRateLimiterCoreMixin, BaseRateLimiter):
+    """Concrete implementation of BaseRateLimiter that limits in-flight requests."""
+
+    _DEFAULT_ATOMIC_ACTION_CLASSES: Sequence[type[store.BaseAtomicAction]] = (
+        RedisPeekAtomicAction,
+        RedisLimitAtomicAction,
+        RedisReleaseAtomicAction,
+        MemoryLimitAtomicAction,
+        MemoryReleaseAtomicAction,
+        MemoryPeekAtomicAction,
+    )
+
+    async def _limit(self, key: str, cost: int = 1) -> RateLimitResult:
+        keys, args = self._prepare_limit(key, cost)
+        return self._to_limit_result(
+            args,
+            await self._atomic_actions[constants.ATOMIC_ACTION_TYPE_LIMIT].do(
+                keys, args
+            ),
+        )
+
+    async def _release(self, key: str, lease: Lease) -> bool:
+        keys, args = self._prepare_release(key, lease)
+        released, *_ = await self._atomic_actions[
+            constants.ATOMIC_ACTION_TYPE_RELEASE
+        ].do(keys, args)
+        return released > 0
+
+    async def _peek(self, key: str) -> RateLimitState:
+        formatted_key, _ttl, limit = self._prepare(key)
+        _limited, remaining, reset_after, retry_after = cast(
+            "tuple[int, int, float, float]",
+            await self._atomic_actions[constants.ATOMIC_ACTION_TYPE_PEEK].do(
+                [formatted_key], [limit]
+            ),
+        )
+        return RateLimitState(
+            limit=limit,
+            remaining=remaining,
+            reset_after=reset_after,
+            retry_after=retry_after,
+        )
@@ -1,35 +1,57 @@
 from collections.abc import Sequence
-from typing import cast
+from typing import TYPE_CHECKING, Any
 
 from ... import constants, types
 from ...rate_limiter.fixed_window import (
     FixedWindowRateLimiterCoreMixin,
     MemoryLimitActionLogic,
+    MemoryLimitAllActionLogic,
+    RedisLimitAllAtomicActionSpec,
     RedisLimitAtomicActionSpec,
 )
 from .. import store
 from . import BaseRateLimiter, RateLimitResult, RateLimitState
 
+if TYPE_CHECKING:
+    from redis.commands.core import AsyncScript
+
 
 class RedisLimitAtomicAction(RedisLimitAtomicActionSpec, store.BaseRedisAtomicAction):
     """Redis-based implementation of AtomicAction for Async FixedWindowRateLimiter."""
 
+    def __init__(self, backend: store.RedisStoreBackend) -> None:
+        super().__init__(backend)
+        self._script: AsyncScript = self._register_script(self.SCRIPTS)
+
     async def do(
         self,
         keys: Sequence[types.KeyT],
         args: Sequence[types.StoreValueT] | None,
-    ) -> tuple[int, int]:
-        if args is None:
-            raise ValueError("args is required")
-        period: int = int(args[0])
-        limit: int = int(args[1])
-        cost: int = int(args[2])
-        client = self._backend.get_client()
-        current: int = await client.incrby(keys[0], cost)
-        if current == cost:
-            await client.expire(keys[0], period)
-        limited: int = int(current > limit and cost != 0)
-        return limited, current
+    ) -> tuple[int, int, float]:
+        return self._parse_result(await self._execute_script(self._script, keys, args))
+
+    async def do_many(
+        self, calls: Sequence[types.AtomicActionCallT]
+    ) -> list[tuple[int, int, float]]:
+        results: list[Any] = await self._execute_script_many(self._script, calls)
+        return [self._parse_result(result) for result in results]
+
+
+class RedisLimitAllAtomicAction(
+    RedisLimitAllAtomicActionSpec, store.BaseRedisAtomicAction
+):
+    """Redis-based all-or-nothing AtomicAction for Async FixedWindowRateLimiter."""
+
+    def __init__(self, backend: store.RedisStoreBackend) -> None:
+        super().__init__(backend)
+        self._script: AsyncScript = self._register_script(self.SCRIPTS)
+
+    async def do(
+        self,
+        keys: Sequence[types.KeyT],
+        args: Sequence[types.StoreValueT] | None,
+    ) -> tuple[int | float, ...]:
+        return self._parse_result(await self._execute_script(self._script, keys, args))
 
 
 class MemoryLimitAtomicAction(MemoryLimitActionLogic, store.BaseMemoryAtomicAction):
@@ -38,39 +60,35 @@ class MemoryLimitAtomicAction(MemoryLimitActionLogic, store.BaseMemoryAtomicActi
     TYPE: types.AtomicActionTypeT = constants.ATOMIC_ACTION_TYPE_LIMIT
 
 
+class MemoryLimitAllAtomicAction(
+    MemoryLimitAllActionLogic, store.BaseMemoryAtomicAction
+):
+    """Memory-based all-or-nothing AtomicAction for Async FixedWindowRateLimiter."""
+
+    TYPE: types.AtomicActionTypeT = constants.ATOMIC_ACTION_TYPE_LIMIT_ALL
+
+
 class FixedWindowRateLimiter(FixedWindowRateLimiterCoreMixin, BaseRateLimiter):
     """Concrete implementation of BaseRateLimiter using fixed window as algorithm."""
 
     _DEFAULT_ATOMIC_ACTION_CLASSES: Sequence[type[store.BaseAtomicAction]] = (
         RedisLimitAtomicAction,
+        RedisLimitAllAtomicAction,
         MemoryLimitAtomicAction,
+        MemoryLimitAllAtomicAction,
     )
 
     async def _limit(self, key: str, cost: int = 1) -> RateLimitResult:
-        period_key, period, limit, now = self._prepare(key)
-        limited, current = cast(
-            "tuple[int, int]",
+        keys, args = self._prepare_limit(key, cost)
+        return self._to_limit_result(
+            args,
             await self._atomic_actions[constants.ATOMIC_ACTION_TYPE_LIMIT].do(
-                [period_key], [period, limit, cost]
-            ),
-        )
-
-        reset_after: float = period - (now % period)
-        return RateLimitResult(
-            limited=bool(limited),
-            state_values=(
-                limit,
-                max(0, limit - current),
-                reset_after,
-                reset_after if limited else 0,
+                keys, args
             ),
         )
 
     async def _peek(self, key: str) -> RateLimitState:
-        period_key, period, limit, now = self._prepare(key)
-        current: int = int(await self._store.get(period_key) or 0)
-        return RateLimitState(
-            limit=limit,
-            remaining=max(0, limit - current),
-            reset_after=period - (now % period),
+        formatted_key, period, limit = self._prepare(key)
+        return self._to_peek_state(
+            await self._store.hgetall(formatted_key), period, limit
         )
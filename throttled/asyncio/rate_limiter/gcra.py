@@ -1,11 +1,13 @@
 from collections.abc import Sequence
-from typing import TYPE_CHECKING, cast
+from typing import TYPE_CHECKING, Any, cast
 
 from ... import constants, types
 from ...rate_limiter.gcra import (
     GCRARateLimiterCoreMixin,
     MemoryLimitActionLogic,
+    MemoryLimitAllActionLogic,
     MemoryPeekActionLogic,
+    RedisLimitAllAtomicActionSpec,
     RedisLimitAtomicActionSpec,
     RedisPeekAtomicActionSpec,
 )
@@ -28,10 +30,30 @@ class RedisLimitAtomicAction(RedisLimitAtomicActionSpec, store.BaseRedisAtomicAc
         keys: Sequence[types.KeyT],
         args: Sequence[types.StoreValueT] | None,
     ) -> tuple[int, int, float, float]:
-        limited, remaining, reset_after, retry_after = cast(
-            "tuple[int, int, str, str]", await self._script(keys, args)
-        )
-        return limited, remaining, float(reset_after), float(retry_after)
+        return self._parse_result(await self._execute_script(self._script, keys, args))
+
+    async def do_many(
+        self, calls: Sequence[types.AtomicActionCallT]
+    ) -> list[tuple[int, int, float, float]]:
+        results: list[Any] = await self._execute_script_many(self._script, calls)
+        return [self._parse_result(result) for result in results]
+
+
+class RedisLimitAllAtomicAction(
+    RedisLimitAllAtomicActionSpec, store.BaseRedisAtomicAction
+):
+    """Redis-based all-or-nothing AtomicAction for Async GCRARateLimiter."""
+
+    def __init__(self, backend: store.RedisStoreBackend) -> None:
+        super().__init__(backend)
+        self._script: AsyncScript = self._register_script(self.SCRIPTS)
+
+    async def do(
+        self,
+        keys: Sequence[types.KeyT],
+        args: Sequence[types.StoreValueT] | None,
+    ) -> tuple[int | float, ...]:
+        return self._parse_result(await self._execute_script(self._script, keys, args))
 
 
 class RedisPeekAtomicAction(RedisPeekAtomicActionSpec, store.BaseRedisAtomicAction):
@@ -46,10 +68,7 @@ class RedisPeekAtomicAction(RedisPeekAtomicActionSpec, store.BaseRedisAtomicActi
         keys: Sequence[types.KeyT],
         args: Sequence[types.StoreValueT] | None,
     ) -> tuple[int, int, float, float]:
-        limited, remaining, reset_after, retry_after = cast(
-            "tuple[int, int, str, str]", await self._script(keys, args)
-        )
-        return limited, remaining, float(reset_after), float(retry_after)
+        return self._parse_result(await self._execute_script(self._script, keys, args))
 
 
 class MemoryLimitAtomicAction(MemoryLimitActionLogic, store.BaseMemoryAtomicAction):
@@ -58,6 +77,14 @@ class MemoryLimitAtomicAction(MemoryLimitActionLogic, store.BaseMemoryAtomicActi
     TYPE: types.AtomicActionTypeT = constants.ATOMIC_ACTION_TYPE_LIMIT
 
 
+class MemoryLimitAllAtomicAction(
+    MemoryLimitAllActionLogic, store.BaseMemoryAtomicAction
+):
+    """Memory-based all-or-nothing AtomicAction for Async GCRARateLimiter."""
+
+    TYPE: types.AtomicActionTypeT = constants.ATOMIC_ACTION_TYPE_LIMIT_ALL
+
+
 class MemoryPeekAtomicAction(MemoryPeekActionLogic, store.BaseMemoryAtomicAction):
     """Memory-based AtomicAction for GCRARateLimiter's peek operation."""
 
@@ -73,24 +100,21 @@ class GCRARateLimiter(
     _DEFAULT_ATOMIC_ACTION_CLASSES: Sequence[type[store.BaseAtomicAction]] = (
         RedisPeekAtomicAction,
         RedisLimitAtomicAction,
+        RedisLimitAllAtomicAction,
         MemoryLimitAtomicAction,
+        MemoryLimitAllAtomicAction,
         MemoryPeekAtomicAction,
     )
 
     async def _limit(self, key: str, cost: int = 1) -> RateLimitResult:
-        formatted_key, emission_interval, capacity = self._prepare(key)
-        limited, remaining, reset_after, retry_after = cast(
-            "tuple[int, int, float, float]",
+        keys, args = self._prepare_limit(key, cost)
+        return self._to_limit_result(
+            args,
             await self._atomic_actions[constants.ATOMIC_ACTION_TYPE_LIMIT].do(
-                [formatted_key], [emission_interval, capacity, cost]
+                keys, args
             ),
         )
 
-        return RateLimitResult(
-            limited=bool(limited),
-            state_values=(capacity, remaining, reset_after, retry_after),
-        )
-
     async def _peek(self, key: str) -> RateLimitState:
         formatted_key, emission_interval, capacity = self._prepare(key)
         _limited, remaining, reset_after, retry_after = cast(
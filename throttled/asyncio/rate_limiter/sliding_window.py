@@ -1,10 +1,11 @@
-import math
 from collections.abc import Sequence
-from typing import TYPE_CHECKING, cast
+from typing import TYPE_CHECKING, Any
 
-from ... import constants, types, utils
+from ... import constants, types
 from ...rate_limiter.sliding_window import (
     MemoryLimitActionLogic,
+    MemoryLimitAllActionLogic,
+    RedisLimitAllAtomicActionSpec,
     RedisLimitAtomicActionSpec,
     SlidingWindowRateLimiterCoreMixin,
 )
@@ -27,10 +28,30 @@ class RedisLimitAtomicAction(RedisLimitAtomicActionSpec, store.BaseRedisAtomicAc
         keys: Sequence[types.KeyT],
         args: Sequence[types.StoreValueT] | None,
     ) -> tuple[int, int, float]:
-        limited, used, retry_after = cast(
-            "tuple[int, int, str]", await self._script(keys, args)
-        )
-        return limited, used, float(retry_after)
+        return self._parse_result(await self._execute_script(self._script, keys, args))
+
+    async def do_many(
+        self, calls: Sequence[types.AtomicActionCallT]
+    ) -> list[tuple[int, int, float]]:
+        results: list[Any] = await self._execute_script_many(self._script, calls)
+        return [self._parse_result(result) for result in results]
+
+
+class RedisLimitAllAtomicAction(
+    RedisLimitAllAtomicActionSpec, store.BaseRedisAtomicAction
+):
+    """Redis-based all-or-nothing AtomicAction for Async SlidingWindowRateLimiter."""
+
+    def __init__(self, backend: store.RedisStoreBackend) -> None:
+        super().__init__(backend)
+        self._script: AsyncScript = self._register_script(self.SCRIPTS)
+
+    async def do(
+        self,
+        keys: Sequence[types.KeyT],
+        args: Sequence[types.StoreValueT] | None,
+    ) -> tuple[int | float, ...]:
+        return self._parse_result(await self._execute_script(self._script, keys, args))
 
 
 class MemoryLimitAtomicAction(MemoryLimitActionLogic, store.BaseMemoryAtomicAction):
@@ -39,37 +60,35 @@ class MemoryLimitAtomicAction(MemoryLimitActionLogic, store.BaseMemoryAtomicActi
     TYPE: types.AtomicActionTypeT = constants.ATOMIC_ACTION_TYPE_LIMIT
 
 
+class MemoryLimitAllAtomicAction(
+    MemoryLimitAllActionLogic, store.BaseMemoryAtomicAction
+):
+    """Memory-based all-or-nothing AtomicAction for Async SlidingWindowRateLimiter."""
+
+    TYPE: types.AtomicActionTypeT = constants.ATOMIC_ACTION_TYPE_LIMIT_ALL
+
+
 class SlidingWindowRateLimiter(SlidingWindowRateLimiterCoreMixin, BaseRateLimiter):
     """Concrete implementation of BaseRateLimiter using sliding window as algorithm."""
 
     _DEFAULT_ATOMIC_ACTION_CLASSES: Sequence[type[store.BaseAtomicAction]] = (
         RedisLimitAtomicAction,
+        RedisLimitAllAtomicAction,
         MemoryLimitAtomicAction,
+        MemoryLimitAllAtomicAction,
     )
 
     async def _limit(self, key: str, cost: int = 1) -> RateLimitResult:
-        current_key, previous_key, period, limit = self._prepare(key)
-        limited, used, retry_after = cast(
-            "tuple[int, int, float]",
+        keys, args = self._prepare_limit(key, cost)
+        return self._to_limit_result(
+            args,
             await self._atomic_actions[constants.ATOMIC_ACTION_TYPE_LIMIT].do(
-                [current_key, previous_key], [period, limit, cost, utils.now_ms()]
+                keys, args
             ),
         )
-        return RateLimitResult(
-            limited=bool(limited),
-            state_values=(limit, max(0, limit - used), period, retry_after),
-        )
 
     async def _peek(self, key: str) -> RateLimitState:
-        current_key, previous_key, period, limit = self._prepare(key)
-        period_ms: int = period * 1000
-        current_proportion: float = (utils.now_ms() % period_ms) / period_ms
-
-        previous: int = math.floor(
-            (1 - current_proportion) * int(await self._store.get(previous_key) or 0)
-        )
-        used: int = previous + int(await self._store.get(current_key) or 0)
-
-        return RateLimitState(
-            limit=limit, remaining=max(0, limit - used), reset_after=period
+        formatted_key, period, limit = self._prepare(key)
+        return self._to_peek_state(
+            await self._store.hgetall(formatted_key), period, limit
         )
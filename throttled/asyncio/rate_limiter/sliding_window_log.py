@@ -0,0 +1,131 @@
+from collections.abc import Sequence
+from typing import TYPE_CHECKING, Any, cast
+
+from ... import constants, types
+from ...rate_limiter.sliding_window_log import (
+    MemoryLimitActionLogic,
+    MemoryLimitAllActionLogic,
+    MemoryPeekActionLogic,
+    RedisLimitAllAtomicActionSpec,
+    RedisLimitAtomicActionSpec,
+    RedisPeekAtomicActionSpec,
+    SlidingWindowLogRateLimiterCoreMixin,
+)
+from .. import store
+from . import BaseRateLimiter, RateLimitResult, RateLimitState
+
+if TYPE_CHECKING:
+    from redis.commands.core import AsyncScript
+
+
+class RedisLimitAtomicAction(RedisLimitAtomicActionSpec, store.BaseRedisAtomicAction):
+    """Redis-based AtomicAction for Async SlidingWindowLogRateLimiter's limit."""
+
+    def __init__(self, backend: store.RedisStoreBackend) -> None:
+        super().__init__(backend)
+        self._script: AsyncScript = self._register_script(self.SCRIPTS)
+
+    async def do(
+        self,
+        keys: Sequence[types.KeyT],
+        args: Sequence[types.StoreValueT] | None,
+    ) -> tuple[int, int, float, float]:
+        return self._parse_result(await self._execute_script(self._script, keys, args))
+
+    async def do_many(
+        self, calls: Sequence[types.AtomicActionCallT]
+    ) -> list[tuple[int, int, float, float]]:
+        results: list[Any] = await self._execute_script_many(self._script, calls)
+        return [self._parse_result(result) for result in results]
+
+
+class RedisLimitAllAtomicAction(
+    RedisLimitAllAtomicActionSpec, store.BaseRedisAtomicAction
+):
+    """Redis-based all-or-nothing AtomicAction for Async SlidingWindowLogRateLimiter."""
+
+    def __init__(self, backend: store.RedisStoreBackend) -> None:
+        super().__init__(backend)
+        self._script: AsyncScript = self._register_script(self.SCRIPTS)
+
+    async def do(
+        self,
+        keys: Sequence[types.KeyT],
+        args: Sequence[types.StoreValueT] | None,
+    ) -> tuple[int | float, ...]:
+        return self._parse_result(await self._execute_script(self._script, keys, args))
+
+
+class RedisPeekAtomicAction(RedisPeekAtomicActionSpec, store.BaseRedisAtomicAction):
+    """Redis-based AtomicAction for Async SlidingWindowLogRateLimiter's peek."""
+
+    def __init__(self, backend: store.RedisStoreBackend) -> None:
+        super().__init__(backend)
+        self._script: AsyncScript = self._register_script(self.SCRIPTS)
+
+    async def do(
+        self,
+        keys: Sequence[types.KeyT],
+        args: Sequence[types.StoreValueT] | None,
+    ) -> tuple[int, int, float, float]:
+        return self._parse_result(await self._execute_script(self._script, keys, args))
+
+
+class MemoryLimitAtomicAction(MemoryLimitActionLogic, store.BaseMemoryAtomicAction):
+    """Memory-based AtomicAction for Async SlidingWindowLogRateLimiter's limit."""
+
+    TYPE: types.AtomicActionTypeT = constants.ATOMIC_ACTION_TYPE_LIMIT
+
+
+class MemoryLimitAllAtomicAction(
+    MemoryLimitAllActionLogic, store.BaseMemoryAtomicAction
+):
+    """Memory-based all-or-nothing AtomicAction for Async SlidingWindowLogRateLimiter."""
+
+    TYPE: types.AtomicActionTypeT = constants.ATOMIC_ACTION_TYPE_LIMIT_ALL
+
+
+class MemoryPeekAtomicAction(MemoryPeekActionLogic, store.BaseMemoryAtomicAction):
+    """Memory-based AtomicAction for Async SlidingWindowLogRateLimiter's peek."""
+
+    TYPE: types.AtomicActionTypeT = constants.ATOMIC_ACTION_TYPE_PEEK
+
+
+class SlidingWindowLogRateLimiter(
+    SlidingWindowLogRateLimiterCoreMixin,
+    BaseRateLimiter,
+):
+    """Concrete implementation of BaseRateLimiter using sliding window log."""
+
+    _DEFAULT_ATOMIC_ACTION_CLASSES: Sequence[type[store.BaseAtomicAction]] = (
+        RedisPeekAtomicAction,
+        RedisLimitAtomicAction,
+        RedisLimitAllAtomicAction,
+        MemoryLimitAtomicAction,
+        MemoryLimitAllAtomicAction,
+        MemoryPeekAtomicAction,
+    )
+
+    async def _limit(self, key: str, cost: int = 1) -> RateLimitResult:
+        keys, args = self._prepare_limit(key, cost)
+        return self._to_limit_result(
+            args,
+            await self._atomic_actions[constants.ATOMIC_ACTION_TYPE_LIMIT].do(
+                keys, args
+            ),
+        )
+
+    async def _peek(self, key: str) -> RateLimitState:
+        formatted_key, period, limit = self._prepare(key)
+        _limited, remaining, reset_after, retry_after = cast(
+            "tuple[int, int, float, float]",
+            await self._atomic_actions[constants.ATOMIC_ACTION_TYPE_PEEK].do(
+                [formatted_key], [period, limit]
+            ),
+        )
+        return RateLimitState(
+            limit=limit,
+            remaining=remaining,
+            reset_after=reset_after,
+            retry_after=retry_after,
+        )
@@ -1,10 +1,11 @@
-import math
 from collections.abc import Sequence
-from typing import TYPE_CHECKING, cast
+from typing import TYPE_CHECKING, Any
 
-from ... import constants, types, utils
+from ... import constants, types
 from ...rate_limiter.token_bucket import (
     MemoryLimitActionLogic,
+    MemoryLimitAllActionLogic,
+    RedisLimitAllAtomicActionSpec,
     RedisLimitAtomicActionSpec,
     TokenBucketRateLimiterCoreMixin,
 )
@@ -26,9 +27,31 @@ class RedisLimitAtomicAction(RedisLimitAtomicActionSpec, store.BaseRedisAtomicAc
         self,
         keys: Sequence[types.KeyT],
         args: Sequence[types.StoreValueT] | None,
-    ) -> tuple[int, int]:
-        limited, tokens = cast("tuple[int, int]", await self._script(keys, args))
-        return limited, tokens
+    ) -> tuple[int, float]:
+        return self._parse_result(await self._execute_script(self._script, keys, args))
+
+    async def do_many(
+        self, calls: Sequence[types.AtomicActionCallT]
+    ) -> list[tuple[int, float]]:
+        results: list[Any] = await self._execute_script_many(self._script, calls)
+        return [self._parse_result(result) for result in results]
+
+
+class RedisLimitAllAtomicAction(
+    RedisLimitAllAtomicActionSpec, store.BaseRedisAtomicAction
+):
+    """Redis-based all-or-nothing AtomicAction for Async TokenBucketRateLimiter."""
+
+    def __init__(self, backend: store.RedisStoreBackend) -> None:
+        super().__init__(backend)
+        self._script: AsyncScript = self._register_script(self.SCRIPTS)
+
+    async def do(
+        self,
+        keys: Sequence[types.KeyT],
+        args: Sequence[types.StoreValueT] | None,
+    ) -> tuple[int | float, ...]:
+        return self._parse_result(await self._execute_script(self._script, keys, args))
 
 
 class MemoryLimitAtomicAction(MemoryLimitActionLogic, store.BaseMemoryAtomicAction):
@@ -37,34 +60,32 @@ class MemoryLimitAtomicAction(MemoryLimitActionLogic, store.BaseMemoryAtomicActi
     TYPE: types.AtomicActionTypeT = constants.ATOMIC_ACTION_TYPE_LIMIT
 
 
+class MemoryLimitAllAtomicAction(
+    MemoryLimitAllActionLogic, store.BaseMemoryAtomicAction
+):
+    """Memory-based all-or-nothing AtomicAction for Async TokenBucketRateLimiter."""
+
+    TYPE: types.AtomicActionTypeT = constants.ATOMIC_ACTION_TYPE_LIMIT_ALL
+
+
 class TokenBucketRateLimiter(TokenBucketRateLimiterCoreMixin, BaseRateLimiter):
     """Concrete implementation of BaseRateLimiter using leaking bucket as algorithm."""
 
     _DEFAULT_ATOMIC_ACTION_CLASSES: Sequence[type[store.BaseAtomicAction]] = (
         RedisLimitAtomicAction,
+        RedisLimitAllAtomicAction,
         MemoryLimitAtomicAction,
+        MemoryLimitAllAtomicAction,
     )
 
     async def _limit(self, key: str, cost: int = 1) -> RateLimitResult:
-        formatted_key, rate, capacity = self._prepare(key)
-        limited, tokens = cast(
-            "tuple[int, int]",
+        keys, args = self._prepare_limit(key, cost)
+        return self._to_limit_result(
+            args,
             await self._atomic_actions[constants.ATOMIC_ACTION_TYPE_LIMIT].do(
-                [formatted_key], [rate, capacity, cost]
+                keys, args
             ),
         )
-        return self._to_result(limited, cost, tokens, capacity)
 
     async def _peek(self, key: str) -> RateLimitState:
-        now: int = utils.now_sec()
-        formatted_key, rate, capacity = self._prepare(key)
-
-        bucket: types.StoreDictValueT = await self._store.hgetall(formatted_key)
-        last_tokens: int = int(bucket.get("tokens", capacity))
-        last_refreshed: int = int(bucket.get("last_refreshed", now))
-
-        time_elapsed: int = max(0, now - last_refreshed)
-        tokens: int = min(capacity, last_tokens + (math.floor(time_elapsed * rate)))
-        reset_after: int = math.ceil((capacity - tokens) / rate)
-
-        return RateLimitState(limit=capacity, remaining=tokens, reset_after=reset_after)
+        return self._to_peek_state(await self._store.hgetall(self._prepare_key(key)))
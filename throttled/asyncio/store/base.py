@@ -15,7 +15,7 @@ class BaseAtomicAction(AutoWrapMethodsMixin, abc.ABC):
     TYPE: types.AtomicActionTypeT = ""
     STORE_TYPE: str = ""
 
-    _WRAPPED_METHOD_NAMES: tuple[str, ...] = ("do",)
+    _WRAPPED_METHOD_NAMES: tuple[str, ...] = ("do", "do_many")
 
     def __init__(self, backend: BaseStoreBackend) -> None:
         self._backend = backend
@@ -32,6 +32,19 @@ class BaseAtomicAction(AutoWrapMethodsMixin, abc.ABC):
         """
         raise NotImplementedError
 
+    async def do_many(
+        self, calls: Sequence[types.AtomicActionCallT]
+    ) -> Sequence[tuple[int | float, ...]]:
+        """Execute the AtomicAction once for each ``(keys, args)`` pair.
+
+        The default implementation awaits :meth:`do` one by one, store backends
+        override it to execute the whole batch in a single round trip.
+
+        :param calls: A sequence of ``(keys, args)`` pairs.
+        :return: The results of the AtomicAction, in the same order as ``calls``.
+        """
+        return [await self.do(keys, args) for keys, args in calls]
+
 
 class BaseStore(StoreSpec, StoreValidationLogic, AutoWrapMethodsMixin, abc.ABC):
     """Abstract class for all async stores."""
@@ -54,6 +67,8 @@ class BaseStore(StoreSpec, StoreValidationLogic, AutoWrapMethodsMixin, abc.ABC):
         self.server: str | None = server
         self.options: dict[str, Any] = options or {}
         self._backend = self._BACKEND_CLASS(server, options)
+        self.key_layout = self._backend.key_layout
+        self.clock = self._backend.clock
 
     def make_atomic(self, action_cls: type[BaseAtomicAction]) -> BaseAtomicAction:
         """Create an async AtomicAction instance bound to the concrete backend."""
@@ -1,23 +1,163 @@
 import abc
 import asyncio
-from collections.abc import Sequence
+import warnings
+import weakref
+from collections.abc import Iterable, Sequence
+from types import TracebackType
 from typing import Any, cast
 
-from ... import constants, store, types
+from ... import constants, exceptions, store, types
 from ...store.memory import BaseMemoryAtomicActionSpec
 from . import BaseAtomicAction, BaseStore
 
 
+class _MultiLock:
+    """Async lock that acquires the locks of several segments in order."""
+
+    __slots__ = ("_locks",)
+
+    def __init__(self, locks: Sequence[types.AsyncLockP]) -> None:
+        self._locks: Sequence[types.AsyncLockP] = locks
+
+    async def acquire(self) -> bool:
+        acquired: int = 0
+        try:
+            for lock in self._locks:
+                await lock.acquire()
+                acquired += 1
+        except BaseException:
+            # Release the locks acquired so far if the acquisition is cancelled.
+            for lock in reversed(self._locks[:acquired]):
+                lock.release()
+            raise
+        return True
+
+    def release(self) -> None:
+        for lock in reversed(self._locks):
+            lock.release()
+
+    async def __aenter__(self) -> None:
+        await self.acquire()
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        self.release()
+
+
+async def _sweep_forever(
+    backend_ref: "weakref.ReferenceType[MemoryStoreBackend]", interval: float
+) -> None:
+    # Hold the backend weakly, so the task exits once the store is collected.
+    while True:
+        await asyncio.sleep(interval)
+        backend: MemoryStoreBackend | None = backend_ref()
+        if backend is None:
+            return
+        await backend.sweep()
+        del backend
+
+
 class MemoryStoreBackend(store.BaseMemoryStoreBackend):
     """Backend for Async MemoryStore."""
 
-    lock: types.AsyncLockP
+    locks: list[types.AsyncLockP]
 
     def __init__(
         self, server: str | None = None, options: dict[str, Any] | None = None
     ) -> None:
         super().__init__(server, options)
-        self.lock = cast("types.AsyncLockP", cast("object", asyncio.Lock()))
+        self.locks = [
+            cast("types.AsyncLockP", cast("object", asyncio.Lock()))
+            for _ in range(self.shards)
+        ]
+
+        self._sweeper: asyncio.Task[None] | None = None
+        # The sweeper task needs a running event loop, so it is started lazily
+        # on the first locked access.
+        self._sweeper_pending: bool = bool(self.sweep_interval)
+
+    async def sweep(self) -> int:
+        """Remove expired keys from all segments.
+
+        Each segment is swept in batches of ``SWEEP_BATCH_SIZE`` indexed keys,
+        and control is yielded to the event loop between batches.
+
+        :return: The number of removed keys.
+        """
+        removed: int = 0
+        for segment, lock in zip(self.segments, self.locks, strict=True):
+            while True:
+                async with lock:
+                    batch_removed, inspected = segment.sweep(self.sweep_batch_size)
+                removed += batch_removed
+                if inspected < self.sweep_batch_size:
+                    break
+                await asyncio.sleep(0)
+        return removed
+
+    def start_sweeper(self) -> None:
+        """Start a task to sweep expired keys every ``SWEEP_INTERVAL``.
+
+        It must be called with a running event loop.
+        """
+        if not self.sweep_interval:
+            raise exceptions.SetUpError("SWEEP_INTERVAL must be set to start sweeper")
+
+        if self._sweeper is not None and not self._sweeper.done():
+            return
+
+        self._sweeper_pending = False
+        self._sweeper = asyncio.get_running_loop().create_task(
+            _sweep_forever(weakref.ref(self), self.sweep_interval)
+        )
+
+    def stop_sweeper(self) -> None:
+        """Cancel the sweeper task if it is running."""
+        self._sweeper_pending = False
+        if self._sweeper is not None:
+            self._sweeper.cancel()
+            self._sweeper = None
+
+    @property
+    def lock(self) -> types.AsyncLockP:
+        """The lock of the first segment, kept for compatibility.
+
+        Deprecated, use :meth:`get_lock` or :meth:`get_locks` instead, as this
+        lock only guards the first segment when ``SHARDS`` is greater than 1.
+        """
+        warnings.warn(
+            "MemoryStoreBackend.lock is deprecated, use get_lock(key) instead.",
+            DeprecationWarning,
+            stacklevel=2,
+        )
+        return self.locks[0]
+
+    def get_lock(self, key: types.KeyT) -> types.AsyncLockP:
+        """Return the lock of the segment that ``key`` hashes to."""
+        if self._sweeper_pending:
+            self.start_sweeper()
+        return self.locks[hash(key) % self.shards]
+
+    def get_locks(self, keys: Iterable[types.KeyT]) -> types.AsyncLockP:
+        """Return a lock that guards all the segments that ``keys`` hash to.
+
+        Locks are always acquired in segment order to avoid deadlocks between
+        multi-key operations.
+        """
+        if self._sweeper_pending:
+            self.start_sweeper()
+
+        if self.shards == 1:
+            return self.locks[0]
+
+        shards: list[int] = self.get_shards(keys)
+        if len(shards) == 1:
+            return self.locks[shards[0]]
+        return _MultiLock([self.locks[shard] for shard in shards])
 
 
 class BaseMemoryAtomicAction(BaseMemoryAtomicActionSpec, BaseAtomicAction, abc.ABC):
@@ -28,9 +168,16 @@ class BaseMemoryAtomicAction(BaseMemoryAtomicActionSpec, BaseAtomicAction, abc.A
     async def do(
         self, keys: Sequence[types.KeyT], args: Sequence[types.StoreValueT] | None
     ) -> tuple[int | float, ...]:
-        async with self._backend.lock:
+        async with self._backend.get_locks(keys):
             return self._do(self._backend, keys, args)
 
+    async def do_many(
+        self, calls: Sequence[types.AtomicActionCallT]
+    ) -> Sequence[tuple[int | float, ...]]:
+        # Hold the locks once for the whole batch instead of once per call.
+        async with self._backend.get_locks(key for keys, _args in calls for key in keys):
+            return [self._do(self._backend, keys, args) for keys, args in calls]
+
 
 class MemoryStore(BaseStore):
     """Concrete implementation of BaseStore using Memory as backend."""
@@ -48,15 +195,16 @@ class MemoryStore(BaseStore):
 
     async def expire(self, key: types.KeyT, timeout: int) -> None:
         self._validate_timeout(timeout)
-        self._backend.expire(key, timeout)
+        async with self._backend.get_lock(key):
+            self._backend.expire(key, timeout)
 
     async def set(self, key: types.KeyT, value: types.StoreValueT, timeout: int) -> None:
         self._validate_timeout(timeout)
-        async with self._backend.lock:
+        async with self._backend.get_lock(key):
             self._backend.set(key, value, timeout)
 
     async def get(self, key: types.KeyT) -> types.StoreValueT | None:
-        async with self._backend.lock:
+        async with self._backend.get_lock(key):
             return self._backend.get(key)
 
     async def hset(
@@ -66,9 +214,9 @@ class MemoryStore(BaseStore):
         value: types.StoreValueT | None = None,
         mapping: types.StoreDictValueT | None = None,
     ) -> None:
-        async with self._backend.lock:
+        async with self._backend.get_lock(name):
             self._backend.hset(name, key, value, mapping)
 
     async def hgetall(self, name: types.KeyT) -> types.StoreDictValueT:
-        async with self._backend.lock:
+        async with self._backend.get_lock(name):
             return self._backend.hgetall(name)
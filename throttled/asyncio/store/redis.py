@@ -1,16 +1,223 @@
 import abc
-from typing import TYPE_CHECKING, Any
+import asyncio
+import contextlib
+import weakref
+from collections.abc import Awaitable, Callable, Sequence
+from typing import TYPE_CHECKING, Any, TypeVar, cast
 
 from ... import constants, exceptions, store, types, utils
+from ...store.client_cache import BaseClientTracker
 from .base import BaseAtomicAction, BaseStore
 
 if TYPE_CHECKING:
     from redis.commands.core import AsyncScript
 
+    from ...store.redis_pool import AsyncPoolStatsMixin
+
+# The value of a read cached by the client cache.
+_ValueT = TypeVar("_ValueT")
+
+# (script, keys, args) of a script call.
+_ScriptCallT = tuple[
+    "AsyncScript", Sequence[types.KeyT], Sequence[types.StoreValueT] | None
+]
+
+# (script, keys, args, future) of a script call waiting to be pipelined.
+_PendingCallT = tuple[
+    "AsyncScript",
+    Sequence[types.KeyT],
+    Sequence[types.StoreValueT] | None,
+    "asyncio.Future[Any]",
+]
+
+
+class AutoPipeline:
+    """Coalesce script calls issued close together into one Redis pipeline.
+
+    Calls made within the same event loop iteration, or within ``window``
+    seconds of the first one, are sent in a single non-transactional pipeline
+    once the batch is flushed, and each result (or error) is dispatched back
+    to the awaiting caller. A batch is flushed early once it holds
+    ``max_size`` calls.
+    """
+
+    def __init__(
+        self, backend: "RedisStoreBackend", window: float = 0, max_size: int = 1024
+    ) -> None:
+        """Initializes the auto pipeline.
+
+        :param backend: The backend whose client executes the pipelines.
+        :param window: Seconds to wait for more calls before flushing a batch,
+            0 flushes on the next event loop iteration.
+        :param max_size: The maximum number of calls in a pipeline.
+        """
+        self._backend: RedisStoreBackend = backend
+        self.window: float = window
+        self.max_size: int = max_size
+        # Batches are bound to the loop that awaits their futures.
+        self._batches: dict[asyncio.AbstractEventLoop, list[_PendingCallT]] = {}
+        # Keep references to running flushes, or they may be garbage collected.
+        self._flushes: set[asyncio.Task[None]] = set()
+
+    def execute(
+        self,
+        script: "AsyncScript",
+        keys: Sequence[types.KeyT],
+        args: Sequence[types.StoreValueT] | None,
+    ) -> "asyncio.Future[Any]":
+        """Queue ``script`` into the current batch and return its future."""
+        loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+        future: asyncio.Future[Any] = loop.create_future()
+
+        batch: list[_PendingCallT] | None = self._batches.get(loop)
+        if batch is None:
+            batch = self._batches[loop] = []
+            if self.window > 0:
+                loop.call_later(self.window, self._flush, loop)
+            else:
+                loop.call_soon(self._flush, loop)
+
+        batch.append((script, keys, args, future))
+        if len(batch) >= self.max_size:
+            self._flush(loop)
+        return future
+
+    def _flush(self, loop: asyncio.AbstractEventLoop) -> None:
+        batch: list[_PendingCallT] = self._batches.pop(loop, [])
+        if not batch:
+            return
+
+        task: asyncio.Task[None] = loop.create_task(self._execute(batch))
+        self._flushes.add(task)
+        task.add_done_callback(self._flushes.discard)
+
+    async def _execute(self, batch: list[_PendingCallT]) -> None:
+        try:
+            results: list[object] = await self._backend.execute_scripts(
+                [(script, keys, args) for script, keys, args, _ in batch]
+            )
+        except Exception as e:
+            # The whole pipeline failed, e.g. the connection was lost.
+            for *_, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for (*_, future), result in zip(batch, results, strict=True):
+            # Skip callers that have been cancelled while waiting.
+            if future.done():
+                continue
+            if isinstance(result, Exception):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+
+async def _track_forever(tracker_ref: "weakref.ReferenceType[ClientTracker]") -> None:
+    # Hold the tracker weakly, so the task exits once the store is collected.
+    while True:
+        tracker: ClientTracker | None = tracker_ref()
+        if tracker is None or not tracker.supported:
+            return
+        await tracker.poll()
+        del tracker
+
+
+class ClientTracker(BaseClientTracker):
+    """Keep a :class:`throttled.store.ClientCache` in sync with Redis from a task.
+
+    The two connections of the tracker are taken from the connection pool
+    of the backend, and are given back once lost.
+    """
+
+    def __init__(
+        self, backend: "RedisStoreBackend", cache: store.ClientCache, interval: float = 1
+    ) -> None:
+        super().__init__(cache, interval)
+        self._backend: RedisStoreBackend = backend
+        self._task: asyncio.Task[None] | None = None
+        # The subscriber and tracking connections, taken from the pool.
+        self._connections: list[types.AsyncConnectionP] = []
+        self._connected: bool = False
+
+    def start(self) -> None:
+        """Start the tracking task in the running loop, if it is not running."""
+        loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+        if self._task is None or self._task.done() or self._task.get_loop() is not loop:
+            self._task = loop.create_task(_track_forever(weakref.ref(self)))
+
+    async def poll(self) -> None:
+        """Handle an invalidation, waiting up to ``interval`` seconds for it.
+
+        Connects first if the tracker is not connected.
+        """
+        try:
+            await self._poll()
+        except self._backend.response_exceptions:
+            # E.g. Redis < 6, which does not support CLIENT TRACKING.
+            self.supported = False
+            await self._disconnect()
+        except self._backend.base_exceptions:
+            await self._disconnect()
+            await asyncio.sleep(self.interval)
+
+    async def _poll(self) -> None:
+        if not self._connected:
+            await self._connect()
+            return
+
+        subscriber, tracking = self._connections
+        message: object = await subscriber.read_response(timeout=self.interval)
+        if message is not None:
+            self._on_message(message)
+        else:
+            # Tracking is turned off once its connection is closed.
+            await tracking.send_command("PING")
+            await tracking.read_response()
+
+    async def _acquire(self) -> types.AsyncConnectionP:
+        pool: AsyncPoolStatsMixin = cast(
+            "AsyncPoolStatsMixin", self._backend.get_connection_pool()
+        )
+        connection: types.AsyncConnectionP = cast(
+            "types.AsyncConnectionP", await pool.acquire()
+        )
+        self._connections.append(connection)
+        return connection
+
+    async def _connect(self) -> None:
+        await self._disconnect()
+        subscriber: types.AsyncConnectionP = await self._acquire()
+        await subscriber.send_command("CLIENT", "ID")
+        client_id: object = await subscriber.read_response()
+        await subscriber.send_command("SUBSCRIBE", self.CHANNEL)
+        await subscriber.read_response()
+
+        tracking: types.AsyncConnectionP = await self._acquire()
+        await tracking.send_command(*self._get_tracking_args(client_id))
+        await tracking.read_response()
+        self._connected = True
+        self.cache.enable()
+
+    async def _disconnect(self) -> None:
+        self.cache.disable()
+        self._connected = False
+        connections: list[types.AsyncConnectionP] = self._connections
+        self._connections = []
+
+        pool: AsyncPoolStatsMixin = cast(
+            "AsyncPoolStatsMixin", self._backend.get_connection_pool()
+        )
+        for connection in connections:
+            await connection.disconnect()
+            await pool.release(cast("Any", connection))
+
 
 class RedisStoreBackend(store.BaseRedisStoreBackend[types.AsyncRedisClientP]):
     """Backend for Async RedisStore."""
 
+    blocking_pool_cls_path: str = "redis.asyncio.BlockingConnectionPool"
+
     @classmethod
     def _set_options(cls, options: dict[str, Any]) -> None:
         super()._set_options(options)
@@ -42,30 +249,395 @@ class RedisStoreBackend(store.BaseRedisStoreBackend[types.AsyncRedisClientP]):
             "REDIS_CLUSTER_NODE_CLASS", "redis.asyncio.cluster.ClusterNode"
         )
 
+    def __init__(
+        self, server: str | None = None, options: dict[str, Any] | None = None
+    ) -> None:
+        super().__init__(server, options)
+
+        self._auto_pipeline: AutoPipeline | None = None
+        if self.options["AUTO_PIPELINE"]:
+            self._auto_pipeline = AutoPipeline(
+                self,
+                self.options["AUTO_PIPELINE_WINDOW"],
+                self.options["AUTO_PIPELINE_MAX_SIZE"],
+            )
+
+        self._client_tracker: ClientTracker | None = None
+        if self._client_cache is not None:
+            self._client_tracker = ClientTracker(self, self._client_cache)
+
+    def get_auto_pipeline(self) -> AutoPipeline | None:
+        """Return the auto pipeline, or None if ``AUTO_PIPELINE`` is disabled."""
+        return self._auto_pipeline
+
+    def get_client_cache(self) -> store.ClientCache | None:
+        """Return the client cache, or None if ``CLIENT_CACHE`` is disabled."""
+        if self._client_tracker is None:
+            return None
+
+        self._client_tracker.start()
+        return self._client_tracker.cache
+
+    async def prewarm(self, connections: int | None = None) -> int:
+        """Open connections in the pool ahead of the first calls.
+
+        :param connections: The number of connections to open, defaults
+            to ``POOL_PREWARM``, and is capped at ``MAX_CONNECTIONS``.
+        :return: The number of connections opened.
+        """
+        pool: AsyncPoolStatsMixin = cast(
+            "AsyncPoolStatsMixin", self.get_connection_pool()
+        )
+        acquired: list[Any] = []
+        try:
+            for __ in range(self._get_prewarm_size(connections)):
+                acquired.append(await pool.acquire())  # noqa: PERF401
+        finally:
+            for connection in acquired:
+                await pool.release(connection)
+        return len(acquired)
+
+    async def get_read_client(self) -> types.AsyncRedisClientP:
+        """Return the client for read-only calls.
+
+        That is the replica client if ``READ_FROM_REPLICAS`` is enabled and
+        replicas lag behind by no more than ``REPLICA_MAX_LAG``, otherwise
+        the primary client.
+        """
+        if not self.reads_from_replicas():
+            return self.get_client()
+
+        client: types.AsyncRedisClientP = self.get_replica_client()
+        if self._should_check_replicas():
+            info: dict[str, Any] | None = None
+            with contextlib.suppress(*self.base_exceptions):
+                info = await self.get_client().info(
+                    "replication", **self._get_replication_info_kwargs()
+                )
+            self._on_replicas_checked(info)
+        return client if self._replica_fresh else self.get_client()
+
+    async def load_scripts(self) -> list[str]:
+        """Load all registered scripts into Redis, see :class:`ScriptRegistry`.
+
+        :return: The SHA1 digests of the loaded scripts.
+        """
+        client: types.AsyncRedisClientP = self.get_client()
+        scripts: dict[str, str] = store.ScriptRegistry.get_scripts()
+        if self.is_cluster():
+            # Cluster pipelines cannot fan out to nodes, SCRIPT LOAD is sent to
+            # all primaries by the client instead.
+            for script in scripts.values():
+                await client.script_load(script)
+        else:
+            pipeline: types.AsyncPipelineP = client.pipeline(transaction=False)
+            for script in scripts.values():
+                pipeline.script_load(script)
+            await pipeline.execute()
+        return list(scripts)
+
+    async def load_functions(self) -> bool:
+        """Load the FUNCTION library of all registered scripts into Redis.
+
+        On Redis Cluster, the library is loaded on all primaries.
+
+        :return: Whether the library is loaded, if Redis does not support
+            functions, scripts are run with EVALSHA instead.
+        """
+        error: Exception | None = None
+        try:
+            await self.get_client().function_load(
+                store.ScriptRegistry.get_library()[1], True
+            )
+        except self.response_exceptions as e:
+            error = e
+        return self._on_functions_loaded(error)
+
+    async def ensure_scripts(self) -> None:
+        """Load all registered scripts again once a connection has reconnected.
+
+        This saves the NOSCRIPT misses of the following calls after a connection
+        reset, a restart or a failover, see :meth:`is_reconnected`. Scripts that
+        are still found missing are loaded again on the miss.
+        """
+        if self.is_reconnected() and not self.uses_functions():
+            await self.load_scripts()
+
+    async def ensure_functions(self) -> None:
+        """Load the FUNCTION library if it is used and not loaded yet."""
+        if self.uses_functions() and not self._functions_loaded:
+            await self.load_functions()
+
+    async def queue_script(
+        self,
+        client: types.AsyncRedisClientP | types.AsyncPipelineP,
+        script: "AsyncScript",
+        keys: Sequence[types.KeyT],
+        args: Sequence[types.StoreValueT] | None,
+    ) -> object:
+        """Call ``script`` on a client or queue it on a pipeline.
+
+        The script is called as a function if the library is loaded, or with
+        EVALSHA otherwise, a missing script is left to the caller.
+        """
+        function: tuple[str, bool] | None = self.get_function(script.sha)
+        # Clients return a coroutine, pipelines return themselves and are
+        # awaitable as well.
+        if function is None:
+            return await cast(
+                "Awaitable[object]",
+                client.evalsha(script.sha, len(keys), *keys, *(args or ())),
+            )
+
+        name, read_only = function
+        fcall = client.fcall_ro if read_only else client.fcall
+        return await cast(
+            "Awaitable[object]", fcall(name, len(keys), *keys, *(args or ()))
+        )
+
+    async def _execute_pipeline(self, calls: Sequence[_ScriptCallT]) -> list[object]:
+        pipeline: types.AsyncPipelineP = self.get_client().pipeline(transaction=False)
+        for script, keys, args in calls:
+            await self.queue_script(pipeline, script, keys, args)
+        results: list[object] = await pipeline.execute(raise_on_error=False)
+        self.check_pipeline_results(results)
+        return results
+
+    async def execute_scripts(self, calls: Sequence[_ScriptCallT]) -> list[object]:
+        """Execute many script calls in one pipeline.
+
+        On Redis Cluster, the client splits the pipeline by node and sends the
+        per-node pipelines concurrently, so a batch takes about one round trip
+        regardless of the number of nodes.
+
+        :param calls: A sequence of ``(script, keys, args)`` calls.
+        :return: The result, or the raised exception, of each call in the
+            same order as ``calls``.
+        """
+        await self.ensure_scripts()
+        await self.ensure_functions()
+        results: list[object] = await self._execute_pipeline(calls)
+        missing: list[int] = [
+            index
+            for index, result in enumerate(results)
+            if isinstance(result, self.no_script_exceptions)
+        ]
+        if not missing:
+            return results
+
+        # Scripts are missing after a restart, failover or flush, reload them
+        # all at once and retry the missed calls in one more pipeline.
+        await self.load_scripts()
+        retried: list[object] = await self._execute_pipeline([calls[i] for i in missing])
+        for index, result in zip(missing, retried, strict=True):
+            results[index] = result
+            if not isinstance(result, self.no_script_exceptions):
+                continue
+            # Not a registered script, load it on its own.
+            try:
+                results[index] = await self.execute_script(*calls[index])
+            except self.base_exceptions as e:
+                results[index] = e
+        return results
+
+    async def execute_script(
+        self,
+        script: "AsyncScript",
+        keys: Sequence[types.KeyT],
+        args: Sequence[types.StoreValueT] | None,
+    ) -> object:
+        """Execute ``script`` as a function if the library is used, or EVALSHA."""
+        await self.ensure_scripts()
+        await self.ensure_functions()
+        client: types.AsyncRedisClientP = self.get_client()
+        if self.get_function(script.sha) is not None:
+            try:
+                return await self.queue_script(client, script, keys, args)
+            except self.response_exceptions as e:
+                if not self.is_function_missing(e):
+                    raise
+                # The library is gone, e.g. after FUNCTION FLUSH, load it
+                # again and fall back to EVALSHA for this call.
+                await self.load_functions()
+
+        try:
+            return await client.evalsha(script.sha, len(keys), *keys, *(args or ()))
+        except self.no_script_exceptions:
+            # The script cache is empty after a restart, failover or flush,
+            # reload all scripts at once rather than missing them one by one.
+            await self.load_scripts()
+            return await script(keys, args)
+
+    async def execute_read_script(
+        self,
+        script: "AsyncScript",
+        keys: Sequence[types.KeyT],
+        args: Sequence[types.StoreValueT] | None,
+    ) -> object:
+        """Execute a read-only ``script`` with the client for read-only calls."""
+        client: types.AsyncRedisClientP = await self.get_read_client()
+        if client is self.get_client():
+            return await self.execute_script(script, keys, args)
+
+        if self.get_function(script.sha) is not None:
+            try:
+                return await self.queue_script(client, script, keys, args)
+            except self.response_exceptions as e:
+                # Replicas may not have the library yet, fall back to scripts.
+                if not self.is_function_missing(e):
+                    raise
+
+        if not self.is_cluster():
+            # Replicas run read-only scripts, the script is loaded on a miss.
+            return await script(keys, args, client=cast("Any", client))
+
+        # Redis Cluster only routes the read-only variants to replicas.
+        try:
+            return await client.evalsha_ro(script.sha, len(keys), *keys, *(args or ()))
+        except self.no_script_exceptions:
+            return await client.eval_ro(script.script, len(keys), *keys, *(args or ()))
+
 
 class BaseRedisAtomicAction(BaseAtomicAction, abc.ABC):
     """Base class for async Redis atomic actions bound to RedisStoreBackend."""
 
     STORE_TYPE: str = constants.StoreType.REDIS.value
     _backend: RedisStoreBackend
+    # The script of the action, registered on the client of the store.
+    _script: "AsyncScript"
+
+    def __init_subclass__(cls, **kwargs: object) -> None:
+        super().__init_subclass__(**kwargs)
+        scripts: str | None = getattr(cls, "SCRIPTS", None)
+        if scripts:
+            store.ScriptRegistry.register(
+                scripts, read_only=cls.TYPE == constants.ATOMIC_ACTION_TYPE_PEEK
+            )
 
     def _register_script(self, scripts: str) -> "AsyncScript":
         return self._backend.get_client().register_script(scripts)
 
+    async def _execute_script(
+        self,
+        script: "AsyncScript",
+        keys: Sequence[types.KeyT],
+        args: Sequence[types.StoreValueT] | None,
+    ) -> object:
+        """Execute ``script``, through the auto pipeline if it is enabled.
+
+        Peeks are routed to replicas if ``READ_FROM_REPLICAS`` is enabled.
+        """
+        if (
+            self.TYPE == constants.ATOMIC_ACTION_TYPE_PEEK
+            and self._backend.reads_from_replicas()
+        ):
+            return await self._backend.execute_read_script(script, keys, args)
+
+        try:
+            auto_pipeline: AutoPipeline | None = self._backend.get_auto_pipeline()
+            if auto_pipeline is not None:
+                return await auto_pipeline.execute(script, keys, args)
+            return await self._backend.execute_script(script, keys, args)
+        finally:
+            self._backend.invalidate_client_cache(keys)
+
+    async def _execute_script_many(
+        self, script: "AsyncScript", calls: Sequence[types.AtomicActionCallT]
+    ) -> list[Any]:
+        """Execute ``script`` for each ``(keys, args)`` pair in one pipeline."""
+        try:
+            results: list[Any] = await self._backend.execute_scripts(
+                [(script, keys, args) for keys, args in calls]
+            )
+        finally:
+            for keys, __ in calls:
+                self._backend.invalidate_client_cache(keys)
+        for result in results:
+            if isinstance(result, Exception):
+                raise result
+        return results
+
 
 class RedisStore(BaseStore):
     """Concrete implementation of BaseStore using Redis as backend."""
 
     TYPE: str = constants.StoreType.REDIS.value
 
+    _WRAPPED_METHOD_NAMES: tuple[str, ...] = (
+        *BaseStore._WRAPPED_METHOD_NAMES,
+        "preload_scripts",
+        "prewarm",
+    )
+
     _BACKEND_CLASS: type[RedisStoreBackend] = RedisStoreBackend
     _backend: RedisStoreBackend
 
+    async def preload_scripts(self) -> list[str]:
+        """Load the Lua scripts of all rate limiters into Redis.
+
+        Call it on startup to save the first EVALSHA miss per script and
+        process. On Redis Cluster, scripts are loaded on all primaries.
+        All scripts are reloaded when a connection of the pool reconnects,
+        e.g. on a failover, or whenever one is found missing.
+
+        :return: The SHA1 digests of the loaded scripts.
+        """
+        if self._backend.uses_functions():
+            await self._backend.load_functions()
+        return await self._backend.load_scripts()
+
+    async def prewarm(self, connections: int | None = None) -> int:
+        """Open connections in the pool ahead of the first calls.
+
+        Call it on startup to save the connection setup of the first calls,
+        see ``POOL_PREWARM``. Not available on Redis Cluster.
+
+        :param connections: The number of connections to open, defaults
+            to ``POOL_PREWARM``, and is capped at ``MAX_CONNECTIONS``.
+        :return: The number of connections opened.
+        """
+        return await self._backend.prewarm(connections)
+
+    def pool_stats(self) -> store.PoolStats:
+        """Return the statistics of the connection pool.
+
+        Not available on Redis Cluster, which keeps a pool per node.
+        """
+        return self._backend.get_connection_pool().get_stats()
+
+    def client_cache_stats(self) -> store.ClientCacheStats:
+        """Return the statistics of the client cache, see ``CLIENT_CACHE``."""
+        cache: store.ClientCache | None = self._backend.get_client_cache()
+        if cache is None:
+            raise exceptions.SetUpError("CLIENT_CACHE is not enabled.")
+        return cache.get_stats()
+
+    async def _cached_read(
+        self,
+        command: str,
+        key: types.KeyT,
+        read: Callable[[types.KeyT], Awaitable[_ValueT]],
+    ) -> _ValueT:
+        cache: store.ClientCache | None = self._backend.get_client_cache()
+        if cache is None or not cache.is_cachable(key):
+            return await read(key)
+
+        hit, cached = cache.get(command, key)
+        if hit:
+            return cast("_ValueT", cached)
+
+        token: object | None = cache.begin(key)
+        value: _ValueT = await read(key)
+        cache.set(token, command, key, value)
+        return value
+
     async def exists(self, key: types.KeyT) -> bool:
-        return bool(await self._backend.get_client().exists(key))
+        client: types.AsyncRedisClientP = await self._backend.get_read_client()
+        return bool(await client.exists(key))
 
     async def ttl(self, key: types.KeyT) -> int:
-        return int(await self._backend.get_client().ttl(key))
+        client: types.AsyncRedisClientP = await self._backend.get_read_client()
+        return int(await client.ttl(key))
 
     async def expire(self, key: types.KeyT, timeout: int) -> None:
         self._validate_timeout(timeout)
@@ -74,9 +646,14 @@ class RedisStore(BaseStore):
     async def set(self, key: types.KeyT, value: types.StoreValueT, timeout: int) -> None:
         self._validate_timeout(timeout)
         await self._backend.get_client().set(key, value, ex=timeout)
+        self._backend.invalidate_client_cache([key])
 
     async def get(self, key: types.KeyT) -> types.StoreValueT | None:
-        value: types.StoreValueT | None = await self._backend.get_client().get(key)
+        return await self._cached_read("get", key, self._get)
+
+    async def _get(self, key: types.KeyT) -> types.StoreValueT | None:
+        client: types.AsyncRedisClientP = await self._backend.get_read_client()
+        value: types.StoreValueT | None = await client.get(key)
         if value is None:
             return None
 
@@ -92,6 +669,12 @@ class RedisStore(BaseStore):
         if key is None and not mapping:
             raise exceptions.DataError("hset must with key value pairs")
         await self._backend.get_client().hset(name, key, value, mapping)
+        self._backend.invalidate_client_cache([name])
 
     async def hgetall(self, name: types.KeyT) -> types.StoreDictValueT:
-        return utils.format_kv(await self._backend.get_client().hgetall(name))
+        # Cached values are shared, callers get a copy of their own.
+        return dict(await self._cached_read("hgetall", name, self._hgetall))
+
+    async def _hgetall(self, name: types.KeyT) -> types.StoreDictValueT:
+        client: types.AsyncRedisClientP = await self._backend.get_read_client()
+        return utils.format_kv(await client.hgetall(name))
@@ -0,0 +1,147 @@
+"""Clocks that stores, rate limiters and throttles read the time from."""
+
+import abc
+import asyncio
+import threading
+import time
+
+from . import exceptions, utils
+
+
+class Clock(abc.ABC):
+    """Abstract class for all clocks.
+
+    A clock is passed to a store with the ``CLOCK`` option, rate limiters and
+    :class:`throttled.Throttled` built on the store read the time and sleep
+    through it, so that traffic can be simulated faster than wall time.
+    """
+
+    @abc.abstractmethod
+    def time(self) -> float:
+        """Return the wall-clock time in seconds since the epoch."""
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def monotonic(self) -> float:
+        """Return the monotonic time in seconds."""
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def sleep(self, seconds: float) -> None:
+        """Block the current thread for ``seconds`` of clock time."""
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    async def async_sleep(self, seconds: float) -> None:
+        """Suspend the current task for ``seconds`` of clock time."""
+        raise NotImplementedError
+
+
+class SystemClock(Clock):
+    """The system clock, used by default."""
+
+    def time(self) -> float:  # noqa: PLR6301
+        return utils.now_sec_f()
+
+    def monotonic(self) -> float:  # noqa: PLR6301
+        return utils.now_mono_f()
+
+    def sleep(self, seconds: float) -> None:  # noqa: PLR6301
+        time.sleep(seconds)
+
+    async def async_sleep(self, seconds: float) -> None:  # noqa: PLR6301
+        await asyncio.sleep(seconds)
+
+
+class ManualClock(Clock):
+    """A clock that only moves when it is advanced.
+
+    Sleeping advances the clock instead of blocking, so a blocking
+    :class:`throttled.Throttled` returns at once, as if it had waited.
+    Both :meth:`time` and :meth:`monotonic` return the same value.
+    """
+
+    def __init__(self, start: float = 0) -> None:
+        """Initializes the clock.
+
+        :param start: The time in seconds the clock starts at, default: 0.
+        """
+        self._now: float = start
+        self._lock: threading.Lock = threading.Lock()
+
+    def time(self) -> float:
+        return self._now
+
+    def monotonic(self) -> float:
+        return self._now
+
+    def advance(self, seconds: float) -> None:
+        """Move the clock forward.
+
+        :param seconds: The time in seconds to move forward by.
+        :raise: DataError if ``seconds`` is negative.
+        """
+        if seconds < 0:
+            raise exceptions.DataError(
+                f"Invalid seconds: {seconds}, must be a non-negative number."
+            )
+        with self._lock:
+            self._now += seconds
+
+    def sleep(self, seconds: float) -> None:
+        self.advance(max(0, seconds))
+
+    async def async_sleep(self, seconds: float) -> None:
+        self.advance(max(0, seconds))
+        # Let other tasks run, as a real sleep would.
+        await asyncio.sleep(0)
+
+
+class SimulatedClock(Clock):
+    """A clock that runs ``speed`` times as fast as the system clock.
+
+    Unlike :class:`ManualClock`, time keeps flowing while threads and tasks
+    run concurrently, sleeps block for ``seconds / speed`` of wall time, so
+    load simulations keep their interleaving while running faster.
+    The clock can also be advanced to skip idle periods.
+    """
+
+    def __init__(self, speed: float, start: float = 0) -> None:
+        """Initializes the clock.
+
+        :param speed: How many seconds of clock time pass per second of wall
+            time, it must be greater than 0.
+        :param start: The time in seconds the clock starts at, default: 0.
+        """
+        if not (isinstance(speed, int | float) and speed > 0):
+            raise exceptions.SetUpError("speed must be a positive number")
+
+        self.speed: float = speed
+        self._start: float = start
+        self._origin: float = utils.now_mono_f()
+        self._lock: threading.Lock = threading.Lock()
+
+    def time(self) -> float:
+        return self._start + (utils.now_mono_f() - self._origin) * self.speed
+
+    def monotonic(self) -> float:
+        return self.time()
+
+    def advance(self, seconds: float) -> None:
+        """Move the clock forward at once.
+
+        :param seconds: The time in seconds to move forward by.
+        :raise: DataError if ``seconds`` is negative.
+        """
+        if seconds < 0:
+            raise exceptions.DataError(
+                f"Invalid seconds: {seconds}, must be a non-negative number."
+            )
+        with self._lock:
+            self._start += seconds
+
+    def sleep(self, seconds: float) -> None:
+        time.sleep(max(0, seconds) / self.speed)
+
+    async def async_sleep(self, seconds: float) -> None:
+        await asyncio.sleep(max(0, seconds) / self.speed)
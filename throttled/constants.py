@@ -20,6 +20,10 @@ STORE_TTL_STATE_NOT_EXIST: int = -2
 # Enumeration for types of AtomicActions
 ATOMIC_ACTION_TYPE_LIMIT: AtomicActionTypeT = "limit"
 ATOMIC_ACTION_TYPE_PEEK: AtomicActionTypeT = "peek"
+# Check all keys first and consume from all of them only if every key passes.
+ATOMIC_ACTION_TYPE_LIMIT_ALL: AtomicActionTypeT = "limit_all"
+# Give back the slots held by a lease before it expires.
+ATOMIC_ACTION_TYPE_RELEASE: AtomicActionTypeT = "release"
 
 
 class RateLimiterType(Enum):
@@ -27,16 +31,63 @@ class RateLimiterType(Enum):
 
     FIXED_WINDOW = "fixed_window"
     SLIDING_WINDOW = "sliding_window"
+    SLIDING_WINDOW_LOG = "sliding_window_log"
     LEAKING_BUCKET = "leaking_bucket"
     TOKEN_BUCKET = "token_bucket"
     GCRA = "gcra"
+    CONCURRENCY = "concurrency"
 
     @classmethod
     def choice(cls) -> list[RateLimiterTypeT]:
         return [
             cls.FIXED_WINDOW.value,
             cls.SLIDING_WINDOW.value,
+            cls.SLIDING_WINDOW_LOG.value,
             cls.LEAKING_BUCKET.value,
             cls.TOKEN_BUCKET.value,
             cls.GCRA.value,
+            cls.CONCURRENCY.value,
         ]
+
+
+class MemoryEvictionPolicy(Enum):
+    """Enumeration for eviction policies of MemoryStore."""
+
+    # Evict the least recently used key.
+    LRU = "lru"
+    # Evict the key that expires soonest, keys without TTL are evicted by LRU.
+    TTL_FIRST = "ttl_first"
+    # Admit a key into the main region only if it is used more often than
+    # the key it replaces, see https://arxiv.org/abs/1512.00727.
+    W_TINYLFU = "w_tinylfu"
+
+    @classmethod
+    def choice(cls) -> list[str]:
+        return [cls.LRU.value, cls.TTL_FIRST.value, cls.W_TINYLFU.value]
+
+
+class KeyLayout(Enum):
+    """Enumeration for how rate limiters lay out their keys in a store."""
+
+    # throttled:v1:{type}:{key}
+    PLAIN = "plain"
+    # throttled:v1:{type}:{{key}}, the key is wrapped in a Redis Cluster hash
+    # tag, so all keys of one subject share a slot.
+    HASH_TAG = "hash_tag"
+
+    @classmethod
+    def choice(cls) -> list[str]:
+        return [cls.PLAIN.value, cls.HASH_TAG.value]
+
+
+class RedisScriptMode(Enum):
+    """Enumeration for how RedisStore runs the Lua scripts of rate limiters."""
+
+    # Run each script with EVALSHA, loading it into the script cache on a miss.
+    EVAL = "eval"
+    # Run the scripts as a Redis 7 FUNCTION library with FCALL / FCALL_RO.
+    FUNCTION = "function"
+
+    @classmethod
+    def choice(cls) -> list[str]:
+        return [cls.EVAL.value, cls.FUNCTION.value]
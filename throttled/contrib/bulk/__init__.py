@@ -0,0 +1,5 @@
+"""NumPy-backed bulk evaluation of quotas for offline replay."""
+
+from .evaluator import BulkEvaluator, BulkResult
+
+__all__ = ["BulkEvaluator", "BulkResult"]
@@ -0,0 +1,335 @@
+"""Vectorized GCRA / token bucket evaluation of recorded requests."""
+
+import math
+from dataclasses import dataclass
+
+import numpy as np
+import numpy.typing as npt
+from throttled.constants import RateLimiterType
+from throttled.exceptions import DataError, SetUpError
+from throttled.rate_limiter import Quota
+
+FloatArrayT = npt.NDArray[np.float64]
+IntArrayT = npt.NDArray[np.int64]
+BoolArrayT = npt.NDArray[np.bool_]
+
+# Once this few keys are left, e.g. the busiest keys of a log, their requests are
+# evaluated one by one, as a round of NumPy calls costs more than a short run.
+_SERIAL_MAX_KEYS: int = 16
+
+
+@dataclass(frozen=True)
+class BulkResult:
+    """Results of :meth:`BulkEvaluator.evaluate`, aligned with the input events."""
+
+    #: Whether each request is limited.
+    limited: BoolArrayT
+
+    #: The remaining requests after each request.
+    remaining: IntArrayT
+
+    #: The time in seconds until the key is reset after each request.
+    reset_after: FloatArrayT
+
+    #: The time in seconds to wait before a limited request can be retried,
+    #: 0 for allowed requests.
+    retry_after: FloatArrayT
+
+
+class BulkEvaluator:
+    """Evaluate a quota over arrays of recorded requests, e.g. for offline replay.
+
+    Each request is evaluated with the same floating-point operations as the
+    memory GCRA / token bucket rate limiters, at its own timestamp instead of the
+    clock of the store, so the results are the same as calling ``limit`` in time
+    order. Keys are integer ids, their state is kept across :meth:`evaluate`
+    calls, so long logs can be replayed in chunks.
+
+    The state of a key only depends on its own requests, so all keys are
+    evaluated at once, one request per key and round of NumPy calls. Once only
+    a few keys are left, usually the busiest ones, their requests are evaluated
+    one at a time.
+    """
+
+    _SUPPORTED_TYPES: tuple[str, ...] = (
+        RateLimiterType.GCRA.value,
+        RateLimiterType.TOKEN_BUCKET.value,
+    )
+
+    def __init__(self, quota: Quota, using: str = RateLimiterType.GCRA.value) -> None:
+        """Initialize the bulk evaluator.
+
+        :param quota: The quota to evaluate.
+        :param using: The rate limiting algorithm, ``gcra`` or ``token_bucket``.
+        """
+        if using not in self._SUPPORTED_TYPES:
+            raise SetUpError(f"RateLimiter({using}) is not supported by BulkEvaluator.")
+
+        self.quota: Quota = quota
+        self._using: str = using
+        self._capacity: int = quota.burst
+        self._emission_interval: float = quota.emission_interval
+        self._fill_rate: float = quota.fill_rate
+        # The state of each key id, as stored by the memory rate limiters: the TAT
+        # for GCRA, the tokens and the time they were refreshed at for token
+        # bucket. Keys without requests yet never limit, as missing keys.
+        self._defaults: tuple[float, ...] = (
+            (-math.inf,)
+            if using == RateLimiterType.GCRA.value
+            else (float(self._capacity), -math.inf)
+        )
+        self._states: list[FloatArrayT] = []
+        self.reset()
+
+    def reset(self) -> None:
+        """Forget the state of all keys."""
+        self._states = [np.empty(0) for _ in self._defaults]
+
+    def evaluate(
+        self,
+        timestamps: npt.ArrayLike,
+        key_ids: npt.ArrayLike,
+        costs: npt.ArrayLike | None = None,
+    ) -> BulkResult:
+        """Evaluate the quota over recorded requests.
+
+        The requests of a key are evaluated in the order of their timestamps,
+        requests at the same time in their input order. Across calls, the requests
+        of a key must not be earlier than the ones already evaluated.
+
+        :param timestamps: The time of each request in seconds, on any clock,
+            e.g. the epoch seconds of an access log.
+        :param key_ids: The non-negative integer id of the key of each request.
+        :param costs: The cost of each request, defaults to 1.
+        :return: The results of the requests, aligned with the input.
+        :raise: DataError if the arrays are invalid.
+        """
+        times: FloatArrayT = np.asarray(timestamps, dtype=np.float64)
+        keys: IntArrayT = np.asarray(key_ids, dtype=np.int64)
+        weights: IntArrayT = (
+            np.ones_like(keys) if costs is None else np.asarray(costs, dtype=np.int64)
+        )
+        self._validate(times, keys, weights)
+
+        if keys.size and keys.max() >= self._states[0].size:
+            size: int = keys.max() + 1 - self._states[0].size
+            self._states = [
+                np.concatenate([state, np.full(size, default)])
+                for state, default in zip(self._states, self._defaults, strict=True)
+            ]
+
+        # Stable sorts by time then by key, logs are usually sorted by time already
+        # and integer keys are radix sorted.
+        order: IntArrayT = np.arange(times.size)
+        if (np.diff(times) < 0).any():
+            order = np.argsort(times, kind="stable")
+        order = order[np.argsort(keys[order], kind="stable")]
+
+        # Map the results back to the input order.
+        unsorted: list[npt.NDArray[np.generic]] = []
+        for values in self._scan(times[order], keys[order], weights[order]):
+            restored: npt.NDArray[np.generic] = np.empty_like(values)
+            restored[order] = values
+            unsorted.append(restored)
+        return BulkResult(*unsorted)  # type: ignore[arg-type]
+
+    @classmethod
+    def _validate(cls, times: FloatArrayT, keys: IntArrayT, costs: IntArrayT) -> None:
+        if times.ndim != 1 or times.shape != keys.shape or times.shape != costs.shape:
+            raise DataError(
+                "Invalid arrays: timestamps, key_ids and costs must be 1-D arrays "
+                "of the same length."
+            )
+        if not np.isfinite(times).all():
+            raise DataError("Invalid timestamps: must be finite.")
+        if (keys < 0).any():
+            raise DataError("Invalid key_ids: must be non-negative integers.")
+        if (costs < 0).any():
+            raise DataError("Invalid costs: must be non-negative integers.")
+
+    def _scan(
+        self, times: FloatArrayT, keys: IntArrayT, costs: IntArrayT
+    ) -> tuple[BoolArrayT, IntArrayT, FloatArrayT, FloatArrayT]:
+        """Evaluate the requests sorted by key and time.
+
+        :return: Whether each request is limited, and its remaining, reset_after
+            and retry_after.
+        """
+        limited: BoolArrayT = np.zeros(times.size, dtype=np.bool_)
+        remaining: IntArrayT = np.zeros(times.size, dtype=np.int64)
+        reset_after: FloatArrayT = np.zeros(times.size)
+        retry_after: FloatArrayT = np.zeros(times.size)
+        if not times.size:
+            return limited, remaining, reset_after, retry_after
+
+        starts: IntArrayT = np.flatnonzero(np.diff(keys, prepend=-1))
+        counts: IntArrayT = np.diff(np.append(starts, times.size))
+        # The busiest keys first, so the keys left in each round are a prefix.
+        busiest: IntArrayT = np.argsort(-counts, kind="stable")
+        starts, counts = starts[busiest], counts[busiest]
+        states: list[FloatArrayT] = [state[keys[starts]] for state in self._states]
+        # The number of keys with more than ``step`` requests, for each step.
+        lefts: IntArrayT = np.searchsorted(-counts, -np.arange(counts[0]), side="left")
+
+        step: int = 0
+        while step < lefts.size and lefts[step] > _SERIAL_MAX_KEYS:
+            left: int = int(lefts[step])
+            indexes: IntArrayT = starts[:left] + step
+            (
+                limited[indexes],
+                remaining[indexes],
+                reset_after[indexes],
+                retry_after[indexes],
+            ) = self._limit(
+                times[indexes], costs[indexes], [state[:left] for state in states]
+            )
+            step += 1
+
+        left = int(lefts[step]) if step < lefts.size else 0
+        for segment in range(left):
+            tail: slice = slice(
+                starts[segment] + step, starts[segment] + counts[segment]
+            )
+            key_state: list[float] = [state[segment] for state in states]
+            (
+                limited[tail],
+                remaining[tail],
+                reset_after[tail],
+                retry_after[tail],
+            ) = self._limit_serial(times[tail].tolist(), costs[tail].tolist(), key_state)
+            for state, value in zip(states, key_state, strict=True):
+                state[segment] = value
+
+        for state, scanned in zip(self._states, states, strict=True):
+            state[keys[starts]] = scanned
+        return limited, remaining, reset_after, retry_after
+
+    def _limit(
+        self, now: FloatArrayT, cost: IntArrayT, states: list[FloatArrayT]
+    ) -> tuple[BoolArrayT, IntArrayT, FloatArrayT, FloatArrayT]:
+        """Evaluate a request of each key, updating ``states`` in place."""
+        if self._using == RateLimiterType.GCRA.value:
+            return self._limit_gcra(now, cost, states[0])
+        return self._limit_token_bucket(now, cost, states[0], states[1])
+
+    def _limit_gcra(
+        self, now: FloatArrayT, cost: IntArrayT, last_tat: FloatArrayT
+    ) -> tuple[BoolArrayT, IntArrayT, FloatArrayT, FloatArrayT]:
+        """See ``gcra.MemoryLimitActionLogic._do``."""
+        emission_interval: float = self._emission_interval
+        tat: FloatArrayT = np.maximum(now, last_tat) + cost * emission_interval
+        allow_at: FloatArrayT = tat - self._capacity * emission_interval
+        time_elapsed: FloatArrayT = now - allow_at
+
+        remaining: FloatArrayT = np.floor(time_elapsed / emission_interval)
+        limited: BoolArrayT = remaining < 0
+        reset_after: FloatArrayT = np.where(
+            limited, np.maximum(0.0, last_tat - now), tat - now
+        )
+        last_tat[:] = np.where(~limited & (reset_after > 0), tat, last_tat)
+        return (
+            limited,
+            np.where(
+                limited, np.minimum(self._capacity, cost + remaining), remaining
+            ).astype(np.int64),
+            reset_after,
+            np.where(limited, np.abs(time_elapsed), 0.0),
+        )
+
+    def _limit_token_bucket(
+        self,
+        now: FloatArrayT,
+        cost: IntArrayT,
+        last_tokens: FloatArrayT,
+        last_refreshed: FloatArrayT,
+    ) -> tuple[BoolArrayT, IntArrayT, FloatArrayT, FloatArrayT]:
+        """See ``token_bucket.MemoryLimitActionLogic._do``."""
+        capacity: int = self._capacity
+        fill_rate: float = self._fill_rate
+        time_elapsed: FloatArrayT = np.maximum(0.0, now - last_refreshed)
+        tokens: FloatArrayT = np.minimum(
+            capacity, last_tokens + time_elapsed * fill_rate
+        )
+
+        limited: BoolArrayT = tokens < cost
+        tokens = np.where(limited, tokens, tokens - cost)
+        last_tokens[:] = np.where(limited, last_tokens, tokens)
+        last_refreshed[:] = np.where(limited, last_refreshed, now)
+        return (
+            limited,
+            np.floor(tokens).astype(np.int64),
+            np.where(tokens >= capacity, 0.0, (capacity - tokens) / fill_rate),
+            np.where(limited, (cost - tokens) / fill_rate, 0.0),
+        )
+
+    def _limit_serial(
+        self, times: list[float], costs: list[int], state: list[float]
+    ) -> tuple[list[bool], list[int], list[float], list[float]]:
+        """Evaluate the requests of a key one by one, updating ``state`` in place.
+
+        The same math as :meth:`_limit` with Python floats, which round the same.
+        """
+        if self._using == RateLimiterType.GCRA.value:
+            return self._limit_gcra_serial(times, costs, state)
+        return self._limit_token_bucket_serial(times, costs, state)
+
+    def _limit_gcra_serial(
+        self, times: list[float], costs: list[int], state: list[float]
+    ) -> tuple[list[bool], list[int], list[float], list[float]]:
+        capacity: int = self._capacity
+        emission_interval: float = self._emission_interval
+        fill_time_for_capacity: float = capacity * emission_interval
+        last_tat: float = state[0]
+        limited: list[bool] = []
+        remaining: list[int] = []
+        reset_after: list[float] = []
+        retry_after: list[float] = []
+        for now, cost in zip(times, costs, strict=True):
+            tat: float = max(now, last_tat) + cost * emission_interval
+            time_elapsed: float = now - (tat - fill_time_for_capacity)
+            left: int = math.floor(time_elapsed / emission_interval)
+            if left < 0:
+                limited.append(True)
+                remaining.append(min(capacity, cost + left))
+                reset_after.append(max(0.0, last_tat - now))
+                retry_after.append(abs(time_elapsed))
+                continue
+            if tat - now > 0:
+                last_tat = tat
+            limited.append(False)
+            remaining.append(left)
+            reset_after.append(tat - now)
+            retry_after.append(0.0)
+
+        state[0] = last_tat
+        return limited, remaining, reset_after, retry_after
+
+    def _limit_token_bucket_serial(
+        self, times: list[float], costs: list[int], state: list[float]
+    ) -> tuple[list[bool], list[int], list[float], list[float]]:
+        capacity: int = self._capacity
+        fill_rate: float = self._fill_rate
+        last_tokens, last_refreshed = state
+        limited: list[bool] = []
+        remaining: list[int] = []
+        reset_after: list[float] = []
+        retry_after: list[float] = []
+        for now, cost in zip(times, costs, strict=True):
+            tokens: float = min(
+                capacity, last_tokens + max(0.0, now - last_refreshed) * fill_rate
+            )
+            if tokens < cost:
+                limited.append(True)
+                retry_after.append((cost - tokens) / fill_rate)
+            else:
+                tokens -= cost
+                last_tokens, last_refreshed = tokens, now
+                limited.append(False)
+                retry_after.append(0.0)
+            remaining.append(math.floor(tokens))
+            reset_after.append(
+                0.0 if tokens >= capacity else (capacity - tokens) / fill_rate
+            )
+
+        state[:] = [last_tokens, last_refreshed]
+        return limited, remaining, reset_after, retry_after
@@ -1,8 +1,10 @@
 """Rate limiter implementations and shared quota utilities."""
 
+from .approximate import ApproximateRateLimiter
 from .base import (
     BaseRateLimiter,
     BaseRateLimiterMixin,
+    Lease,
     Quota,
     Rate,
     RateLimiterMeta,
@@ -18,10 +20,13 @@ from .base import (
 )
 
 # Trigger to register RateLimiter
+from .concurrency import ConcurrencyRateLimiter
+from .denied_cache import DeniedCache
 from .fixed_window import FixedWindowRateLimiter
 from .gcra import GCRARateLimiter
 from .leaking_bucket import LeakingBucketRateLimiter
 from .sliding_window import SlidingWindowRateLimiter
+from .sliding_window_log import SlidingWindowLogRateLimiter
 from .token_bucket import TokenBucketRateLimiter
 
 __all__ = [
@@ -35,13 +40,18 @@ __all__ = [
     "Quota",
     "RateLimitState",
     "RateLimitResult",
+    "Lease",
     "RateLimiterRegistry",
     "RateLimiterMeta",
     "BaseRateLimiter",
     "BaseRateLimiterMixin",
     "FixedWindowRateLimiter",
     "SlidingWindowRateLimiter",
+    "SlidingWindowLogRateLimiter",
     "TokenBucketRateLimiter",
     "LeakingBucketRateLimiter",
     "GCRARateLimiter",
+    "ConcurrencyRateLimiter",
+    "ApproximateRateLimiter",
+    "DeniedCache",
 ]
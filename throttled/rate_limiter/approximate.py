@@ -0,0 +1,263 @@
+import math
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from .. import constants, exceptions, types
+from ..store import MemoryStore
+from .base import (
+    BaseRateLimiter,
+    BaseRateLimiterMixin,
+    Quota,
+    RateLimitResult,
+    RateLimitState,
+)
+
+
+class ApproximateRateLimiterMixin:
+    """Pure logic shared by sync / async approximate rate limiters.
+
+    The lease of a key is stored as a hash in the local store:
+
+    - ``tokens``: leased tokens that have not been consumed yet.
+    - ``debt``: cost served beyond the lease while a refill is in flight,
+      it is consumed from the remote limiter along with the next lease.
+    - ``limit`` / ``remaining`` / ``reset_after``: the remote state at the
+      last lease.
+    """
+
+    LEASE_KEY_SUFFIX: str = ":lease"
+
+    quota: Quota
+    lease_size: int
+    max_overshoot: int
+
+    @classmethod
+    def _validate_options(cls, lease_size: int, max_overshoot: int) -> None:
+        if not (isinstance(lease_size, int) and lease_size > 0):
+            raise exceptions.SetUpError("lease_size must be a positive integer")
+        if not (isinstance(max_overshoot, int) and max_overshoot >= 0):
+            raise exceptions.SetUpError("max_overshoot must be a non-negative integer")
+
+    @classmethod
+    def _validate_limiter(cls, limiter: BaseRateLimiterMixin) -> None:
+        if (
+            constants.ATOMIC_ACTION_TYPE_RELEASE
+            in limiter._supported_atomic_action_types()
+        ):
+            # Slots are held until each request releases them, they cannot be
+            # leased in advance.
+            raise exceptions.SetUpError(
+                f"RateLimiter({limiter.Meta.type}) is not supported by "
+                f"ApproximateRateLimiter."
+            )
+
+    @classmethod
+    def _prepare_lease_key(cls, limiter_key: str) -> str:
+        return f"{limiter_key}{cls.LEASE_KEY_SUFFIX}"
+
+    def _consume_lease(
+        self, lease: types.StoreDictValueT, cost: int, refilling: bool
+    ) -> RateLimitResult | None:
+        """Consume ``cost`` from the lease in place.
+
+        :param lease: The lease of the key, updated in place if it is consumed.
+        :param cost: The cost of the current request.
+        :param refilling: Whether a refill of the lease is in flight, the request
+            may overshoot the lease by up to ``max_overshoot`` only if it is.
+        :return: The result of the request, or None if the lease cannot serve it.
+        """
+        tokens: int = int(lease.get("tokens", 0))
+        debt: int = int(lease.get("debt", 0))
+        if cost <= tokens:
+            tokens -= cost
+        elif refilling and debt + cost - tokens <= self.max_overshoot:
+            debt += cost - tokens
+            tokens = 0
+        else:
+            return None
+
+        lease["tokens"] = tokens
+        lease["debt"] = debt
+        return RateLimitResult(
+            limited=False,
+            state_values=(
+                int(lease.get("limit", self.quota.get_limit())),
+                int(lease.get("remaining", 0)) + tokens,
+                float(lease.get("reset_after", 0)),
+                0,
+            ),
+        )
+
+    @classmethod
+    def _get_lease_size(cls, cost: int, debt: int, state: RateLimitState) -> int:
+        """Return the size of a partial lease after a full lease was denied.
+
+        Near the end of a quota, lease whatever is left instead of nothing,
+        0 if it cannot even cover ``cost`` and ``debt``.
+        """
+        if max(cost, 1) + debt > state.remaining:
+            return 0
+        return state.remaining - debt
+
+    def _get_lease_timeout(self) -> int:
+        """Return the timeout of a lease, the quota period rounded up to seconds."""
+        return max(1, math.ceil(self.quota.period_sec_f))
+
+    def _should_refill(self, tokens: int) -> bool:
+        # Prefetch the next lease once half of the current one is consumed.
+        return tokens * 2 < self.lease_size
+
+    @classmethod
+    def _to_leased_result(
+        cls, lease: types.StoreDictValueT, state: RateLimitState
+    ) -> RateLimitResult:
+        return RateLimitResult(
+            limited=False,
+            state_values=(
+                state.limit,
+                state.remaining + int(lease["tokens"]),
+                state.reset_after,
+                0,
+            ),
+        )
+
+
+class ApproximateRateLimiter(ApproximateRateLimiterMixin):
+    """Serve rate limit checks from quota leased in bulk from another limiter.
+
+    Designed for high-volume, low-precision limits on :class:`RedisStore`
+    (e.g. 100k req/min per tenant): instead of a Redis round trip per request,
+    ``lease_size`` tokens are consumed from the wrapped limiter at once and
+    then served from a local :class:`MemoryStore`. The next lease is fetched in
+    a background thread once half of the current one is consumed.
+
+    Precision trade-offs:
+
+    - Leased tokens are reserved by this process, other processes may be
+      limited while they are unused, up to ``lease_size`` per key per process.
+    - While a refill is in flight, a key may be served up to ``max_overshoot``
+      beyond its lease, the overshoot is consumed along with the next lease,
+      and is let through without being counted if that lease is denied.
+
+    Leases are consumed with :meth:`BaseRateLimiter.limit_all`, so a denied
+    lease never consumes quota, whatever the algorithm.
+    """
+
+    def __init__(
+        self,
+        limiter: BaseRateLimiter,
+        lease_size: int,
+        max_overshoot: int = 0,
+        local_store: MemoryStore | None = None,
+    ) -> None:
+        """Initializes the approximate rate limiter.
+
+        :param limiter: The limiter to lease quota from, usually on a RedisStore.
+        :param lease_size: The number of tokens leased from ``limiter`` at once.
+        :param max_overshoot: The maximum cost a key may be served beyond its
+            lease while a refill is in flight, default: 0.
+        :param local_store: The store to keep leases in, by default a new
+            :class:`MemoryStore` is created with the clock of ``limiter``.
+        """
+        self._validate_options(lease_size, max_overshoot)
+        self._validate_limiter(limiter)
+        self.quota: Quota = limiter.quota
+        self.lease_size: int = lease_size
+        self.max_overshoot: int = max_overshoot
+
+        self._limiter: BaseRateLimiter = limiter
+        self._local_store: MemoryStore = local_store or MemoryStore(
+            options={"CLOCK": limiter._clock}
+        )
+        self._lock: threading.Lock = threading.Lock()
+        self._refilling: set[str] = set()
+        self._executor: ThreadPoolExecutor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="throttled-lease"
+        )
+
+    def limit(self, key: str, cost: int = 1) -> RateLimitResult:
+        """Apply rate limiting logic to a given key with a specified cost.
+
+        The request is served from the local lease if possible, otherwise a new
+        lease is consumed from the wrapped limiter in the calling thread.
+
+        :param key: The unique identifier for the rate limit subject.
+        :param cost: The cost of the current request.
+        :return: The result of the rate limiting check.
+        """
+        lease_key: str = self._prepare_lease_key(self._limiter._prepare_key(key))
+        with self._lock:
+            lease: types.StoreDictValueT = self._local_store.hgetall(lease_key)
+            result: RateLimitResult | None = self._consume_lease(
+                lease, cost, key in self._refilling
+            )
+            if result is not None:
+                self._local_store.hset(lease_key, mapping=lease)
+                if self._should_refill(int(lease["tokens"])):
+                    self._schedule_refill(key)
+                return result
+
+        return self._lease(key, cost)
+
+    def peek(self, key: str) -> RateLimitState:
+        """Retrieve the state of the wrapped limiter for the given key.
+
+        Tokens leased by any process are reported as consumed.
+        """
+        return self._limiter.peek(key)
+
+    def flush(self) -> None:
+        """Wait for the leases being refilled in the background."""
+        self._executor.submit(lambda: None).result()
+
+    def close(self) -> None:
+        """Wait for the background refills and stop the background thread."""
+        self._executor.shutdown(wait=True)
+
+    def _schedule_refill(self, key: str) -> None:
+        if key not in self._refilling:
+            self._refilling.add(key)
+            self._executor.submit(self._refill, key)
+
+    def _refill(self, key: str) -> None:
+        try:
+            self._lease(key, 0)
+        finally:
+            with self._lock:
+                self._refilling.discard(key)
+
+    def _consume_remote(self, key: str, cost: int) -> RateLimitResult:
+        # All-or-nothing, so that a denied lease never consumes quota.
+        return self._limiter.limit_all([(key, cost)])[0]
+
+    def _lease(self, key: str, cost: int) -> RateLimitResult:
+        """Lease tokens from the wrapped limiter, then consume ``cost`` from them.
+
+        The debt of the key is settled along with the lease.
+        """
+        lease_key: str = self._prepare_lease_key(self._limiter._prepare_key(key))
+        with self._lock:
+            lease: types.StoreDictValueT = self._local_store.hgetall(lease_key)
+            debt: int = int(lease.get("debt", 0))
+            if debt:
+                self._local_store.hset(lease_key, "debt", 0)
+
+        size: int = max(self.lease_size, cost)
+        result: RateLimitResult = self._consume_remote(key, size + debt)
+        if result.limited:
+            size = self._get_lease_size(cost, debt, result.state)
+            if size:
+                result = self._consume_remote(key, size + debt)
+        if result.limited:
+            return result
+
+        with self._lock:
+            lease = self._local_store.hgetall(lease_key)
+            lease["tokens"] = int(lease.get("tokens", 0)) + size - cost
+            lease["limit"] = result.state.limit
+            lease["remaining"] = result.state.remaining
+            lease["reset_after"] = result.state.reset_after
+            self._local_store.hset(lease_key, mapping=lease)
+            # Unused tokens are dropped once the quota period has passed.
+            self._local_store.expire(lease_key, self._get_lease_timeout())
+        return self._to_leased_result(lease, result.state)
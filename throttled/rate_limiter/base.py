@@ -4,7 +4,7 @@ from dataclasses import dataclass, field
 from datetime import timedelta
 from typing import TYPE_CHECKING, Any, Generic, Protocol, TypeVar
 
-from .. import exceptions, types
+from .. import constants, exceptions, types, utils
 
 logger: logging.Logger = logging.getLogger(__name__)
 
@@ -14,7 +14,9 @@ if TYPE_CHECKING:
     from collections.abc import Sequence
     from typing import ClassVar
 
+    from ..clock import Clock
     from ..store import BaseAtomicAction, BaseStore
+    from .denied_cache import DeniedCache
 
 
 @dataclass
@@ -39,17 +41,20 @@ class Quota:
     #: Default is 0, which means no burst capacity.
     burst: int = 0
 
-    #: The period in seconds.
+    #: The period in whole seconds, 0 for a period under one second.
     period_sec: int = field(init=False)
+    #: The period in seconds, including fractions of a second.
+    period_sec_f: float = field(init=False)
     #: The emission interval in seconds.
     emission_interval: float = field(init=False)
     #: The fill rate per second.
     fill_rate: float = field(init=False)
 
     def __post_init__(self) -> None:
-        self.period_sec = int(self.rate.period.total_seconds())
-        self.emission_interval = self.period_sec / self.rate.limit
-        self.fill_rate = self.rate.limit / self.period_sec
+        self.period_sec_f = self.rate.period.total_seconds()
+        self.period_sec = int(self.period_sec_f)
+        self.emission_interval = self.period_sec_f / self.rate.limit
+        self.fill_rate = self.rate.limit / self.period_sec_f
 
     def get_period_sec(self) -> int:
         """Get the period in seconds."""
@@ -112,6 +117,17 @@ class RateLimitState:
     retry_after: float = 0
 
 
+@dataclass(frozen=True)
+class Lease:
+    """Slots held by an allowed request of a concurrency rate limiter."""
+
+    #: The unique identifier of the lease.
+    id: int
+
+    #: The number of slots held by the lease.
+    cost: int
+
+
 class RateLimitResult:
     """Result produced by the rate limiter for a given key.
 
@@ -119,13 +135,19 @@ class RateLimitResult:
     :class:`RateLimitState` snapshot via the :attr:`state` property.
     """
 
-    __slots__ = ("limited", "_state_values", "_state")
+    __slots__ = ("limited", "lease", "_state_values", "_state")
 
     def __init__(
-        self, limited: bool, state_values: tuple[int, int, float, float]
+        self,
+        limited: bool,
+        state_values: tuple[int, int, float, float],
+        lease: Lease | None = None,
     ) -> None:
         #: Represents whether this request is allowed to pass.
         self.limited: bool = limited
+        #: The slots held by this request until they are released or expire,
+        #: only set by rate limiters that limit concurrency.
+        self.lease: Lease | None = lease
         self._state_values: tuple[int, int, float, float] = state_values
         self._state: RateLimitState | None = None
 
@@ -211,6 +233,15 @@ class BaseRateLimiterMixin(abc.ABC):
     KEY_PREFIX: str = "throttled:v1:"
 
     quota: Quota
+    # Whether quotas with a period under one second, or not a whole number of
+    # seconds, are supported, window-based algorithms count and expire keys in
+    # whole seconds.
+    _SUB_SECOND_PERIOD: bool = False
+    # Whether to wrap keys in hash tags, see ``KEY_LAYOUT`` of stores.
+    _hash_tag_keys: bool = False
+    _denied_cache: "DeniedCache | None" = None
+    # The clock of the store, see ``CLOCK`` of stores.
+    _clock: "Clock"
 
     class Meta:
         type: types.RateLimiterTypeT = ""
@@ -243,6 +274,27 @@ class BaseRateLimiterMixin(abc.ABC):
                 )
             )
 
+    @classmethod
+    def _validate_quota(cls, quota: Quota) -> None:
+        """Check that the algorithm supports the period of ``quota``.
+
+        :raise: SetUpError if the period is under one second or not a whole number
+            of seconds, and the algorithm does not support it.
+        """
+        if cls._SUB_SECOND_PERIOD:
+            return
+
+        if quota.period_sec < 1:
+            raise exceptions.SetUpError(
+                f"RateLimiter({cls.Meta.type}) does not support quotas with a period "
+                f"under one second, got {quota.period_sec_f}s."
+            )
+        if quota.period_sec != quota.period_sec_f:
+            raise exceptions.SetUpError(
+                f"RateLimiter({cls.Meta.type}) does not support quotas with a period "
+                f"of a fraction of seconds, got {quota.period_sec_f}s."
+            )
+
     def _prepare_key(self, key: str) -> str:
         """Prepare the key by adding the prefix.
 
@@ -267,8 +319,116 @@ class BaseRateLimiterMixin(abc.ABC):
         # serial     -> 🕒Latency: 0.0724 ms/op, 🚀Throughput: 13712 req/s (--)
         # concurrent -> 🕒Latency: 2.3126 ms/op, 🚀Throughput: 13782 req/s (⬆️0.51%)
         """
+        if self._hash_tag_keys and utils.get_hash_tag(key) is None:
+            # Keys that carry their own hash tag keep it, so callers can still
+            # co-locate several subjects, e.g. for limit_all.
+            return f"{self.KEY_PREFIX}{self.Meta.type}:{{{key}}}"
         return f"{self.KEY_PREFIX}{self.Meta.type}:{key}"
 
+    def _prepare_limit(
+        self, key: str, cost: int
+    ) -> tuple[list[types.KeyT], list[types.StoreValueT]]:
+        """Build the ``(keys, args)`` passed to the limit AtomicAction.
+
+        :param key: The unique identifier for the rate limit subject.
+        :param cost: The cost of the current request.
+        :return: The keys and args of the limit AtomicAction.
+        """
+        raise NotImplementedError
+
+    def _to_limit_result(
+        self, args: "Sequence[types.StoreValueT]", ret: "Sequence[int | float]"
+    ) -> RateLimitResult:
+        """Convert the limit AtomicAction result to a :class:`RateLimitResult`.
+
+        :param args: The args built by :meth:`_prepare_limit`.
+        :param ret: The result returned by the limit AtomicAction.
+        :return: The result of the rate limiting check.
+        """
+        raise NotImplementedError
+
+    def _get_denied_for(  # noqa: PLR6301
+        self,
+        result: RateLimitResult,  # noqa: ARG002
+        started_at: float,  # noqa: ARG002
+    ) -> float:
+        """Return how long the key of a denied request is known to be limited.
+
+        Only algorithms whose ``retry_after`` is exact override this, the
+        default 0 means denials are never cached by :class:`DeniedCache`.
+
+        :param result: The denied result of the request.
+        :param started_at: The wall-clock time at which the request was sent.
+        :return: The time in seconds from ``started_at`` during which requests of
+            the same or a higher cost are limited.
+        """
+        return 0
+
+    def _cache_denied(
+        self, key: str, cost: int, result: RateLimitResult, started_at: float
+    ) -> None:
+        if self._denied_cache is None or not result.limited or cost <= 0:
+            return
+        denied_for: float = self._get_denied_for(result, started_at)
+        if denied_for > 0:
+            self._denied_cache.set(key, cost, result, started_at, denied_for)
+
+    @classmethod
+    def _prepare_limit_all(
+        cls, items: "Sequence[tuple[BaseRateLimiterMixin, str, int]]"
+    ) -> tuple[list[types.KeyT], list[types.StoreValueT], list[list[types.StoreValueT]]]:
+        """Flatten ``items`` into the ``(keys, args)`` of the limit-all AtomicAction.
+
+        :param items: A sequence of ``(limiter, key, cost)``, each item is prepared
+            by the :meth:`_prepare_limit` of its own limiter.
+        :return: The keys and args of the limit-all AtomicAction, and the args
+            of each item built by :meth:`_prepare_limit`.
+        :raise: DataError if ``items`` contains duplicate keys.
+        """
+        keys: list[types.KeyT] = []
+        args: list[types.StoreValueT] = []
+        items_args: list[list[types.StoreValueT]] = []
+        for limiter, key, cost in items:
+            item_keys, item_args = limiter._prepare_limit(key, cost)
+            keys.extend(item_keys)
+            args.extend(item_args)
+            items_args.append(item_args)
+
+        if len(set(keys)) != len(keys):
+            raise exceptions.DataError(
+                f"Invalid keys: {keys}, keys must be unique in a limit-all request."
+            )
+        return keys, args, items_args
+
+    @classmethod
+    def _to_limit_all_results(
+        cls,
+        items: "Sequence[tuple[BaseRateLimiterMixin, str, int]]",
+        items_args: "Sequence[Sequence[types.StoreValueT]]",
+        ret: "Sequence[int | float]",
+    ) -> list[RateLimitResult]:
+        """Convert the limit-all AtomicAction result to :class:`RateLimitResult` list.
+
+        The limit-all AtomicAction returns ``(limited, *values_1, ..., *values_n)``,
+        where ``values_i`` has the same layout as the limit AtomicAction result
+        without the leading ``limited`` flag.
+
+        :param items: The ``(limiter, key, cost)`` items of the request.
+        :param items_args: The args of each item built by :meth:`_prepare_limit`.
+        :param ret: The result returned by the limit-all AtomicAction.
+        :return: A list of :class:`RateLimitResult`, one for each item.
+        """
+        limited: int | float = ret[0]
+        width: int = (len(ret) - 1) // len(items_args)
+        return [
+            limiter._to_limit_result(
+                args, (limited, *ret[1 + index * width : 1 + (index + 1) * width])
+            )
+            for index, ((limiter, _key, _cost), args) in enumerate(
+                zip(items, items_args, strict=True)
+            )
+        ]
+
 
 class BaseRateLimiter(BaseRateLimiterMixin, abc.ABC, metaclass=RateLimiterMeta):
     """Base class for RateLimiter."""
@@ -283,9 +443,16 @@ class BaseRateLimiter(BaseRateLimiterMixin, abc.ABC, metaclass=RateLimiterMeta):
         quota: Quota,
         store: "BaseStore",
         additional_atomic_actions: "Sequence[type[BaseAtomicAction]] | None" = None,
+        denied_cache: "DeniedCache | None" = None,
     ) -> None:
+        self._validate_quota(quota)
         self.quota: Quota = quota
         self._store = store
+        self._hash_tag_keys = store.key_layout == constants.KeyLayout.HASH_TAG.value
+        self._clock = store.clock
+        self._denied_cache = denied_cache
+        if denied_cache is not None:
+            denied_cache.bind_clock(store.clock)
         self._atomic_actions = {}
         self._register_atomic_actions(additional_atomic_actions or [])
 
@@ -333,7 +500,86 @@ class BaseRateLimiter(BaseRateLimiterMixin, abc.ABC, metaclass=RateLimiterMeta):
                  - RateLimitState: Representing the current state of the RateLimiter for
                                    the given key.
         """
-        return self._limit(key, cost)
+        if self._denied_cache is None:
+            return self._limit(key, cost)
+
+        result: RateLimitResult | None = self._denied_cache.get(key, cost)
+        if result is not None:
+            return result
+
+        started_at: float = self._denied_cache.clock.time()
+        result = self._limit(key, cost)
+        self._cache_denied(key, cost, result, started_at)
+        return result
+
+    def _do_limit_many(
+        self, items: "Sequence[tuple[BaseRateLimiterMixin, str, int]]"
+    ) -> list[RateLimitResult]:
+        calls: list[tuple[list[types.KeyT], list[types.StoreValueT]]] = [
+            limiter._prepare_limit(key, cost) for limiter, key, cost in items
+        ]
+        rets: Sequence[tuple[int | float, ...]] = self._atomic_actions[
+            constants.ATOMIC_ACTION_TYPE_LIMIT
+        ].do_many(calls)
+        return [
+            limiter._to_limit_result(args, ret)
+            for (limiter, _key, _cost), (_keys, args), ret in zip(
+                items, calls, rets, strict=True
+            )
+        ]
+
+    def _do_limit_all(
+        self, items: "Sequence[tuple[BaseRateLimiterMixin, str, int]]"
+    ) -> list[RateLimitResult]:
+        if not items:
+            return []
+
+        action: BaseAtomicAction | None = self._atomic_actions.get(
+            constants.ATOMIC_ACTION_TYPE_LIMIT_ALL
+        )
+        if action is None:
+            raise exceptions.SetUpError(
+                f"RateLimiter({self.Meta.type}) does not support limit_all."
+            )
+
+        keys, args, items_args = self._prepare_limit_all(items)
+        return self._to_limit_all_results(items, items_args, action.do(keys, args))
+
+    def _limit_many(self, items: "Sequence[tuple[str, int]]") -> list[RateLimitResult]:
+        return self._do_limit_many([(self, key, cost) for key, cost in items])
+
+    def _release(
+        self,
+        key: str,  # noqa: ARG002
+        lease: Lease,  # noqa: ARG002
+    ) -> bool:
+        raise exceptions.SetUpError(
+            f"RateLimiter({self.Meta.type}) does not support release."
+        )
+
+    def _limit_all(self, items: "Sequence[tuple[str, int]]") -> list[RateLimitResult]:
+        return self._do_limit_all([(self, key, cost) for key, cost in items])
+
+    def limit_rules(
+        self, rules: "Sequence[tuple[BaseRateLimiter, str]]", cost: int = 1
+    ) -> list[RateLimitResult]:
+        """Apply the rules of a multi-rule quota to a request in a single round trip.
+
+        Each rule is a limiter of the same algorithm and store, with its own quota,
+        paired with the key it limits. The rules are applied all-or-nothing in one
+        atomic operation if the algorithm supports :meth:`limit_all`, otherwise
+        they are applied independently in one pipeline, like :meth:`limit_many`.
+
+        :param rules: A sequence of ``(limiter, key)`` pairs with unique keys.
+        :param cost: The cost of the current request.
+        :return: A list of :class:`RateLimitResult`, in the same order as ``rules``.
+        """
+        items: list[tuple[BaseRateLimiterMixin, str, int]] = [
+            (limiter, key, cost) for limiter, key in rules
+        ]
+        if constants.ATOMIC_ACTION_TYPE_LIMIT_ALL in self._atomic_actions:
+            return self._do_limit_all(items)
+        return self._do_limit_many(items)
 
     def peek(self, key: str) -> RateLimitState:
         """Retrieve the current state of rate limiter for the given key.
@@ -344,3 +590,48 @@ class BaseRateLimiter(BaseRateLimiterMixin, abc.ABC, metaclass=RateLimiterMeta):
                                   for the given key.
         """
         return self._peek(key)
+
+    def release(self, key: str, lease: Lease) -> bool:
+        """Give back the slots held by ``lease`` before it expires.
+
+        :param key: The unique identifier for the rate limit subject.
+        :param lease: The :attr:`RateLimitResult.lease` of an allowed request.
+        :return: True if the slots were released, False if the lease had already
+                 expired or been released.
+        :raise: SetUpError if the algorithm does not hold slots until released.
+        """
+        return self._release(key, lease)
+
+    def limit_many(self, items: "Sequence[tuple[str, int]]") -> list[RateLimitResult]:
+        """Apply rate limiting logic to many keys in a single store round trip.
+
+        Each item is checked independently, exactly as if :meth:`limit` were
+        called for it, but the whole batch is executed in one pipeline on
+        :class:`throttled.store.RedisStore` and under one lock acquisition on
+        :class:`throttled.store.MemoryStore`.
+
+        :param items: A sequence of ``(key, cost)`` pairs.
+        :return: A list of :class:`RateLimitResult`, in the same order as ``items``.
+        """
+        return self._limit_many(items)
+
+    def limit_all(self, items: "Sequence[tuple[str, int]]") -> list[RateLimitResult]:
+        """Apply rate limiting logic to many keys as a single all-or-nothing request.
+
+        All keys are checked first in one atomic operation, and the cost of each
+        item is consumed only if every key allows the request, so a denied key
+        never leaks quota from the others.
+
+        Every result shares the same ``limited`` flag, while its state reflects
+        the corresponding key: ``retry_after`` is non-zero only for the keys
+        that denied the request.
+
+        With Redis Cluster, all keys must map to the same hash slot, use hash tags
+        (e.g. ``{tenant-1}:user-1`` and ``{tenant-1}:global``) to guarantee it.
+
+        :param items: A sequence of ``(key, cost)`` pairs with unique keys.
+        :return: A list of :class:`RateLimitResult`, in the same order as ``items``.
+        :raise: DataError if ``items`` contains duplicate keys.
+        :raise: SetUpError if the algorithm does not support all-or-nothing limiting.
+        """
+        return self._limit_all(items)
@@ -0,0 +1,448 @@
+import heapq
+import math
+import uuid
+from collections.abc import Sequence
+from typing import TYPE_CHECKING, Any, cast
+
+from .. import constants, store, types
+from . import (
+    BaseRateLimiter,
+    BaseRateLimiterMixin,
+    Lease,
+    RateLimitResult,
+    RateLimitState,
+)
+
+if TYPE_CHECKING:
+    from redis.commands.core import Script as SyncScript
+
+
+class RedisLimitAtomicActionSpec:
+    """Identity and Lua script shared by sync / async Redis concurrency actions.
+
+    The slots of a key are a sorted set of the leased slots, scored by their
+    expiration time in microseconds of the Redis server time. Scores are formatted
+    with ``%.0f``, as Lua numbers passed to Redis commands are rounded to 14
+    significant digits.
+    """
+
+    TYPE: types.AtomicActionTypeT = constants.ATOMIC_ACTION_TYPE_LIMIT
+
+    SCRIPTS: str = """
+    local ttl = tonumber(ARGV[1])
+    local limit = tonumber(ARGV[2])
+    local cost = tonumber(ARGV[3])
+    local lease_id = ARGV[4]
+    local t = redis.call("TIME")
+    local now = tonumber(t[1]) * 1000000 + tonumber(t[2])
+    local ttl_us = math.floor(ttl * 1000000 + 0.5)
+
+    -- Reclaim the slots of leases that expired without being released,
+    -- e.g. because their holder crashed.
+    redis.call("ZREMRANGEBYSCORE", KEYS[1], "-inf", string.format("%.0f", now))
+    local count = redis.call("ZCARD", KEYS[1])
+
+    local limited = 0
+    local retry_after = 0
+    local reset_after = 0
+    local latest = redis.call("ZRANGE", KEYS[1], -1, -1, "WITHSCORES")
+    if latest[2] then
+        reset_after = tonumber(latest[2]) - now
+    end
+
+    if cost > 0 and count + cost > limit then
+        limited = 1
+        -- Wait for the earliest leases to expire until cost fits, they are
+        -- usually released sooner.
+        local overflow = count + cost - limit
+        retry_after = reset_after
+        if overflow <= count then
+            local entry = redis.call(
+                "ZRANGE", KEYS[1], overflow - 1, overflow - 1, "WITHSCORES"
+            )
+            retry_after = tonumber(entry[2]) - now
+        end
+    elseif cost > 0 then
+        local score = string.format("%.0f", now + ttl_us)
+        for start = 1, cost, 1000 do
+            local entries = {}
+            for i = start, math.min(cost, start + 999) do
+                entries[#entries + 1] = score
+                entries[#entries + 1] = lease_id .. ":" .. i
+            end
+            redis.call("ZADD", KEYS[1], unpack(entries))
+        end
+        -- The key lives as long as its latest lease.
+        reset_after = math.max(reset_after, ttl_us)
+        redis.call("PEXPIRE", KEYS[1], math.ceil(reset_after / 1000))
+        count = count + cost
+    end
+
+    return {
+        limited,
+        math.max(0, limit - count),
+        tostring(reset_after / 1000000),
+        tostring(retry_after / 1000000),
+    }
+    """
+
+    @classmethod
+    def _parse_result(cls, result: object) -> tuple[int, int, float, float]:
+        limited, remaining, reset_after, retry_after = cast(
+            "tuple[int, int, str, str]", result
+        )
+        return limited, remaining, float(reset_after), float(retry_after)
+
+
+class RedisReleaseAtomicActionSpec:
+    """Identity and Lua script shared by sync / async Redis release actions."""
+
+    TYPE: types.AtomicActionTypeT = constants.ATOMIC_ACTION_TYPE_RELEASE
+
+    SCRIPTS: str = """
+    local lease_id = ARGV[1]
+    local cost = tonumber(ARGV[2])
+
+    local released = 0
+    for start = 1, cost, 1000 do
+        local members = {}
+        for i = start, math.min(cost, start + 999) do
+            members[#members + 1] = lease_id .. ":" .. i
+        end
+        released = released + redis.call("ZREM", KEYS[1], unpack(members))
+    end
+    return released
+    """
+
+    @classmethod
+    def _parse_result(cls, result: object) -> tuple[int]:
+        return (int(cast("int", result)),)
+
+
+class RedisPeekAtomicActionSpec:
+    """Identity and Lua script shared by sync / async Redis peek actions."""
+
+    TYPE: types.AtomicActionTypeT = constants.ATOMIC_ACTION_TYPE_PEEK
+
+    SCRIPTS: str = """
+    local limit = tonumber(ARGV[1])
+    local t = redis.call("TIME")
+    local now = tonumber(t[1]) * 1000000 + tonumber(t[2])
+
+    -- Expired leases are left to the next limit call, peek does not write.
+    local min = string.format("(%.0f", now)
+    local count = redis.call("ZCOUNT", KEYS[1], min, "+inf")
+
+    local limited = 0
+    local retry_after = 0
+    local reset_after = 0
+    if count > 0 then
+        local latest = redis.call("ZRANGE", KEYS[1], -1, -1, "WITHSCORES")
+        reset_after = tonumber(latest[2]) - now
+    end
+    if count + 1 > limit then
+        limited = 1
+        retry_after = reset_after
+        local overflow = count + 1 - limit
+        if overflow <= count then
+            local entry = redis.call(
+                "ZRANGEBYSCORE", KEYS[1], min, "+inf", "WITHSCORES",
+                "LIMIT", overflow - 1, 1
+            )
+            retry_after = tonumber(entry[2]) - now
+        end
+    end
+
+    return {
+        limited,
+        math.max(0, limit - count),
+        tostring(reset_after / 1000000),
+        tostring(retry_after / 1000000),
+    }
+    """
+
+    @classmethod
+    def _parse_result(cls, result: object) -> tuple[int, int, float, float]:
+        limited, remaining, reset_after, retry_after = cast(
+            "tuple[int, int, str, str]", result
+        )
+        return limited, remaining, float(reset_after), float(retry_after)
+
+
+class RedisLimitAtomicAction(RedisLimitAtomicActionSpec, store.BaseRedisAtomicAction):
+    """Redis-based implementation of AtomicAction for ConcurrencyRateLimiter."""
+
+    def __init__(self, backend: store.RedisStoreBackend) -> None:
+        super().__init__(backend)
+        self._script: SyncScript = self._register_script(self.SCRIPTS)
+
+    def do(
+        self,
+        keys: Sequence[types.KeyT],
+        args: Sequence[types.StoreValueT] | None,
+    ) -> tuple[int, int, float, float]:
+        return self._parse_result(self._execute_script(self._script, keys, args))
+
+    def do_many(
+        self, calls: Sequence[types.AtomicActionCallT]
+    ) -> list[tuple[int, int, float, float]]:
+        results: list[Any] = self._execute_script_many(self._script, calls)
+        return [self._parse_result(result) for result in results]
+
+
+class RedisReleaseAtomicAction(
+    RedisReleaseAtomicActionSpec, store.BaseRedisAtomicAction
+):
+    """Redis-based AtomicAction for ConcurrencyRateLimiter's release operation."""
+
+    def __init__(self, backend: store.RedisStoreBackend) -> None:
+        super().__init__(backend)
+        self._script: SyncScript = self._register_script(self.SCRIPTS)
+
+    def do(
+        self,
+        keys: Sequence[types.KeyT],
+        args: Sequence[types.StoreValueT] | None,
+    ) -> tuple[int]:
+        return self._parse_result(self._execute_script(self._script, keys, args))
+
+
+class RedisPeekAtomicAction(RedisPeekAtomicActionSpec, store.BaseRedisAtomicAction):
+    """Redis-based AtomicAction for ConcurrencyRateLimiter's peek operation."""
+
+    def __init__(self, backend: store.RedisStoreBackend) -> None:
+        super().__init__(backend)
+        self._script: SyncScript = self._register_script(self.SCRIPTS)
+
+    def do(
+        self,
+        keys: Sequence[types.KeyT],
+        args: Sequence[types.StoreValueT] | None,
+    ) -> tuple[int, int, float, float]:
+        return self._parse_result(self._execute_script(self._script, keys, args))
+
+
+class MemoryLimitActionLogic:
+    """Pure logic shared by sync / async memory limit actions.
+
+    The slots of a key are a dict that maps each leased slot to its monotonic
+    expiration time. A slot is only added if the request is allowed, so the
+    dict is bounded to ``limit`` entries.
+    """
+
+    @classmethod
+    def _get_leases(
+        cls, backend: store.BaseMemoryStoreBackend, key: types.KeyT, now: float
+    ) -> dict[str, float]:
+        """Return the slots of ``key`` without the leases that expired."""
+        leases: dict[str, float] | None = backend.get_leases(key)
+        if leases is None:
+            return {}
+
+        # Reclaim the slots of leases that expired without being released,
+        # e.g. because their holder crashed.
+        for slot in [slot for slot, expire_at in leases.items() if expire_at <= now]:
+            del leases[slot]
+        return leases
+
+    @classmethod
+    def _check(
+        cls, leases: dict[str, float], limit: int, cost: int, now: float
+    ) -> tuple[int, float, float]:
+        """Return whether ``cost`` is limited, and the reset / retry after of the slots.
+
+        :param leases: The slots of the key, returned by :meth:`_get_leases`.
+        """
+        reset_after: float = max(leases.values()) - now if leases else 0.0
+        if cost <= 0 or len(leases) + cost <= limit:
+            return 0, reset_after, 0.0
+
+        # Wait for the earliest leases to expire until cost fits.
+        overflow: int = len(leases) + cost - limit
+        if overflow > len(leases):
+            return 1, reset_after, reset_after
+        return 1, reset_after, heapq.nsmallest(overflow, leases.values())[-1] - now
+
+    @classmethod
+    def _do(
+        cls,
+        backend: store.BaseMemoryStoreBackend,
+        keys: Sequence[types.KeyT],
+        args: Sequence[types.StoreValueT] | None,
+    ) -> tuple[int, int, float, float]:
+        if args is None:
+            raise ValueError("args is required")
+        key: str = keys[0]
+        ttl: float = float(args[0])
+        limit: int = int(args[1])
+        cost: int = int(args[2])
+        lease_id: int = int(args[3])
+
+        now: float = backend.clock.monotonic()
+        leases: dict[str, float] = cls._get_leases(backend, key, now)
+        limited, reset_after, retry_after = cls._check(leases, limit, cost, now)
+        if not limited and cost > 0:
+            expire_at: float = now + ttl
+            leases.update((f"{lease_id}:{i}", expire_at) for i in range(1, cost + 1))
+            reset_after = max(reset_after, ttl)
+            backend.set_leases(key, leases, math.ceil(reset_after))
+        return limited, max(0, limit - len(leases)), reset_after, retry_after
+
+
+class MemoryLimitAtomicAction(MemoryLimitActionLogic, store.BaseMemoryAtomicAction):
+    """Memory-based implementation of AtomicAction for ConcurrencyRateLimiter."""
+
+    TYPE: types.AtomicActionTypeT = constants.ATOMIC_ACTION_TYPE_LIMIT
+
+
+class MemoryReleaseActionLogic:
+    """Pure logic shared by sync / async memory release actions."""
+
+    @classmethod
+    def _do(
+        cls,
+        backend: store.BaseMemoryStoreBackend,
+        keys: Sequence[types.KeyT],
+        args: Sequence[types.StoreValueT] | None,
+    ) -> tuple[int]:
+        if args is None:
+            raise ValueError("args is required")
+        key: str = keys[0]
+        lease_id: int = int(args[0])
+        cost: int = int(args[1])
+
+        leases: dict[str, float] | None = backend.get_leases(key)
+        if leases is None:
+            return (0,)
+
+        released: int = 0
+        for i in range(1, cost + 1):
+            if leases.pop(f"{lease_id}:{i}", None) is not None:
+                released += 1
+        if not leases:
+            backend.delete(key)
+        return (released,)
+
+
+class MemoryReleaseAtomicAction(MemoryReleaseActionLogic, store.BaseMemoryAtomicAction):
+    """Memory-based AtomicAction for ConcurrencyRateLimiter's release operation."""
+
+    TYPE: types.AtomicActionTypeT = constants.ATOMIC_ACTION_TYPE_RELEASE
+
+
+class MemoryPeekActionLogic:
+    """Pure logic shared by sync / async memory peek actions."""
+
+    @classmethod
+    def _do(
+        cls,
+        backend: store.BaseMemoryStoreBackend,
+        keys: Sequence[types.KeyT],
+        args: Sequence[types.StoreValueT] | None,
+    ) -> tuple[int, int, float, float]:
+        if args is None:
+            raise ValueError("args is required")
+        limit: int = int(args[0])
+
+        now: float = backend.clock.monotonic()
+        leases: dict[str, float] = MemoryLimitActionLogic._get_leases(
+            backend, keys[0], now
+        )
+        limited, reset_after, retry_after = MemoryLimitActionLogic._check(
+            leases, limit, 1, now
+        )
+        return limited, max(0, limit - len(leases)), reset_after, retry_after
+
+
+class MemoryPeekAtomicAction(MemoryPeekActionLogic, store.BaseMemoryAtomicAction):
+    """Memory-based AtomicAction for ConcurrencyRateLimiter's peek operation."""
+
+    TYPE: types.AtomicActionTypeT = constants.ATOMIC_ACTION_TYPE_PEEK
+
+
+class ConcurrencyRateLimiterCoreMixin(BaseRateLimiterMixin):
+    """Core mixin for ConcurrencyRateLimiter."""
+
+    _SUB_SECOND_PERIOD: bool = True
+
+    class Meta(BaseRateLimiterMixin.Meta):
+        type: types.RateLimiterTypeT = constants.RateLimiterType.CONCURRENCY.value
+
+    @classmethod
+    def _supported_atomic_action_types(cls) -> Sequence[types.AtomicActionTypeT]:
+        return [
+            constants.ATOMIC_ACTION_TYPE_LIMIT,
+            constants.ATOMIC_ACTION_TYPE_PEEK,
+            constants.ATOMIC_ACTION_TYPE_RELEASE,
+        ]
+
+    def _prepare(self, key: str) -> tuple[str, float, int]:
+        return self._prepare_key(key), self.quota.period_sec_f, self.quota.get_limit()
+
+    def _prepare_limit(
+        self, key: str, cost: int
+    ) -> tuple[list[types.KeyT], list[types.StoreValueT]]:
+        formatted_key, ttl, limit = self._prepare(key)
+        return [formatted_key], [ttl, limit, cost, uuid.uuid4().int]
+
+    def _prepare_release(
+        self, key: str, lease: Lease
+    ) -> tuple[list[types.KeyT], list[types.StoreValueT]]:
+        return [self._prepare_key(key)], [lease.id, lease.cost]
+
+    def _to_limit_result(  # noqa: PLR6301
+        self, args: Sequence[types.StoreValueT], ret: Sequence[int | float]
+    ) -> RateLimitResult:
+        limited, remaining, reset_after, retry_after = ret
+        cost: int = int(args[2])
+        return RateLimitResult(
+            limited=bool(limited),
+            state_values=(int(args[1]), int(remaining), reset_after, retry_after),
+            lease=None if limited or cost <= 0 else Lease(id=int(args[3]), cost=cost),
+        )
+
+
+class ConcurrencyRateLimiter(ConcurrencyRateLimiterCoreMixin, BaseRateLimiter):
+    """Concrete implementation of BaseRateLimiter that limits in-flight requests.
+
+    Each allowed request holds ``cost`` of the ``limit`` slots of the quota
+    until it is released, or until its lease expires after ``period``, so the
+    slots of holders that crashed are reclaimed automatically.
+    """
+
+    _DEFAULT_ATOMIC_ACTION_CLASSES: Sequence[type[store.BaseAtomicAction]] = (
+        RedisPeekAtomicAction,
+        RedisLimitAtomicAction,
+        RedisReleaseAtomicAction,
+        MemoryLimitAtomicAction,
+        MemoryReleaseAtomicAction,
+        MemoryPeekAtomicAction,
+    )
+
+    def _limit(self, key: str, cost: int = 1) -> RateLimitResult:
+        keys, args = self._prepare_limit(key, cost)
+        return self._to_limit_result(
+            args, self._atomic_actions[constants.ATOMIC_ACTION_TYPE_LIMIT].do(keys, args)
+        )
+
+    def _release(self, key: str, lease: Lease) -> bool:
+        keys, args = self._prepare_release(key, lease)
+        released, *_ = self._atomic_actions[constants.ATOMIC_ACTION_TYPE_RELEASE].do(
+            keys, args
+        )
+        return released > 0
+
+    def _peek(self, key: str) -> RateLimitState:
+        formatted_key, _ttl, limit = self._prepare(key)
+        _limited, remaining, reset_after, retry_after = cast(
+            "tuple[int, int, float, float]",
+            self._atomic_actions[constants.ATOMIC_ACTION_TYPE_PEEK].do(
+                [formatted_key], [limit]
+            ),
+        )
+        return RateLimitState(
+            limit=limit,
+            remaining=remaining,
+            reset_after=reset_after,
+            retry_after=retry_after,
+        )
@@ -0,0 +1,132 @@
+import threading
+from collections import OrderedDict
+
+from .. import exceptions
+from ..clock import Clock, SystemClock
+from .base import RateLimitResult, RateLimitState
+
+
+class DeniedCache:
+    """Bounded local cache of keys known to be limited until a deadline.
+
+    A rate limiter with a :class:`DeniedCache` remembers each denied key along
+    with the cost of the denied request, and answers later requests of the same
+    or a higher cost locally until the deadline, instead of a store round trip.
+
+    Denials are only cached for algorithms whose ``retry_after`` is exact, so
+    a request is never answered as limited while the store would allow it.
+    Requests consumed by other processes can only push the deadline further.
+
+    The least recently denied keys are dropped once ``max_size`` is reached.
+    A cache must not be shared by rate limiters with different quotas.
+    """
+
+    def __init__(self, max_size: int = 1024, clock: Clock | None = None) -> None:
+        """Initializes the cache.
+
+        :param max_size: The maximum number of denied keys to remember,
+            default: 1024.
+        :param clock: The clock that deadlines are counted on, it must be the
+            clock of the store, default: the clock of the store of the first
+            rate limiter the cache is passed to.
+        """
+        if not (isinstance(max_size, int) and max_size > 0):
+            raise exceptions.SetUpError("max_size must be a positive integer")
+
+        self.max_size: int = max_size
+        self._clock: Clock | None = clock
+        # key -> (started_at, deadline, cost, result)
+        self._entries: OrderedDict[str, tuple[float, float, int, RateLimitResult]] = (
+            OrderedDict()
+        )
+        self._lock: threading.Lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def clock(self) -> Clock:
+        """The clock that deadlines are counted on."""
+        if self._clock is None:
+            self._clock = SystemClock()
+        return self._clock
+
+    def bind_clock(self, clock: Clock) -> None:
+        """Count deadlines on ``clock``, the clock of the store of a rate limiter.
+
+        :param clock: The clock of the store.
+        :raise: SetUpError if the cache already counts on another clock.
+        """
+        if self._clock is None:
+            self._clock = clock
+        elif self._clock is not clock and not (
+            # All system clocks read the same time.
+            isinstance(self._clock, SystemClock) and isinstance(clock, SystemClock)
+        ):
+            raise exceptions.SetUpError(
+                "DeniedCache must count on the clock of the store, see CLOCK."
+            )
+
+    def get(self, key: str, cost: int) -> RateLimitResult | None:
+        """Return a synthesized limited result if ``key`` is known to be limited.
+
+        :param key: The unique identifier for the rate limit subject.
+        :param cost: The cost of the current request.
+        :return: The limited result, with ``reset_after`` and ``retry_after``
+            counted down to now, or None if the store must be asked.
+        """
+        with self._lock:
+            entry: tuple[float, float, int, RateLimitResult] | None = self._entries.get(
+                key
+            )
+            if entry is None:
+                return None
+
+            started_at, deadline, denied_cost, denied_result = entry
+            now: float = self.clock.time()
+            if now >= deadline:
+                del self._entries[key]
+                return None
+
+        if cost < denied_cost:
+            return None
+
+        state: RateLimitState = denied_result.state
+        return RateLimitResult(
+            limited=True,
+            state_values=(
+                state.limit,
+                state.remaining,
+                max(0.0, state.reset_after - (now - started_at)),
+                deadline - now,
+            ),
+        )
+
+    def set(
+        self,
+        key: str,
+        cost: int,
+        result: RateLimitResult,
+        started_at: float,
+        denied_for: float,
+    ) -> None:
+        """Remember that ``key`` is limited for ``cost`` for ``denied_for`` seconds.
+
+        :param key: The unique identifier for the rate limit subject.
+        :param cost: The cost of the denied request.
+        :param result: The denied result returned by the store.
+        :param started_at: The wall-clock time at which the denied request was
+            sent to the store.
+        :param denied_for: The time in seconds from ``started_at`` during which
+            requests of ``cost`` or higher are known to be limited.
+        """
+        with self._lock:
+            self._entries[key] = (started_at, started_at + denied_for, cost, result)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Forget all denied keys."""
+        with self._lock:
+            self._entries.clear()
@@ -1,39 +1,203 @@
 from collections.abc import Sequence
-from typing import cast
+from typing import TYPE_CHECKING, Any, cast
 
-from .. import constants, store, types, utils
+from .. import constants, store, types
 from . import BaseRateLimiter, BaseRateLimiterMixin, RateLimitResult, RateLimitState
 
+if TYPE_CHECKING:
+    from redis.commands.core import Script as SyncScript
+
 
 class RedisLimitAtomicActionSpec:
-    """Identity shared by sync / async Redis fixed-window atomic actions."""
+    """Identity and Lua script shared by sync / async Redis fixed-window actions."""
 
     TYPE: types.AtomicActionTypeT = constants.ATOMIC_ACTION_TYPE_LIMIT
 
+    # The window index and reset_after are derived from the Redis server time,
+    # so that clients with skewed clocks always count in the same window.
+    SCRIPTS: str = """
+    local period = tonumber(ARGV[1])
+    local limit = tonumber(ARGV[2])
+    local cost = tonumber(ARGV[3])
+    local now = redis.call("TIME")
+    local now_ms = tonumber(now[1]) * 1000 + math.floor(tonumber(now[2]) / 1000)
+
+    local period_ms = period * 1000
+    local window = math.floor(now_ms / period_ms)
+    local current = 0
+    local counter = redis.call("HMGET", KEYS[1], "window", "count")
+    local is_new_window = tonumber(counter[1]) ~= window
+    if not is_new_window then
+        current = tonumber(counter[2])
+    end
+
+    current = current + cost
+    redis.call("HSET", KEYS[1], "window", window, "count", current)
+    if is_new_window then
+        redis.call("EXPIRE", KEYS[1], period)
+    end
+
+    local limited = 0
+    if current > limit and cost ~= 0 then
+        limited = 1
+    end
+    local reset_after = (period_ms - now_ms % period_ms) / 1000
+    return {limited, current, tostring(reset_after)}
+    """
+
+    @classmethod
+    def _parse_result(cls, result: object) -> tuple[int, int, float]:
+        # Lua script returns {limited, current, reset_after}, reset_after is
+        # returned as string to keep its precision.
+        limited, current, reset_after = cast("tuple[int, int, str]", result)
+        return limited, current, float(reset_after)
+
+
+class RedisLimitAllAtomicActionSpec:
+    """Identity and Lua script shared by sync / async Redis fixed-window limit-all."""
+
+    TYPE: types.AtomicActionTypeT = constants.ATOMIC_ACTION_TYPE_LIMIT_ALL
+
+    SCRIPTS: str = """
+    local limited = 0
+    local counters = {}
+    local now = redis.call("TIME")
+    local now_ms = tonumber(now[1]) * 1000 + math.floor(tonumber(now[2]) / 1000)
+
+    -- Check all windows first, ARGV holds (period, limit, cost) for each key.
+    for i = 1, #KEYS do
+        local offset = (i - 1) * 3
+        local period = tonumber(ARGV[offset + 1])
+        local limit = tonumber(ARGV[offset + 2])
+        local cost = tonumber(ARGV[offset + 3])
+
+        local period_ms = period * 1000
+        local window = math.floor(now_ms / period_ms)
+        local current = 0
+        local counter = redis.call("HMGET", KEYS[i], "window", "count")
+        local is_new_window = tonumber(counter[1]) ~= window
+        if not is_new_window then
+            current = tonumber(counter[2])
+        end
+        if current + cost > limit and cost ~= 0 then
+            limited = 1
+        end
+        local reset_after = (period_ms - now_ms % period_ms) / 1000
+        counters[i] = {current, window, is_new_window, reset_after}
+    end
+
+    -- Count the request in all windows only if every window allows it.
+    local result = {limited}
+    for i = 1, #KEYS do
+        local current = counters[i][1]
+        if limited == 0 then
+            local offset = (i - 1) * 3
+            current = current + tonumber(ARGV[offset + 3])
+            redis.call("HSET", KEYS[i], "window", counters[i][2], "count", current)
+            if counters[i][3] then
+                redis.call("EXPIRE", KEYS[i], tonumber(ARGV[offset + 1]))
+            end
+        end
+        result[2 * i] = current
+        result[2 * i + 1] = tostring(counters[i][4])
+    end
+
+    return result
+    """
+
+    @classmethod
+    def _parse_result(cls, result: object) -> tuple[int | float, ...]:
+        # Lua script returns {limited, current_1, reset_after_1, ...}, reset_after
+        # is returned as string to keep its precision.
+        values: list[int | str] = cast("list[int | str]", result)
+        parsed: list[int | float] = [int(values[0])]
+        for index in range(1, len(values), 2):
+            parsed.extend([int(values[index]), float(values[index + 1])])
+        return tuple(parsed)
+
 
 class RedisLimitAtomicAction(RedisLimitAtomicActionSpec, store.BaseRedisAtomicAction):
     """Redis-based implementation of AtomicAction for FixedWindowRateLimiter."""
 
+    def __init__(self, backend: store.RedisStoreBackend) -> None:
+        super().__init__(backend)
+        self._script: SyncScript = self._register_script(self.SCRIPTS)
+
     def do(
         self,
         keys: Sequence[types.KeyT],
         args: Sequence[types.StoreValueT] | None,
-    ) -> tuple[int, int]:
-        if args is None:
-            raise ValueError("args is required")
-        period: int = int(args[0])
-        limit: int = int(args[1])
-        cost: int = int(args[2])
-        client = self._backend.get_client()
-        current: int = client.incrby(keys[0], cost)
-        if current == cost:
-            client.expire(keys[0], period)
-        limited: int = int(current > limit and cost != 0)
-        return limited, current
+    ) -> tuple[int, int, float]:
+        return self._parse_result(self._execute_script(self._script, keys, args))
+
+    def do_many(
+        self, calls: Sequence[types.AtomicActionCallT]
+    ) -> list[tuple[int, int, float]]:
+        results: list[Any] = self._execute_script_many(self._script, calls)
+        return [self._parse_result(result) for result in results]
+
+
+class RedisLimitAllAtomicAction(
+    RedisLimitAllAtomicActionSpec, store.BaseRedisAtomicAction
+):
+    """Redis-based all-or-nothing AtomicAction for FixedWindowRateLimiter."""
+
+    def __init__(self, backend: store.RedisStoreBackend) -> None:
+        super().__init__(backend)
+        self._script: SyncScript = self._register_script(self.SCRIPTS)
+
+    def do(
+        self,
+        keys: Sequence[types.KeyT],
+        args: Sequence[types.StoreValueT] | None,
+    ) -> tuple[int | float, ...]:
+        return self._parse_result(self._execute_script(self._script, keys, args))
 
 
 class MemoryLimitActionLogic:
-    """Pure logic shared by sync / async memory limit actions."""
+    """Pure logic shared by sync / async memory limit actions.
+
+    The counter of a key is stored as a hash of ``window`` (the index of the
+    window it counts) and ``count``, like the Redis script.
+    """
+
+    @classmethod
+    def _to_counter(
+        cls, counter: types.StoreDictValueT, period: int, now_ms: int
+    ) -> tuple[int, int | None]:
+        """Return the current window, and its count or None if it is not counted.
+
+        :param counter: The hash of the key.
+        """
+        window: int = now_ms // (period * 1000)
+        if counter and int(counter["window"]) == window:
+            return window, int(counter["count"])
+        return window, None
+
+    @classmethod
+    def _get_reset_after(cls, period: int, now_ms: int) -> float:
+        # |-- now % period --|-- reset_after --|----- next period -----|
+        # |--------------- period -------------|
+        period_ms: int = period * 1000
+        return (period_ms - now_ms % period_ms) / 1000
+
+    @classmethod
+    def _incr(
+        cls,
+        backend: store.BaseMemoryStoreBackend,
+        key: types.KeyT,
+        counter: tuple[int, int | None],
+        cost: int,
+        period: int,
+    ) -> int:
+        """Increase the counter of the window by ``cost`` and return the new value."""
+        window, current = counter
+        count: int = (current or 0) + cost
+        backend.hset(key, mapping={"window": window, "count": count})
+        if current is None:
+            # set expiration only for the first request in a new window.
+            backend.expire(key, period)
+        return count
 
     @classmethod
     def _do(
@@ -41,24 +205,63 @@ class MemoryLimitActionLogic:
         backend: store.BaseMemoryStoreBackend,
         keys: Sequence[types.KeyT],
         args: Sequence[types.StoreValueT] | None,
-    ) -> tuple[int, int]:
+    ) -> tuple[int, int, float]:
         if args is None:
             raise ValueError("args is required")
         key: str = keys[0]
         period: int = int(args[0])
         limit: int = int(args[1])
         cost: int = int(args[2])
-        current_raw: types.StoreValueT | None = backend.get(key)
-        current: int
-        if current_raw is None:
-            current = cost
-            backend.set(key, current, period)
-        else:
-            current = int(current_raw) + cost
-            backend.get_client()[key] = current
+        now_ms: int = int(backend.clock.time() * 1000)
+        counter: tuple[int, int | None] = cls._to_counter(
+            backend.hgetall(key), period, now_ms
+        )
+        current: int = cls._incr(backend, key, counter, cost, period)
 
         limited: int = int(current > limit and cost != 0)
-        return limited, current
+        return limited, current, cls._get_reset_after(period, now_ms)
+
+
+class MemoryLimitAllActionLogic:
+    """Pure logic shared by sync / async memory limit-all actions."""
+
+    @classmethod
+    def _do(
+        cls,
+        backend: store.BaseMemoryStoreBackend,
+        keys: Sequence[types.KeyT],
+        args: Sequence[types.StoreValueT] | None,
+    ) -> tuple[int | float, ...]:
+        if args is None:
+            raise ValueError("args is required")
+        limited: int = 0
+        counters: list[tuple[int, int | None]] = []
+        now_ms: int = int(backend.clock.time() * 1000)
+
+        # Check all windows first, args holds (period, limit, cost) for each key.
+        for index, key in enumerate(keys):
+            limit: int = int(args[index * 3 + 1])
+            cost: int = int(args[index * 3 + 2])
+            counter: tuple[int, int | None] = MemoryLimitActionLogic._to_counter(
+                backend.hgetall(key), int(args[index * 3]), now_ms
+            )
+            limited |= int((counter[1] or 0) + cost > limit and cost != 0)
+            counters.append(counter)
+
+        # Count the request in all windows only if every window allows it.
+        result: list[int | float] = [limited]
+        for index, (key, counter) in enumerate(zip(keys, counters, strict=True)):
+            period: int = int(args[index * 3])
+            current: int = counter[1] or 0
+            if not limited:
+                cost = int(args[index * 3 + 2])
+                current = MemoryLimitActionLogic._incr(
+                    backend, key, counter, cost, period
+                )
+            result.extend(
+                [current, MemoryLimitActionLogic._get_reset_after(period, now_ms)]
+            )
+        return tuple(result)
 
 
 class MemoryLimitAtomicAction(MemoryLimitActionLogic, store.BaseMemoryAtomicAction):
@@ -67,6 +270,14 @@ class MemoryLimitAtomicAction(MemoryLimitActionLogic, store.BaseMemoryAtomicActi
     TYPE: types.AtomicActionTypeT = constants.ATOMIC_ACTION_TYPE_LIMIT
 
 
+class MemoryLimitAllAtomicAction(
+    MemoryLimitAllActionLogic, store.BaseMemoryAtomicAction
+):
+    """Memory-based all-or-nothing AtomicAction for FixedWindowRateLimiter."""
+
+    TYPE: types.AtomicActionTypeT = constants.ATOMIC_ACTION_TYPE_LIMIT_ALL
+
+
 class FixedWindowRateLimiterCoreMixin(BaseRateLimiterMixin):
     """Core mixin for FixedWindowRateLimiter."""
 
@@ -75,50 +286,75 @@ class FixedWindowRateLimiterCoreMixin(BaseRateLimiterMixin):
 
     @classmethod
     def _supported_atomic_action_types(cls) -> Sequence[types.AtomicActionTypeT]:
-        return [constants.ATOMIC_ACTION_TYPE_LIMIT]
+        return [
+            constants.ATOMIC_ACTION_TYPE_LIMIT,
+            constants.ATOMIC_ACTION_TYPE_LIMIT_ALL,
+        ]
 
-    def _prepare(self, key: str) -> tuple[str, int, int, int]:
-        now: int = utils.now_sec()
+    def _prepare(self, key: str) -> tuple[str, int, int]:
         period: int = self.quota.get_period_sec()
-        period_key: str = f"{key}:period:{now // period}"
-        return self._prepare_key(period_key), period, self.quota.get_limit(), now
-
-
-class FixedWindowRateLimiter(FixedWindowRateLimiterCoreMixin, BaseRateLimiter):
-    """Concrete implementation of BaseRateLimiter using fixed window as algorithm."""
+        return self._prepare_key(key), period, self.quota.get_limit()
 
-    _DEFAULT_ATOMIC_ACTION_CLASSES: Sequence[type[store.BaseAtomicAction]] = (
-        RedisLimitAtomicAction,
-        MemoryLimitAtomicAction,
-    )
+    def _prepare_limit(
+        self, key: str, cost: int
+    ) -> tuple[list[types.KeyT], list[types.StoreValueT]]:
+        formatted_key, period, limit = self._prepare(key)
+        return [formatted_key], [period, limit, cost]
 
-    def _limit(self, key: str, cost: int = 1) -> RateLimitResult:
-        period_key, period, limit, now = self._prepare(key)
-        limited, current = cast(
-            "tuple[int, int]",
-            self._atomic_actions[constants.ATOMIC_ACTION_TYPE_LIMIT].do(
-                [period_key], [period, limit, cost]
-            ),
-        )
-
-        # |-- now % period --|-- reset_after --|----- next period -----|
-        # |--------------- period -------------|
-        reset_after: float = period - (now % period)
+    def _to_limit_result(  # noqa: PLR6301
+        self, args: Sequence[types.StoreValueT], ret: Sequence[int | float]
+    ) -> RateLimitResult:
+        limited, current, reset_after = ret
+        limit: int = int(args[1])
         return RateLimitResult(
             limited=bool(limited),
             state_values=(
                 limit,
-                max(0, limit - current),
+                max(0, limit - int(current)),
                 reset_after,
                 reset_after if limited else 0,
             ),
         )
 
-    def _peek(self, key: str) -> RateLimitState:
-        period_key, period, limit, now = self._prepare(key)
-        current: int = int(self._store.get(period_key) or 0)
+    def _to_peek_state(
+        self, counter: types.StoreDictValueT, period: int, limit: int
+    ) -> RateLimitState:
+        # Peek has no server time, the window is derived from the client time.
+        now_ms: int = int(self._clock.time() * 1000)
+        _window, current = MemoryLimitActionLogic._to_counter(counter, period, now_ms)
         return RateLimitState(
             limit=limit,
-            remaining=max(0, limit - current),
-            reset_after=period - (now % period),
+            remaining=max(0, limit - (current or 0)),
+            reset_after=MemoryLimitActionLogic._get_reset_after(period, now_ms),
         )
+
+    def _get_denied_for(  # noqa: PLR6301
+        self,
+        result: RateLimitResult,
+        started_at: float,  # noqa: ARG002
+    ) -> float:
+        # The counter of a window only grows, so a denied key stays limited
+        # until the end of its window, reset_after is measured by the store
+        # after the request was sent.
+        return result.state.reset_after
+
+
+class FixedWindowRateLimiter(FixedWindowRateLimiterCoreMixin, BaseRateLimiter):
+    """Concrete implementation of BaseRateLimiter using fixed window as algorithm."""
+
+    _DEFAULT_ATOMIC_ACTION_CLASSES: Sequence[type[store.BaseAtomicAction]] = (
+        RedisLimitAtomicAction,
+        RedisLimitAllAtomicAction,
+        MemoryLimitAtomicAction,
+        MemoryLimitAllAtomicAction,
+    )
+
+    def _limit(self, key: str, cost: int = 1) -> RateLimitResult:
+        keys, args = self._prepare_limit(key, cost)
+        return self._to_limit_result(
+            args, self._atomic_actions[constants.ATOMIC_ACTION_TYPE_LIMIT].do(keys, args)
+        )
+
+    def _peek(self, key: str) -> RateLimitState:
+        formatted_key, period, limit = self._prepare(key)
+        return self._to_peek_state(self._store.hgetall(formatted_key), period, limit)
@@ -1,8 +1,8 @@
 import math
 from collections.abc import Sequence
-from typing import TYPE_CHECKING, cast
+from typing import TYPE_CHECKING, Any, cast
 
-from .. import constants, store, types, utils
+from .. import constants, store, types
 from . import BaseRateLimiter, BaseRateLimiterMixin, RateLimitResult, RateLimitState
 
 if TYPE_CHECKING:
@@ -54,6 +54,91 @@ class RedisLimitAtomicActionSpec:
     return {limited, remaining, tostring(reset_after), tostring(retry_after)}
     """
 
+    @classmethod
+    def _parse_result(cls, result: object) -> tuple[int, int, float, float]:
+        limited, remaining, reset_after, retry_after = cast(
+            "tuple[int, int, str, str]", result
+        )
+        return limited, remaining, float(reset_after), float(retry_after)
+
+
+class RedisLimitAllAtomicActionSpec:
+    """Identity and Lua script shared by sync / async Redis GCRA limit-all actions."""
+
+    TYPE: types.AtomicActionTypeT = constants.ATOMIC_ACTION_TYPE_LIMIT_ALL
+
+    SCRIPTS: str = """
+    local jan_1_2025 = 1735660800
+    local now = redis.call("TIME")
+    now = (now[1] - jan_1_2025) + (now[2] / 1000000)
+
+    local limited = 0
+    local cells = {}
+
+    -- Check all keys first, ARGV holds (emission_interval, capacity, cost) per key.
+    for i = 1, #KEYS do
+        local offset = (i - 1) * 3
+        local emission_interval = tonumber(ARGV[offset + 1])
+        local capacity = tonumber(ARGV[offset + 2])
+        local cost = tonumber(ARGV[offset + 3])
+
+        local last_tat = redis.call("GET", KEYS[i])
+        if not last_tat then
+            last_tat = now
+        else
+            last_tat = tonumber(last_tat)
+        end
+
+        local tat = math.max(now, last_tat) + cost * emission_interval
+        local time_elapsed = now - (tat - capacity * emission_interval)
+        local remaining = math.floor(time_elapsed / emission_interval)
+        if remaining < 0 then
+            limited = 1
+        end
+        cells[i] = {capacity, cost, last_tat, tat, time_elapsed, remaining}
+    end
+
+    -- Update the TAT of all keys only if every key allows the request.
+    local result = {limited}
+    for i = 1, #KEYS do
+        local cell = cells[i]
+        local remaining = cell[6]
+        local retry_after = 0
+        local reset_after = cell[4] - now
+        if limited == 1 then
+            if remaining < 0 then
+                retry_after = cell[5] * -1
+            end
+            reset_after = math.max(0, cell[3] - now)
+            remaining = math.min(cell[1], cell[2] + remaining)
+        elseif reset_after > 0 then
+            redis.call("SET", KEYS[i], cell[4], "EX", math.ceil(reset_after))
+        end
+
+        local offset = (i - 1) * 3
+        result[offset + 2] = remaining
+        result[offset + 3] = tostring(reset_after)
+        result[offset + 4] = tostring(retry_after)
+    end
+
+    return result
+    """
+
+    @classmethod
+    def _parse_result(cls, result: object) -> tuple[int | float, ...]:
+        # Lua script returns {limited, (remaining, reset_after, retry_after) * n}.
+        values: list[int | str] = cast("list[int | str]", result)
+        parsed: list[int | float] = [int(values[0])]
+        for index in range(1, len(values), 3):
+            parsed.extend(
+                (
+                    int(values[index]),
+                    float(values[index + 1]),
+                    float(values[index + 2]),
+                )
+            )
+        return tuple(parsed)
+
 
 class RedisPeekAtomicActionSpec:
     """Identity and Lua script shared by sync / async Redis GCRA peek actions."""
@@ -92,6 +177,13 @@ class RedisPeekAtomicActionSpec:
     return {limited, remaining, tostring(reset_after), tostring(retry_after)}
     """
 
+    @classmethod
+    def _parse_result(cls, result: object) -> tuple[int, int, float, float]:
+        limited, remaining, reset_after, retry_after = cast(
+            "tuple[int, int, str, str]", result
+        )
+        return limited, remaining, float(reset_after), float(retry_after)
+
 
 class RedisLimitAtomicAction(RedisLimitAtomicActionSpec, store.BaseRedisAtomicAction):
     """Redis-based implementation of AtomicAction for GCRARateLimiter's limit operation.
@@ -108,10 +200,30 @@ class RedisLimitAtomicAction(RedisLimitAtomicActionSpec, store.BaseRedisAtomicAc
         keys: Sequence[types.KeyT],
         args: Sequence[types.StoreValueT] | None,
     ) -> tuple[int, int, float, float]:
-        limited, remaining, reset_after, retry_after = cast(
-            "tuple[int, int, str, str]", self._script(keys, args)
-        )
-        return limited, remaining, float(reset_after), float(retry_after)
+        return self._parse_result(self._execute_script(self._script, keys, args))
+
+    def do_many(
+        self, calls: Sequence[types.AtomicActionCallT]
+    ) -> list[tuple[int, int, float, float]]:
+        results: list[Any] = self._execute_script_many(self._script, calls)
+        return [self._parse_result(result) for result in results]
+
+
+class RedisLimitAllAtomicAction(
+    RedisLimitAllAtomicActionSpec, store.BaseRedisAtomicAction
+):
+    """Redis-based all-or-nothing AtomicAction for GCRARateLimiter."""
+
+    def __init__(self, backend: store.RedisStoreBackend) -> None:
+        super().__init__(backend)
+        self._script: SyncScript = self._register_script(self.SCRIPTS)
+
+    def do(
+        self,
+        keys: Sequence[types.KeyT],
+        args: Sequence[types.StoreValueT] | None,
+    ) -> tuple[int | float, ...]:
+        return self._parse_result(self._execute_script(self._script, keys, args))
 
 
 class RedisPeekAtomicAction(RedisPeekAtomicActionSpec, store.BaseRedisAtomicAction):
@@ -126,10 +238,7 @@ class RedisPeekAtomicAction(RedisPeekAtomicActionSpec, store.BaseRedisAtomicActi
         keys: Sequence[types.KeyT],
         args: Sequence[types.StoreValueT] | None,
     ) -> tuple[int, int, float, float]:
-        limited, remaining, reset_after, retry_after = cast(
-            "tuple[int, int, str, str]", self._script(keys, args)
-        )
-        return limited, remaining, float(reset_after), float(retry_after)
+        return self._parse_result(self._execute_script(self._script, keys, args))
 
 
 class MemoryLimitActionLogic:
@@ -148,7 +257,7 @@ class MemoryLimitActionLogic:
         emission_interval: float = float(args[0])
         capacity: int = int(args[1])
         cost: int = int(args[2])
-        now: float = utils.now_mono_f()
+        now: float = backend.clock.monotonic()
         last_tat: float = float(backend.get(key) or now)
 
         fill_time_for_cost: float = cost * emission_interval
@@ -182,6 +291,57 @@ class MemoryLimitAtomicAction(MemoryLimitActionLogic, store.BaseMemoryAtomicActi
     TYPE: types.AtomicActionTypeT = constants.ATOMIC_ACTION_TYPE_LIMIT
 
 
+class MemoryLimitAllActionLogic:
+    """Pure logic shared by sync / async memory limit-all actions."""
+
+    @classmethod
+    def _do(
+        cls,
+        backend: store.BaseMemoryStoreBackend,
+        keys: Sequence[types.KeyT],
+        args: Sequence[types.StoreValueT] | None,
+    ) -> tuple[int | float, ...]:
+        if args is None:
+            raise ValueError("args is required")
+        now: float = backend.clock.monotonic()
+        limited: int = 0
+        cells: list[tuple[float, int, int, float, float, float]] = []
+
+        # Check all keys first, args holds (emission_interval, capacity, cost)
+        # for each key.
+        for index, key in enumerate(keys):
+            emission_interval: float = float(args[index * 3])
+            capacity: int = int(args[index * 3 + 1])
+            cost: int = int(args[index * 3 + 2])
+            last_tat: float = float(backend.get(key) or now)
+
+            tat: float = max(now, last_tat) + cost * emission_interval
+            time_elapsed: float = now - (tat - capacity * emission_interval)
+            if math.floor(time_elapsed / emission_interval) < 0:
+                limited = 1
+            cells.append(
+                (emission_interval, capacity, cost, last_tat, tat, time_elapsed)
+            )
+
+        # Update the TAT of all keys only if every key allows the request.
+        result: list[int | float] = [limited]
+        for key, cell in zip(keys, cells, strict=True):
+            emission_interval, capacity, cost, last_tat, tat, time_elapsed = cell
+            remaining: int = math.floor(time_elapsed / emission_interval)
+            retry_after: float = 0.0
+            reset_after: float = tat - now
+            if limited:
+                if remaining < 0:
+                    retry_after = abs(time_elapsed)
+                reset_after = max(0.0, last_tat - now)
+                remaining = min(capacity, cost + remaining)
+            elif reset_after > 0:
+                backend.set(key, tat, math.ceil(reset_after))
+
+            result.extend((remaining, reset_after, retry_after))
+        return tuple(result)
+
+
 class MemoryPeekActionLogic:
     """Pure logic shared by sync / async memory peek actions."""
 
@@ -198,7 +358,7 @@ class MemoryPeekActionLogic:
         emission_interval: float = float(args[0])
         capacity: int = int(args[1])
 
-        now: float = utils.now_mono_f()
+        now: float = backend.clock.monotonic()
         tat: float = float(backend.get(key) or now)
         fill_time_for_capacity: float = capacity * emission_interval
         allow_at: float = max(now, tat) - fill_time_for_capacity
@@ -215,6 +375,14 @@ class MemoryPeekActionLogic:
         return limited, remaining, reset_after, retry_after
 
 
+class MemoryLimitAllAtomicAction(
+    MemoryLimitAllActionLogic, store.BaseMemoryAtomicAction
+):
+    """Memory-based all-or-nothing AtomicAction for GCRARateLimiter."""
+
+    TYPE: types.AtomicActionTypeT = constants.ATOMIC_ACTION_TYPE_LIMIT_ALL
+
+
 class MemoryPeekAtomicAction(MemoryPeekActionLogic, store.BaseMemoryAtomicAction):
     """Memory-based AtomicAction for GCRARateLimiter's peek operation."""
 
@@ -224,16 +392,45 @@ class MemoryPeekAtomicAction(MemoryPeekActionLogic, store.BaseMemoryAtomicAction
 class GCRARateLimiterCoreMixin(BaseRateLimiterMixin):
     """Core mixin for GCRARateLimiter."""
 
+    _SUB_SECOND_PERIOD: bool = True
+
     class Meta(BaseRateLimiterMixin.Meta):
         type: types.RateLimiterTypeT = constants.RateLimiterType.GCRA.value
 
     @classmethod
     def _supported_atomic_action_types(cls) -> Sequence[types.AtomicActionTypeT]:
-        return [constants.ATOMIC_ACTION_TYPE_LIMIT, constants.ATOMIC_ACTION_TYPE_PEEK]
+        return [
+            constants.ATOMIC_ACTION_TYPE_LIMIT,
+            constants.ATOMIC_ACTION_TYPE_LIMIT_ALL,
+            constants.ATOMIC_ACTION_TYPE_PEEK,
+        ]
 
     def _prepare(self, key: str) -> tuple[str, float, int]:
         return self._prepare_key(key), self.quota.emission_interval, self.quota.burst
 
+    def _prepare_limit(
+        self, key: str, cost: int
+    ) -> tuple[list[types.KeyT], list[types.StoreValueT]]:
+        formatted_key, emission_interval, capacity = self._prepare(key)
+        return [formatted_key], [emission_interval, capacity, cost]
+
+    def _to_limit_result(  # noqa: PLR6301
+        self, args: Sequence[types.StoreValueT], ret: Sequence[int | float]
+    ) -> RateLimitResult:
+        limited, remaining, reset_after, retry_after = ret
+        return RateLimitResult(
+            limited=bool(limited),
+            state_values=(int(args[1]), int(remaining), reset_after, retry_after),
+        )
+
+    def _get_denied_for(  # noqa: PLR6301
+        self,
+        result: RateLimitResult,
+        started_at: float,  # noqa: ARG002
+    ) -> float:
+        # The TAT of a key never moves back, so retry_after is exact.
+        return result.state.retry_after
+
 
 class GCRARateLimiter(GCRARateLimiterCoreMixin, BaseRateLimiter):
     """Concrete implementation of BaseRateLimiter using GCRA as algorithm."""
@@ -241,22 +438,16 @@ class GCRARateLimiter(GCRARateLimiterCoreMixin, BaseRateLimiter):
     _DEFAULT_ATOMIC_ACTION_CLASSES: Sequence[type[store.BaseAtomicAction]] = (
         RedisPeekAtomicAction,
         RedisLimitAtomicAction,
+        RedisLimitAllAtomicAction,
         MemoryLimitAtomicAction,
+        MemoryLimitAllAtomicAction,
         MemoryPeekAtomicAction,
     )
 
     def _limit(self, key: str, cost: int = 1) -> RateLimitResult:
-        formatted_key, emission_interval, capacity = self._prepare(key)
-        limited, remaining, reset_after, retry_after = cast(
-            "tuple[int, int, float, float]",
-            self._atomic_actions[constants.ATOMIC_ACTION_TYPE_LIMIT].do(
-                [formatted_key], [emission_interval, capacity, cost]
-            ),
-        )
-
-        return RateLimitResult(
-            limited=bool(limited),
-            state_values=(capacity, remaining, reset_after, retry_after),
+        keys, args = self._prepare_limit(key, cost)
+        return self._to_limit_result(
+            args, self._atomic_actions[constants.ATOMIC_ACTION_TYPE_LIMIT].do(keys, args)
         )
 
     def _peek(self, key: str) -> RateLimitState:
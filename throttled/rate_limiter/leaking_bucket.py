@@ -1,8 +1,8 @@
 import math
 from collections.abc import Sequence
-from typing import TYPE_CHECKING, cast
+from typing import TYPE_CHECKING, Any, cast
 
-from .. import constants, store, types, utils
+from .. import constants, store, types
 from . import BaseRateLimiter, BaseRateLimiterMixin, RateLimitResult, RateLimitState
 
 if TYPE_CHECKING:
@@ -18,7 +18,8 @@ class RedisLimitAtomicActionSpec:
     local rate = tonumber(ARGV[1])
     local capacity = tonumber(ARGV[2])
     local cost = tonumber(ARGV[3])
-    local now = tonumber(redis.call("TIME")[1])
+    local now = redis.call("TIME")
+    now = tonumber(now[1]) + tonumber(now[2]) / 1000000
 
     local last_tokens = 0
     local last_refreshed = now
@@ -30,19 +31,84 @@ class RedisLimitAtomicActionSpec:
     end
 
     local time_elapsed = math.max(0, now - last_refreshed)
-    local tokens = math.max(0, last_tokens - (math.floor(time_elapsed * rate)))
+    local tokens = math.max(0, last_tokens - time_elapsed * rate)
 
     local limited = tokens + cost > capacity
     if limited then
-        return {limited, capacity - tokens}
+        return {limited, tostring(capacity - tokens)}
     end
 
     local fill_time = capacity / rate
-    redis.call("EXPIRE", KEYS[1], math.floor(2 * fill_time))
     redis.call("HSET", KEYS[1], "tokens", tokens + cost, "last_refreshed", now)
-    return {limited, capacity - (tokens + cost)}
+    redis.call("EXPIRE", KEYS[1], math.max(1, math.ceil(2 * fill_time)))
+    return {limited, tostring(capacity - (tokens + cost))}
     """
 
+    @classmethod
+    def _parse_result(cls, result: object) -> tuple[int, float]:
+        # Lua script returns {limited, tostring(remaining)}, as Lua numbers are
+        # truncated to integers in replies.
+        limited, remaining = cast("tuple[int, bytes | str]", result)
+        return limited, float(remaining)
+
+
+class RedisLimitAllAtomicActionSpec:
+    """Identity and Lua script shared by sync / async Redis leaking-bucket limit-all."""
+
+    TYPE: types.AtomicActionTypeT = constants.ATOMIC_ACTION_TYPE_LIMIT_ALL
+
+    SCRIPTS: str = """
+    local now = redis.call("TIME")
+    now = tonumber(now[1]) + tonumber(now[2]) / 1000000
+    local limited = 0
+    local buckets = {}
+
+    -- Check all buckets first, ARGV holds (rate, capacity, cost) for each key.
+    for i = 1, #KEYS do
+        local offset = (i - 1) * 3
+        local rate = tonumber(ARGV[offset + 1])
+        local capacity = tonumber(ARGV[offset + 2])
+        local cost = tonumber(ARGV[offset + 3])
+
+        local last_tokens = 0
+        local last_refreshed = now
+        local bucket = redis.call("HMGET", KEYS[i], "tokens", "last_refreshed")
+        if bucket[1] ~= false then
+            last_tokens = tonumber(bucket[1])
+            last_refreshed = tonumber(bucket[2])
+        end
+
+        local time_elapsed = math.max(0, now - last_refreshed)
+        local tokens = math.max(0, last_tokens - time_elapsed * rate)
+        if tokens + cost > capacity then
+            limited = 1
+        end
+        buckets[i] = {rate, capacity, cost, tokens}
+    end
+
+    -- Fill all buckets only if every bucket has enough room.
+    local result = {limited}
+    for i = 1, #KEYS do
+        local capacity = buckets[i][2]
+        local tokens = buckets[i][4]
+        if limited == 0 then
+            tokens = tokens + buckets[i][3]
+            local fill_time = capacity / buckets[i][1]
+            redis.call("HSET", KEYS[i], "tokens", tokens, "last_refreshed", now)
+            redis.call("EXPIRE", KEYS[i], math.max(1, math.ceil(2 * fill_time)))
+        end
+        result[i + 1] = tostring(capacity - tokens)
+    end
+
+    return result
+    """
+
+    @classmethod
+    def _parse_result(cls, result: object) -> tuple[int | float, ...]:
+        # Lua script returns {limited, tostring(remaining_1), ...}.
+        limited, *remaining = cast("list[int | bytes | str]", result)
+        return (int(limited), *(float(value) for value in remaining))
+
 
 class RedisLimitAtomicAction(RedisLimitAtomicActionSpec, store.BaseRedisAtomicAction):
     """Redis-based implementation of AtomicAction for LeakingBucketRateLimiter."""
@@ -55,82 +121,203 @@ class RedisLimitAtomicAction(RedisLimitAtomicActionSpec, store.BaseRedisAtomicAc
         self,
         keys: Sequence[types.KeyT],
         args: Sequence[types.StoreValueT] | None,
-    ) -> tuple[int, int]:
-        limited, tokens = cast("tuple[int, int]", self._script(keys, args))
-        return limited, tokens
+    ) -> tuple[int, float]:
+        return self._parse_result(self._execute_script(self._script, keys, args))
+
+    def do_many(
+        self, calls: Sequence[types.AtomicActionCallT]
+    ) -> list[tuple[int, float]]:
+        results: list[Any] = self._execute_script_many(self._script, calls)
+        return [self._parse_result(result) for result in results]
+
+
+class RedisLimitAllAtomicAction(
+    RedisLimitAllAtomicActionSpec, store.BaseRedisAtomicAction
+):
+    """Redis-based all-or-nothing AtomicAction for LeakingBucketRateLimiter."""
+
+    def __init__(self, backend: store.RedisStoreBackend) -> None:
+        super().__init__(backend)
+        self._script: SyncScript = self._register_script(self.SCRIPTS)
+
+    def do(
+        self,
+        keys: Sequence[types.KeyT],
+        args: Sequence[types.StoreValueT] | None,
+    ) -> tuple[int | float, ...]:
+        return self._parse_result(self._execute_script(self._script, keys, args))
 
 
 class MemoryLimitActionLogic:
     """Pure logic shared by sync / async memory limit actions."""
 
+    @classmethod
+    def _to_tokens(cls, bucket: types.StoreDictValueT, now: float, rate: float) -> float:
+        """Return the water level of ``bucket`` after leaking up to ``now``."""
+        last_tokens: float = float(bucket.get("tokens", 0))
+        last_refreshed: float = float(bucket.get("last_refreshed", now))
+
+        time_elapsed: float = max(0.0, now - last_refreshed)
+        return max(0.0, last_tokens - time_elapsed * rate)
+
+    @classmethod
+    def _get_tokens(
+        cls,
+        backend: store.BaseMemoryStoreBackend,
+        key: types.KeyT,
+        now: float,
+        rate: float,
+    ) -> float:
+        """Return the water level of the bucket after leaking up to ``now``."""
+        return cls._to_tokens(backend.hgetall(key), now, rate)
+
+    @classmethod
+    def _set_tokens(
+        cls,
+        backend: store.BaseMemoryStoreBackend,
+        key: types.KeyT,
+        now: float,
+        tokens: float,
+        fill_time: float,
+    ) -> None:
+        backend.hset(key, mapping={"tokens": tokens, "last_refreshed": now})
+        backend.expire(key, math.ceil(2 * fill_time))
+
     @classmethod
     def _do(
         cls,
         backend: store.BaseMemoryStoreBackend,
         keys: Sequence[types.KeyT],
         args: Sequence[types.StoreValueT] | None,
-    ) -> tuple[int, int]:
+    ) -> tuple[int, float]:
         if args is None:
             raise ValueError("args is required")
         key: str = keys[0]
         rate: float = float(args[0])
         capacity: int = int(args[1])
         cost: int = int(args[2])
-        now: int = utils.now_sec()
-
-        bucket: types.StoreDictValueT = backend.hgetall(key)
-        last_tokens: int = int(bucket.get("tokens", 0))
-        last_refreshed: int = int(bucket.get("last_refreshed", now))
-
-        time_elapsed: float = now - last_refreshed
-        tokens: int = max(0, last_tokens - math.floor(time_elapsed * rate))
+        now: float = backend.clock.time()
+        tokens: float = cls._get_tokens(backend, key, now, rate)
 
         limited: int = int(tokens + cost > capacity)
         if limited:
             return limited, capacity - tokens
 
-        fill_time: float = capacity / rate
-        backend.expire(key, math.ceil(2 * fill_time))
-        backend.hset(key, mapping={"tokens": tokens + cost, "last_refreshed": now})
-
+        cls._set_tokens(backend, key, now, tokens + cost, capacity / rate)
         return limited, capacity - (tokens + cost)
 
 
+class MemoryLimitAllActionLogic:
+    """Pure logic shared by sync / async memory limit-all actions."""
+
+    @classmethod
+    def _do(
+        cls,
+        backend: store.BaseMemoryStoreBackend,
+        keys: Sequence[types.KeyT],
+        args: Sequence[types.StoreValueT] | None,
+    ) -> tuple[int | float, ...]:
+        if args is None:
+            raise ValueError("args is required")
+        now: float = backend.clock.time()
+        limited: int = 0
+        buckets: list[tuple[float, int, int, float]] = []
+
+        # Check all buckets first, args holds (rate, capacity, cost) for each key.
+        for index, key in enumerate(keys):
+            rate: float = float(args[index * 3])
+            capacity: int = int(args[index * 3 + 1])
+            cost: int = int(args[index * 3 + 2])
+            tokens: float = MemoryLimitActionLogic._get_tokens(backend, key, now, rate)
+            limited |= int(tokens + cost > capacity)
+            buckets.append((rate, capacity, cost, tokens))
+
+        # Fill all buckets only if every bucket has enough room.
+        result: list[int | float] = [limited]
+        for key, (rate, capacity, cost, tokens) in zip(keys, buckets, strict=True):
+            if limited:
+                result.append(capacity - tokens)
+                continue
+
+            MemoryLimitActionLogic._set_tokens(
+                backend, key, now, tokens + cost, capacity / rate
+            )
+            result.append(capacity - (tokens + cost))
+        return tuple(result)
+
+
 class MemoryLimitAtomicAction(MemoryLimitActionLogic, store.BaseMemoryAtomicAction):
     """Memory-based implementation of AtomicAction for LeakingBucketRateLimiter."""
 
     TYPE: types.AtomicActionTypeT = constants.ATOMIC_ACTION_TYPE_LIMIT
 
 
+class MemoryLimitAllAtomicAction(
+    MemoryLimitAllActionLogic, store.BaseMemoryAtomicAction
+):
+    """Memory-based all-or-nothing AtomicAction for LeakingBucketRateLimiter."""
+
+    TYPE: types.AtomicActionTypeT = constants.ATOMIC_ACTION_TYPE_LIMIT_ALL
+
+
 class LeakingBucketRateLimiterCoreMixin(BaseRateLimiterMixin):
     """Core mixin for LeakingBucketRateLimiter."""
 
+    _SUB_SECOND_PERIOD: bool = True
+
     class Meta(BaseRateLimiterMixin.Meta):
         type: types.RateLimiterTypeT = constants.RateLimiterType.LEAKING_BUCKET.value
 
     @classmethod
     def _supported_atomic_action_types(cls) -> Sequence[types.AtomicActionTypeT]:
-        return [constants.ATOMIC_ACTION_TYPE_LIMIT]
+        return [
+            constants.ATOMIC_ACTION_TYPE_LIMIT,
+            constants.ATOMIC_ACTION_TYPE_LIMIT_ALL,
+        ]
 
     def _prepare(self, key: str) -> tuple[str, float, int]:
         return self._prepare_key(key), self.quota.fill_rate, self.quota.burst
 
-    def _refill_sec(self, upper: int, remaining: int) -> int:
+    def _prepare_limit(
+        self, key: str, cost: int
+    ) -> tuple[list[types.KeyT], list[types.StoreValueT]]:
+        formatted_key, rate, capacity = self._prepare(key)
+        return [formatted_key], [rate, capacity, cost]
+
+    def _to_limit_result(
+        self, args: Sequence[types.StoreValueT], ret: Sequence[int | float]
+    ) -> RateLimitResult:
+        limited, remaining = ret
+        return self._to_result(bool(limited), int(args[2]), remaining, int(args[1]))
+
+    def _refill_sec(self, upper: int, remaining: float) -> float:
         """Calculate the time in seconds until the bucket reaches the upper limit."""
         if remaining >= upper:
             return 0
-        return math.ceil((upper - remaining) / self.quota.fill_rate)
+        return (upper - remaining) / self.quota.fill_rate
 
     def _to_result(
-        self, limited: int, cost: int, tokens: int, capacity: int
+        self, limited: int, cost: int, remaining: float, capacity: int
     ) -> RateLimitResult:
         """Convert the limiting result to a RateLimitResult."""
-        reset_after: int = self._refill_sec(capacity, tokens)
-        # When the tokens are filled to the cost, it can be retried.
-        retry_after: int = self._refill_sec(cost, tokens) if limited else 0
+        reset_after: float = self._refill_sec(capacity, remaining)
+        # When the bucket has leaked enough room for the cost, it can be retried.
+        retry_after: float = self._refill_sec(cost, remaining) if limited else 0
         return RateLimitResult(
             limited=bool(limited),
-            state_values=(capacity, tokens, reset_after, retry_after),
+            # Only whole requests fit in the remaining room.
+            state_values=(capacity, math.floor(remaining), reset_after, retry_after),
+        )
+
+    def _to_peek_state(self, bucket: types.StoreDictValueT) -> RateLimitState:
+        capacity: int = self.quota.burst
+        remaining: float = capacity - MemoryLimitActionLogic._to_tokens(
+            bucket, self._clock.time(), self.quota.fill_rate
+        )
+        return RateLimitState(
+            limit=capacity,
+            remaining=math.floor(remaining),
+            reset_after=self._refill_sec(capacity, remaining),
         )
 
 
@@ -139,32 +326,16 @@ class LeakingBucketRateLimiter(LeakingBucketRateLimiterCoreMixin, BaseRateLimite
 
     _DEFAULT_ATOMIC_ACTION_CLASSES: Sequence[type[store.BaseAtomicAction]] = (
         RedisLimitAtomicAction,
+        RedisLimitAllAtomicAction,
         MemoryLimitAtomicAction,
+        MemoryLimitAllAtomicAction,
     )
 
     def _limit(self, key: str, cost: int = 1) -> RateLimitResult:
-        formatted_key, rate, capacity = self._prepare(key)
-        limited, tokens = cast(
-            "tuple[int, int]",
-            self._atomic_actions[constants.ATOMIC_ACTION_TYPE_LIMIT].do(
-                [formatted_key], [rate, capacity, cost]
-            ),
+        keys, args = self._prepare_limit(key, cost)
+        return self._to_limit_result(
+            args, self._atomic_actions[constants.ATOMIC_ACTION_TYPE_LIMIT].do(keys, args)
         )
-        return self._to_result(limited, cost, tokens, capacity)
 
     def _peek(self, key: str) -> RateLimitState:
-        now: int = utils.now_sec()
-        formatted_key, rate, capacity = self._prepare(key)
-
-        bucket: types.StoreDictValueT = self._store.hgetall(formatted_key)
-        last_tokens: int = int(bucket.get("tokens", 0))
-        last_refreshed: int = int(bucket.get("last_refreshed", now))
-
-        time_elapsed: int = max(0, now - last_refreshed)
-        tokens: int = max(0, last_tokens - math.floor(time_elapsed * rate))
-
-        return RateLimitState(
-            limit=capacity,
-            remaining=capacity - tokens,
-            reset_after=math.ceil(tokens / rate),
-        )
+        return self._to_peek_state(self._store.hgetall(self._prepare_key(key)))
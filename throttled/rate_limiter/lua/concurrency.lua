@@ -0,0 +1,63 @@
+-- Concurrency implementation for rate limiting.
+-- Every leased slot is a member of a sorted set, scored by its expiration time in microseconds.
+-- ARGV[1]: ttl - How long a lease holds its slots in seconds, may be fractional.
+-- ARGV[2]: limit - Maximum number of slots held at the same time.
+-- ARGV[3]: cost - Number of slots to lease.
+-- ARGV[4]: lease_id - Unique id of the lease, its slots are named lease_id:1..cost.
+-- KEYS[1]: Redis key of the sorted set of the leased slots.
+
+local ttl = tonumber(ARGV[1])
+local limit = tonumber(ARGV[2])
+local cost = tonumber(ARGV[3])
+local lease_id = ARGV[4]
+local t = redis.call("TIME")
+local now = tonumber(t[1]) * 1000000 + tonumber(t[2])
+local ttl_us = math.floor(ttl * 1000000 + 0.5)
+
+-- Reclaim the slots of leases that expired without being released,
+-- e.g. because their holder crashed.
+redis.call("ZREMRANGEBYSCORE", KEYS[1], "-inf", string.format("%.0f", now))
+local count = redis.call("ZCARD", KEYS[1])
+
+local limited = 0
+local retry_after = 0
+local reset_after = 0
+local latest = redis.call("ZRANGE", KEYS[1], -1, -1, "WITHSCORES")
+if latest[2] then
+    reset_after = tonumber(latest[2]) - now
+end
+
+if cost > 0 and count + cost > limit then
+    limited = 1
+    -- Wait for the earliest leases to expire until cost fits, they are
+    -- usually released sooner.
+    local overflow = count + cost - limit
+    retry_after = reset_after
+    if overflow <= count then
+        local entry = redis.call(
+            "ZRANGE", KEYS[1], overflow - 1, overflow - 1, "WITHSCORES"
+        )
+        retry_after = tonumber(entry[2]) - now
+    end
+elseif cost > 0 then
+    local score = string.format("%.0f", now + ttl_us)
+    for start = 1, cost, 1000 do
+        local entries = {}
+        for i = start, math.min(cost, start + 999) do
+            entries[#entries + 1] = score
+            entries[#entries + 1] = lease_id .. ":" .. i
+        end
+        redis.call("ZADD", KEYS[1], unpack(entries))
+    end
+    -- The key lives as long as its latest lease.
+    reset_after = math.max(reset_after, ttl_us)
+    redis.call("PEXPIRE", KEYS[1], math.ceil(reset_after / 1000))
+    count = count + cost
+end
+
+return {
+    limited,
+    math.max(0, limit - count),
+    tostring(reset_after / 1000000),
+    tostring(retry_after / 1000000),
+}
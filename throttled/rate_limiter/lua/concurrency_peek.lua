@@ -0,0 +1,38 @@
+-- Peek the state of the concurrency rate limiter without leasing slots.
+-- ARGV[1]: limit - Maximum number of slots held at the same time.
+-- KEYS[1]: Redis key of the sorted set of the leased slots.
+
+local limit = tonumber(ARGV[1])
+local t = redis.call("TIME")
+local now = tonumber(t[1]) * 1000000 + tonumber(t[2])
+
+-- Expired leases are left to the next limit call, peek does not write.
+local min = string.format("(%.0f", now)
+local count = redis.call("ZCOUNT", KEYS[1], min, "+inf")
+
+local limited = 0
+local retry_after = 0
+local reset_after = 0
+if count > 0 then
+    local latest = redis.call("ZRANGE", KEYS[1], -1, -1, "WITHSCORES")
+    reset_after = tonumber(latest[2]) - now
+end
+if count + 1 > limit then
+    limited = 1
+    retry_after = reset_after
+    local overflow = count + 1 - limit
+    if overflow <= count then
+        local entry = redis.call(
+            "ZRANGEBYSCORE", KEYS[1], min, "+inf", "WITHSCORES",
+            "LIMIT", overflow - 1, 1
+        )
+        retry_after = tonumber(entry[2]) - now
+    end
+end
+
+return {
+    limited,
+    math.max(0, limit - count),
+    tostring(reset_after / 1000000),
+    tostring(retry_after / 1000000),
+}
@@ -0,0 +1,17 @@
+-- Release the slots held by a lease of the concurrency rate limiter.
+-- ARGV[1]: lease_id - Id of the lease to release.
+-- ARGV[2]: cost - Number of slots held by the lease.
+-- KEYS[1]: Redis key of the sorted set of the leased slots.
+
+local lease_id = ARGV[1]
+local cost = tonumber(ARGV[2])
+
+local released = 0
+for start = 1, cost, 1000 do
+    local members = {}
+    for i = start, math.min(cost, start + 999) do
+        members[#members + 1] = lease_id .. ":" .. i
+    end
+    released = released + redis.call("ZREM", KEYS[1], unpack(members))
+end
+return released
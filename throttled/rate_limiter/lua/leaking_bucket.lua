@@ -7,7 +7,9 @@
 local rate = tonumber(ARGV[1])
 local capacity = tonumber(ARGV[2])
 local cost = tonumber(ARGV[3])
-local now = tonumber(redis.call("TIME")[1])
+-- Current time in seconds, with microsecond precision.
+local now = redis.call("TIME")
+now = tonumber(now[1]) + tonumber(now[2]) / 1000000
 
 -- Start with empty bucket.
 local last_tokens = 0
@@ -25,22 +27,23 @@ end
 -- Calculate time elapsed since last leak.
 local time_elapsed = math.max(0, now - last_refreshed)
 -- Calculate new water level(leak over time).
-local tokens = math.max(0, last_tokens - (math.floor(time_elapsed * rate)))
+local tokens = math.max(0, last_tokens - time_elapsed * rate)
 
 -- Check if request exceeds available water level.
 local limited = tokens + cost > capacity
 if limited then
-    return {limited, capacity - tokens}
+    return {limited, tostring(capacity - tokens)}
 end
 
 -- Time to empty full bucket.
 local fill_time = capacity / rate
--- Set expiration to prevent stale data.
-redis.call("EXPIRE", KEYS[1], math.floor(2 * fill_time))
 -- Store new water level and update timestamp.
 redis.call("HSET", KEYS[1], "tokens", tokens + cost, "last_refreshed", now)
+-- Set expiration after the write, EXPIRE on a missing key is a no-op.
+redis.call("EXPIRE", KEYS[1], math.max(1, math.ceil(2 * fill_time)))
 
 -- Return [limited, remaining]
 -- limited: 1 if over limit, 0 otherwise.
--- remaining: available capacity after processing request.
-return {limited, capacity - (tokens + cost)}
+-- remaining: available capacity after processing request, as a string to keep
+-- fractions of a request, since Lua numbers are truncated to integers in replies.
+return {limited, tostring(capacity - (tokens + cost))}
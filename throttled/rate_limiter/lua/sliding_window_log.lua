@@ -0,0 +1,66 @@
+-- Sliding window log implementation for rate limiting.
+-- Every allowed request is logged in a sorted set, scored by the server time in microseconds.
+-- ARGV[1]: period - The window in seconds, may be fractional.
+-- ARGV[2]: limit - Maximum number of requests in any window of period.
+-- ARGV[3]: cost - The cost of the current request.
+-- KEYS[1]: Redis key of the sorted set of the requests in the window.
+
+local period = tonumber(ARGV[1])
+local limit = tonumber(ARGV[2])
+local cost = tonumber(ARGV[3])
+local t = redis.call("TIME")
+local now = tonumber(t[1]) * 1000000 + tonumber(t[2])
+local period_us = math.floor(period * 1000000 + 0.5)
+
+-- The window is (now - period, now].
+redis.call(
+    "ZREMRANGEBYSCORE", KEYS[1], "-inf", string.format("%.0f", now - period_us)
+)
+local count = redis.call("ZCARD", KEYS[1])
+
+local limited = 0
+local retry_after = 0
+local reset_after = 0
+if cost > 0 and count + cost > limit then
+    limited = 1
+    local newest = redis.call("ZRANGE", KEYS[1], -1, -1, "WITHSCORES")
+    if newest[2] then
+        reset_after = tonumber(newest[2]) + period_us - now
+    end
+
+    -- Wait for the oldest requests to leave the window until cost fits.
+    local overflow = count + cost - limit
+    retry_after = reset_after
+    if overflow <= count then
+        local entry = redis.call(
+            "ZRANGE", KEYS[1], overflow - 1, overflow - 1, "WITHSCORES"
+        )
+        retry_after = tonumber(entry[2]) + period_us - now
+    end
+elseif cost > 0 then
+    -- Members are unique within the same microsecond by the position in the log.
+    local score = string.format("%.0f", now)
+    for start = 1, cost, 1000 do
+        local entries = {}
+        for i = start, math.min(cost, start + 999) do
+            entries[#entries + 1] = score
+            entries[#entries + 1] = score .. ":" .. (count + i)
+        end
+        redis.call("ZADD", KEYS[1], unpack(entries))
+    end
+    redis.call("PEXPIRE", KEYS[1], math.ceil(period_us / 1000))
+    count = count + cost
+    reset_after = period_us
+else
+    local newest = redis.call("ZRANGE", KEYS[1], -1, -1, "WITHSCORES")
+    if newest[2] then
+        reset_after = tonumber(newest[2]) + period_us - now
+    end
+end
+
+return {
+    limited,
+    math.max(0, limit - count),
+    tostring(reset_after / 1000000),
+    tostring(retry_after / 1000000),
+}
@@ -0,0 +1,42 @@
+-- Sliding window log implementation for rate limiting.
+-- Every allowed request is logged in a sorted set, scored by the server time in microseconds.
+-- ARGV[1]: period - The window in seconds, may be fractional.
+-- ARGV[2]: limit - Maximum number of requests in any window of period.
+-- KEYS[1]: Redis key of the sorted set of the requests in the window.
+
+local period = tonumber(ARGV[1])
+local limit = tonumber(ARGV[2])
+local t = redis.call("TIME")
+local now = tonumber(t[1]) * 1000000 + tonumber(t[2])
+local period_us = math.floor(period * 1000000 + 0.5)
+
+-- Expired requests are left to the next limit call, peek does not write.
+local min = string.format("(%.0f", now - period_us)
+local count = redis.call("ZCOUNT", KEYS[1], min, "+inf")
+
+local limited = 0
+local retry_after = 0
+local reset_after = 0
+if count > 0 then
+    local newest = redis.call("ZRANGE", KEYS[1], -1, -1, "WITHSCORES")
+    reset_after = tonumber(newest[2]) + period_us - now
+end
+if count + 1 > limit then
+    limited = 1
+    retry_after = reset_after
+    local overflow = count + 1 - limit
+    if overflow <= count then
+        local entry = redis.call(
+            "ZRANGEBYSCORE", KEYS[1], min, "+inf", "WITHSCORES",
+            "LIMIT", overflow - 1, 1
+        )
+        retry_after = tonumber(entry[2]) + period_us - now
+    end
+end
+
+return {
+    limited,
+    math.max(0, limit - count),
+    tostring(reset_after / 1000000),
+    tostring(retry_after / 1000000),
+}
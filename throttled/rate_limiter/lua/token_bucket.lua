@@ -2,13 +2,14 @@
 -- ARGV[1]: rate - Tokens generated per second
 -- ARGV[2]: capacity - Maximum number of tokens the bucket can hold.
 -- ARGV[3]: cost - Number of tokens required for the current request.
--- ARGV[4]: now - Current time in seconds.
 -- KEYS[1]: Redis hash key storing bucket state.
 
 local rate = tonumber(ARGV[1])
 local capacity = tonumber(ARGV[2])
 local cost = tonumber(ARGV[3])
-local now = tonumber(redis.call("TIME")[1])
+-- Current time in seconds, with microsecond precision.
+local now = redis.call("TIME")
+now = tonumber(now[1]) + tonumber(now[2]) / 1000000
 
 -- Initialize default bucket state.
 local last_tokens = capacity    -- Start with full bucket.
@@ -25,12 +26,12 @@ end
 -- Calculate time elapsed since last refresh.
 local time_elapsed = math.max(0, now - last_refreshed)
 -- Calculate new tokens based on time elapsed.
-local tokens = math.min(capacity, last_tokens + (math.floor(time_elapsed * rate)))
+local tokens = math.min(capacity, last_tokens + time_elapsed * rate)
 
 -- Check if request exceeds available tokens.
 local limited = cost > tokens
 if limited then
-    return {limited, tokens}
+    return {limited, tostring(tokens)}
 end
 
 -- Deduct tokens for current request.
@@ -39,9 +40,10 @@ tokens = tokens - cost
 local fill_time = capacity / rate
 -- Update bucket state in Redis.
 redis.call("HSET", KEYS[1], "tokens", tokens, "last_refreshed", now)
-redis.call("EXPIRE", KEYS[1], math.floor(2 * fill_time))
+redis.call("EXPIRE", KEYS[1], math.max(1, math.ceil(2 * fill_time)))
 
 -- Return [limited, tokens]
 -- limited: 1 if over limit, 0 otherwise.
--- tokens: number of tokens remaining in bucket.
-return {limited, tokens}
+-- tokens: number of tokens remaining in bucket, as a string to keep fractions of
+-- a token, since Lua numbers are truncated to integers in replies.
+return {limited, tostring(tokens)}
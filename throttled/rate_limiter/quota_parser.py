@@ -7,6 +7,11 @@ from ..exceptions import DataError
 from .base import Quota, per_duration
 
 _UNIT_ALIAS_TO_CANONICAL: dict[str, str] = {
+    "ms": "millisecond",
+    "msec": "millisecond",
+    "msecs": "millisecond",
+    "millisecond": "millisecond",
+    "milliseconds": "millisecond",
     "s": "second",
     "sec": "second",
     "secs": "second",
@@ -33,6 +38,7 @@ _UNIT_ALIAS_TO_CANONICAL: dict[str, str] = {
 }
 
 _CANONICAL_UNIT_TO_DURATION: dict[str, timedelta] = {
+    "millisecond": timedelta(milliseconds=1),
     "second": timedelta(seconds=1),
     "minute": timedelta(minutes=1),
     "hour": timedelta(hours=1),
@@ -46,9 +52,9 @@ _RATE_PATTERN = re.compile(
     (?P<limit>\d+)
     \s*
     (?:
-        /\s*(?P<slash_unit>[a-zA-Z]+)
+        /\s*(?P<slash_count>\d+)?\s*(?P<slash_unit>[a-zA-Z]+)
         |
-        per\s+(?P<per_unit>[a-zA-Z]+)
+        per\s+(?P<per_count>\d+)?\s*(?P<per_unit>[a-zA-Z]+)
     )
     (?:\s+burst\s+(?P<burst>\d+))?
     \s*$
@@ -65,7 +71,8 @@ def _parse_unit(raw_unit: str, token: str) -> str:
 
     raise DataError(
         f"Invalid quota token: '{token}', unsupported unit '{raw_unit}'. "
-        "Expected one of: s/sec/second, m/min/minute, h/hr/hour, d/day, w/wk/week."
+        "Expected one of: ms/msec/millisecond, s/sec/second, m/min/minute, "
+        "h/hr/hour, d/day, w/wk/week."
     )
 
 
@@ -81,11 +88,18 @@ def _parse_rate_token(token: str) -> tuple[int, timedelta, int | None]:
     if limit <= 0:
         raise DataError(f"Invalid quota token: '{token}', limit must be greater than 0.")
 
+    count_expr: str | None = matched.group("slash_count") or matched.group("per_count")
+    count: int = int(count_expr) if count_expr else 1
+    if count <= 0:
+        raise DataError(
+            f"Invalid quota token: '{token}', period must be greater than 0."
+        )
+
     raw_unit: str = matched.group("slash_unit") or matched.group("per_unit")
     canonical_unit = _parse_unit(raw_unit, token)
     burst_expr: str | None = matched.group("burst")
     burst: int | None = int(burst_expr) if burst_expr else None
-    return limit, _CANONICAL_UNIT_TO_DURATION[canonical_unit], burst
+    return limit, count * _CANONICAL_UNIT_TO_DURATION[canonical_unit], burst
 
 
 def parse(quota_expr: str) -> list[Quota]:
@@ -94,6 +108,8 @@ def parse(quota_expr: str) -> list[Quota]:
     Supported forms:
     - ``n/unit`` (e.g. ``100/s``)
     - ``n per unit`` (e.g. ``100 per second``)
+    - An optional period count before the unit (e.g. ``5 per 100ms``,
+      ``10/2m``)
     - Optional ``burst <n>`` attached to the same rule
     - Multi-rule separators: ``,`` ``;`` ``|``
     """
@@ -1,8 +1,8 @@
 import math
 from collections.abc import Sequence
-from typing import TYPE_CHECKING, cast
+from typing import TYPE_CHECKING, Any, cast
 
-from .. import constants, store, types, utils
+from .. import constants, store, types
 from . import BaseRateLimiter, BaseRateLimiterMixin, RateLimitResult, RateLimitState
 
 if TYPE_CHECKING:
@@ -14,49 +14,137 @@ class RedisLimitAtomicActionSpec:
 
     TYPE: types.AtomicActionTypeT = constants.ATOMIC_ACTION_TYPE_LIMIT
 
+    # The window index and proportion are derived from the Redis server time,
+    # so that clients with skewed clocks always count in the same window.
     SCRIPTS: str = """
     local period = tonumber(ARGV[1])
     local limit = tonumber(ARGV[2])
     local cost = tonumber(ARGV[3])
-    local now_ms = tonumber(ARGV[4])
+    local now = redis.call("TIME")
+    local now_ms = tonumber(now[1]) * 1000 + math.floor(tonumber(now[2]) / 1000)
 
-    local exists = true
-    local current = redis.call("GET", KEYS[1])
-    if current == false then
-        current = 0
-        exists = false
-    end
-
-    local previous = redis.call("GET", KEYS[2])
-    if previous == false then
-        previous = 0
+    local period_ms = period * 1000
+    local window = math.floor(now_ms / period_ms)
+    local current = 0
+    local previous = 0
+    local counter = redis.call("HMGET", KEYS[1], "window", "current", "previous")
+    local last_window = tonumber(counter[1])
+    if last_window == window then
+        current = tonumber(counter[2])
+        previous = tonumber(counter[3])
+    elseif last_window == window - 1 then
+        previous = tonumber(counter[2])
     end
 
-    local period_ms = period * 1000
     local current_proportion = (now_ms % period_ms) / period_ms
     local previous_proportion = 1 - current_proportion
-    previous = math.floor(previous_proportion * previous)
+    local weighted_previous = math.floor(previous_proportion * previous)
 
     local retry_after = 0
-    local used = previous + current + cost
+    local used = weighted_previous + current + cost
     local limited = used > limit and cost ~= 0
     if limited then
-        if cost <= previous then
-            retry_after = previous_proportion * period * cost / previous
+        if cost <= weighted_previous then
+            retry_after = previous_proportion * period * cost / weighted_previous
         else
             retry_after = previous_proportion * period
         end
     else
-        if exists then
-            redis.call("INCRBY", KEYS[1], cost)
-        else
-            redis.call("SET", KEYS[1], cost, "EX", 3 * period)
-        end
+        redis.call(
+            "HSET", KEYS[1], "window", window,
+            "current", current + cost, "previous", previous
+        )
+        -- The counter is still used as the previous window in the next one.
+        redis.call("EXPIRE", KEYS[1], 2 * period)
     end
 
     return {limited, used, tostring(retry_after)}
     """
 
+    @classmethod
+    def _parse_result(cls, result: object) -> tuple[int, int, float]:
+        limited, used, retry_after = cast("tuple[int, int, str]", result)
+        return limited, used, float(retry_after)
+
+
+class RedisLimitAllAtomicActionSpec:
+    """Identity and Lua script shared by sync / async Redis sliding-window limit-all."""
+
+    TYPE: types.AtomicActionTypeT = constants.ATOMIC_ACTION_TYPE_LIMIT_ALL
+
+    SCRIPTS: str = """
+    local limited = 0
+    local states = {}
+    local now = redis.call("TIME")
+    local now_ms = tonumber(now[1]) * 1000 + math.floor(tonumber(now[2]) / 1000)
+
+    -- Check all windows first, ARGV holds (period, limit, cost) for each key.
+    for i = 1, #KEYS do
+        local offset = (i - 1) * 3
+        local period = tonumber(ARGV[offset + 1])
+        local limit = tonumber(ARGV[offset + 2])
+        local cost = tonumber(ARGV[offset + 3])
+
+        local period_ms = period * 1000
+        local window = math.floor(now_ms / period_ms)
+        local current = 0
+        local previous = 0
+        local counter = redis.call("HMGET", KEYS[i], "window", "current", "previous")
+        local last_window = tonumber(counter[1])
+        if last_window == window then
+            current = tonumber(counter[2])
+            previous = tonumber(counter[3])
+        elseif last_window == window - 1 then
+            previous = tonumber(counter[2])
+        end
+
+        local current_proportion = (now_ms % period_ms) / period_ms
+        local previous_proportion = 1 - current_proportion
+        local weighted_previous = math.floor(previous_proportion * previous)
+
+        local retry_after = 0
+        local used = weighted_previous + current
+        if used + cost > limit and cost ~= 0 then
+            limited = 1
+            if cost <= weighted_previous then
+                retry_after = previous_proportion * period * cost / weighted_previous
+            else
+                retry_after = previous_proportion * period
+            end
+        end
+        states[i] = {window, current, previous, used, cost, period, retry_after}
+    end
+
+    -- Count the request in all windows only if every window allows it.
+    local result = {limited}
+    for i = 1, #KEYS do
+        local state = states[i]
+        local used = state[4]
+        if limited == 0 then
+            used = used + state[5]
+            redis.call(
+                "HSET", KEYS[i], "window", state[1],
+                "current", state[2] + state[5], "previous", state[3]
+            )
+            redis.call("EXPIRE", KEYS[i], 2 * state[6])
+        end
+        result[2 * i] = used
+        result[2 * i + 1] = tostring(state[7])
+    end
+
+    return result
+    """
+
+    @classmethod
+    def _parse_result(cls, result: object) -> tuple[int | float, ...]:
+        # Lua script returns {limited, used_1, retry_after_1, ...}, retry_after
+        # is returned as string to keep its precision.
+        values: list[int | str] = cast("list[int | str]", result)
+        parsed: list[int | float] = [int(values[0])]
+        for index in range(1, len(values), 2):
+            parsed.extend([int(values[index]), float(values[index + 1])])
+        return tuple(parsed)
+
 
 class RedisLimitAtomicAction(RedisLimitAtomicActionSpec, store.BaseRedisAtomicAction):
     """Redis-based implementation of AtomicAction for SlidingWindowRateLimiter."""
@@ -70,14 +158,94 @@ class RedisLimitAtomicAction(RedisLimitAtomicActionSpec, store.BaseRedisAtomicAc
         keys: Sequence[types.KeyT],
         args: Sequence[types.StoreValueT] | None,
     ) -> tuple[int, int, float]:
-        limited, used, retry_after = cast(
-            "tuple[int, int, str]", self._script(keys, args)
-        )
-        return limited, used, float(retry_after)
+        return self._parse_result(self._execute_script(self._script, keys, args))
+
+    def do_many(
+        self, calls: Sequence[types.AtomicActionCallT]
+    ) -> list[tuple[int, int, float]]:
+        results: list[Any] = self._execute_script_many(self._script, calls)
+        return [self._parse_result(result) for result in results]
+
+
+class RedisLimitAllAtomicAction(
+    RedisLimitAllAtomicActionSpec, store.BaseRedisAtomicAction
+):
+    """Redis-based all-or-nothing AtomicAction for SlidingWindowRateLimiter."""
+
+    def __init__(self, backend: store.RedisStoreBackend) -> None:
+        super().__init__(backend)
+        self._script: SyncScript = self._register_script(self.SCRIPTS)
+
+    def do(
+        self,
+        keys: Sequence[types.KeyT],
+        args: Sequence[types.StoreValueT] | None,
+    ) -> tuple[int | float, ...]:
+        return self._parse_result(self._execute_script(self._script, keys, args))
 
 
 class MemoryLimitActionLogic:
-    """Pure logic shared by sync / async memory limit actions."""
+    """Pure logic shared by sync / async memory limit actions.
+
+    The counter of a key is stored as a hash of ``window`` (the index of the
+    current window), ``current`` and ``previous`` (the counts of the current
+    and the previous window), like the Redis script.
+    """
+
+    @classmethod
+    def _to_counter(
+        cls, counter: types.StoreDictValueT, period: int, now_ms: int
+    ) -> tuple[int, int, int]:
+        """Return the current window, and the counts of the current / previous one.
+
+        :param counter: The hash of the key.
+        """
+        window: int = now_ms // (period * 1000)
+        last_window: int | None = int(counter["window"]) if counter else None
+        if last_window == window:
+            return window, int(counter["current"]), int(counter["previous"])
+        if last_window == window - 1:
+            return window, 0, int(counter["current"])
+        return window, 0, 0
+
+    @classmethod
+    def _check(
+        cls, counter: tuple[int, int, int], period: int, now_ms: int
+    ) -> tuple[int, float, float]:
+        """Return the used count, the weight of the previous window and its count.
+
+        :param counter: The ``(window, current, previous)`` of the key.
+        """
+        _window, current, previous = counter
+        period_ms: int = period * 1000
+        previous_proportion: float = 1 - (now_ms % period_ms) / period_ms
+        weighted_previous: int = math.floor(previous_proportion * previous)
+        return weighted_previous + current, previous_proportion, weighted_previous
+
+    @classmethod
+    def _get_retry_after(
+        cls, cost: int, period: int, previous_proportion: float, previous: float
+    ) -> float:
+        if cost <= previous:
+            return previous_proportion * period * cost / previous
+        return previous_proportion * period
+
+    @classmethod
+    def _incr(
+        cls,
+        backend: store.BaseMemoryStoreBackend,
+        key: types.KeyT,
+        counter: tuple[int, int, int],
+        cost: int,
+        period: int,
+    ) -> None:
+        window, current, previous = counter
+        backend.hset(
+            key,
+            mapping={"window": window, "current": current + cost, "previous": previous},
+        )
+        # The counter is still used as the previous window in the next one.
+        backend.expire(key, 2 * period)
 
     @classmethod
     def _do(
@@ -88,41 +256,28 @@ class MemoryLimitActionLogic:
     ) -> tuple[int, int, float]:
         if args is None:
             raise ValueError("args is required")
-        current_key: str = keys[0]
-        previous_key: str = keys[1]
+        key: str = keys[0]
         period: int = int(args[0])
         limit: int = int(args[1])
         cost: int = int(args[2])
+        # Read the time under the lock, a time read before it could belong to
+        # the window before the one a concurrent request has already rolled to.
+        now_ms: int = int(backend.clock.time() * 1000)
 
-        current_raw: types.StoreValueT | None = backend.get(current_key)
-        current: int
-        if current_raw is None:
-            current = 0
-            # set expiration only for the first request in a new window.
-            backend.set(current_key, cost, 3 * period)
-        else:
-            current = int(current_raw)
-
-        # calculate the current window count proportion.
-        period_ms: int = period * 1000
-        current_proportion: float = (int(args[3]) % period_ms) / period_ms
-        previous_proportion: float = 1 - current_proportion
-        previous_raw: types.StoreValueT | None = backend.get(previous_key)
-        previous: int = math.floor(
-            previous_proportion * (int(previous_raw) if previous_raw is not None else 0)
+        counter: tuple[int, int, int] = cls._to_counter(
+            backend.hgetall(key), period, now_ms
         )
+        used, previous_proportion, previous = cls._check(counter, period, now_ms)
+        used += cost
 
         retry_after: float = 0.0
-        used: int = previous + current + cost
         limited: int = int(used > limit and cost != 0)
         if limited:
-            if cost <= previous:
-                retry_after = previous_proportion * period * cost / previous
-            else:
-                retry_after = previous_proportion * period
+            retry_after = cls._get_retry_after(
+                cost, period, previous_proportion, previous
+            )
         else:
-            # increment the current key by cost.
-            backend.get_client()[current_key] = current + cost
+            cls._incr(backend, key, counter, cost, period)
 
         return limited, used, retry_after
 
@@ -133,6 +288,67 @@ class MemoryLimitAtomicAction(MemoryLimitActionLogic, store.BaseMemoryAtomicActi
     TYPE: types.AtomicActionTypeT = constants.ATOMIC_ACTION_TYPE_LIMIT
 
 
+class MemoryLimitAllActionLogic:
+    """Pure logic shared by sync / async memory limit-all actions."""
+
+    @classmethod
+    def _do(
+        cls,
+        backend: store.BaseMemoryStoreBackend,
+        keys: Sequence[types.KeyT],
+        args: Sequence[types.StoreValueT] | None,
+    ) -> tuple[int | float, ...]:
+        if args is None:
+            raise ValueError("args is required")
+        limited: int = 0
+        states: list[tuple[tuple[int, int, int], int, float]] = []
+        now_ms: int = int(backend.clock.time() * 1000)
+
+        # Check all windows first, args holds (period, limit, cost) for each key.
+        for index, key in enumerate(keys):
+            period: int = int(args[index * 3])
+            limit: int = int(args[index * 3 + 1])
+            cost: int = int(args[index * 3 + 2])
+
+            counter: tuple[int, int, int] = MemoryLimitActionLogic._to_counter(
+                backend.hgetall(key), period, now_ms
+            )
+            used, previous_proportion, previous = MemoryLimitActionLogic._check(
+                counter, period, now_ms
+            )
+
+            retry_after: float = 0.0
+            if used + cost > limit and cost != 0:
+                limited = 1
+                retry_after = MemoryLimitActionLogic._get_retry_after(
+                    cost, period, previous_proportion, previous
+                )
+            states.append((counter, used, retry_after))
+
+        # Count the request in all windows only if every window allows it.
+        result: list[int | float] = [limited]
+        for index, (key, (counter, used, retry_after)) in enumerate(
+            zip(keys, states, strict=True)
+        ):
+            if limited:
+                result.extend([used, retry_after])
+                continue
+
+            period = int(args[index * 3])
+            cost = int(args[index * 3 + 2])
+            MemoryLimitActionLogic._incr(backend, key, counter, cost, period)
+            result.extend([used + cost, retry_after])
+        return tuple(result)
+
+
+class MemoryLimitAllAtomicAction(
+    MemoryLimitAllActionLogic, store.BaseMemoryAtomicAction
+):
+    """Memory-based all-or-nothing AtomicAction for SlidingWindowRateLimiter."""
+
+    TYPE: types.AtomicActionTypeT = constants.ATOMIC_ACTION_TYPE_LIMIT_ALL
+
+
 class SlidingWindowRateLimiterCoreMixin(BaseRateLimiterMixin):
     """Core mixin for SlidingWindowRateLimiter."""
 
@@ -141,14 +357,46 @@ class SlidingWindowRateLimiterCoreMixin(BaseRateLimiterMixin):
 
     @classmethod
     def _supported_atomic_action_types(cls) -> Sequence[types.AtomicActionTypeT]:
-        return [constants.ATOMIC_ACTION_TYPE_LIMIT]
+        return [
+            constants.ATOMIC_ACTION_TYPE_LIMIT,
+            constants.ATOMIC_ACTION_TYPE_LIMIT_ALL,
+        ]
+
+    def _prepare(self, key: str) -> tuple[str, int, int]:
+        return (
+            self._prepare_key(key),
+            self.quota.get_period_sec(),
+            self.quota.get_limit(),
+        )
 
-    def _prepare(self, key: str) -> tuple[str, str, int, int]:
-        period: int = self.quota.get_period_sec()
-        current_idx: int = utils.now_sec() // period
-        current_key: str = self._prepare_key(f"{key}:period:{current_idx}")
-        previous_key: str = self._prepare_key(f"{key}:period:{current_idx - 1}")
-        return current_key, previous_key, period, self.quota.get_limit()
+    def _prepare_limit(
+        self, key: str, cost: int
+    ) -> tuple[list[types.KeyT], list[types.StoreValueT]]:
+        formatted_key, period, limit = self._prepare(key)
+        return [formatted_key], [period, limit, cost]
+
+    def _to_peek_state(
+        self, counter: types.StoreDictValueT, period: int, limit: int
+    ) -> RateLimitState:
+        # Peek has no server time, the window is derived from the client time.
+        now_ms: int = int(self._clock.time() * 1000)
+        used, _previous_proportion, _previous = MemoryLimitActionLogic._check(
+            MemoryLimitActionLogic._to_counter(counter, period, now_ms), period, now_ms
+        )
+        return RateLimitState(
+            limit=limit, remaining=max(0, limit - used), reset_after=period
+        )
+
+    def _to_limit_result(  # noqa: PLR6301
+        self, args: Sequence[types.StoreValueT], ret: Sequence[int | float]
+    ) -> RateLimitResult:
+        limited, used, retry_after = ret
+        period: int = int(args[0])
+        limit: int = int(args[1])
+        return RateLimitResult(
+            limited=bool(limited),
+            state_values=(limit, max(0, limit - int(used)), period, retry_after),
+        )
 
 
 class SlidingWindowRateLimiter(SlidingWindowRateLimiterCoreMixin, BaseRateLimiter):
@@ -156,31 +404,17 @@ class SlidingWindowRateLimiter(SlidingWindowRateLimiterCoreMixin, BaseRateLimite
 
     _DEFAULT_ATOMIC_ACTION_CLASSES: Sequence[type[store.BaseAtomicAction]] = (
         RedisLimitAtomicAction,
+        RedisLimitAllAtomicAction,
         MemoryLimitAtomicAction,
+        MemoryLimitAllAtomicAction,
     )
 
     def _limit(self, key: str, cost: int = 1) -> RateLimitResult:
-        current_key, previous_key, period, limit = self._prepare(key)
-        limited, used, retry_after = cast(
-            "tuple[int, int, float]",
-            self._atomic_actions[constants.ATOMIC_ACTION_TYPE_LIMIT].do(
-                [current_key, previous_key], [period, limit, cost, utils.now_ms()]
-            ),
-        )
-        return RateLimitResult(
-            limited=bool(limited),
-            state_values=(limit, max(0, limit - used), period, retry_after),
+        keys, args = self._prepare_limit(key, cost)
+        return self._to_limit_result(
+            args, self._atomic_actions[constants.ATOMIC_ACTION_TYPE_LIMIT].do(keys, args)
         )
 
     def _peek(self, key: str) -> RateLimitState:
-        current_key, previous_key, period, limit = self._prepare(key)
-        period_ms: int = period * 1000
-        current_proportion: float = (utils.now_ms() % period_ms) / period_ms
-        previous: int = math.floor(
-            (1 - current_proportion) * int(self._store.get(previous_key) or 0)
-        )
-        used: int = previous + int(self._store.get(current_key) or 0)
-
-        return RateLimitState(
-            limit=limit, remaining=max(0, limit - used), reset_after=period
-        )
+        formatted_key, period, limit = self._prepare(key)
+        return self._to_peek_state(self._store.hgetall(formatted_key), period, limit)
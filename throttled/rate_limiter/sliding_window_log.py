@@ -0,0 +1,532 @@
+import math
+from collections import deque
+from collections.abc import Sequence
+from itertools import repeat
+from typing import TYPE_CHECKING, Any, cast
+
+from .. import constants, store, types
+from . import BaseRateLimiter, BaseRateLimiterMixin, RateLimitResult, RateLimitState
+
+if TYPE_CHECKING:
+    from redis.commands.core import Script as SyncScript
+
+
+class RedisLimitAtomicActionSpec:
+    """Identity and Lua script shared by sync / async Redis sliding-window-log actions.
+
+    The log of a key is a sorted set of the requests in the window, scored by the
+    Redis server time in microseconds. Scores are formatted with ``%.0f``, as Lua
+    numbers passed to Redis commands are rounded to 14 significant digits.
+    """
+
+    TYPE: types.AtomicActionTypeT = constants.ATOMIC_ACTION_TYPE_LIMIT
+
+    SCRIPTS: str = """
+    local period = tonumber(ARGV[1])
+    local limit = tonumber(ARGV[2])
+    local cost = tonumber(ARGV[3])
+    local t = redis.call("TIME")
+    local now = tonumber(t[1]) * 1000000 + tonumber(t[2])
+    local period_us = math.floor(period * 1000000 + 0.5)
+
+    -- The window is (now - period, now].
+    redis.call(
+        "ZREMRANGEBYSCORE", KEYS[1], "-inf", string.format("%.0f", now - period_us)
+    )
+    local count = redis.call("ZCARD", KEYS[1])
+
+    local limited = 0
+    local retry_after = 0
+    local reset_after = 0
+    if cost > 0 and count + cost > limit then
+        limited = 1
+        local newest = redis.call("ZRANGE", KEYS[1], -1, -1, "WITHSCORES")
+        if newest[2] then
+            reset_after = tonumber(newest[2]) + period_us - now
+        end
+
+        -- Wait for the oldest requests to leave the window until cost fits.
+        local overflow = count + cost - limit
+        retry_after = reset_after
+        if overflow <= count then
+            local entry = redis.call(
+                "ZRANGE", KEYS[1], overflow - 1, overflow - 1, "WITHSCORES"
+            )
+            retry_after = tonumber(entry[2]) + period_us - now
+        end
+    elseif cost > 0 then
+        -- Members are unique within the same microsecond by the position in the log.
+        local score = string.format("%.0f", now)
+        for start = 1, cost, 1000 do
+            local entries = {}
+            for i = start, math.min(cost, start + 999) do
+                entries[#entries + 1] = score
+                entries[#entries + 1] = score .. ":" .. (count + i)
+            end
+            redis.call("ZADD", KEYS[1], unpack(entries))
+        end
+        redis.call("PEXPIRE", KEYS[1], math.ceil(period_us / 1000))
+        count = count + cost
+        reset_after = period_us
+    else
+        local newest = redis.call("ZRANGE", KEYS[1], -1, -1, "WITHSCORES")
+        if newest[2] then
+            reset_after = tonumber(newest[2]) + period_us - now
+        end
+    end
+
+    return {
+        limited,
+        math.max(0, limit - count),
+        tostring(reset_after / 1000000),
+        tostring(retry_after / 1000000),
+    }
+    """
+
+    @classmethod
+    def _parse_result(cls, result: object) -> tuple[int, int, float, float]:
+        limited, remaining, reset_after, retry_after = cast(
+            "tuple[int, int, str, str]", result
+        )
+        return limited, remaining, float(reset_after), float(retry_after)
+
+
+class RedisLimitAllAtomicActionSpec:
+    """Identity and Lua script shared by sync / async Redis limit-all actions."""
+
+    TYPE: types.AtomicActionTypeT = constants.ATOMIC_ACTION_TYPE_LIMIT_ALL
+
+    SCRIPTS: str = """
+    local t = redis.call("TIME")
+    local now = tonumber(t[1]) * 1000000 + tonumber(t[2])
+
+    local limited = 0
+    local logs = {}
+
+    -- Check all logs first, ARGV holds (period, limit, cost) per key.
+    for i = 1, #KEYS do
+        local offset = (i - 1) * 3
+        local period_us = math.floor(tonumber(ARGV[offset + 1]) * 1000000 + 0.5)
+        local limit = tonumber(ARGV[offset + 2])
+        local cost = tonumber(ARGV[offset + 3])
+
+        redis.call(
+            "ZREMRANGEBYSCORE", KEYS[i], "-inf", string.format("%.0f", now - period_us)
+        )
+        local count = redis.call("ZCARD", KEYS[i])
+        local overflow = 0
+        if cost > 0 and count + cost > limit then
+            limited = 1
+            overflow = count + cost - limit
+        end
+        logs[i] = {period_us, limit, cost, count, overflow}
+    end
+
+    -- Log the request in all windows only if every window allows it.
+    local score = string.format("%.0f", now)
+    local result = {limited}
+    for i = 1, #KEYS do
+        local period_us, limit, cost, count, overflow = unpack(logs[i])
+        local retry_after = 0
+        local reset_after = 0
+        if limited == 0 and cost > 0 then
+            for start = 1, cost, 1000 do
+                local entries = {}
+                for j = start, math.min(cost, start + 999) do
+                    entries[#entries + 1] = score
+                    entries[#entries + 1] = score .. ":" .. (count + j)
+                end
+                redis.call("ZADD", KEYS[i], unpack(entries))
+            end
+            redis.call("PEXPIRE", KEYS[i], math.ceil(period_us / 1000))
+            count = count + cost
+            reset_after = period_us
+        else
+            local newest = redis.call("ZRANGE", KEYS[i], -1, -1, "WITHSCORES")
+            if newest[2] then
+                reset_after = tonumber(newest[2]) + period_us - now
+            end
+            if overflow > count then
+                retry_after = reset_after
+            elseif overflow > 0 then
+                local entry = redis.call(
+                    "ZRANGE", KEYS[i], overflow - 1, overflow - 1, "WITHSCORES"
+                )
+                retry_after = tonumber(entry[2]) + period_us - now
+            end
+        end
+
+        local offset = (i - 1) * 3
+        result[offset + 2] = math.max(0, limit - count)
+        result[offset + 3] = tostring(reset_after / 1000000)
+        result[offset + 4] = tostring(retry_after / 1000000)
+    end
+
+    return result
+    """
+
+    @classmethod
+    def _parse_result(cls, result: object) -> tuple[int | float, ...]:
+        # Lua script returns {limited, (remaining, reset_after, retry_after) * n}.
+        values: list[int | str] = cast("list[int | str]", result)
+        parsed: list[int | float] = [int(values[0])]
+        for index in range(1, len(values), 3):
+            parsed.extend(
+                (
+                    int(values[index]),
+                    float(values[index + 1]),
+                    float(values[index + 2]),
+                )
+            )
+        return tuple(parsed)
+
+
+class RedisPeekAtomicActionSpec:
+    """Identity and Lua script shared by sync / async Redis peek actions."""
+
+    TYPE: types.AtomicActionTypeT = constants.ATOMIC_ACTION_TYPE_PEEK
+
+    SCRIPTS: str = """
+    local period = tonumber(ARGV[1])
+    local limit = tonumber(ARGV[2])
+    local t = redis.call("TIME")
+    local now = tonumber(t[1]) * 1000000 + tonumber(t[2])
+    local period_us = math.floor(period * 1000000 + 0.5)
+
+    -- Expired requests are left to the next limit call, peek does not write.
+    local min = string.format("(%.0f", now - period_us)
+    local count = redis.call("ZCOUNT", KEYS[1], min, "+inf")
+
+    local limited = 0
+    local retry_after = 0
+    local reset_after = 0
+    if count > 0 then
+        local newest = redis.call("ZRANGE", KEYS[1], -1, -1, "WITHSCORES")
+        reset_after = tonumber(newest[2]) + period_us - now
+    end
+    if count + 1 > limit then
+        limited = 1
+        retry_after = reset_after
+        local overflow = count + 1 - limit
+        if overflow <= count then
+            local entry = redis.call(
+                "ZRANGEBYSCORE", KEYS[1], min, "+inf", "WITHSCORES",
+                "LIMIT", overflow - 1, 1
+            )
+            retry_after = tonumber(entry[2]) + period_us - now
+        end
+    end
+
+    return {
+        limited,
+        math.max(0, limit - count),
+        tostring(reset_after / 1000000),
+        tostring(retry_after / 1000000),
+    }
+    """
+
+    @classmethod
+    def _parse_result(cls, result: object) -> tuple[int, int, float, float]:
+        limited, remaining, reset_after, retry_after = cast(
+            "tuple[int, int, str, str]", result
+        )
+        return limited, remaining, float(reset_after), float(retry_after)
+
+
+class RedisLimitAtomicAction(RedisLimitAtomicActionSpec, store.BaseRedisAtomicAction):
+    """Redis-based implementation of AtomicAction for SlidingWindowLogRateLimiter."""
+
+    def __init__(self, backend: store.RedisStoreBackend) -> None:
+        super().__init__(backend)
+        self._script: SyncScript = self._register_script(self.SCRIPTS)
+
+    def do(
+        self,
+        keys: Sequence[types.KeyT],
+        args: Sequence[types.StoreValueT] | None,
+    ) -> tuple[int, int, float, float]:
+        return self._parse_result(self._execute_script(self._script, keys, args))
+
+    def do_many(
+        self, calls: Sequence[types.AtomicActionCallT]
+    ) -> list[tuple[int, int, float, float]]:
+        results: list[Any] = self._execute_script_many(self._script, calls)
+        return [self._parse_result(result) for result in results]
+
+
+class RedisLimitAllAtomicAction(
+    RedisLimitAllAtomicActionSpec, store.BaseRedisAtomicAction
+):
+    """Redis-based all-or-nothing AtomicAction for SlidingWindowLogRateLimiter."""
+
+    def __init__(self, backend: store.RedisStoreBackend) -> None:
+        super().__init__(backend)
+        self._script: SyncScript = self._register_script(self.SCRIPTS)
+
+    def do(
+        self,
+        keys: Sequence[types.KeyT],
+        args: Sequence[types.StoreValueT] | None,
+    ) -> tuple[int | float, ...]:
+        return self._parse_result(self._execute_script(self._script, keys, args))
+
+
+class RedisPeekAtomicAction(RedisPeekAtomicActionSpec, store.BaseRedisAtomicAction):
+    """Redis-based AtomicAction for SlidingWindowLogRateLimiter's peek operation."""
+
+    def __init__(self, backend: store.RedisStoreBackend) -> None:
+        super().__init__(backend)
+        self._script: SyncScript = self._register_script(self.SCRIPTS)
+
+    def do(
+        self,
+        keys: Sequence[types.KeyT],
+        args: Sequence[types.StoreValueT] | None,
+    ) -> tuple[int, int, float, float]:
+        return self._parse_result(self._execute_script(self._script, keys, args))
+
+
+class MemoryLimitActionLogic:
+    """Pure logic shared by sync / async memory limit actions.
+
+    The log of a key is a deque of the monotonic times of the requests in the
+    window, in ascending order. A request is only logged if it is allowed, so
+    the deque is bounded to ``limit`` entries.
+    """
+
+    @classmethod
+    def _get_log(
+        cls,
+        backend: store.BaseMemoryStoreBackend,
+        key: types.KeyT,
+        period: float,
+        limit: int,
+        now: float,
+    ) -> deque[float]:
+        """Return the log of ``key`` without the requests that left the window."""
+        log: deque[float] | None = backend.get_log(key)
+        if log is None or log.maxlen != limit:
+            # The limit of the key has changed, keep the newest requests.
+            log = deque(log or (), maxlen=limit)
+
+        boundary: float = now - period
+        while log and log[0] <= boundary:
+            log.popleft()
+        return log
+
+    @classmethod
+    def _check(
+        cls, log: deque[float], period: float, limit: int, cost: int, now: float
+    ) -> tuple[int, float, float]:
+        """Return whether ``cost`` is limited, and the reset / retry after of the log.
+
+        :param log: The log of the key, returned by :meth:`_get_log`.
+        """
+        reset_after: float = log[-1] + period - now if log else 0.0
+        if cost <= 0 or len(log) + cost <= limit:
+            return 0, reset_after, 0.0
+
+        # Wait for the oldest requests to leave the window until cost fits.
+        overflow: int = len(log) + cost - limit
+        if overflow > len(log):
+            return 1, reset_after, reset_after
+        return 1, reset_after, log[overflow - 1] + period - now
+
+    @classmethod
+    def _do(
+        cls,
+        backend: store.BaseMemoryStoreBackend,
+        keys: Sequence[types.KeyT],
+        args: Sequence[types.StoreValueT] | None,
+    ) -> tuple[int, int, float, float]:
+        if args is None:
+            raise ValueError("args is required")
+        key: str = keys[0]
+        period: float = float(args[0])
+        limit: int = int(args[1])
+        cost: int = int(args[2])
+
+        now: float = backend.clock.monotonic()
+        log: deque[float] = cls._get_log(backend, key, period, limit, now)
+        limited, reset_after, retry_after = cls._check(log, period, limit, cost, now)
+        if not limited and cost > 0:
+            log.extend(repeat(now, cost))
+            backend.set_log(key, log, math.ceil(period))
+            reset_after = period
+        return limited, max(0, limit - len(log)), reset_after, retry_after
+
+
+class MemoryLimitAtomicAction(MemoryLimitActionLogic, store.BaseMemoryAtomicAction):
+    """Memory-based implementation of AtomicAction for SlidingWindowLogRateLimiter."""
+
+    TYPE: types.AtomicActionTypeT = constants.ATOMIC_ACTION_TYPE_LIMIT
+
+
+class MemoryLimitAllActionLogic:
+    """Pure logic shared by sync / async memory limit-all actions."""
+
+    @classmethod
+    def _do(
+        cls,
+        backend: store.BaseMemoryStoreBackend,
+        keys: Sequence[types.KeyT],
+        args: Sequence[types.StoreValueT] | None,
+    ) -> tuple[int | float, ...]:
+        if args is None:
+            raise ValueError("args is required")
+        now: float = backend.clock.monotonic()
+        limited: int = 0
+        states: list[tuple[deque[float], float, int, float, float]] = []
+
+        # Check all logs first, args holds (period, limit, cost) for each key.
+        for index, key in enumerate(keys):
+            period: float = float(args[index * 3])
+            limit: int = int(args[index * 3 + 1])
+            cost: int = int(args[index * 3 + 2])
+
+            log: deque[float] = MemoryLimitActionLogic._get_log(
+                backend, key, period, limit, now
+            )
+            key_limited, reset_after, retry_after = MemoryLimitActionLogic._check(
+                log, period, limit, cost, now
+            )
+            limited |= key_limited
+            states.append((log, period, cost, reset_after, retry_after))
+
+        # Log the request in all windows only if every window allows it.
+        result: list[int | float] = [limited]
+        for index, (key, (log, period, cost, reset_after, retry_after)) in enumerate(
+            zip(keys, states, strict=True)
+        ):
+            limit = int(args[index * 3 + 1])
+            if limited or cost <= 0:
+                result.extend((max(0, limit - len(log)), reset_after, retry_after))
+                continue
+
+            log.extend(repeat(now, cost))
+            backend.set_log(key, log, math.ceil(period))
+            result.extend((max(0, limit - len(log)), period, retry_after))
+        return tuple(result)
+
+
+class MemoryLimitAllAtomicAction(
+    MemoryLimitAllActionLogic, store.BaseMemoryAtomicAction
+):
+    """Memory-based all-or-nothing AtomicAction for SlidingWindowLogRateLimiter."""
+
+    TYPE: types.AtomicActionTypeT = constants.ATOMIC_ACTION_TYPE_LIMIT_ALL
+
+
+class MemoryPeekActionLogic:
+    """Pure logic shared by sync / async memory peek actions."""
+
+    @classmethod
+    def _do(
+        cls,
+        backend: store.BaseMemoryStoreBackend,
+        keys: Sequence[types.KeyT],
+        args: Sequence[types.StoreValueT] | None,
+    ) -> tuple[int, int, float, float]:
+        if args is None:
+            raise ValueError("args is required")
+        period: float = float(args[0])
+        limit: int = int(args[1])
+
+        now: float = backend.clock.monotonic()
+        log: deque[float] = MemoryLimitActionLogic._get_log(
+            backend, keys[0], period, limit, now
+        )
+        limited, reset_after, retry_after = MemoryLimitActionLogic._check(
+            log, period, limit, 1, now
+        )
+        return limited, max(0, limit - len(log)), reset_after, retry_after
+
+
+class MemoryPeekAtomicAction(MemoryPeekActionLogic, store.BaseMemoryAtomicAction):
+    """Memory-based AtomicAction for SlidingWindowLogRateLimiter's peek operation."""
+
+    TYPE: types.AtomicActionTypeT = constants.ATOMIC_ACTION_TYPE_PEEK
+
+
+class SlidingWindowLogRateLimiterCoreMixin(BaseRateLimiterMixin):
+    """Core mixin for SlidingWindowLogRateLimiter."""
+
+    _SUB_SECOND_PERIOD: bool = True
+
+    class Meta(BaseRateLimiterMixin.Meta):
+        type: types.RateLimiterTypeT = constants.RateLimiterType.SLIDING_WINDOW_LOG.value
+
+    @classmethod
+    def _supported_atomic_action_types(cls) -> Sequence[types.AtomicActionTypeT]:
+        return [
+            constants.ATOMIC_ACTION_TYPE_LIMIT,
+            constants.ATOMIC_ACTION_TYPE_LIMIT_ALL,
+            constants.ATOMIC_ACTION_TYPE_PEEK,
+        ]
+
+    def _prepare(self, key: str) -> tuple[str, float, int]:
+        return self._prepare_key(key), self.quota.period_sec_f, self.quota.get_limit()
+
+    def _prepare_limit(
+        self, key: str, cost: int
+    ) -> tuple[list[types.KeyT], list[types.StoreValueT]]:
+        formatted_key, period, limit = self._prepare(key)
+        return [formatted_key], [period, limit, cost]
+
+    def _to_limit_result(  # noqa: PLR6301
+        self, args: Sequence[types.StoreValueT], ret: Sequence[int | float]
+    ) -> RateLimitResult:
+        limited, remaining, reset_after, retry_after = ret
+        return RateLimitResult(
+            limited=bool(limited),
+            state_values=(int(args[1]), int(remaining), reset_after, retry_after),
+        )
+
+    def _get_denied_for(  # noqa: PLR6301
+        self,
+        result: RateLimitResult,
+        started_at: float,  # noqa: ARG002
+    ) -> float:
+        # Logged requests leave the window at known times and a denied cost only
+        # fits once they do, so retry_after is exact.
+        return result.state.retry_after
+
+
+class SlidingWindowLogRateLimiter(SlidingWindowLogRateLimiterCoreMixin, BaseRateLimiter):
+    """Concrete implementation of BaseRateLimiter using sliding window log as algorithm.
+
+    Unlike :class:`SlidingWindowRateLimiter`, which weights the count of the
+    previous window, every allowed request is logged, so the limit is exact over
+    any window of ``period``, at the cost of keeping up to ``limit`` entries per
+    key in the store.
+    """
+
+    _DEFAULT_ATOMIC_ACTION_CLASSES: Sequence[type[store.BaseAtomicAction]] = (
+        RedisPeekAtomicAction,
+        RedisLimitAtomicAction,
+        RedisLimitAllAtomicAction,
+        MemoryLimitAtomicAction,
+        MemoryLimitAllAtomicAction,
+        MemoryPeekAtomicAction,
+    )
+
+    def _limit(self, key: str, cost: int = 1) -> RateLimitResult:
+        keys, args = self._prepare_limit(key, cost)
+        return self._to_limit_result(
+            args, self._atomic_actions[constants.ATOMIC_ACTION_TYPE_LIMIT].do(keys, args)
+        )
+
+    def _peek(self, key: str) -> RateLimitState:
+        formatted_key, period, limit = self._prepare(key)
+        _limited, remaining, reset_after, retry_after = cast(
+            "tuple[int, int, float, float]",
+            self._atomic_actions[constants.ATOMIC_ACTION_TYPE_PEEK].do(
+                [formatted_key], [period, limit]
+            ),
+        )
+        return RateLimitState(
+            limit=limit,
+            remaining=remaining,
+            reset_after=reset_after,
+            retry_after=retry_after,
+        )
@@ -1,8 +1,8 @@
 import math
 from collections.abc import Sequence
-from typing import TYPE_CHECKING, cast
+from typing import TYPE_CHECKING, Any, cast
 
-from .. import constants, store, types, utils
+from .. import constants, store, types
 from . import BaseRateLimiter, BaseRateLimiterMixin, RateLimitResult, RateLimitState
 
 if TYPE_CHECKING:
@@ -18,7 +18,8 @@ class RedisLimitAtomicActionSpec:
     local rate = tonumber(ARGV[1])
     local capacity = tonumber(ARGV[2])
     local cost = tonumber(ARGV[3])
-    local now = tonumber(redis.call("TIME")[1])
+    local now = redis.call("TIME")
+    now = tonumber(now[1]) + tonumber(now[2]) / 1000000
 
     local last_tokens = capacity
     local last_refreshed = now
@@ -30,21 +31,86 @@ class RedisLimitAtomicActionSpec:
     end
 
     local time_elapsed = math.max(0, now - last_refreshed)
-    local tokens = math.min(capacity, last_tokens + (math.floor(time_elapsed * rate)))
+    local tokens = math.min(capacity, last_tokens + time_elapsed * rate)
 
     local limited = cost > tokens
     if limited then
-        return {limited, tokens}
+        return {limited, tostring(tokens)}
     end
 
     tokens = tokens - cost
     local fill_time = capacity / rate
     redis.call("HSET", KEYS[1], "tokens", tokens, "last_refreshed", now)
-    redis.call("EXPIRE", KEYS[1], math.floor(2 * fill_time))
+    redis.call("EXPIRE", KEYS[1], math.max(1, math.ceil(2 * fill_time)))
 
-    return {limited, tokens}
+    return {limited, tostring(tokens)}
     """
 
+    @classmethod
+    def _parse_result(cls, result: object) -> tuple[int, float]:
+        # Lua script returns {limited, tostring(tokens)}, as Lua numbers are
+        # truncated to integers in replies; redis-py types this as Any.
+        limited, tokens = cast("tuple[int, bytes | str]", result)
+        return limited, float(tokens)
+
+
+class RedisLimitAllAtomicActionSpec:
+    """Identity and Lua script shared by sync / async Redis limit-all actions."""
+
+    TYPE: types.AtomicActionTypeT = constants.ATOMIC_ACTION_TYPE_LIMIT_ALL
+
+    SCRIPTS: str = """
+    local now = redis.call("TIME")
+    now = tonumber(now[1]) + tonumber(now[2]) / 1000000
+    local limited = 0
+    local buckets = {}
+
+    -- Check all buckets first, ARGV holds (rate, capacity, cost) for each key.
+    for i = 1, #KEYS do
+        local offset = (i - 1) * 3
+        local rate = tonumber(ARGV[offset + 1])
+        local capacity = tonumber(ARGV[offset + 2])
+        local cost = tonumber(ARGV[offset + 3])
+
+        local last_tokens = capacity
+        local last_refreshed = now
+        local bucket = redis.call("HMGET", KEYS[i], "tokens", "last_refreshed")
+        if bucket[1] ~= false then
+            last_tokens = tonumber(bucket[1])
+            last_refreshed = tonumber(bucket[2])
+        end
+
+        local time_elapsed = math.max(0, now - last_refreshed)
+        local tokens = math.min(capacity, last_tokens + time_elapsed * rate)
+        if cost > tokens then
+            limited = 1
+        end
+        buckets[i] = {rate, capacity, cost, tokens}
+    end
+
+    -- Consume from all buckets only if every bucket has enough tokens.
+    local result = {limited}
+    for i = 1, #KEYS do
+        local tokens = buckets[i][4]
+        if limited == 0 then
+            local rate = buckets[i][1]
+            tokens = tokens - buckets[i][3]
+            redis.call("HSET", KEYS[i], "tokens", tokens, "last_refreshed", now)
+            local fill_time = buckets[i][2] / rate
+            redis.call("EXPIRE", KEYS[i], math.max(1, math.ceil(2 * fill_time)))
+        end
+        result[i + 1] = tostring(tokens)
+    end
+
+    return result
+    """
+
+    @classmethod
+    def _parse_result(cls, result: object) -> tuple[int | float, ...]:
+        # Lua script returns {limited, tostring(tokens_1), ..., tostring(tokens_n)}.
+        limited, *tokens = cast("list[int | bytes | str]", result)
+        return (int(limited), *(float(value) for value in tokens))
+
 
 class RedisLimitAtomicAction(RedisLimitAtomicActionSpec, store.BaseRedisAtomicAction):
     """Redis-based implementation of AtomicAction for TokenBucketRateLimiter."""
@@ -57,47 +123,135 @@ class RedisLimitAtomicAction(RedisLimitAtomicActionSpec, store.BaseRedisAtomicAc
         self,
         keys: Sequence[types.KeyT],
         args: Sequence[types.StoreValueT] | None,
-    ) -> tuple[int, int]:
-        # Lua script returns {limited, tokens}; redis-py types this as Any.
-        limited, tokens = cast("tuple[int, int]", self._script(keys, args))
-        return limited, tokens
+    ) -> tuple[int, float]:
+        return self._parse_result(self._execute_script(self._script, keys, args))
+
+    def do_many(
+        self, calls: Sequence[types.AtomicActionCallT]
+    ) -> list[tuple[int, float]]:
+        results: list[Any] = self._execute_script_many(self._script, calls)
+        return [self._parse_result(result) for result in results]
+
+
+class RedisLimitAllAtomicAction(
+    RedisLimitAllAtomicActionSpec, store.BaseRedisAtomicAction
+):
+    """Redis-based all-or-nothing AtomicAction for TokenBucketRateLimiter."""
+
+    def __init__(self, backend: store.RedisStoreBackend) -> None:
+        super().__init__(backend)
+        self._script: SyncScript = self._register_script(self.SCRIPTS)
+
+    def do(
+        self,
+        keys: Sequence[types.KeyT],
+        args: Sequence[types.StoreValueT] | None,
+    ) -> tuple[int | float, ...]:
+        return self._parse_result(self._execute_script(self._script, keys, args))
 
 
 class MemoryLimitActionLogic:
     """Pure logic shared by sync / async memory limit actions."""
 
+    @classmethod
+    def _to_tokens(
+        cls, bucket: types.StoreDictValueT, now: float, rate: float, capacity: int
+    ) -> float:
+        """Return the tokens in ``bucket`` after refilling up to ``now``."""
+        last_tokens: float = float(bucket.get("tokens", capacity))
+        last_refreshed: float = float(bucket.get("last_refreshed", now))
+
+        time_elapsed: float = max(0.0, now - last_refreshed)
+        return min(capacity, last_tokens + time_elapsed * rate)
+
+    @classmethod
+    def _get_tokens(
+        cls,
+        backend: store.BaseMemoryStoreBackend,
+        key: types.KeyT,
+        now: float,
+        rate: float,
+        capacity: int,
+    ) -> float:
+        """Return the tokens in the bucket after refilling up to ``now``."""
+        return cls._to_tokens(backend.hgetall(key), now, rate, capacity)
+
+    @classmethod
+    def _set_tokens(
+        cls,
+        backend: store.BaseMemoryStoreBackend,
+        key: types.KeyT,
+        now: float,
+        tokens: float,
+        fill_time: float,
+    ) -> None:
+        backend.hset(key, mapping={"tokens": tokens, "last_refreshed": now})
+        backend.expire(key, math.ceil(2 * fill_time))
+
     @classmethod
     def _do(
         cls,
         backend: store.BaseMemoryStoreBackend,
         keys: Sequence[types.KeyT],
         args: Sequence[types.StoreValueT] | None,
-    ) -> tuple[int, int]:
+    ) -> tuple[int, float]:
         if args is None:
             raise ValueError("args is required")
         key: str = keys[0]
-        now: int = utils.now_sec()
+        now: float = backend.clock.time()
         rate: float = float(args[0])
         capacity: int = int(args[1])
         cost: int = int(args[2])
-        bucket: types.StoreDictValueT = backend.hgetall(key)
-        last_tokens: int = int(bucket.get("tokens", capacity))
-        last_refreshed: int = int(bucket.get("last_refreshed", now))
-
-        time_elapsed: int = max(0, now - last_refreshed)
-        tokens: int = min(capacity, last_tokens + (math.floor(time_elapsed * rate)))
+        tokens: float = cls._get_tokens(backend, key, now, rate, capacity)
 
         limited: int = int(tokens < cost)
         if limited:
             return limited, tokens
 
         tokens -= cost
-        backend.hset(key, mapping={"tokens": tokens, "last_refreshed": now})
+        cls._set_tokens(backend, key, now, tokens, capacity / rate)
+        return limited, tokens
 
-        fill_time: float = capacity / rate
-        backend.expire(key, math.ceil(2 * fill_time))
 
-        return limited, tokens
+class MemoryLimitAllActionLogic:
+    """Pure logic shared by sync / async memory limit-all actions."""
+
+    @classmethod
+    def _do(
+        cls,
+        backend: store.BaseMemoryStoreBackend,
+        keys: Sequence[types.KeyT],
+        args: Sequence[types.StoreValueT] | None,
+    ) -> tuple[int | float, ...]:
+        if args is None:
+            raise ValueError("args is required")
+        now: float = backend.clock.time()
+        limited: int = 0
+        buckets: list[tuple[float, int, int, float]] = []
+
+        # Check all buckets first, args holds (rate, capacity, cost) for each key.
+        for index, key in enumerate(keys):
+            rate: float = float(args[index * 3])
+            capacity: int = int(args[index * 3 + 1])
+            cost: int = int(args[index * 3 + 2])
+            tokens: float = MemoryLimitActionLogic._get_tokens(
+                backend, key, now, rate, capacity
+            )
+            limited |= int(tokens < cost)
+            buckets.append((rate, capacity, cost, tokens))
+
+        # Consume from all buckets only if every bucket has enough tokens.
+        result: list[int | float] = [limited]
+        for key, (rate, capacity, cost, tokens) in zip(keys, buckets, strict=True):
+            if limited:
+                result.append(tokens)
+                continue
+
+            MemoryLimitActionLogic._set_tokens(
+                backend, key, now, tokens - cost, capacity / rate
+            )
+            result.append(tokens - cost)
+        return tuple(result)
 
 
 class MemoryLimitAtomicAction(MemoryLimitActionLogic, store.BaseMemoryAtomicAction):
@@ -106,35 +260,72 @@ class MemoryLimitAtomicAction(MemoryLimitActionLogic, store.BaseMemoryAtomicActi
     TYPE: types.AtomicActionTypeT = constants.ATOMIC_ACTION_TYPE_LIMIT
 
 
+class MemoryLimitAllAtomicAction(
+    MemoryLimitAllActionLogic, store.BaseMemoryAtomicAction
+):
+    """Memory-based all-or-nothing AtomicAction for TokenBucketRateLimiter."""
+
+    TYPE: types.AtomicActionTypeT = constants.ATOMIC_ACTION_TYPE_LIMIT_ALL
+
+
 class TokenBucketRateLimiterCoreMixin(BaseRateLimiterMixin):
     """Core mixin for TokenBucketRateLimiter."""
 
+    _SUB_SECOND_PERIOD: bool = True
+
     class Meta(BaseRateLimiterMixin.Meta):
         type: types.RateLimiterTypeT = constants.RateLimiterType.TOKEN_BUCKET.value
 
     @classmethod
     def _supported_atomic_action_types(cls) -> Sequence[types.AtomicActionTypeT]:
-        return [constants.ATOMIC_ACTION_TYPE_LIMIT]
+        return [
+            constants.ATOMIC_ACTION_TYPE_LIMIT,
+            constants.ATOMIC_ACTION_TYPE_LIMIT_ALL,
+        ]
 
     def _prepare(self, key: str) -> tuple[str, float, int]:
         return self._prepare_key(key), self.quota.fill_rate, self.quota.burst
 
-    def _refill_sec(self, upper: int, remaining: int) -> int:
+    def _prepare_limit(
+        self, key: str, cost: int
+    ) -> tuple[list[types.KeyT], list[types.StoreValueT]]:
+        formatted_key, rate, capacity = self._prepare(key)
+        return [formatted_key], [rate, capacity, cost]
+
+    def _to_limit_result(
+        self, args: Sequence[types.StoreValueT], ret: Sequence[int | float]
+    ) -> RateLimitResult:
+        limited, tokens = ret
+        return self._to_result(bool(limited), int(args[2]), tokens, int(args[1]))
+
+    def _refill_sec(self, upper: int, tokens: float) -> float:
         """Calculate the time in seconds until the bucket reaches the upper limit."""
-        if remaining >= upper:
+        if tokens >= upper:
             return 0
-        return math.ceil((upper - remaining) / self.quota.fill_rate)
+        return (upper - tokens) / self.quota.fill_rate
 
     def _to_result(
-        self, limited: int, cost: int, tokens: int, capacity: int
+        self, limited: int, cost: int, tokens: float, capacity: int
     ) -> RateLimitResult:
         """Convert the limiting result to a RateLimitResult."""
-        reset_after: int = self._refill_sec(capacity, tokens)
+        reset_after: float = self._refill_sec(capacity, tokens)
         # When the tokens are filled to the cost, it can be retried.
-        retry_after: int = self._refill_sec(cost, tokens) if limited else 0
+        retry_after: float = self._refill_sec(cost, tokens) if limited else 0
         return RateLimitResult(
             limited=bool(limited),
-            state_values=(capacity, tokens, reset_after, retry_after),
+            # Only whole tokens can be consumed.
+            state_values=(capacity, math.floor(tokens), reset_after, retry_after),
+        )
+
+    def _to_peek_state(self, bucket: types.StoreDictValueT) -> RateLimitState:
+        capacity: int = self.quota.burst
+        tokens: float = MemoryLimitActionLogic._to_tokens(
+            bucket, self._clock.time(), self.quota.fill_rate, capacity
+        )
+        return RateLimitState(
+            limit=capacity,
+            remaining=math.floor(tokens),
+            reset_after=self._refill_sec(capacity, tokens),
         )
 
 
@@ -143,29 +334,16 @@ class TokenBucketRateLimiter(TokenBucketRateLimiterCoreMixin, BaseRateLimiter):
 
     _DEFAULT_ATOMIC_ACTION_CLASSES: Sequence[type[store.BaseAtomicAction]] = (
         RedisLimitAtomicAction,
+        RedisLimitAllAtomicAction,
         MemoryLimitAtomicAction,
+        MemoryLimitAllAtomicAction,
     )
 
     def _limit(self, key: str, cost: int = 1) -> RateLimitResult:
-        formatted_key, rate, capacity = self._prepare(key)
-        limited, tokens = cast(
-            "tuple[int, int]",
-            self._atomic_actions[constants.ATOMIC_ACTION_TYPE_LIMIT].do(
-                [formatted_key], [rate, capacity, cost]
-            ),
+        keys, args = self._prepare_limit(key, cost)
+        return self._to_limit_result(
+            args, self._atomic_actions[constants.ATOMIC_ACTION_TYPE_LIMIT].do(keys, args)
         )
-        return self._to_result(limited, cost, tokens, capacity)
 
     def _peek(self, key: str) -> RateLimitState:
-        now: int = utils.now_sec()
-        formatted_key, rate, capacity = self._prepare(key)
-
-        bucket: types.StoreDictValueT = self._store.hgetall(formatted_key)
-        last_tokens: int = int(bucket.get("tokens", capacity))
-        last_refreshed: int = int(bucket.get("last_refreshed", now))
-
-        time_elapsed: int = max(0, now - last_refreshed)
-        tokens: int = min(capacity, last_tokens + (math.floor(time_elapsed * rate)))
-        reset_after: int = math.ceil((capacity - tokens) / rate)
-
-        return RateLimitState(limit=capacity, remaining=tokens, reset_after=reset_after)
+        return self._to_peek_state(self._store.hgetall(self._prepare_key(key)))
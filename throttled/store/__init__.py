@@ -5,6 +5,7 @@ from .base import (
     BaseStore,
     BaseStoreBackend,
 )
+from .client_cache import ClientCache, ClientCacheStats
 from .memory import (
     BaseMemoryAtomicAction,
     BaseMemoryStoreBackend,
@@ -16,11 +17,13 @@ from .redis import (
     BaseRedisStoreBackend,
     RedisStore,
     RedisStoreBackend,
+    ScriptRegistry,
 )
 from .redis_pool import (
     BaseConnectionFactory,
     ClusterConnectionFactory,
     ConnectionFactory,
+    PoolStats,
     SentinelConnectionFactory,
     get_connection_factory,
 )
@@ -37,9 +40,13 @@ __all__ = [
     "BaseRedisAtomicAction",
     "RedisStoreBackend",
     "RedisStore",
+    "ScriptRegistry",
     "BaseConnectionFactory",
     "ConnectionFactory",
     "SentinelConnectionFactory",
     "ClusterConnectionFactory",
     "get_connection_factory",
+    "PoolStats",
+    "ClientCache",
+    "ClientCacheStats",
 ]
@@ -2,7 +2,8 @@ import abc
 from collections.abc import Sequence
 from typing import Any
 
-from .. import exceptions, types
+from .. import constants, exceptions, types
+from ..clock import Clock, SystemClock
 from .wraps import AutoWrapMethodsMixin
 
 
@@ -19,6 +20,19 @@ class BaseStoreBackend:
         self.server: str | None = server
         self.options: dict[str, Any] = options or {}
 
+        self.key_layout: str = self.options.get(
+            "KEY_LAYOUT", constants.KeyLayout.PLAIN.value
+        )
+        if self.key_layout not in constants.KeyLayout.choice():
+            raise exceptions.SetUpError(
+                f"KEY_LAYOUT must be one of {', '.join(constants.KeyLayout.choice())}"
+            )
+
+        clock: Clock | None = self.options.get("CLOCK")
+        if not (clock is None or isinstance(clock, Clock)):
+            raise exceptions.SetUpError("CLOCK must be an instance of Clock")
+        self.clock: Clock = clock or SystemClock()
+
 
 class BaseAtomicAction(AutoWrapMethodsMixin, abc.ABC):
     """Abstract class for all atomic actions performed by a store backend."""
@@ -26,7 +40,7 @@ class BaseAtomicAction(AutoWrapMethodsMixin, abc.ABC):
     TYPE: types.AtomicActionTypeT = ""
     STORE_TYPE: str = ""
 
-    _WRAPPED_METHOD_NAMES: tuple[str, ...] = ("do",)
+    _WRAPPED_METHOD_NAMES: tuple[str, ...] = ("do", "do_many")
 
     def __init__(self, backend: BaseStoreBackend) -> None:
         self._backend = backend
@@ -45,6 +59,19 @@ class BaseAtomicAction(AutoWrapMethodsMixin, abc.ABC):
         """
         raise NotImplementedError
 
+    def do_many(
+        self, calls: Sequence[types.AtomicActionCallT]
+    ) -> Sequence[tuple[int | float, ...]]:
+        """Execute the AtomicAction once for each ``(keys, args)`` pair.
+
+        The default implementation calls :meth:`do` one by one, store backends
+        override it to execute the whole batch in a single round trip.
+
+        :param calls: A sequence of ``(keys, args)`` pairs.
+        :return: The results of the AtomicAction, in the same order as ``calls``.
+        """
+        return [self.do(keys, args) for keys, args in calls]
+
 
 class StoreSpec:
     """Shared identity and wrapped-command declaration for stores."""
@@ -52,6 +79,12 @@ class StoreSpec:
     # Unique identifier for the type of store.
     TYPE: str = ""
 
+    #: How rate limiters lay out their keys, see ``KEY_LAYOUT``.
+    key_layout: str = constants.KeyLayout.PLAIN.value
+
+    #: The clock that the store and the rate limiters on it read, see ``CLOCK``.
+    clock: Clock
+
     _WRAPPED_METHOD_NAMES: tuple[str, ...] = (
         "exists",
         "ttl",
@@ -103,6 +136,8 @@ class BaseStore(StoreSpec, StoreValidationLogic, AutoWrapMethodsMixin, abc.ABC):
         self.server: str | None = server
         self.options: dict[str, Any] = options or {}
         self._backend = self._BACKEND_CLASS(server, options)
+        self.key_layout = self._backend.key_layout
+        self.clock = self._backend.clock
 
     def make_atomic(self, action_cls: type[BaseAtomicAction]) -> BaseAtomicAction:
         """Create an AtomicAction instance bound to the concrete store backend."""
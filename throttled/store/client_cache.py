@@ -0,0 +1,209 @@
+import threading
+from collections import OrderedDict
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
+
+from .. import exceptions, types
+
+
+@dataclass(frozen=True)
+class ClientCacheStats:
+    """ClientCacheStats is a snapshot of the statistics of a client cache."""
+
+    #: The number of reads answered by the cache.
+    hits: int
+
+    #: The number of reads sent to Redis.
+    misses: int
+
+    #: The number of keys in the cache.
+    size: int
+
+    #: The maximum number of keys in the cache.
+    max_size: int
+
+    #: Whether the cache is in sync with Redis and serves reads.
+    enabled: bool
+
+
+class _Entry:
+    """Values of the read commands of a key, e.g. ``{"get": b"1"}``."""
+
+    __slots__ = ("values",)
+
+    def __init__(self) -> None:
+        self.values: dict[str, object] = {}
+
+
+class ClientCache:
+    """Bounded local cache of Redis reads, invalidated by the server.
+
+    A :class:`ClientCache` is filled by the ``get`` / ``hgetall`` calls of a
+    :class:`throttled.store.RedisStore`, and keys are dropped as soon as Redis
+    reports them as changed (``CLIENT TRACKING``), so a read is answered
+    locally until the key changes.
+
+    Reads only start to be cached once the cache is enabled, i.e. once the
+    invalidation channel is set up, and the cache is cleared whenever the
+    channel is lost. The least recently read keys are dropped once
+    ``max_size`` is reached.
+    """
+
+    def __init__(
+        self, max_size: int = 10000, prefixes: Sequence[str] = ("throttled:",)
+    ) -> None:
+        """Initializes the cache.
+
+        :param max_size: The maximum number of keys to cache, default: 10000.
+        :param prefixes: Only keys with one of these prefixes are cached,
+            an empty prefix caches all keys.
+        """
+        if not (isinstance(max_size, int) and max_size > 0):
+            raise exceptions.SetUpError("max_size must be a positive integer")
+
+        self.max_size: int = max_size
+        self.prefixes: tuple[str, ...] = tuple(prefixes)
+        self._entries: OrderedDict[str, _Entry] = OrderedDict()
+        self._lock: threading.Lock = threading.Lock()
+        self._enabled: bool = False
+        self._hits: int = 0
+        self._misses: int = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def is_cachable(self, key: types.KeyT) -> bool:
+        """Return whether reads of ``key`` are cached."""
+        return key.startswith(self.prefixes)
+
+    def get(self, command: str, key: types.KeyT) -> tuple[bool, object]:
+        """Return ``(hit, value)`` of the cached ``command`` read of ``key``."""
+        with self._lock:
+            entry: _Entry | None = self._entries.get(key)
+            if entry is not None and command in entry.values:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return True, entry.values[command]
+
+            self._misses += 1
+            return False, None
+
+    def begin(self, key: types.KeyT) -> object | None:
+        """Start a read of ``key`` to be cached with :meth:`set`.
+
+        :return: A token of the read, None if the read must not be cached.
+        """
+        with self._lock:
+            if not self._enabled:
+                return None
+
+            entry: _Entry | None = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                return entry
+
+            entry = self._entries[key] = _Entry()
+            if len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+            return entry
+
+    def set(
+        self, token: object | None, command: str, key: types.KeyT, value: object
+    ) -> None:
+        """Cache the ``command`` read of ``key`` started by :meth:`begin`.
+
+        The value is dropped if the key has been invalidated meanwhile,
+        as it may predate the change.
+        """
+        if token is None:
+            return
+
+        with self._lock:
+            entry: _Entry | None = self._entries.get(key)
+            if entry is not None and entry is token:
+                entry.values[command] = value
+
+    def invalidate(self, keys: Iterable[types.KeyT] | None) -> None:
+        """Drop ``keys`` from the cache, or all keys if None."""
+        with self._lock:
+            if keys is None:
+                self._entries.clear()
+                return
+
+            for key in keys:
+                self._entries.pop(key, None)
+
+    def enable(self) -> None:
+        """Start caching reads, once changes are reported by Redis."""
+        with self._lock:
+            self._enabled = True
+
+    def disable(self) -> None:
+        """Stop caching reads and clear the cache, e.g. the channel is lost."""
+        with self._lock:
+            self._enabled = False
+            self._entries.clear()
+
+    def get_stats(self) -> ClientCacheStats:
+        """Return a snapshot of the statistics of the cache."""
+        with self._lock:
+            return ClientCacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                size=len(self._entries),
+                max_size=self.max_size,
+                enabled=self._enabled,
+            )
+
+
+class BaseClientTracker:
+    """Base class of the trackers that keep a :class:`ClientCache` in sync.
+
+    A tracker holds two connections: one subscribed to the invalidation
+    channel, and one with ``CLIENT TRACKING`` on in broadcasting mode, which
+    redirects the invalidations of all keys with the cache prefixes to the
+    former. The cache only serves reads while both connections are up.
+    """
+
+    #: The channel that invalidations are redirected to.
+    CHANNEL: str = "__redis__:invalidate"
+
+    def __init__(self, cache: ClientCache, interval: float = 1) -> None:
+        """Initializes the tracker.
+
+        :param cache: The cache to keep in sync.
+        :param interval: Seconds between two checks of the tracking connection,
+            and between two attempts to connect.
+        """
+        self.cache: ClientCache = cache
+        self.interval: float = interval
+        # Whether the server supports CLIENT TRACKING, reads are not cached if not.
+        self.supported: bool = True
+
+    def _get_tracking_args(self, client_id: object) -> list[object]:
+        args: list[object] = ["CLIENT", "TRACKING", "ON", "REDIRECT", client_id, "BCAST"]
+        # An empty prefix tracks all keys.
+        if all(self.cache.prefixes):
+            for prefix in self.cache.prefixes:
+                args.extend(["PREFIX", prefix])
+        return args
+
+    def _on_message(self, message: object) -> None:
+        # [b"message", b"__redis__:invalidate", keys], where keys is None once
+        # all keys are invalidated, e.g. after FLUSHALL.
+        if not (
+            isinstance(message, list) and message[:1] in ([b"message"], ["message"])
+        ):
+            return
+
+        keys: object = message[-1]
+        if keys is None:
+            self.cache.invalidate(None)
+            return
+
+        if not isinstance(keys, list):
+            # A single key, e.g. published by hand.
+            keys = [keys]
+        self.cache.invalidate(
+            key.decode() if isinstance(key, bytes) else str(key) for key in keys
+        )
@@ -1,31 +1,78 @@
 import abc
+import heapq
 import math
 import threading
-from collections import OrderedDict
-from collections.abc import Sequence
+import warnings
+import weakref
+from collections import OrderedDict, deque
+from collections.abc import Iterable, Sequence
+from types import TracebackType
 from typing import Any, cast
 
-from .. import constants, exceptions, types, utils
+from .. import constants, exceptions, types
+from ..clock import Clock, SystemClock
 from .base import BaseAtomicAction, BaseStore, BaseStoreBackend
 
-_ClientT = OrderedDict[types.KeyT, types.StoreBucketValueT]
+_RecordValueT = (
+    types.StoreValueT | tuple[types.StoreValueT, ...] | deque[float] | dict[str, float]
+)
 
 
-class BaseMemoryStoreBackend(BaseStoreBackend):
-    """Base backend for Memory Store."""
+class MemoryRecord:
+    """Value of a key stored in :class:`MemoryStoreSegment`.
+
+    A hash is stored as a tuple of values, along with a tuple of field names
+    that is shared by all records with the same fields. A log of timestamps is
+    stored as a deque, and the leases of a concurrency limit as a dict that maps
+    each slot to its expiration time.
+    """
+
+    __slots__ = ("fields", "value", "expire_at", "expire_second")
 
     def __init__(
-        self, server: str | None = None, options: dict[str, Any] | None = None
+        self,
+        value: _RecordValueT,
+        fields: tuple[types.KeyT, ...] | None = None,
     ) -> None:
-        super().__init__(server, options)
+        self.fields: tuple[types.KeyT, ...] | None = fields
+        self.value: _RecordValueT = value
+        self.expire_at: float | None = None
+        # The second the key is indexed in by its segment, None if not indexed.
+        self.expire_second: int | None = None
+
+
+_ClientT = OrderedDict[types.KeyT, MemoryRecord]
 
-        max_size: int = self.options.get("MAX_SIZE", 1024)
-        if not (isinstance(max_size, int) and max_size > 0):
-            raise exceptions.SetUpError("MAX_SIZE must be a positive integer")
 
+class MemoryStoreSegment:
+    """LRU cache with expiration time, a MemoryStore holds one or more of them.
+
+    Expired keys are dropped lazily when they are touched, and proactively by
+    :meth:`sweep`, which walks the keys indexed by the second they expire in.
+    Each key is indexed once at most and is dropped from the index when it is
+    deleted or evicted, so the index is bounded by the size of the segment.
+    """
+
+    __slots__ = (
+        "max_size",
+        "_clock",
+        "_client",
+        "_expire_slots",
+        "_expire_heap",
+        "_fields_cache",
+    )
+
+    def __init__(self, max_size: int, clock: Clock | None = None) -> None:
         self.max_size: int = max_size
-        self.expire_info: dict[str, float] = {}
+        self._clock: Clock = clock or SystemClock()
         self._client: _ClientT = OrderedDict()
+        # Keys are indexed by the second they expire in, a key is moved only when
+        # it gets an earlier expiration time, later ones are moved by sweep.
+        self._expire_slots: dict[int, dict[types.KeyT, None]] = {}
+        # Min-heap of the seconds in ``_expire_slots``, seconds whose keys have
+        # all been deleted are skipped.
+        self._expire_heap: list[int] = []
+        self._fields_cache: dict[tuple[types.KeyT, ...], tuple[types.KeyT, ...]] = {}
 
     def get_client(self) -> _ClientT:
         return self._client
@@ -37,13 +84,14 @@ class BaseMemoryStoreBackend(BaseStoreBackend):
         return self.ttl(key) == constants.STORE_TTL_STATE_NOT_EXIST
 
     def ttl(self, key: types.KeyT) -> int:
-        exp: float | None = self.expire_info.get(key)
-        if exp is None:
-            if not self.exists(key):
-                return constants.STORE_TTL_STATE_NOT_EXIST
+        record: MemoryRecord | None = self._client.get(key)
+        if record is None:
+            return constants.STORE_TTL_STATE_NOT_EXIST
+
+        if record.expire_at is None:
             return constants.STORE_TTL_STATE_NOT_TTL
 
-        ttl: float = exp - utils.now_mono_f()
+        ttl: float = record.expire_at - self._clock.monotonic()
         if ttl <= 0:
             return constants.STORE_TTL_STATE_NOT_EXIST
         return math.ceil(ttl)
@@ -51,31 +99,193 @@ class BaseMemoryStoreBackend(BaseStoreBackend):
     def check_and_evict(self, key: types.KeyT) -> None:
         is_full: bool = len(self._client) >= self.max_size
         if is_full and not self.exists(key):
-            pop_key, __ = self._client.popitem(last=False)
-            self.expire_info.pop(pop_key, None)
+            self._evict()
 
     def expire(self, key: types.KeyT, timeout: int) -> None:
-        self.expire_info[key] = utils.now_mono_f() + timeout
+        record: MemoryRecord | None = self._client.get(key)
+        if record is None:
+            return
+
+        expire_at: float = self._clock.monotonic() + timeout
+        origin_expire_at: float | None = record.expire_at
+        record.expire_at = expire_at
+        if origin_expire_at is None or expire_at < origin_expire_at:
+            self._index_expire(key, record)
+
+    def sweep(self, max_keys: int) -> tuple[int, int]:
+        """Remove expired keys, inspect at most ``max_keys`` indexed keys.
+
+        :param max_keys: The maximum number of indexed keys to inspect.
+        :return: The number of removed keys and the number of inspected keys.
+        """
+        now: float = self._clock.monotonic()
+        removed: int = 0
+        inspected: int = 0
+        while inspected < max_keys and self._expire_heap:
+            second: int = self._expire_heap[0]
+            if second > now:
+                break
+
+            keys: dict[types.KeyT, None] | None = self._expire_slots.get(second)
+            while keys and inspected < max_keys:
+                inspected += 1
+                key, __ = keys.popitem()
+                record: MemoryRecord = self._client[key]
+                record.expire_second = None
+                if cast("float", record.expire_at) > now:
+                    # The expiration time of the key has been extended.
+                    self._index_expire(key, record)
+                else:
+                    removed += self.delete(key)
+
+            if not keys:
+                heapq.heappop(self._expire_heap)
+                self._expire_slots.pop(second, None)
+        return removed, inspected
+
+    def _index_expire(self, key: types.KeyT, record: MemoryRecord) -> None:
+        """Index ``key`` by the second it expires in, instead of its current one."""
+        self._unindex_expire(key, record)
+        second: int = math.ceil(cast("float", record.expire_at))
+        keys: dict[types.KeyT, None] | None = self._expire_slots.get(second)
+        if keys is None:
+            keys = self._expire_slots[second] = {}
+            heapq.heappush(self._expire_heap, second)
+            if len(self._expire_heap) > 2 * len(self._expire_slots) + 64:
+                # Drop the seconds whose keys have all been deleted.
+                self._expire_heap = list(self._expire_slots)
+                heapq.heapify(self._expire_heap)
+        keys[key] = None
+        record.expire_second = second
+
+    def _unindex_expire(self, key: types.KeyT, record: MemoryRecord) -> None:
+        """Drop ``key`` from the expiration index, e.g. when it is deleted."""
+        if record.expire_second is None:
+            return
+
+        keys: dict[types.KeyT, None] = self._expire_slots[record.expire_second]
+        del keys[key]
+        if not keys:
+            # The second is left in the heap and skipped when it is reached.
+            del self._expire_slots[record.expire_second]
+        record.expire_second = None
+
+    def _get_record(self, key: types.KeyT) -> MemoryRecord | None:
+        """Return the live record of ``key``, dropping it if it has expired."""
+        record: MemoryRecord | None = self._client.get(key)
+        if record is None or record.expire_at is None:
+            return record
+
+        if record.expire_at <= self._clock.monotonic():
+            self.delete(key)
+            return None
+        return record
+
+    def _add(self, key: types.KeyT, record: MemoryRecord) -> None:
+        """Add a new key, evict another one first if the segment is full."""
+        if len(self._client) >= self.max_size:
+            self._evict()
+        self._client[key] = record
+
+    def _touch(self, key: types.KeyT) -> None:
+        """Record an access to an existing key."""
+        self._client.move_to_end(key)
+
+    def _evict(self) -> None:
+        """Evict a key to make room for a new one."""
+        key, record = self._client.popitem(last=False)
+        self._unindex_expire(key, record)
 
     def get(self, key: types.KeyT) -> types.StoreValueT | None:
-        if self.has_expired(key):
-            self.delete(key)
+        record: MemoryRecord | None = self._get_record(key)
+        if record is None:
             return None
 
-        bucket_value: types.StoreBucketValueT | None = self._client.get(key)
-        if bucket_value is not None and isinstance(bucket_value, dict):
+        if record.fields is not None:
             raise exceptions.DataError("dict value does not support get")
-        value: types.StoreValueT | None = bucket_value
-        if value is not None:
-            self._client.move_to_end(key)
-        return value
+        if isinstance(record.value, deque):
+            raise exceptions.DataError("log value does not support get")
+        if isinstance(record.value, dict):
+            raise exceptions.DataError("lease value does not support get")
+        self._touch(key)
+        return cast("types.StoreValueT", record.value)
 
     def set(self, key: types.KeyT, value: types.StoreValueT, timeout: int) -> None:
-        self.check_and_evict(key)
-        self._client[key] = value
-        self._client.move_to_end(key)
+        self._put(key, MemoryRecord(value), timeout)
+
+    def _put(self, key: types.KeyT, record: MemoryRecord, timeout: int) -> None:
+        origin: MemoryRecord | None = self._get_record(key)
+        if origin is None:
+            self._add(key, record)
+        else:
+            # Update the record in place to keep its expiration time, so the key is
+            # only indexed again if it expires earlier.
+            origin.value = record.value
+            origin.fields = record.fields
+            self._touch(key)
         self.expire(key, timeout)
 
+    def incrby(self, key: types.KeyT, amount: int) -> int:
+        """Increase the value of ``key`` by ``amount``, keeping its expiration time.
+
+        :return: The value after the increment.
+        """
+        record: MemoryRecord | None = self._get_record(key)
+        if record is None:
+            self._add(key, MemoryRecord(amount))
+            return amount
+
+        if record.fields is not None:
+            raise exceptions.DataError("dict value does not support incrby")
+        if isinstance(record.value, deque):
+            raise exceptions.DataError("log value does not support incrby")
+        if isinstance(record.value, dict):
+            raise exceptions.DataError("lease value does not support incrby")
+        self._touch(key)
+        value: int = int(cast("types.StoreValueT", record.value)) + amount
+        record.value = value
+        return value
+
+    def get_log(self, key: types.KeyT) -> deque[float] | None:
+        """Return the log of timestamps of ``key``, or None if it does not exist.
+
+        The log is updated in place by the caller, under the lock of the key.
+        """
+        record: MemoryRecord | None = self._get_record(key)
+        if record is None:
+            return None
+
+        if not isinstance(record.value, deque):
+            raise exceptions.DataError(
+                "NumberLike or dict value does not support get_log"
+            )
+        self._touch(key)
+        return record.value
+
+    def set_log(self, key: types.KeyT, log: deque[float], timeout: int) -> None:
+        self._put(key, MemoryRecord(log), timeout)
+
+    def get_leases(self, key: types.KeyT) -> dict[str, float] | None:
+        """Return the leased slots of ``key``, or None if it does not exist.
+
+        The slots are updated in place by the caller, under the lock of the key.
+        """
+        record: MemoryRecord | None = self._get_record(key)
+        if record is None:
+            return None
+
+        if record.fields is not None or not isinstance(record.value, dict):
+            raise exceptions.DataError(
+                "NumberLike, dict or log value does not support get_leases"
+            )
+        self._touch(key)
+        return record.value
+
+    def set_leases(
+        self, key: types.KeyT, leases: dict[str, float], timeout: int
+    ) -> None:
+        self._put(key, MemoryRecord(leases), timeout)
+
     def hset(
         self,
         name: types.KeyT,
@@ -94,39 +304,356 @@ class BaseMemoryStoreBackend(BaseStoreBackend):
         if mapping:
             kv.update(mapping)
 
-        origin: types.StoreBucketValueT | None = self._client.get(name)
-        if origin is not None:
-            if not isinstance(origin, dict):
-                raise exceptions.DataError("origin must be a dict")
-            origin.update(kv)
+        record: MemoryRecord | None = self._get_record(name)
+        if record is None:
+            record = MemoryRecord(())
+            self._add(name, record)
+        elif record.fields is None:
+            raise exceptions.DataError("origin must be a dict")
         else:
-            self.check_and_evict(name)
-            self._client[name] = kv
+            self._touch(name)
 
-        self._client.move_to_end(name)
+        fields: tuple[types.KeyT, ...] = tuple(kv)
+        if fields != record.fields:
+            if record.fields:
+                kv = self._to_dict(record) | kv
+                fields = tuple(kv)
+            # Share the tuple of field names between records with the same fields.
+            record.fields = self._fields_cache.setdefault(fields, fields)
+        record.value = tuple(kv.values())
 
     def hgetall(self, name: types.KeyT) -> types.StoreDictValueT:
-        if self.has_expired(name):
-            self.delete(name)
+        record: MemoryRecord | None = self._get_record(name)
+        if record is None:
             return {}
 
-        kv: types.StoreBucketValueT | None = self._client.get(name)
-        if not (kv is None or isinstance(kv, dict)):
+        if record.fields is None:
             raise exceptions.DataError("NumberLike value does not support hgetall")
+        self._touch(name)
+        return self._to_dict(record)
+
+    def delete(self, key: types.KeyT) -> bool:
+        record: MemoryRecord | None = self._client.pop(key, None)
+        if record is None:
+            return False
+
+        self._unindex_expire(key, record)
+        return True
+
+    @classmethod
+    def _to_dict(cls, record: MemoryRecord) -> types.StoreDictValueT:
+        values: tuple[types.StoreValueT, ...] = record.value  # type: ignore[assignment]
+        return dict(zip(record.fields or (), values, strict=False))
+
+
+class TTLFirstMemoryStoreSegment(MemoryStoreSegment):
+    """Segment that evicts the key which expires soonest.
+
+    Keys are picked from the expiration index at the granularity of a second,
+    the least recently used key is evicted if no key has an expiration time.
+    """
 
-        if kv is not None:
-            self._client.move_to_end(name)
+    __slots__ = ()
 
-        return kv or {}
+    def _evict(self) -> None:
+        while self._expire_heap:
+            second: int = self._expire_heap[0]
+            keys: dict[types.KeyT, None] | None = self._expire_slots.get(second)
+            victim: types.KeyT | None = None
+            while keys and victim is None:
+                key, __ = keys.popitem()
+                record: MemoryRecord = self._client[key]
+                record.expire_second = None
+                if math.ceil(cast("float", record.expire_at)) > second:
+                    # The expiration time of the key has been extended.
+                    self._index_expire(key, record)
+                else:
+                    victim = key
+
+            if not keys:
+                heapq.heappop(self._expire_heap)
+                self._expire_slots.pop(second, None)
+            if victim is not None:
+                self.delete(victim)
+                return
+
+        super()._evict()
+
+
+# Maps a counter value to its half, used to age the frequency sketch.
+_HALVE_TABLE: bytes = bytes(value >> 1 for value in range(256))
+
+
+class _FrequencySketch:
+    """Count-Min sketch of 4-bit counters to estimate how often a key is used.
+
+    All counters are halved once the number of additions reaches ten times the
+    capacity, so that the estimation follows recent usage.
+    """
+
+    __slots__ = ("_table", "_width", "_mask", "_additions", "_sample_size")
+
+    # Number of rows, each row hashes a key with a different odd multiplier.
+    DEPTH: int = 4
+    MAX_COUNT: int = 15
+
+    def __init__(self, capacity: int) -> None:
+        # 4 counters per key in each row keep collisions low under scans.
+        self._width: int = 1 << max(4, (4 * capacity - 1).bit_length())
+        self._mask: int = self._width - 1
+        self._table: bytearray = bytearray(self._width * self.DEPTH)
+        self._additions: int = 0
+        self._sample_size: int = 10 * capacity
+
+    def _indexes(self, key: types.KeyT) -> tuple[int, int, int, int]:
+        hashed: int = hash(key)
+        mask: int = self._mask
+        width: int = self._width
+        return (
+            ((hashed * 0x9E3779B97F4A7C15) >> 32) & mask,
+            width + (((hashed * 0xC2B2AE3D27D4EB4F) >> 32) & mask),
+            2 * width + (((hashed * 0x165667B19E3779F9) >> 32) & mask),
+            3 * width + (((hashed * 0xD6E8FEB86659FD93) >> 32) & mask),
+        )
+
+    def frequency(self, key: types.KeyT) -> int:
+        table: bytearray = self._table
+        i0, i1, i2, i3 = self._indexes(key)
+        return min(table[i0], table[i1], table[i2], table[i3])
+
+    def increment(self, key: types.KeyT) -> None:
+        table: bytearray = self._table
+        for index in self._indexes(key):
+            if table[index] < self.MAX_COUNT:
+                table[index] += 1
+
+        self._additions += 1
+        if self._additions >= self._sample_size:
+            self._table = table.translate(_HALVE_TABLE)
+            self._additions //= 2
+
+
+class TinyLFUMemoryStoreSegment(MemoryStoreSegment):
+    """Segment with the W-TinyLFU eviction policy.
+
+    New keys enter a small LRU window. When the window overflows, its oldest
+    key is admitted into the main region only if it is used more often than
+    the key the main region would evict, so that one-off keys (e.g. a scan
+    over random IPs) cannot flush out hot keys. The main region is a
+    segmented LRU: keys hit again while in probation are promoted to the
+    protected part.
+    """
+
+    __slots__ = (
+        "_sketch",
+        "_window",
+        "_probation",
+        "_protected",
+        "_window_size",
+        "_protected_size",
+    )
+
+    def __init__(self, max_size: int, clock: Clock | None = None) -> None:
+        super().__init__(max_size, clock)
+        self._sketch: _FrequencySketch = _FrequencySketch(max_size)
+        # 1% of the capacity for the window, 80% of the rest is protected.
+        self._window_size: int = max(1, max_size // 100)
+        self._protected_size: int = (max_size - self._window_size) * 4 // 5
+        self._window: OrderedDict[types.KeyT, None] = OrderedDict()
+        self._probation: OrderedDict[types.KeyT, None] = OrderedDict()
+        self._protected: OrderedDict[types.KeyT, None] = OrderedDict()
 
     def delete(self, key: types.KeyT) -> bool:
-        try:
-            self.expire_info.pop(key, None)
-            del self._client[key]
-        except KeyError:
+        if not super().delete(key):
             return False
+
+        for region in (self._window, self._probation, self._protected):
+            if key in region:
+                del region[key]
+                break
         return True
 
+    def _add(self, key: types.KeyT, record: MemoryRecord) -> None:
+        self._sketch.increment(key)
+        self._client[key] = record
+        self._window[key] = None
+        if len(self._window) <= self._window_size:
+            if len(self._client) > self.max_size:
+                self._evict()
+            return
+
+        candidate, __ = self._window.popitem(last=False)
+        if len(self._client) > self.max_size:
+            # Let the candidate compete with the key the main region would evict.
+            victim: types.KeyT | None = self._get_main_victim()
+            if victim is None or self._sketch.frequency(
+                candidate
+            ) <= self._sketch.frequency(victim):
+                super().delete(candidate)
+                return
+            self.delete(victim)
+        self._probation[candidate] = None
+
+    def _touch(self, key: types.KeyT) -> None:
+        self._sketch.increment(key)
+        if key in self._window:
+            self._window.move_to_end(key)
+        elif key in self._probation:
+            del self._probation[key]
+            self._protected[key] = None
+            if len(self._protected) > self._protected_size:
+                demoted, __ = self._protected.popitem(last=False)
+                self._probation[demoted] = None
+        else:
+            self._protected.move_to_end(key)
+
+    def _evict(self) -> None:
+        victim: types.KeyT | None = self._get_main_victim()
+        if victim is None:
+            victim = next(iter(self._window))
+        self.delete(victim)
+
+    def _get_main_victim(self) -> types.KeyT | None:
+        for region in (self._probation, self._protected):
+            if region:
+                return next(iter(region))
+        return None
+
+
+class BaseMemoryStoreBackend(BaseStoreBackend):
+    """Base backend for Memory Store.
+
+    Keys are hashed to ``SHARDS`` independent segments, capacity and expiry are
+    enforced per segment, so that each segment can be guarded by its own lock.
+    """
+
+    SEGMENT_CLASSES: dict[str, type[MemoryStoreSegment]] = {
+        constants.MemoryEvictionPolicy.LRU.value: MemoryStoreSegment,
+        constants.MemoryEvictionPolicy.TTL_FIRST.value: TTLFirstMemoryStoreSegment,
+        constants.MemoryEvictionPolicy.W_TINYLFU.value: TinyLFUMemoryStoreSegment,
+    }
+
+    def __init__(
+        self, server: str | None = None, options: dict[str, Any] | None = None
+    ) -> None:
+        super().__init__(server, options)
+
+        max_size: int = self.options.get("MAX_SIZE", 1024)
+        if not (isinstance(max_size, int) and max_size > 0):
+            raise exceptions.SetUpError("MAX_SIZE must be a positive integer")
+
+        shards: int = self.options.get("SHARDS", 1)
+        if not (isinstance(shards, int) and 0 < shards <= max_size):
+            raise exceptions.SetUpError(
+                "SHARDS must be a positive integer not greater than MAX_SIZE"
+            )
+
+        sweep_interval: float = self.options.get("SWEEP_INTERVAL", 0)
+        if not (isinstance(sweep_interval, int | float) and sweep_interval >= 0):
+            raise exceptions.SetUpError("SWEEP_INTERVAL must be a non-negative number")
+
+        sweep_batch_size: int = self.options.get("SWEEP_BATCH_SIZE", 256)
+        if not (isinstance(sweep_batch_size, int) and sweep_batch_size > 0):
+            raise exceptions.SetUpError("SWEEP_BATCH_SIZE must be a positive integer")
+
+        eviction_policy: str = self.options.get(
+            "EVICTION_POLICY", constants.MemoryEvictionPolicy.LRU.value
+        )
+        if eviction_policy not in constants.MemoryEvictionPolicy.choice():
+            raise exceptions.SetUpError(
+                "EVICTION_POLICY must be one of "
+                f"{', '.join(constants.MemoryEvictionPolicy.choice())}"
+            )
+
+        self.max_size: int = max_size
+        self.shards: int = shards
+        self.sweep_interval: float = sweep_interval
+        self.sweep_batch_size: int = sweep_batch_size
+        self.eviction_policy: str = eviction_policy
+
+        segment_cls: type[MemoryStoreSegment] = self.SEGMENT_CLASSES[eviction_policy]
+        self.segments: list[MemoryStoreSegment] = [
+            segment_cls(math.ceil(max_size / shards), self.clock) for _ in range(shards)
+        ]
+
+    def get_shard(self, key: types.KeyT) -> int:
+        """Return the index of the segment that ``key`` hashes to."""
+        return hash(key) % self.shards
+
+    def get_shards(self, keys: Iterable[types.KeyT]) -> list[int]:
+        """Return the sorted indexes of the segments that ``keys`` hash to."""
+        return sorted({hash(key) % self.shards for key in keys})
+
+    def get_segment(self, key: types.KeyT) -> MemoryStoreSegment:
+        """Return the segment that ``key`` hashes to."""
+        return self.segments[hash(key) % self.shards]
+
+    def get_client(self, key: types.KeyT | None = None) -> _ClientT:
+        """Return the client of the segment that ``key`` hashes to.
+
+        :param key: The key to locate, the first segment is returned if omitted.
+        """
+        if key is None:
+            return self.segments[0].get_client()
+        return self.get_segment(key).get_client()
+
+    def exists(self, key: types.KeyT) -> bool:
+        return self.get_segment(key).exists(key)
+
+    def has_expired(self, key: types.KeyT) -> bool:
+        return self.get_segment(key).has_expired(key)
+
+    def ttl(self, key: types.KeyT) -> int:
+        return self.get_segment(key).ttl(key)
+
+    def check_and_evict(self, key: types.KeyT) -> None:
+        self.get_segment(key).check_and_evict(key)
+
+    def expire(self, key: types.KeyT, timeout: int) -> None:
+        self.get_segment(key).expire(key, timeout)
+
+    def get(self, key: types.KeyT) -> types.StoreValueT | None:
+        return self.get_segment(key).get(key)
+
+    def set(self, key: types.KeyT, value: types.StoreValueT, timeout: int) -> None:
+        self.get_segment(key).set(key, value, timeout)
+
+    def incrby(self, key: types.KeyT, amount: int) -> int:
+        return self.get_segment(key).incrby(key, amount)
+
+    def hset(
+        self,
+        name: types.KeyT,
+        key: types.KeyT | None = None,
+        value: types.StoreValueT | None = None,
+        mapping: types.StoreDictValueT | None = None,
+    ) -> None:
+        self.get_segment(name).hset(name, key, value, mapping)
+
+    def hgetall(self, name: types.KeyT) -> types.StoreDictValueT:
+        return self.get_segment(name).hgetall(name)
+
+    def get_log(self, key: types.KeyT) -> deque[float] | None:
+        """Return the log of timestamps of ``key``, or None if it does not exist."""
+        return self.get_segment(key).get_log(key)
+
+    def set_log(self, key: types.KeyT, log: deque[float], timeout: int) -> None:
+        """Store the log of timestamps of ``key`` with the specified timeout."""
+        self.get_segment(key).set_log(key, log, timeout)
+
+    def get_leases(self, key: types.KeyT) -> dict[str, float] | None:
+        """Return the leased slots of ``key``, or None if it does not exist."""
+        return self.get_segment(key).get_leases(key)
+
+    def set_leases(
+        self, key: types.KeyT, leases: dict[str, float], timeout: int
+    ) -> None:
+        """Store the leased slots of ``key`` with the specified timeout."""
+        self.get_segment(key).set_leases(key, leases, timeout)
+
+    def delete(self, key: types.KeyT) -> bool:
+        return self.get_segment(key).delete(key)
+
 
 class BaseMemoryAtomicActionSpec(abc.ABC):
     """Base class for sync memory atomic action specifications."""
@@ -144,16 +671,144 @@ class BaseMemoryAtomicActionSpec(abc.ABC):
         raise NotImplementedError
 
 
+class _MultiLock:
+    """Sync lock that acquires the locks of several segments in order."""
+
+    __slots__ = ("_locks",)
+
+    def __init__(self, locks: Sequence[types.SyncLockP]) -> None:
+        self._locks: Sequence[types.SyncLockP] = locks
+
+    def acquire(self, blocking: bool = True, timeout: float = -1) -> bool:
+        for index, lock in enumerate(self._locks):
+            if not lock.acquire(blocking, timeout):
+                for acquired_lock in reversed(self._locks[:index]):
+                    acquired_lock.release()
+                return False
+        return True
+
+    def release(self) -> None:
+        for lock in reversed(self._locks):
+            lock.release()
+
+    def __enter__(self) -> bool:
+        return self.acquire()
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        self.release()
+
+
+def _sweep_forever(
+    backend_ref: "weakref.ReferenceType[MemoryStoreBackend]",
+    interval: float,
+    stopped: threading.Event,
+) -> None:
+    # Hold the backend weakly, so the thread exits once the store is collected.
+    while not stopped.wait(interval):
+        backend: MemoryStoreBackend | None = backend_ref()
+        if backend is None:
+            return
+        backend.sweep()
+        del backend
+
+
 class MemoryStoreBackend(BaseMemoryStoreBackend):
     """Backend for sync Memory Store."""
 
-    lock: types.SyncLockP
+    locks: list[types.SyncLockP]
 
     def __init__(
         self, server: str | None = None, options: dict[str, Any] | None = None
     ) -> None:
         super().__init__(server, options)
-        self.lock = cast("types.SyncLockP", cast("object", threading.Lock()))
+        self.locks = [
+            cast("types.SyncLockP", cast("object", threading.Lock()))
+            for _ in range(self.shards)
+        ]
+
+        self._sweeper: threading.Thread | None = None
+        self._sweeper_stopped: threading.Event = threading.Event()
+        if self.sweep_interval:
+            self.start_sweeper()
+
+    def sweep(self) -> int:
+        """Remove expired keys from all segments.
+
+        Each segment is swept in batches of ``SWEEP_BATCH_SIZE`` indexed keys,
+        and its lock is released between batches to keep the lock hold time short.
+
+        :return: The number of removed keys.
+        """
+        removed: int = 0
+        for segment, lock in zip(self.segments, self.locks, strict=True):
+            while True:
+                with lock:
+                    batch_removed, inspected = segment.sweep(self.sweep_batch_size)
+                removed += batch_removed
+                if inspected < self.sweep_batch_size:
+                    break
+        return removed
+
+    def start_sweeper(self) -> None:
+        """Start a daemon thread to sweep expired keys every ``SWEEP_INTERVAL``."""
+        if not self.sweep_interval:
+            raise exceptions.SetUpError("SWEEP_INTERVAL must be set to start sweeper")
+
+        if self._sweeper is not None and self._sweeper.is_alive():
+            return
+
+        self._sweeper_stopped.clear()
+        self._sweeper = threading.Thread(
+            target=_sweep_forever,
+            args=(weakref.ref(self), self.sweep_interval, self._sweeper_stopped),
+            name="throttled-memory-sweeper",
+            daemon=True,
+        )
+        self._sweeper.start()
+
+    def stop_sweeper(self) -> None:
+        """Stop the sweeper thread if it is running."""
+        self._sweeper_stopped.set()
+        if self._sweeper is not None:
+            self._sweeper.join()
+            self._sweeper = None
+
+    @property
+    def lock(self) -> types.SyncLockP:
+        """The lock of the first segment, kept for compatibility.
+
+        Deprecated, use :meth:`get_lock` or :meth:`get_locks` instead, as this
+        lock only guards the first segment when ``SHARDS`` is greater than 1.
+        """
+        warnings.warn(
+            "MemoryStoreBackend.lock is deprecated, use get_lock(key) instead.",
+            DeprecationWarning,
+            stacklevel=2,
+        )
+        return self.locks[0]
+
+    def get_lock(self, key: types.KeyT) -> types.SyncLockP:
+        """Return the lock of the segment that ``key`` hashes to."""
+        return self.locks[hash(key) % self.shards]
+
+    def get_locks(self, keys: Iterable[types.KeyT]) -> types.SyncLockP:
+        """Return a lock that guards all the segments that ``keys`` hash to.
+
+        Locks are always acquired in segment order to avoid deadlocks between
+        multi-key operations.
+        """
+        if self.shards == 1:
+            return self.locks[0]
+
+        shards: list[int] = self.get_shards(keys)
+        if len(shards) == 1:
+            return self.locks[shards[0]]
+        return _MultiLock([self.locks[shard] for shard in shards])
 
 
 class BaseMemoryAtomicAction(BaseMemoryAtomicActionSpec, BaseAtomicAction, abc.ABC):
@@ -166,9 +821,16 @@ class BaseMemoryAtomicAction(BaseMemoryAtomicActionSpec, BaseAtomicAction, abc.A
         keys: Sequence[types.KeyT],
         args: Sequence[types.StoreValueT] | None,
     ) -> tuple[int | float, ...]:
-        with self._backend.lock:
+        with self._backend.get_locks(keys):
             return self._do(self._backend, keys, args)
 
+    def do_many(
+        self, calls: Sequence[types.AtomicActionCallT]
+    ) -> Sequence[tuple[int | float, ...]]:
+        # Hold the locks once for the whole batch instead of once per call.
+        with self._backend.get_locks(key for keys, _args in calls for key in keys):
+            return [self._do(self._backend, keys, args) for keys, args in calls]
+
 
 class MemoryStore(BaseStore):
     """Concrete implementation of BaseStore using Memory as backend.
@@ -176,7 +838,8 @@ class MemoryStore(BaseStore):
     :class:`throttled.store.MemoryStore` is essentially a memory-based
     `LRU Cache <https://en.wikipedia.org/wiki/Cache_replacement_policies#LRU>`_
     with expiration time, it is thread-safe and can be used for rate limiting
-    in a single process.
+    in a single process. Keys can be hashed to several independently locked
+    segments via the ``SHARDS`` option to reduce lock contention between threads.
     """
 
     # Below are the performance benchmarks for different configurations of the LRU cache,
@@ -200,15 +863,16 @@ class MemoryStore(BaseStore):
 
     def expire(self, key: types.KeyT, timeout: int) -> None:
         self._validate_timeout(timeout)
-        self._backend.expire(key, timeout)
+        with self._backend.get_lock(key):
+            self._backend.expire(key, timeout)
 
     def set(self, key: types.KeyT, value: types.StoreValueT, timeout: int) -> None:
         self._validate_timeout(timeout)
-        with self._backend.lock:
+        with self._backend.get_lock(key):
             self._backend.set(key, value, timeout)
 
     def get(self, key: types.KeyT) -> types.StoreValueT | None:
-        with self._backend.lock:
+        with self._backend.get_lock(key):
             return self._backend.get(key)
 
     def hset(
@@ -218,9 +882,9 @@ class MemoryStore(BaseStore):
         value: types.StoreValueT | None = None,
         mapping: types.StoreDictValueT | None = None,
     ) -> None:
-        with self._backend.lock:
+        with self._backend.get_lock(name):
             self._backend.hset(name, key, value, mapping)
 
     def hgetall(self, name: types.KeyT) -> types.StoreDictValueT:
-        with self._backend.lock:
+        with self._backend.get_lock(name):
             return self._backend.hgetall(name)
@@ -1,12 +1,29 @@
 import abc
+import contextlib
 import copy
+import hashlib
+import math
+import os
+import threading
+import time
 import urllib.parse
+import weakref
+from collections import deque
+from collections.abc import Callable, Sequence
+from concurrent.futures import Future
 from types import ModuleType
-from typing import TYPE_CHECKING, Any, Generic, cast
+from typing import TYPE_CHECKING, Any, ClassVar, Generic, TypeVar, cast
 
 from .. import constants, exceptions, types, utils
 from .base import BaseAtomicAction, BaseStore, BaseStoreBackend
-from .redis_pool import BaseConnectionFactory, get_connection_factory
+from .client_cache import BaseClientTracker, ClientCache, ClientCacheStats
+from .redis_pool import (
+    BaseConnectionFactory,
+    PoolStats,
+    PoolStatsMixin,
+    SyncPoolStatsMixin,
+    get_connection_factory,
+)
 
 if TYPE_CHECKING:
     from redis.commands.core import Script as SyncScript
@@ -32,11 +49,116 @@ def _build_base_exceptions() -> tuple[type[Exception], ...]:
     return tuple(base_exceptions)
 
 
+_FUNCTION_TEMPLATE: str = """
+redis.register_function{{
+    function_name = "{name}",
+    callback = function(KEYS, ARGV)
+{script}
+    end,
+    flags = {{{flags}}},
+}}
+"""
+
+
+class ScriptRegistry:
+    """Registry of the Lua scripts used by Redis atomic actions.
+
+    Every :class:`BaseRedisAtomicAction` subclass registers its ``SCRIPTS``
+    once it is defined, so that all scripts can be loaded into Redis at once,
+    see :meth:`RedisStore.preload_scripts`. The registered scripts can also be
+    bundled into a Redis 7 FUNCTION library, see :meth:`get_library`.
+    """
+
+    # SHA1 digest -> script, the digest is what EVALSHA refers to.
+    _scripts: ClassVar[dict[str, str]] = {}
+    # SHA1 digests of the scripts that do not write keys.
+    _read_only: ClassVar[set[str]] = set()
+    # (name, code) of the library, built on demand.
+    _library: ClassVar[tuple[str, str] | None] = None
+
+    @classmethod
+    def register(cls, script: str, read_only: bool = False) -> str:
+        """Register ``script`` and return its SHA1 digest.
+
+        :param script: The Lua script.
+        :param read_only: Whether the script only reads keys, read-only scripts
+            are called with ``FCALL_RO`` when run as functions.
+        """
+        sha: str = hashlib.sha1(script.encode()).hexdigest()
+        cls._scripts[sha] = script
+        if read_only:
+            cls._read_only.add(sha)
+        cls._library = None
+        return sha
+
+    @classmethod
+    def get_scripts(cls) -> dict[str, str]:
+        """Return the registered scripts, keyed by their SHA1 digest."""
+        return dict(cls._scripts)
+
+    @classmethod
+    def _get_library_name(cls) -> str:
+        # Name the library after its content, so processes running different
+        # versions load their own library instead of replacing each other's.
+        content: str = ",".join(
+            f"{sha}:{sha in cls._read_only}" for sha in sorted(cls._scripts)
+        )
+        return f"throttled_{hashlib.sha1(content.encode()).hexdigest()[:16]}"
+
+    @classmethod
+    def get_function(cls, sha: str) -> tuple[str, bool] | None:
+        """Return the function name of a script in the library.
+
+        :param sha: The SHA1 digest of the script.
+        :return: A ``(name, read_only)`` tuple, or None if the script is not
+            registered.
+        """
+        if sha not in cls._scripts:
+            return None
+        library_name: str = cls.get_library()[0]
+        return f"{library_name}_{sha[:16]}", sha in cls._read_only
+
+    @classmethod
+    def get_library(cls) -> tuple[str, str]:
+        """Return the name and code of a FUNCTION library of all scripts.
+
+        Each script is registered as a function that takes the same keys and
+        arguments, read-only scripts are flagged with ``no-writes``.
+        """
+        if cls._library is not None:
+            return cls._library
+
+        name: str = cls._get_library_name()
+        functions: list[str] = [f"#!lua name={name}"]
+        for sha, script in cls._scripts.items():
+            functions.append(
+                _FUNCTION_TEMPLATE.format(
+                    name=f"{name}_{sha[:16]}",
+                    script=script,
+                    flags='"no-writes"' if sha in cls._read_only else "",
+                )
+            )
+        cls._library = (name, "\n".join(functions))
+        return cls._library
+
+
 class BaseRedisStoreBackend(BaseStoreBackend, Generic[types.RedisClientT]):
     """Base backend for Redis store."""
 
     # Older redis-py versions do not expose ``RedisClusterException``.
     base_exceptions = _build_base_exceptions()
+    # Raised by EVALSHA when the script is missing from the script cache.
+    no_script_exceptions: tuple[type[Exception], ...] = (
+        () if redis_exceptions is None else (redis_exceptions.NoScriptError,)
+    )
+    # Raised by Redis for a failed command, e.g. an unknown one.
+    response_exceptions: tuple[type[Exception], ...] = (
+        () if redis_exceptions is None else (redis_exceptions.ResponseError,)
+    )
+    # Seconds between two checks of the replication lag of replicas.
+    replica_check_interval: float = 1
+    # The standalone connection pool class used when POOL_TIMEOUT is set.
+    blocking_pool_cls_path: str = "redis.BlockingConnectionPool"
 
     @classmethod
     def _parse_auth(cls, parsed: urllib.parse.ParseResult) -> dict[str, str]:
@@ -62,7 +184,19 @@ class BaseRedisStoreBackend(BaseStoreBackend, Generic[types.RedisClientT]):
 
     @classmethod
     def _set_options(cls, options: dict[str, Any]) -> None:
-        pass
+        options.setdefault("AUTO_PIPELINE", False)
+        options.setdefault("AUTO_PIPELINE_WINDOW", 0)
+        options.setdefault("AUTO_PIPELINE_MAX_SIZE", 1024)
+        options.setdefault("SCRIPT_MODE", constants.RedisScriptMode.EVAL.value)
+        options.setdefault("READ_FROM_REPLICAS", False)
+        options.setdefault("REPLICA_MAX_LAG", None)
+        options.setdefault("MAX_CONNECTIONS", None)
+        options.setdefault("POOL_TIMEOUT", None)
+        options.setdefault("POOL_PREWARM", 0)
+        options.setdefault("HEALTH_CHECK_INTERVAL", None)
+        options.setdefault("CLIENT_CACHE", False)
+        options.setdefault("CLIENT_CACHE_MAX_SIZE", 10000)
+        options.setdefault("CLIENT_CACHE_PREFIXES", ["throttled:"])
 
     @classmethod
     def _set_sentinel_options(cls, options: dict[str, Any]) -> None:
@@ -79,7 +213,10 @@ class BaseRedisStoreBackend(BaseStoreBackend, Generic[types.RedisClientT]):
 
     @classmethod
     def _set_standalone_options(cls, options: dict[str, Any]) -> None:
-        pass
+        # Wait up to POOL_TIMEOUT for a free connection, rather than failing
+        # once MAX_CONNECTIONS are in use.
+        if options.get("POOL_TIMEOUT") is not None:
+            options.setdefault("CONNECTION_POOL_CLASS", cls.blocking_pool_cls_path)
 
     @classmethod
     def _parse(
@@ -134,7 +271,50 @@ class BaseRedisStoreBackend(BaseStoreBackend, Generic[types.RedisClientT]):
     ) -> None:
         super().__init__(*self._parse(server, options))
 
+        window: float = self.options["AUTO_PIPELINE_WINDOW"]
+        if not (isinstance(window, int | float) and window >= 0):
+            raise exceptions.SetUpError(
+                "AUTO_PIPELINE_WINDOW must be a non-negative number"
+            )
+
+        max_size: int = self.options["AUTO_PIPELINE_MAX_SIZE"]
+        if not (isinstance(max_size, int) and max_size > 0):
+            raise exceptions.SetUpError(
+                "AUTO_PIPELINE_MAX_SIZE must be a positive integer"
+            )
+
+        if self.options["SCRIPT_MODE"] not in constants.RedisScriptMode.choice():
+            raise exceptions.SetUpError(
+                "SCRIPT_MODE must be one of "
+                f"{', '.join(constants.RedisScriptMode.choice())}"
+            )
+
+        max_lag: float | None = self.options["REPLICA_MAX_LAG"]
+        if max_lag is not None and not (
+            isinstance(max_lag, int | float) and max_lag >= 0
+        ):
+            raise exceptions.SetUpError(
+                "REPLICA_MAX_LAG must be a non-negative number or None"
+            )
+
+        self._validate_pool_options()
+        self._client_cache: ClientCache | None = self._make_client_cache()
+
         self._client: types.RedisClientT | None = None
+        self._replica_client: types.RedisClientT | None = None
+        # Whether replicas are within REPLICA_MAX_LAG, as of the last check.
+        self._replica_fresh: bool = True
+        self._replica_checked_at: float = -math.inf
+        # The replication offset of each primary at the checks of the last
+        # REPLICA_MAX_LAG seconds, oldest first.
+        self._replication_offsets: deque[tuple[float, dict[str, int]]] = deque()
+        # Whether the FUNCTION library is known to be loaded, and whether Redis
+        # supports functions at all, scripts fall back to EVALSHA if not.
+        self._functions_loaded: bool = False
+        self._functions_supported: bool = True
+        # The number of reconnections of the pool as of the last check, scripts
+        # are loaded again once it grows, see ``is_reconnected``.
+        self._reconnected: int = 0
 
         connection_factory_cls_path: str | None = self.options.get(
             "CONNECTION_FACTORY_CLASS"
@@ -143,6 +323,51 @@ class BaseRedisStoreBackend(BaseStoreBackend, Generic[types.RedisClientT]):
             connection_factory_cls_path, self.options
         )
 
+    def _validate_pool_options(self) -> None:
+        max_connections: int | None = self.options["MAX_CONNECTIONS"]
+        if max_connections is not None and not (
+            isinstance(max_connections, int) and max_connections > 0
+        ):
+            raise exceptions.SetUpError(
+                "MAX_CONNECTIONS must be a positive integer or None"
+            )
+
+        for name in ["POOL_TIMEOUT", "HEALTH_CHECK_INTERVAL"]:
+            value: float | None = self.options[name]
+            if value is not None and not (isinstance(value, int | float) and value >= 0):
+                raise exceptions.SetUpError(
+                    f"{name} must be a non-negative number or None"
+                )
+
+        if self.options["POOL_TIMEOUT"] is not None and (
+            self.is_cluster() or self.options.get("SENTINELS")
+        ):
+            raise exceptions.SetUpError(
+                "POOL_TIMEOUT requires a standalone Redis server"
+            )
+
+        prewarm: int = self.options["POOL_PREWARM"]
+        if not (isinstance(prewarm, int) and prewarm >= 0):
+            raise exceptions.SetUpError("POOL_PREWARM must be a non-negative integer")
+
+    def _make_client_cache(self) -> ClientCache | None:
+        if not self.options["CLIENT_CACHE"]:
+            return None
+
+        cache_max_size: int = self.options["CLIENT_CACHE_MAX_SIZE"]
+        if not (isinstance(cache_max_size, int) and cache_max_size > 0):
+            raise exceptions.SetUpError(
+                "CLIENT_CACHE_MAX_SIZE must be a positive integer"
+            )
+        if self.is_cluster() or self.reads_from_replicas():
+            # Invalidations are only reported by the primary of a standalone
+            # or Sentinel setup, while replicas may lag behind them.
+            raise exceptions.SetUpError(
+                "CLIENT_CACHE is not available on Redis Cluster "
+                "or with READ_FROM_REPLICAS"
+            )
+        return ClientCache(cache_max_size, self.options["CLIENT_CACHE_PREFIXES"])
+
     def get_client(self) -> types.RedisClientT:
         if self._client is not None:
             return self._client
@@ -155,20 +380,723 @@ class BaseRedisStoreBackend(BaseStoreBackend, Generic[types.RedisClientT]):
         self._client = client
         return client
 
+    def get_replica_client(self) -> types.RedisClientT:
+        """Return the client that reads from replicas, see ``READ_FROM_REPLICAS``."""
+        if self._replica_client is not None:
+            return self._replica_client
+
+        client: types.RedisClientT = cast(
+            "types.RedisClientT", self._connection_factory.connect_replica(self.server)
+        )
+        self._replica_client = client
+        return client
+
+    def is_cluster(self) -> bool:
+        """Return whether the backend connects to a Redis Cluster."""
+        return bool(self.options.get("CLUSTER_NODES"))
+
+    def get_connection_pool(self) -> PoolStatsMixin:
+        """Return the connection pool of the client.
+
+        Pools are shared by stores with the same server if ``REUSE_CONNECTION``
+        is enabled. Redis Cluster keeps a pool per node, which is not exposed.
+        """
+        if self.is_cluster():
+            raise exceptions.SetUpError(
+                "Connection pool stats are not available on Redis Cluster."
+            )
+
+        pool: object = self.get_client().connection_pool
+        if not isinstance(pool, PoolStatsMixin):
+            raise exceptions.SetUpError(
+                "Connection pool stats are not recorded by the connection factory."
+            )
+        return pool
+
+    def invalidate_client_cache(self, keys: Sequence[types.KeyT]) -> None:
+        """Drop ``keys`` from the client cache once they have been written.
+
+        Invalidations of Redis arrive asynchronously, this makes a write visible
+        to the following reads of the same process right away.
+        """
+        if self._client_cache is not None:
+            self._client_cache.invalidate(keys)
+
+    def _get_prewarm_size(self, connections: int | None) -> int:
+        pool: PoolStatsMixin = self.get_connection_pool()
+        if connections is None:
+            connections = self.options["POOL_PREWARM"]
+        # Do not wait for, or fail on, connections beyond MAX_CONNECTIONS.
+        return max(min(connections, pool.max_connections), 0)
+
+    def reads_from_replicas(self) -> bool:
+        """Return whether read-only calls are routed to replicas."""
+        return bool(self.options["READ_FROM_REPLICAS"])
+
+    def _should_check_replicas(self) -> bool:
+        if self.options["REPLICA_MAX_LAG"] is None:
+            return False
+
+        now: float = time.monotonic()
+        if now - self._replica_checked_at < self.replica_check_interval:
+            return False
+        # Claim the check before running it, so concurrent callers skip it.
+        self._replica_checked_at = now
+        return True
+
+    def _get_replication_info_kwargs(self) -> dict[str, str]:
+        # Redis Cluster only sends INFO to a single node by default.
+        return {"target_nodes": "primaries"} if self.is_cluster() else {}
+
+    def _on_replicas_checked(self, info: dict[str, Any] | None) -> None:
+        # Replicas that cannot be checked are considered stale.
+        lag: float = (
+            math.inf
+            if info is None
+            else self._get_replication_lag(info, self._replica_checked_at)
+        )
+        self._replica_fresh = lag <= self.options["REPLICA_MAX_LAG"]
+
+    def _get_replication_lag(self, info: dict[str, Any], now: float) -> float:
+        """Return the largest replication lag of replicas, in seconds.
+
+        ``info`` is the ``INFO replication`` of the primaries, which report the
+        replication offset each replica has acknowledged, about once per second.
+        A replica lags by the time since its primary was at that offset, as of
+        the checks of the last ``REPLICA_MAX_LAG`` seconds, or infinity if it
+        is behind all of them or not online. Redis Cluster replies with the
+        info of each node.
+
+        :param info: The ``INFO replication`` of the primaries.
+        :param now: The monotonic time of the check.
+        """
+        nodes: dict[str, dict[str, Any]] = {"": info} if "role" in info else info
+        primaries: dict[str, dict[str, Any]] = {
+            name: node for name, node in nodes.items() if node.get("role") == "master"
+        }
+        self._replication_offsets.append(
+            (
+                now,
+                {
+                    name: int(node.get("master_repl_offset", 0))
+                    for name, node in primaries.items()
+                },
+            )
+        )
+        while now - self._replication_offsets[0][0] > self.options["REPLICA_MAX_LAG"]:
+            self._replication_offsets.popleft()
+
+        lags: list[float] = []
+        for name, node in primaries.items():
+            # Replicas are reported as slave0, slave1, ...
+            for field, replica in node.items():
+                if not (field.startswith("slave") and isinstance(replica, dict)):
+                    continue
+                if replica.get("state") != "online":
+                    return math.inf
+                offset: int = int(replica.get("offset", -1))
+                lags.append(
+                    min(
+                        (
+                            now - checked_at
+                            for checked_at, offsets in self._replication_offsets
+                            if offsets.get(name, math.inf) <= offset
+                        ),
+                        default=math.inf,
+                    )
+                )
+        return max(lags, default=math.inf)
+
+    def uses_functions(self) -> bool:
+        """Return whether scripts are run as functions of a FUNCTION library."""
+        return (
+            self.options["SCRIPT_MODE"] == constants.RedisScriptMode.FUNCTION.value
+            and self._functions_supported
+        )
+
+    def get_function(self, sha: str) -> tuple[str, bool] | None:
+        """Return the ``(name, read_only)`` of the function of a loaded script."""
+        if not (self._functions_loaded and self.uses_functions()):
+            return None
+        return ScriptRegistry.get_function(sha)
+
+    def is_reconnected(self) -> bool:
+        """Return whether a connection has been established again since the last check.
+
+        Redis may have lost its script cache and FUNCTION library, e.g. after a
+        restart or a failover, so the library is marked to be loaded again.
+        Reconnections are counted by the connection pool, they are not known on
+        Redis Cluster or with pools that do not record :class:`PoolStats`.
+        """
+        if self.is_cluster():
+            return False
+
+        pool: object = self.get_client().connection_pool
+        if not isinstance(pool, PoolStatsMixin):
+            return False
+
+        reconnected: int = pool.get_reconnected()
+        if reconnected == self._reconnected:
+            return False
+
+        self._reconnected = reconnected
+        self._functions_loaded = False
+        return True
+
+    def _on_functions_loaded(self, error: Exception | None) -> bool:
+        if error is None:
+            self._functions_loaded = True
+        else:
+            # E.g. Redis < 7 or servers without FUNCTION, keep using EVALSHA.
+            self._functions_supported = False
+        return self._functions_loaded
+
+    def check_pipeline_results(self, results: Sequence[object]) -> None:
+        """Mark the library to be loaded again if a pipelined call missed it.
+
+        Functions go missing after e.g. FUNCTION FLUSH, the affected calls fail
+        and the library is loaded again before the next call.
+        """
+        if any(self.is_function_missing(result) for result in results):
+            self._functions_loaded = False
+
+    @classmethod
+    def is_function_missing(cls, result: object) -> bool:
+        """Return whether ``result`` is the error of calling a missing function."""
+        return isinstance(result, cls.response_exceptions) and (
+            "function not found" in str(result).lower()
+        )
+
+
+# The value of a read cached by the client cache.
+_ValueT = TypeVar("_ValueT")
+
+# (script, keys, args) of a script call.
+_ScriptCallT = tuple[
+    "SyncScript", Sequence[types.KeyT], Sequence[types.StoreValueT] | None
+]
+
+# (script, keys, args, future) of a script call waiting to be pipelined.
+_PendingCallT = tuple[
+    "SyncScript",
+    Sequence[types.KeyT],
+    Sequence[types.StoreValueT] | None,
+    "Future[Any]",
+]
+
+
+def _flush_forever(auto_pipeline_ref: "weakref.ReferenceType[AutoPipeline]") -> None:
+    # Hold the pipeline weakly, so the thread exits once the store is collected.
+    while True:
+        auto_pipeline: AutoPipeline | None = auto_pipeline_ref()
+        if auto_pipeline is None:
+            return
+        auto_pipeline.flush(timeout=1)
+        del auto_pipeline
+
+
+class AutoPipeline:
+    """Coalesce script calls from many threads into one Redis pipeline.
+
+    Callers block on a per-call future, while a daemon thread sends the
+    pending calls in one non-transactional pipeline per flush, up to
+    ``max_size`` calls at a time. Calls queued while a pipeline is in flight
+    are batched into the next one.
+    """
+
+    def __init__(
+        self, backend: "RedisStoreBackend", window: float = 0, max_size: int = 1024
+    ) -> None:
+        """Initializes the auto pipeline.
+
+        :param backend: The backend whose client executes the pipelines.
+        :param window: Seconds to linger for more calls after the first pending
+            one, before flushing a batch smaller than ``max_size``.
+        :param max_size: The maximum number of calls in a pipeline.
+        """
+        self._backend: RedisStoreBackend = backend
+        self.window: float = window
+        self.max_size: int = max_size
+        self._pending: list[_PendingCallT] = []
+        self._cond: threading.Condition = threading.Condition()
+        self._flusher: threading.Thread | None = None
+
+    def execute(
+        self,
+        script: "SyncScript",
+        keys: Sequence[types.KeyT],
+        args: Sequence[types.StoreValueT] | None,
+    ) -> object:
+        """Queue ``script`` into the next pipeline and wait for its result."""
+        future: Future[Any] = Future()
+        with self._cond:
+            self._pending.append((script, keys, args, future))
+            # The thread is also gone in a child process after a fork.
+            if self._flusher is None or not self._flusher.is_alive():
+                self._flusher = threading.Thread(
+                    target=_flush_forever,
+                    args=(weakref.ref(self),),
+                    name="throttled-redis-auto-pipeline",
+                    daemon=True,
+                )
+                self._flusher.start()
+            self._cond.notify()
+        return future.result()
+
+    def flush(self, timeout: float | None = None) -> int:
+        """Wait up to ``timeout`` seconds for pending calls and send a batch.
+
+        :return: The number of calls sent.
+        """
+        with self._cond:
+            if not self._cond.wait_for(lambda: self._pending, timeout):
+                return 0
+
+            deadline: float = time.monotonic() + self.window
+            while len(self._pending) < self.max_size:
+                remaining: float = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                self._cond.wait(remaining)
+
+            batch: list[_PendingCallT] = self._pending[: self.max_size]
+            del self._pending[: self.max_size]
+
+        self._execute(batch)
+        return len(batch)
+
+    def _execute(self, batch: list[_PendingCallT]) -> None:
+        try:
+            results: list[object] = self._backend.execute_scripts(
+                [(script, keys, args) for script, keys, args, _ in batch]
+            )
+        except Exception as e:
+            # The whole pipeline failed, e.g. the connection was lost.
+            for *_, future in batch:
+                future.set_exception(e)
+            return
+
+        for (*_, future), result in zip(batch, results, strict=True):
+            if isinstance(result, Exception):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+
+def _track_forever(tracker_ref: "weakref.ReferenceType[ClientTracker]") -> None:
+    # Hold the tracker weakly, so the thread exits once the store is collected.
+    while True:
+        tracker: ClientTracker | None = tracker_ref()
+        if tracker is None or not tracker.supported:
+            return
+        tracker.poll()
+        del tracker
+
+
+class ClientTracker(BaseClientTracker):
+    """Keep a :class:`ClientCache` in sync with Redis from a daemon thread.
+
+    The two connections of the tracker are taken from the connection pool
+    of the backend, and are given back once lost.
+    """
+
+    def __init__(
+        self, backend: "RedisStoreBackend", cache: ClientCache, interval: float = 1
+    ) -> None:
+        super().__init__(cache, interval)
+        self._backend: RedisStoreBackend = backend
+        self._lock: threading.Lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+        # The subscriber and tracking connections, taken from the pool.
+        self._connections: list[types.SyncConnectionP] = []
+        self._connected: bool = False
+        self._pid: int = os.getpid()
+
+    def start(self) -> None:
+        """Start the tracking thread, if it is not running."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+
+        with self._lock:
+            # The thread is also gone in a child process after a fork.
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(
+                    target=_track_forever,
+                    args=(weakref.ref(self),),
+                    name="throttled-redis-client-tracker",
+                    daemon=True,
+                )
+                self._thread.start()
+
+    def poll(self) -> None:
+        """Handle an invalidation, waiting up to ``interval`` seconds for it.
+
+        Connects first if the tracker is not connected.
+        """
+        try:
+            self._poll()
+        except self._backend.response_exceptions:
+            # E.g. Redis < 6, which does not support CLIENT TRACKING.
+            self.supported = False
+            self._disconnect()
+        except self._backend.base_exceptions:
+            self._disconnect()
+            time.sleep(self.interval)
+
+    def _poll(self) -> None:
+        if not self._connected or self._pid != os.getpid():
+            self._connect()
+            return
+
+        subscriber, tracking = self._connections
+        if subscriber.can_read(timeout=self.interval):
+            self._on_message(subscriber.read_response())
+        else:
+            # Tracking is turned off once its connection is closed.
+            tracking.send_command("PING")
+            tracking.read_response()
+
+    def _acquire(self) -> types.SyncConnectionP:
+        pool: SyncPoolStatsMixin = cast(
+            "SyncPoolStatsMixin", self._backend.get_connection_pool()
+        )
+        connection: types.SyncConnectionP = cast("types.SyncConnectionP", pool.acquire())
+        self._connections.append(connection)
+        return connection
+
+    def _connect(self) -> None:
+        self._disconnect()
+        self._pid = os.getpid()
+        subscriber: types.SyncConnectionP = self._acquire()
+        subscriber.send_command("CLIENT", "ID")
+        client_id: object = subscriber.read_response()
+        subscriber.send_command("SUBSCRIBE", self.CHANNEL)
+        subscriber.read_response()
+
+        tracking: types.SyncConnectionP = self._acquire()
+        tracking.send_command(*self._get_tracking_args(client_id))
+        tracking.read_response()
+        self._connected = True
+        self.cache.enable()
+
+    def _disconnect(self) -> None:
+        self.cache.disable()
+        self._connected = False
+        connections: list[types.SyncConnectionP] = self._connections
+        self._connections = []
+        # Connections of the parent process must be left alone after a fork.
+        if self._pid != os.getpid():
+            return
+
+        pool: SyncPoolStatsMixin = cast(
+            "SyncPoolStatsMixin", self._backend.get_connection_pool()
+        )
+        for connection in connections:
+            connection.disconnect()
+            pool.release(cast("Any", connection))
+
 
 class RedisStoreBackend(BaseRedisStoreBackend[types.SyncRedisClientP]):
     """Backend for sync Redis store."""
 
+    def __init__(
+        self, server: str | None = None, options: dict[str, Any] | None = None
+    ) -> None:
+        super().__init__(server, options)
+
+        self._auto_pipeline: AutoPipeline | None = None
+        if self.options["AUTO_PIPELINE"]:
+            self._auto_pipeline = AutoPipeline(
+                self,
+                self.options["AUTO_PIPELINE_WINDOW"],
+                self.options["AUTO_PIPELINE_MAX_SIZE"],
+            )
+
+        self._client_tracker: ClientTracker | None = None
+        if self._client_cache is not None:
+            self._client_tracker = ClientTracker(self, self._client_cache)
+
+    def get_auto_pipeline(self) -> AutoPipeline | None:
+        """Return the auto pipeline, or None if ``AUTO_PIPELINE`` is disabled."""
+        return self._auto_pipeline
+
+    def get_client_cache(self) -> ClientCache | None:
+        """Return the client cache, or None if ``CLIENT_CACHE`` is disabled."""
+        if self._client_tracker is None:
+            return None
+
+        self._client_tracker.start()
+        return self._client_tracker.cache
+
+    def prewarm(self, connections: int | None = None) -> int:
+        """Open connections in the pool ahead of the first calls.
+
+        :param connections: The number of connections to open, defaults
+            to ``POOL_PREWARM``, and is capped at ``MAX_CONNECTIONS``.
+        :return: The number of connections opened.
+        """
+        pool: SyncPoolStatsMixin = cast("SyncPoolStatsMixin", self.get_connection_pool())
+        acquired: list[Any] = []
+        try:
+            acquired.extend(
+                pool.acquire() for __ in range(self._get_prewarm_size(connections))
+            )
+        finally:
+            for connection in acquired:
+                pool.release(connection)
+        return len(acquired)
+
+    def get_read_client(self) -> types.SyncRedisClientP:
+        """Return the client for read-only calls.
+
+        That is the replica client if ``READ_FROM_REPLICAS`` is enabled and
+        replicas lag behind by no more than ``REPLICA_MAX_LAG``, otherwise
+        the primary client.
+        """
+        if not self.reads_from_replicas():
+            return self.get_client()
+
+        client: types.SyncRedisClientP = self.get_replica_client()
+        if self._should_check_replicas():
+            info: dict[str, Any] | None = None
+            with contextlib.suppress(*self.base_exceptions):
+                info = self.get_client().info(
+                    "replication", **self._get_replication_info_kwargs()
+                )
+            self._on_replicas_checked(info)
+        return client if self._replica_fresh else self.get_client()
+
+    def load_scripts(self) -> list[str]:
+        """Load all registered scripts into Redis, see :class:`ScriptRegistry`.
+
+        :return: The SHA1 digests of the loaded scripts.
+        """
+        client: types.SyncRedisClientP = self.get_client()
+        scripts: dict[str, str] = ScriptRegistry.get_scripts()
+        if self.is_cluster():
+            # Cluster pipelines cannot fan out to nodes, SCRIPT LOAD is sent to
+            # all primaries by the client instead.
+            for script in scripts.values():
+                client.script_load(script)
+        else:
+            pipeline: types.SyncPipelineP = client.pipeline(transaction=False)
+            for script in scripts.values():
+                pipeline.script_load(script)
+            pipeline.execute()
+        return list(scripts)
+
+    def load_functions(self) -> bool:
+        """Load the FUNCTION library of all registered scripts into Redis.
+
+        On Redis Cluster, the library is loaded on all primaries.
+
+        :return: Whether the library is loaded, if Redis does not support
+            functions, scripts are run with EVALSHA instead.
+        """
+        error: Exception | None = None
+        try:
+            self.get_client().function_load(ScriptRegistry.get_library()[1], True)
+        except self.response_exceptions as e:
+            error = e
+        return self._on_functions_loaded(error)
+
+    def ensure_functions(self) -> None:
+        """Load the FUNCTION library if it is used and not loaded yet."""
+        if self.uses_functions() and not self._functions_loaded:
+            self.load_functions()
+
+    def ensure_scripts(self) -> None:
+        """Load all registered scripts again once a connection has reconnected.
+
+        This saves the NOSCRIPT misses of the following calls after a connection
+        reset, a restart or a failover, see :meth:`is_reconnected`. Scripts that
+        are still found missing are loaded again on the miss.
+        """
+        if self.is_reconnected() and not self.uses_functions():
+            self.load_scripts()
+
+    def queue_script(
+        self,
+        client: types.SyncRedisClientP | types.SyncPipelineP,
+        script: "SyncScript",
+        keys: Sequence[types.KeyT],
+        args: Sequence[types.StoreValueT] | None,
+    ) -> object:
+        """Call ``script`` on a client or queue it on a pipeline.
+
+        The script is called as a function if the library is loaded, or with
+        EVALSHA otherwise, a missing script is left to the caller.
+        """
+        function: tuple[str, bool] | None = self.get_function(script.sha)
+        if function is None:
+            return client.evalsha(script.sha, len(keys), *keys, *(args or ()))
+
+        name, read_only = function
+        fcall = client.fcall_ro if read_only else client.fcall
+        return fcall(name, len(keys), *keys, *(args or ()))
+
+    def execute_script(
+        self,
+        script: "SyncScript",
+        keys: Sequence[types.KeyT],
+        args: Sequence[types.StoreValueT] | None,
+    ) -> object:
+        """Execute ``script`` as a function if the library is used, or EVALSHA."""
+        self.ensure_scripts()
+        self.ensure_functions()
+        client: types.SyncRedisClientP = self.get_client()
+        if self.get_function(script.sha) is not None:
+            try:
+                return self.queue_script(client, script, keys, args)
+            except self.response_exceptions as e:
+                if not self.is_function_missing(e):
+                    raise
+                # The library is gone, e.g. after FUNCTION FLUSH, load it
+                # again and fall back to EVALSHA for this call.
+                self.load_functions()
+
+        try:
+            return client.evalsha(script.sha, len(keys), *keys, *(args or ()))
+        except self.no_script_exceptions:
+            # The script cache is empty after a restart, failover or flush,
+            # reload all scripts at once rather than missing them one by one.
+            self.load_scripts()
+            return script(keys, args)
+
+    def _execute_pipeline(self, calls: Sequence[_ScriptCallT]) -> list[object]:
+        pipeline: types.SyncPipelineP = self.get_client().pipeline(transaction=False)
+        for script, keys, args in calls:
+            self.queue_script(pipeline, script, keys, args)
+        results: list[object] = pipeline.execute(raise_on_error=False)
+        self.check_pipeline_results(results)
+        return results
+
+    def execute_scripts(self, calls: Sequence[_ScriptCallT]) -> list[object]:
+        """Execute many script calls in one pipeline.
+
+        On Redis Cluster, the client splits the pipeline by node and sends the
+        per-node pipelines to all nodes before reading any reply, so a batch
+        takes about one round trip regardless of the number of nodes.
+
+        :param calls: A sequence of ``(script, keys, args)`` calls.
+        :return: The result, or the raised exception, of each call in the
+            same order as ``calls``.
+        """
+        self.ensure_scripts()
+        self.ensure_functions()
+        results: list[object] = self._execute_pipeline(calls)
+        missing: list[int] = [
+            index
+            for index, result in enumerate(results)
+            if isinstance(result, self.no_script_exceptions)
+        ]
+        if not missing:
+            return results
+
+        # Scripts are missing after a restart, failover or flush, reload them
+        # all at once and retry the missed calls in one more pipeline.
+        self.load_scripts()
+        retried: list[object] = self._execute_pipeline([calls[i] for i in missing])
+        for index, result in zip(missing, retried, strict=True):
+            results[index] = result
+            if not isinstance(result, self.no_script_exceptions):
+                continue
+            # Not a registered script, load it on its own.
+            try:
+                results[index] = self.execute_script(*calls[index])
+            except self.base_exceptions as e:
+                results[index] = e
+        return results
+
+    def execute_read_script(
+        self,
+        script: "SyncScript",
+        keys: Sequence[types.KeyT],
+        args: Sequence[types.StoreValueT] | None,
+    ) -> object:
+        """Execute a read-only ``script`` with the client for read-only calls."""
+        client: types.SyncRedisClientP = self.get_read_client()
+        if client is self.get_client():
+            return self.execute_script(script, keys, args)
+
+        if self.get_function(script.sha) is not None:
+            try:
+                return self.queue_script(client, script, keys, args)
+            except self.response_exceptions as e:
+                # Replicas may not have the library yet, fall back to scripts.
+                if not self.is_function_missing(e):
+                    raise
+
+        if not self.is_cluster():
+            # Replicas run read-only scripts, the script is loaded on a miss.
+            return script(keys, args, client=cast("Any", client))
+
+        # Redis Cluster only routes the read-only variants to replicas.
+        try:
+            return client.evalsha_ro(script.sha, len(keys), *keys, *(args or ()))
+        except self.no_script_exceptions:
+            return client.eval_ro(script.script, len(keys), *keys, *(args or ()))
+
 
 class BaseRedisAtomicAction(BaseAtomicAction, abc.ABC):
     """Base class for sync Redis atomic actions bound to RedisStoreBackend."""
 
     STORE_TYPE: str = constants.StoreType.REDIS.value
     _backend: RedisStoreBackend
+    # The script of the action, registered on the client of the store.
+    _script: "SyncScript"
+
+    def __init_subclass__(cls, **kwargs: object) -> None:
+        super().__init_subclass__(**kwargs)
+        scripts: str | None = getattr(cls, "SCRIPTS", None)
+        if scripts:
+            ScriptRegistry.register(
+                scripts, read_only=cls.TYPE == constants.ATOMIC_ACTION_TYPE_PEEK
+            )
 
     def _register_script(self, scripts: str) -> "SyncScript":
         return self._backend.get_client().register_script(scripts)
 
+    def _execute_script(
+        self,
+        script: "SyncScript",
+        keys: Sequence[types.KeyT],
+        args: Sequence[types.StoreValueT] | None,
+    ) -> object:
+        """Execute ``script``, through the auto pipeline if it is enabled.
+
+        Peeks are routed to replicas if ``READ_FROM_REPLICAS`` is enabled.
+        """
+        if (
+            self.TYPE == constants.ATOMIC_ACTION_TYPE_PEEK
+            and self._backend.reads_from_replicas()
+        ):
+            return self._backend.execute_read_script(script, keys, args)
+
+        try:
+            auto_pipeline: AutoPipeline | None = self._backend.get_auto_pipeline()
+            if auto_pipeline is not None:
+                return auto_pipeline.execute(script, keys, args)
+            return self._backend.execute_script(script, keys, args)
+        finally:
+            self._backend.invalidate_client_cache(keys)
+
+    def _execute_script_many(
+        self, script: "SyncScript", calls: Sequence[types.AtomicActionCallT]
+    ) -> list[Any]:
+        """Execute ``script`` for each ``(keys, args)`` pair in one pipeline."""
+        try:
+            results: list[Any] = self._backend.execute_scripts(
+                [(script, keys, args) for keys, args in calls]
+            )
+        finally:
+            for keys, __ in calls:
+                self._backend.invalidate_client_cache(keys)
+        for result in results:
+            if isinstance(result, Exception):
+                raise result
+        return results
+
 
 class RedisStore(BaseStore):
     """Concrete implementation of BaseStore using Redis as backend.
@@ -180,14 +1108,76 @@ class RedisStore(BaseStore):
 
     TYPE: str = constants.StoreType.REDIS.value
 
+    _WRAPPED_METHOD_NAMES: tuple[str, ...] = (
+        *BaseStore._WRAPPED_METHOD_NAMES,
+        "preload_scripts",
+        "prewarm",
+    )
+
     _BACKEND_CLASS: type[RedisStoreBackend] = RedisStoreBackend
     _backend: RedisStoreBackend
 
+    def preload_scripts(self) -> list[str]:
+        """Load the Lua scripts of all rate limiters into Redis.
+
+        Call it on startup to save the first EVALSHA miss per script and
+        process. On Redis Cluster, scripts are loaded on all primaries.
+        All scripts are reloaded when a connection of the pool reconnects,
+        e.g. on a failover, or whenever one is found missing.
+
+        :return: The SHA1 digests of the loaded scripts.
+        """
+        if self._backend.uses_functions():
+            self._backend.load_functions()
+        return self._backend.load_scripts()
+
+    def prewarm(self, connections: int | None = None) -> int:
+        """Open connections in the pool ahead of the first calls.
+
+        Call it on startup to save the connection setup of the first calls,
+        see ``POOL_PREWARM``. Not available on Redis Cluster.
+
+        :param connections: The number of connections to open, defaults
+            to ``POOL_PREWARM``, and is capped at ``MAX_CONNECTIONS``.
+        :return: The number of connections opened.
+        """
+        return self._backend.prewarm(connections)
+
+    def pool_stats(self) -> PoolStats:
+        """Return the statistics of the connection pool.
+
+        Not available on Redis Cluster, which keeps a pool per node.
+        """
+        return self._backend.get_connection_pool().get_stats()
+
+    def client_cache_stats(self) -> ClientCacheStats:
+        """Return the statistics of the client cache, see ``CLIENT_CACHE``."""
+        cache: ClientCache | None = self._backend.get_client_cache()
+        if cache is None:
+            raise exceptions.SetUpError("CLIENT_CACHE is not enabled.")
+        return cache.get_stats()
+
+    def _cached_read(
+        self, command: str, key: types.KeyT, read: Callable[[types.KeyT], _ValueT]
+    ) -> _ValueT:
+        cache: ClientCache | None = self._backend.get_client_cache()
+        if cache is None or not cache.is_cachable(key):
+            return read(key)
+
+        hit, cached = cache.get(command, key)
+        if hit:
+            return cast("_ValueT", cached)
+
+        token: object | None = cache.begin(key)
+        value: _ValueT = read(key)
+        cache.set(token, command, key, value)
+        return value
+
     def exists(self, key: types.KeyT) -> bool:
-        return bool(self._backend.get_client().exists(key))
+        return bool(self._backend.get_read_client().exists(key))
 
     def ttl(self, key: types.KeyT) -> int:
-        return int(self._backend.get_client().ttl(key))
+        return int(self._backend.get_read_client().ttl(key))
 
     def expire(self, key: types.KeyT, timeout: int) -> None:
         self._validate_timeout(timeout)
@@ -196,9 +1186,13 @@ class RedisStore(BaseStore):
     def set(self, key: types.KeyT, value: types.StoreValueT, timeout: int) -> None:
         self._validate_timeout(timeout)
         self._backend.get_client().set(key, value, ex=timeout)
+        self._backend.invalidate_client_cache([key])
 
     def get(self, key: types.KeyT) -> types.StoreValueT | None:
-        value: types.StoreValueT | None = self._backend.get_client().get(key)
+        return self._cached_read("get", key, self._get)
+
+    def _get(self, key: types.KeyT) -> types.StoreValueT | None:
+        value: types.StoreValueT | None = self._backend.get_read_client().get(key)
         if value is None:
             return None
         return utils.format_value(value)
@@ -213,6 +1207,11 @@ class RedisStore(BaseStore):
         if key is None and not mapping:
             raise exceptions.DataError("hset must with key value pairs")
         self._backend.get_client().hset(name, key, value, mapping)
+        self._backend.invalidate_client_cache([name])
 
     def hgetall(self, name: types.KeyT) -> types.StoreDictValueT:
-        return utils.format_kv(self._backend.get_client().hgetall(name))
+        # Cached values are shared, callers get a copy of their own.
+        return dict(self._cached_read("hgetall", name, self._hgetall))
+
+    def _hgetall(self, name: types.KeyT) -> types.StoreDictValueT:
+        return utils.format_kv(self._backend.get_read_client().hgetall(name))
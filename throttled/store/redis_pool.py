@@ -26,8 +26,13 @@
 # THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
 import abc
+import inspect
+import threading
+import time
+import weakref
+from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any, Protocol, TypeAlias, cast
-from urllib.parse import ParseResult, parse_qs, urlparse
+from urllib.parse import ParseResult, parse_qs, urlencode, urlparse
 
 from ..exceptions import SetUpError
 from ..types import RedisP
@@ -37,12 +42,208 @@ if TYPE_CHECKING:
     import redis
     import redis.asyncio as aioredis
     from redis.asyncio.cluster import ClusterNode as AsyncClusterNode
+    from redis.asyncio.connection import AbstractConnection
     from redis.cluster import ClusterNode as SyncClusterNode
 
     ConnectionPool: TypeAlias = redis.ConnectionPool | aioredis.ConnectionPool
     Sentinel: TypeAlias = redis.Sentinel | aioredis.Sentinel
     ClusterNode: TypeAlias = SyncClusterNode | AsyncClusterNode
 
+    _SyncPoolBase: TypeAlias = redis.ConnectionPool
+    _AsyncPoolBase: TypeAlias = aioredis.ConnectionPool
+else:
+    _SyncPoolBase = _AsyncPoolBase = object
+
+# redis-py pools fall back to this size when max_connections is not set.
+_UNBOUNDED_CONNECTIONS: int = 2**31
+
+
+@dataclass(frozen=True)
+class PoolStats:
+    """PoolStats is a snapshot of the statistics of a connection pool."""
+
+    #: The number of connections created by the pool.
+    created: int
+
+    #: The number of connections currently checked out of the pool.
+    in_use: int
+
+    #: The number of connections kept in the pool for reuse.
+    idle: int
+
+    #: The maximum number of connections, None if unbounded.
+    max_connections: int | None
+
+    #: The number of times a connection has been checked out of the pool.
+    acquired: int
+
+    #: The total seconds spent waiting to check out connections.
+    wait_time: float
+
+    #: The number of times a connection has been established again, e.g. after
+    #: a connection reset, a restart or a failover of Redis.
+    reconnected: int = 0
+
+
+class _PoolCounters:
+    """Thread-safe counters of a connection pool, see :class:`PoolStats`."""
+
+    def __init__(self) -> None:
+        self._lock: threading.Lock = threading.Lock()
+        self.created: int = 0
+        self.in_use: int = 0
+        self.acquired: int = 0
+        self.wait_time: float = 0
+        self.reconnected: int = 0
+        self._connected: weakref.WeakSet[object] = weakref.WeakSet()
+
+    def on_created(self) -> None:
+        with self._lock:
+            self.created += 1
+
+    def on_acquired(self, start: float) -> None:
+        with self._lock:
+            self.acquired += 1
+            self.in_use += 1
+            self.wait_time += time.perf_counter() - start
+
+    def on_released(self) -> None:
+        with self._lock:
+            self.in_use = max(self.in_use - 1, 0)
+
+    def on_connected(self, connection: object) -> None:
+        with self._lock:
+            if connection in self._connected:
+                self.reconnected += 1
+            else:
+                self._connected.add(connection)
+
+    def get_stats(self, max_connections: int) -> PoolStats:
+        with self._lock:
+            return PoolStats(
+                created=self.created,
+                in_use=self.in_use,
+                idle=max(self.created - self.in_use, 0),
+                max_connections=(
+                    None
+                    if max_connections >= _UNBOUNDED_CONNECTIONS
+                    else max_connections
+                ),
+                acquired=self.acquired,
+                wait_time=self.wait_time,
+                reconnected=self.reconnected,
+            )
+
+
+class PoolStatsMixin:
+    """Mixin for connection pools that record :class:`PoolStats`."""
+
+    _counters: _PoolCounters
+    max_connections: int
+
+    def get_stats(self) -> PoolStats:
+        """Return a snapshot of the statistics of the pool."""
+        return self._counters.get_stats(self.max_connections)
+
+    def get_reconnected(self) -> int:
+        """Return the number of times a connection has been established again."""
+        return self._counters.reconnected
+
+    def _on_connect(self, connection: object) -> None:
+        # Called by redis-py each time a connection of the pool connects.
+        self._counters.on_connected(connection)
+
+
+class SyncPoolStatsMixin(PoolStatsMixin, _SyncPoolBase):
+    """Record :class:`PoolStats` of a sync connection pool."""
+
+    def reset(self) -> None:
+        # Called by the pool constructor, and again after a fork.
+        self._counters = _PoolCounters()
+        super().reset()
+
+    def make_connection(self) -> "redis.connection.ConnectionInterface":
+        self._counters.on_created()
+        connection: redis.connection.ConnectionInterface = super().make_connection()
+        connection.register_connect_callback(self._on_connect)  # type: ignore[no-untyped-call]
+        return connection
+
+    def get_connection(
+        self, *args: object, **kwargs: object
+    ) -> "redis.connection.Connection":
+        start: float = time.perf_counter()
+        connection: redis.connection.Connection = super().get_connection(*args, **kwargs)
+        self._counters.on_acquired(start)
+        return connection
+
+    def release(self, connection: "redis.connection.ConnectionInterface") -> None:
+        super().release(cast("redis.connection.Connection", connection))
+        self._counters.on_released()
+
+    def acquire(self) -> "redis.connection.Connection":
+        """Check out a connected connection, release it with :meth:`release`."""
+        try:
+            return self.get_connection()
+        except TypeError:
+            # Older redis-py versions require a command name.
+            return self.get_connection("PING")
+
+
+class AsyncPoolStatsMixin(PoolStatsMixin, _AsyncPoolBase):
+    """Record :class:`PoolStats` of an async connection pool."""
+
+    def reset(self) -> None:
+        self._counters = _PoolCounters()
+        super().reset()  # type: ignore[no-untyped-call]
+
+    def make_connection(self) -> "AbstractConnection":
+        self._counters.on_created()
+        connection: AbstractConnection = super().make_connection()  # type: ignore[no-untyped-call]
+        connection.register_connect_callback(self._on_connect)  # type: ignore[no-untyped-call]
+        return connection
+
+    async def get_connection(
+        self, *args: object, **kwargs: object
+    ) -> "AbstractConnection":
+        start: float = time.perf_counter()
+        connection: AbstractConnection = await super().get_connection(  # type: ignore[no-untyped-call]
+            *args, **kwargs
+        )
+        self._counters.on_acquired(start)
+        return connection
+
+    async def release(self, connection: "AbstractConnection") -> None:
+        await super().release(connection)
+        self._counters.on_released()
+
+    async def acquire(self) -> "AbstractConnection":
+        """Check out a connected connection, release it with :meth:`release`."""
+        try:
+            return await self.get_connection()
+        except TypeError:
+            return await self.get_connection("PING")
+
+
+_STATS_POOL_CLASSES: dict[type[object], type[object]] = {}
+
+
+def get_stats_pool_cls(pool_cls: type["ConnectionPool"]) -> type["ConnectionPool"]:
+    """Return a subclass of ``pool_cls`` that records :class:`PoolStats`."""
+    if issubclass(pool_cls, PoolStatsMixin):
+        return pool_cls
+
+    stats_pool_cls: type[object] | None = _STATS_POOL_CLASSES.get(pool_cls)
+    if stats_pool_cls is None:
+        mixin: type[PoolStatsMixin] = (
+            AsyncPoolStatsMixin
+            if inspect.iscoroutinefunction(pool_cls.get_connection)
+            else SyncPoolStatsMixin
+        )
+        stats_pool_cls = _STATS_POOL_CLASSES[pool_cls] = type(
+            pool_cls.__name__, (mixin, pool_cls), {"__module__": pool_cls.__module__}
+        )
+    return cast("type[ConnectionPool]", stats_pool_cls)
+
 
 class _RedisClientFactory(Protocol):
     """Protocol for Redis client class constructor.
@@ -68,8 +269,8 @@ class BaseConnectionFactory(abc.ABC):
     def __init__(self, options: dict[str, Any]) -> None:
         pool_cls_path: str = options.get("CONNECTION_POOL_CLASS", "redis.ConnectionPool")
         try:
-            self.pool_cls: type[ConnectionPool] = cast(
-                "type[ConnectionPool]", import_string(pool_cls_path)
+            self.pool_cls: type[ConnectionPool] = get_stats_pool_cls(
+                cast("type[ConnectionPool]", import_string(pool_cls_path))
             )
         except ImportError:
             raise ImportError(
@@ -110,6 +311,13 @@ class BaseConnectionFactory(abc.ABC):
         """Given a basic connection parameters, return a new connection."""
         raise NotImplementedError
 
+    def connect_replica(self, url: str | None = None) -> RedisP:  # noqa: PLR6301
+        """Return a new connection that reads from replicas.
+
+        Only Redis Sentinel and Cluster know the replicas of a server.
+        """
+        raise SetUpError("Reading from replicas requires Redis Sentinel or Cluster.")
+
     @abc.abstractmethod
     def get_connection(self, params: dict[str, Any]) -> RedisP:
         """Given a now preformatted params, return a new connection.
@@ -165,6 +373,25 @@ class ConnectionFactory(BaseConnectionFactory):
                 raise SetUpError("Socket connect timeout should be float or integer")
             kwargs["socket_connect_timeout"] = socket_connect_timeout
 
+        # PING connections that have been idle for longer before use.
+        health_check_interval: float | None = self.options.get("HEALTH_CHECK_INTERVAL")
+        if health_check_interval is not None:
+            kwargs["health_check_interval"] = health_check_interval
+
+        return kwargs
+
+    def make_pool_params(self) -> dict[str, Any]:
+        """Build the sizing parameters of connection pools."""
+        kwargs: dict[str, Any] = {}
+        max_connections: int | None = self.options.get("MAX_CONNECTIONS")
+        if max_connections is not None:
+            kwargs["max_connections"] = max_connections
+
+        # Only accepted by blocking pools, how long to wait for a free connection.
+        pool_timeout: float | None = self.options.get("POOL_TIMEOUT")
+        if pool_timeout is not None:
+            kwargs["timeout"] = pool_timeout
+
         return kwargs
 
     def connect(self, url: str | None = None) -> RedisP:
@@ -195,6 +422,7 @@ class ConnectionFactory(BaseConnectionFactory):
 
     def get_connection_pool(self, params: dict[str, Any]) -> "ConnectionPool":
         cp_params: dict[str, Any] = dict(params)
+        cp_params.update(self.make_pool_params())
         cp_params.update(self.pool_cls_kwargs)
         pool: ConnectionPool = self.pool_cls.from_url(**cp_params)
 
@@ -238,6 +466,13 @@ class SentinelConnectionFactory(ConnectionFactory):
     def _get_pool_key(self, params: dict[str, Any]) -> str:
         return f"{self.redis_client_cls_path}:{self._sentinels_str}:{params['url']}"
 
+    def connect_replica(self, url: str | None = None) -> RedisP:
+        """Return a new connection to the replicas of the monitored service."""
+        parsed: ParseResult = urlparse(url or self.DEFAULT_URL)
+        query: dict[str, list[str]] = parse_qs(parsed.query)
+        query["is_master"] = ["false"]
+        return self.connect(parsed._replace(query=urlencode(query, doseq=True)).geturl())
+
     def get_connection_pool(self, params: dict[str, Any]) -> "ConnectionPool":
         """Return a new sentinel connection pool for the given parameters."""
         url: ParseResult = cast("ParseResult", urlparse(params["url"]))
@@ -284,12 +519,20 @@ class ClusterConnectionFactory(ConnectionFactory):
         cluster_params: dict[str, Any] = dict(params)
         cluster_params.pop("url", None)
         cluster_params.pop("parser_class", None)
+        # RedisCluster keeps a connection pool of MAX_CONNECTIONS per node.
+        cluster_params.update(self.make_pool_params())
         return self.redis_client_cls(
             startup_nodes=self._startup_nodes,
             **cluster_params,
             **self.redis_client_cls_kwargs,
         )
 
+    def connect_replica(self, url: str | None = None) -> RedisP:
+        """Return a new connection that sends read-only commands to replicas."""
+        params: dict[str, Any] = self.make_connection_params(url)
+        params["read_from_replicas"] = True
+        return self.get_connection(params)
+
 
 def get_connection_factory(
     path: str | None = None, options: dict[str, Any] | None = None
@@ -1,16 +1,17 @@
 import abc
 import threading
-import time
 from collections.abc import Callable, Sequence
 from functools import wraps
 from types import TracebackType
 from typing import TYPE_CHECKING
 
-from . import exceptions, types, utils
+from . import constants, exceptions, types
 from ._throttled.logic import ThrottledLogic
 from .hooks import Hook, HookContext, build_hook_chain
 from .rate_limiter import (
     BaseRateLimiter,
+    DeniedCache,
+    Lease,
     Quota,
     RateLimiterRegistry,
     RateLimitResult,
@@ -24,6 +25,8 @@ Func = Callable[types.P, types.R]
 if TYPE_CHECKING:
     from _thread import LockType
 
+    from .clock import Clock
+
 
 class BaseThrottled(ThrottledLogic, abc.ABC):
     """Abstract class for all throttled classes."""
@@ -32,10 +35,15 @@ class BaseThrottled(ThrottledLogic, abc.ABC):
         "key",
         "timeout",
         "_quota",
+        "_quotas",
+        "_rule_limiters",
         "_cost",
         "_store",
+        "_clock",
         "_limiter_cls",
         "_limiter",
+        "_denied_cache",
+        "_leased",
         "_lock",
         "_hooks",
     )
@@ -53,6 +61,7 @@ class BaseThrottled(ThrottledLogic, abc.ABC):
         store: BaseStore | None = None,
         cost: int = 1,
         hooks: Sequence[Hook] | None = None,
+        denied_cache: DeniedCache | None = None,
     ) -> None:
         """Initializes the Throttled class.
 
@@ -67,15 +76,21 @@ class BaseThrottled(ThrottledLogic, abc.ABC):
         :param quota: The quota for the rate limiter, default: 60 requests per minute.
             It accepts either:
             - :class:`throttled.rate_limiter.Quota`
-            - A quota DSL string, e.g. ``"100/s burst 200"``
+            - A quota DSL string, e.g. ``"100/s burst 200"``, multiple rules
+              such as ``"10/s, 500/m, 10000/d"`` are all enforced on every request
+              and the most restrictive rule is reported.
         :param store: The store to use for the rate limiter. By default, it uses
             the global shared :class:`throttled.store.MemoryStore` instance with
             maximum capacity of 1024, so you don't usually need to create it manually.
+            Blocking waits sleep on the clock of the store, see ``CLOCK``.
         :type store: :class:`throttled.store.BaseStore`
         :param cost: The cost of each request in terms of how much of the rate limit
             quota it consumes, default: 1.
         :param hooks: A sequence of hooks invoked by the middleware before and/or after
             each ``limit()`` operation, including any internal retries.
+        :param denied_cache: An opt-in :class:`DeniedCache` that answers keys known
+            to be limited locally until their ``retry_after``, only used with a
+            single quota rule.
         """
         # TODO Support key prefix.
         # TODO Support extract key from params.
@@ -85,15 +100,24 @@ class BaseThrottled(ThrottledLogic, abc.ABC):
         self.timeout: float = self._NON_BLOCKING if timeout is None else timeout
         self._validate_timeout(self.timeout)
 
-        self._quota: Quota = self._parse_quota(quota)
+        self._quotas: list[Quota] = self._parse_quotas(quota)
+        self._quota: Quota = self._quotas[0]
         self._store: BaseStore = store or self._DEFAULT_GLOBAL_STORE
+        self._clock: Clock = self._store.clock
         self._limiter_cls: type[BaseRateLimiter] = self._REGISTRY_CLASS.get(
             using or self._DEFAULT_RATE_LIMITER_TYPE
         )
+        self._leased: bool = self._is_leased(self._limiter_cls, self._quotas)
 
         self._lock: LockType = self._get_lock()
         self._limiter: BaseRateLimiter | None = None
+        # One limiter per quota rule, only used when multiple rules are configured.
+        self._rule_limiters: list[BaseRateLimiter] = []
         self._hooks: tuple[Hook, ...] = self._validate_hooks(hooks)
+        self._denied_cache: DeniedCache | None = denied_cache
+        if denied_cache is not None:
+            # Deadlines are counted on the clock of the store, as quotas.
+            denied_cache.bind_clock(self._clock)
 
         self._validate_cost(cost)
         self._cost: int = cost
@@ -116,8 +140,12 @@ class BaseThrottled(ThrottledLogic, abc.ABC):
                 return limiter
 
             created_limiter: BaseRateLimiter = self._limiter_cls(
-                self._quota, self._store
+                self._quota, self._store, denied_cache=self._denied_cache
             )
+            if len(self._quotas) > 1:
+                self._rule_limiters = [created_limiter] + [
+                    self._limiter_cls(quota, self._store) for quota in self._quotas[1:]
+                ]
             self._limiter = created_limiter
             return created_limiter
 
@@ -149,7 +177,13 @@ class BaseThrottled(ThrottledLogic, abc.ABC):
         exc_val: BaseException | None,
         exc_tb: TracebackType | None,
     ) -> None:
-        """Exit the context manager."""
+        """Exit the context manager, releasing the slots held on enter if any."""
+        if not self._leased:
+            return
+
+        held: tuple[types.KeyT, Lease] | None = self._unhold_lease()
+        if held is not None:
+            self.limiter.release(*held)
 
     @abc.abstractmethod
     def __call__(self, func: Func[types.P, types.R]) -> Func[types.P, types.R]:
@@ -189,6 +223,49 @@ class BaseThrottled(ThrottledLogic, abc.ABC):
         """
         raise NotImplementedError
 
+    @abc.abstractmethod
+    def limit_many(
+        self, items: Sequence[tuple[types.KeyT | None, int]]
+    ) -> list[RateLimitResult]:
+        """Apply rate limiting logic to multiple keys in a single batch.
+
+        The whole batch is sent to the store in one round trip
+        (a single pipeline on Redis, a single lock acquisition on Memory),
+        which is much cheaper than calling :meth:`limit` in a loop.
+
+        Batch requests are always non-blocking and do not invoke hooks.
+
+        :param items: A sequence of ``(key, cost)`` pairs, a ``None`` key
+            falls back to the instance key.
+        :return: A list of :class:`throttled.RateLimitResult`, in the same
+            order as ``items``.
+        :raise: :class:`throttled.exceptions.DataError` if invalid parameters
+            are provided.
+        """
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def limit_all(
+        self, items: Sequence[tuple[types.KeyT | None, int]]
+    ) -> list[RateLimitResult]:
+        """Apply rate limiting logic to multiple keys as an all-or-nothing request.
+
+        All keys are checked in one atomic operation, and the cost of each item is
+        consumed only if every key allows the request, e.g. "consume from the
+        user AND the tenant bucket, or from neither".
+
+        With Redis Cluster, all keys must map to the same hash slot, use hash
+        tags like ``{tenant-1}:user-1`` to guarantee it.
+
+        :param items: A sequence of ``(key, cost)`` pairs with unique keys,
+            a ``None`` key falls back to the instance key.
+        :return: A list of RateLimitResult, in the same order as ``items``,
+            all of them share the same ``limited`` flag.
+        :raise: DataError if invalid parameters are provided.
+        :raise: SetUpError if the algorithm does not support it.
+        """
+        raise NotImplementedError
+
     @abc.abstractmethod
     def peek(self, key: types.KeyT) -> RateLimitState:
         """Retrieve the current state of rate limiter for the given key.
@@ -201,6 +278,22 @@ class BaseThrottled(ThrottledLogic, abc.ABC):
         """
         raise NotImplementedError
 
+    @abc.abstractmethod
+    def release(self, result: RateLimitResult, key: types.KeyT | None = None) -> bool:
+        """Give back the slots held by an allowed request before its lease expires.
+
+        Only needed for results of :meth:`limit` with the ``concurrency``
+        algorithm, the context manager and the decorator release their slots
+        on exit.
+
+        :param result: The result returned by :meth:`limit`.
+        :param key: The key passed to :meth:`limit`, it falls back to the
+            instance key if not provided.
+        :return: True if the slots were released, False if the result holds
+            no slots or its lease has already expired or been released.
+        """
+        raise NotImplementedError
+
 
 class Throttled(BaseThrottled):
     """Throttled class for synchronous rate limiting."""
@@ -211,6 +304,8 @@ class Throttled(BaseThrottled):
         result: RateLimitResult = self.limit()
         if result.limited:
             raise exceptions.LimitedError(rate_limit_result=result)
+        if self._leased:
+            self._hold_lease(result)
         return result
 
     def __call__(self, func: Func[types.P, types.R]) -> Func[types.P, types.R]:
@@ -245,7 +340,13 @@ class Throttled(BaseThrottled):
                 result: RateLimitResult = self.limit(cost=self._cost)
                 if result.limited:
                     raise exceptions.LimitedError(rate_limit_result=result)
-                return f(*args, **kwargs)
+                if result.lease is None:
+                    return f(*args, **kwargs)
+
+                try:
+                    return f(*args, **kwargs)
+                finally:
+                    self.release(result)
 
             return _inner
 
@@ -255,40 +356,55 @@ class Throttled(BaseThrottled):
         if retry_after <= 0:
             return
 
-        start_time: float = utils.now_mono_f()
+        start_time: float = self._clock.monotonic()
         while True:
             # Sleep for the specified time.
             wait_time = self._get_wait_time(retry_after)
-            time.sleep(wait_time)
+            self._clock.sleep(wait_time)
 
             if self._is_exit_waiting(start_time, retry_after, timeout):
                 break
 
+    def _limit_once(self, key: types.KeyT, cost: int) -> RateLimitResult:
+        limiter: BaseRateLimiter = self.limiter
+        if not self._rule_limiters:
+            return limiter.limit(key, cost)
+
+        # Apply all quota rules in a single round trip and report the most
+        # restrictive one.
+        hash_tag: bool = self._store.key_layout == constants.KeyLayout.HASH_TAG.value
+        rules: list[tuple[BaseRateLimiter, str]] = [
+            (rule_limiter, self._get_rule_key(key, rule_limiter.quota, hash_tag))
+            for rule_limiter in self._rule_limiters
+        ]
+        return self._select_result(limiter.limit_rules(rules, cost))
+
     def _do_limit(self, key: types.KeyT, cost: int, timeout: float) -> RateLimitResult:
         """Execute rate limit check with retry logic.
 
         This method contains the entire limit logic including
         blocking/retry, so hooks can measure the total duration.
         """
-        result: RateLimitResult = self.limiter.limit(key, cost)
+        result: RateLimitResult = self._limit_once(key, cost)
 
         if timeout == self._NON_BLOCKING or not result.limited:
             return result
 
         # TODO: When cost > limit, return early instead of waiting.
-        start_time: float = utils.now_mono_f()
+        start_time: float = self._clock.monotonic()
         while True:
-            if result.state.retry_after > timeout:
+            retry_after: float = self._get_retry_after(result, timeout)
+            if retry_after > timeout:
                 break
 
-            self._wait(timeout, result.state.retry_after)
+            self._wait(timeout, retry_after)
 
-            result = self.limiter.limit(key, cost)
+            result = self._limit_once(key, cost)
 
             if not result.limited:
                 break
 
-            elapsed: float = utils.now_mono_f() - start_time
+            elapsed: float = self._clock.monotonic() - start_time
             if elapsed >= timeout:
                 break
 
@@ -320,5 +436,32 @@ class Throttled(BaseThrottled):
         chain = build_hook_chain(self._hooks, do_limit, context)
         return chain()
 
+    def limit_many(
+        self, items: Sequence[tuple[types.KeyT | None, int]]
+    ) -> list[RateLimitResult]:
+        self._validate_single_rule("limit_many")
+        return self.limiter.limit_many(self._get_items(items))
+
+    def limit_all(
+        self, items: Sequence[tuple[types.KeyT | None, int]]
+    ) -> list[RateLimitResult]:
+        self._validate_single_rule("limit_all")
+        return self.limiter.limit_all(self._get_items(items))
+
     def peek(self, key: types.KeyT) -> RateLimitState:
-        return self.limiter.peek(key)
+        limiter: BaseRateLimiter = self.limiter
+        if not self._rule_limiters:
+            return limiter.peek(key)
+
+        hash_tag: bool = self._store.key_layout == constants.KeyLayout.HASH_TAG.value
+        return self._select_state(
+            [
+                rule_limiter.peek(self._get_rule_key(key, rule_limiter.quota, hash_tag))
+                for rule_limiter in self._rule_limiters
+            ]
+        )
+
+    def release(self, result: RateLimitResult, key: types.KeyT | None = None) -> bool:
+        if result.lease is None:
+            return False
+        return self.limiter.release(self._get_key(key), result.lease)
@@ -1,5 +1,6 @@
+from collections.abc import Sequence
 from types import TracebackType
-from typing import TYPE_CHECKING, ParamSpec, Protocol, TypeVar
+from typing import TYPE_CHECKING, Any, ParamSpec, Protocol, TypeVar
 
 if TYPE_CHECKING:
     from redis.commands.core import AsyncScript
@@ -16,6 +17,9 @@ StoreBucketValueT = _NumberLikeT | StoreDictValueT
 
 AtomicActionTypeT = str
 
+# A single AtomicAction invocation: ``(keys, args)``.
+AtomicActionCallT = tuple[Sequence[KeyT], Sequence[StoreValueT] | None]
+
 RateLimiterTypeT = str
 
 TimeLikeValueT = int | float
@@ -54,13 +58,57 @@ class AsyncLockP(Protocol):
     ) -> None: ...
 
 
-class SyncRedisClientP(Protocol):
+class SyncConnectionP(Protocol):
+    """Protocol declaring the Redis connection methods used by sync RedisStore."""
+
+    def send_command(self, *args: object) -> None: ...
+    def read_response(self) -> object: ...
+    def can_read(self, timeout: float = ...) -> bool: ...
+    def disconnect(self) -> None: ...
+
+
+class AsyncConnectionP(Protocol):
+    """Protocol declaring the Redis connection methods used by async RedisStore."""
+
+    async def send_command(self, *args: object) -> None: ...
+    async def read_response(self, timeout: float | None = ...) -> object: ...
+    async def disconnect(self) -> None: ...
+
+
+class SyncPipelineP(Protocol):
+    """Protocol declaring the Redis pipeline methods used by sync RedisStore."""
+
+    def script_load(self, script: str) -> object: ...
+    def evalsha(self, sha: str, numkeys: int, *keys_and_args: object) -> object: ...
+    def fcall(self, function: str, numkeys: int, *keys_and_args: object) -> object: ...
+    def fcall_ro(
+        self, function: str, numkeys: int, *keys_and_args: object
+    ) -> object: ...
+    def execute(self, raise_on_error: bool = ...) -> list[Any]: ...
+
+
+class AsyncPipelineP(Protocol):
+    """Protocol declaring the Redis pipeline methods used by async RedisStore."""
+
+    def script_load(self, script: str) -> object: ...
+    def evalsha(self, sha: str, numkeys: int, *keys_and_args: object) -> object: ...
+    def fcall(self, function: str, numkeys: int, *keys_and_args: object) -> object: ...
+    def fcall_ro(
+        self, function: str, numkeys: int, *keys_and_args: object
+    ) -> object: ...
+    async def execute(self, raise_on_error: bool = ...) -> list[Any]: ...
+
+
+class SyncRedisClientP(Protocol):  # noqa: PLR0904
     """Protocol declaring Redis methods used by sync RedisStore.
 
     Centralizes the redis-py boundary: ``_client()`` casts once to this
     Protocol, and all downstream method calls are fully type-safe.
     """
 
+    # Not set on Redis Cluster clients, which keep a pool per node.
+    connection_pool: object
+
     def exists(self, name: str) -> int: ...
     def ttl(self, name: str) -> int: ...
     def expire(self, name: str, time: int) -> bool: ...
@@ -71,6 +119,19 @@ class SyncRedisClientP(Protocol):
     def keys(self, pattern: str) -> list[str]: ...
     def flushall(self) -> bool: ...
     def register_script(self, script: str) -> "SyncScript": ...
+    def script_load(self, script: str) -> str: ...
+    def evalsha(self, sha: str, numkeys: int, *keys_and_args: object) -> object: ...
+    def evalsha_ro(self, sha: str, numkeys: int, *keys_and_args: object) -> object: ...
+    def eval_ro(
+        self, script: str | bytes | memoryview, numkeys: int, *keys_and_args: object
+    ) -> object: ...
+    def info(self, section: str | None = ..., **kwargs: object) -> dict[str, Any]: ...
+    def function_load(self, code: str, replace: bool = ...) -> str: ...
+    def fcall(self, function: str, numkeys: int, *keys_and_args: object) -> object: ...
+    def fcall_ro(
+        self, function: str, numkeys: int, *keys_and_args: object
+    ) -> object: ...
+    def pipeline(self, transaction: bool = ...) -> "SyncPipelineP": ...
 
     def hset(
         self,
@@ -83,13 +144,16 @@ class SyncRedisClientP(Protocol):
     def hgetall(self, name: str) -> StoreDictValueT: ...
 
 
-class AsyncRedisClientP(Protocol):
+class AsyncRedisClientP(Protocol):  # noqa: PLR0904
     """Protocol declaring Redis methods used by async RedisStore.
 
     Centralizes the redis-py boundary: ``_client()`` casts once to this
     Protocol, and all downstream method calls are fully type-safe.
     """
 
+    # Not set on Redis Cluster clients, which keep a pool per node.
+    connection_pool: object
+
     async def exists(self, name: str) -> int: ...
     async def ttl(self, name: str) -> int: ...
     async def expire(self, name: str, time: int) -> bool: ...
@@ -100,6 +164,27 @@ class AsyncRedisClientP(Protocol):
     async def keys(self, pattern: str) -> list[str]: ...
     async def flushall(self) -> bool: ...
     def register_script(self, script: str) -> "AsyncScript": ...
+    async def script_load(self, script: str) -> str: ...
+    async def evalsha(
+        self, sha: str, numkeys: int, *keys_and_args: object
+    ) -> object: ...
+    async def evalsha_ro(
+        self, sha: str, numkeys: int, *keys_and_args: object
+    ) -> object: ...
+    async def eval_ro(
+        self, script: str | bytes | memoryview, numkeys: int, *keys_and_args: object
+    ) -> object: ...
+    async def info(
+        self, section: str | None = ..., **kwargs: object
+    ) -> dict[str, Any]: ...
+    async def function_load(self, code: str, replace: bool = ...) -> str: ...
+    async def fcall(
+        self, function: str, numkeys: int, *keys_and_args: object
+    ) -> object: ...
+    async def fcall_ro(
+        self, function: str, numkeys: int, *keys_and_args: object
+    ) -> object: ...
+    def pipeline(self, transaction: bool = ...) -> "AsyncPipelineP": ...
 
     async def set(
         self, name: str, value: StoreValueT, ex: int | None = ...
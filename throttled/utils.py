@@ -1,7 +1,9 @@
 import asyncio
+import gc
 import platform
 import sys
 import time
+import tracemalloc
 from collections.abc import Callable, Coroutine
 from concurrent.futures import ThreadPoolExecutor
 from functools import wraps
@@ -38,6 +40,11 @@ def now_sec() -> int:
     return int(time.time())
 
 
+def now_sec_f() -> float:
+    """Return current wall-clock time in seconds, with sub-second precision."""
+    return time.time()
+
+
 def now_mono_f() -> float:
     """Return current monotonic clock time in seconds."""
     return time.monotonic()
@@ -60,6 +67,22 @@ def to_bool(value: object | None) -> bool | None:
     return bool(value)
 
 
+def get_hash_tag(key: str) -> str | None:
+    """Return the hash tag of a Redis Cluster key, or None if it has none.
+
+    Redis Cluster only hashes the part between the first ``{`` and the first
+    ``}`` after it, if that part is not empty, so keys sharing a hash tag are
+    stored in the same slot.
+    """
+    start: int = key.find("{")
+    if start == -1:
+        return None
+    end: int = key.find("}", start + 1)
+    if end <= start + 1:
+        return None
+    return key[start + 1 : end]
+
+
 class Timer:
     """Measure elapsed time for sync and async call scopes."""
 
@@ -284,6 +307,49 @@ class Benchmark:
         with self:
             return [self._timer(task)(*args, **kwargs) for __ in range(batch)]
 
+    def memory(
+        self,
+        task: Callable[types.P, types.R],
+        batch: int,
+        *args: types.P.args,
+        **kwargs: types.P.kwargs,
+    ) -> float:
+        """Run ``task`` ``batch`` times and report the memory it retains per call.
+
+        :return: The retained memory in bytes per call.
+        """
+        self._checked_environment()
+        gc.collect()
+        tracemalloc.start()
+        try:
+            start, __ = tracemalloc.get_traced_memory()
+            for __ in range(batch):
+                task(*args, **kwargs)
+            gc.collect()
+            end, __ = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        bytes_per_call: float = (end - start) / batch
+        print(f"✅ Total: {batch}, 📦 Memory: {bytes_per_call:.1f} bytes/op")
+        return bytes_per_call
+
+    def hit_rate(
+        self,
+        task: Callable[types.P, bool],
+        batch: int,
+        *args: types.P.args,
+        **kwargs: types.P.kwargs,
+    ) -> float:
+        """Run ``task`` ``batch`` times and report the ratio of calls returning True.
+
+        :return: The hit rate, between 0 and 1.
+        """
+        hits: int = sum(self.serial(task, batch, *args, **kwargs))
+        rate: float = hits / batch
+        print(f"🎯 Hit rate: {rate:.2%}")
+        return rate
+
 
 # --------------------------------------------------------------------------------------
 # Copyright (c) Django Software Foundation and individual contributors.